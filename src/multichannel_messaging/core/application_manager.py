@@ -364,7 +364,8 @@ class ApplicationManager:
             
             self.message_logger = MessageLogger(
                 db_path=str(db_path),
-                user_id=user_id
+                user_id=user_id,
+                buffered=self.config_manager.get("logging.buffered_writes", False)
             )
             
             # Register cleanup callback
@@ -519,9 +520,8 @@ class ApplicationManager:
         """Cleanup message logger resources."""
         if self.message_logger:
             try:
-                # End any active session
-                if self.message_logger.current_session_id:
-                    self.message_logger.end_session()
+                # End any active session and commit buffered writes
+                self.message_logger.close()
                 
                 logger.debug("Message logger cleaned up")
             except Exception as e:
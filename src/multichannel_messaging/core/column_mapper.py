@@ -4,8 +4,11 @@ Intelligent column mapping system with pattern recognition and user-friendly int
 
 import re
 import json
+import random
+import warnings
+from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Dict, Iterable, List, Optional, Tuple, Any, Set
 from dataclasses import dataclass, field
 from enum import Enum
 import difflib
@@ -50,6 +53,20 @@ class MappingTemplate:
     success_rate: float = 0.0
 
 
+@dataclass
+class ColumnProfile:
+    """Value profile of a column computed from sampled rows."""
+    column: str
+    total_values: int  # Non-empty values in the sampled rows
+    unique_values: int
+    avg_length: float
+    patterns: Dict[str, float]  # common pattern name -> share of values matching
+    pattern_ratios: Dict[str, float]  # regex -> share of values matching
+    sample_values: List[str] = field(default_factory=list)
+    sampled_rows: int = 0
+    total_rows: int = 0
+
+
 @dataclass
 class MappingResult:
     """Complete column mapping result."""
@@ -59,6 +76,300 @@ class MappingResult:
     confidence_score: float
     suggested_templates: List[MappingTemplate]
     transformation_suggestions: Dict[str, List[str]]
+    column_profiles: Dict[str, ColumnProfile] = field(default_factory=dict)
+
+
+def _ratio_above(matcher: difflib.SequenceMatcher, text: str, threshold: float) -> float:
+    """
+    Similarity ratio of text to the matcher's second sequence if above threshold.
+
+    The length and character-count upper bounds are checked first, so the full
+    ratio is only computed for candidates that could pass.
+
+    Returns:
+        The ratio, or 0.0 if it is not above threshold
+    """
+    matcher.set_seq1(text)
+    if matcher.real_quick_ratio() <= threshold or matcher.quick_ratio() <= threshold:
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio > threshold else 0.0
+
+
+class HeaderMatcher:
+    """
+    Precompiled header matcher for a set of field definitions.
+    
+    Exact matches are looked up in a table of normalized names, regex patterns
+    are compiled and ordered by score so the first hit is the best one, and
+    fuzzy candidates keep a SequenceMatcher so only candidates passing cheap
+    upper bounds get a full ratio. Results are memoized per normalized header,
+    and template matches per header layout.
+    """
+    
+    # Minimum similarity for fuzzy and template matches
+    FUZZY_THRESHOLD = 0.7
+    TEMPLATE_FUZZY_THRESHOLD = 0.8
+    
+    # Memoized results are dropped once this many are held
+    MAX_CACHED_RESULTS = 50_000
+    MAX_CACHED_LAYOUTS = 32
+    
+    def __init__(self, field_definitions: Dict[str, Dict[str, Any]]):
+        """
+        Compile the matcher.
+        
+        Args:
+            field_definitions: Field definitions of an IntelligentColumnMapper
+        """
+        self.field_definitions = field_definitions
+        
+        # normalized exact match -> fields, in definition order
+        self._exact: Dict[str, List[str]] = {}
+        # field -> [(score, compiled pattern)], best score first
+        self._patterns: Dict[str, List[Tuple[float, re.Pattern]]] = {}
+        # field -> [(candidate, matcher)], fuzzy matches then exact matches
+        self._fuzzy: Dict[str, List[Tuple[str, difflib.SequenceMatcher]]] = {}
+        
+        for field, config in field_definitions.items():
+            for exact_match in config['exact_matches']:
+                fields = self._exact.setdefault(exact_match.lower(), [])
+                if field not in fields:
+                    fields.append(field)
+            
+            # More specific patterns get higher scores
+            self._patterns[field] = sorted(
+                ((0.8 + len(pattern) / 100.0, re.compile(pattern)) for pattern in config['pattern_matches']),
+                key=lambda item: item[0], reverse=True
+            )
+            
+            self._fuzzy[field] = [
+                (candidate, difflib.SequenceMatcher(None, '', candidate.lower()))
+                for candidate in config['fuzzy_matches'] + config['exact_matches']
+            ]
+        
+        self._pattern_scores: Dict[Tuple[str, str], float] = {}
+        self._fuzzy_matches: Dict[Tuple[str, str], Tuple[float, Optional[str]]] = {}
+        
+        # (column pattern, regex patterns) -> (normalized column pattern, compiled patterns, matcher)
+        self._template_patterns: Dict[Tuple[str, Tuple[str, ...]], Tuple[str, List[re.Pattern], Any]] = {}
+        # header layout -> (column pattern, regex patterns) -> first matching header
+        self._template_columns: "OrderedDict[Tuple[str, ...], Dict[Tuple[str, Tuple[str, ...]], Optional[str]]]" = (
+            OrderedDict()
+        )
+    
+    @staticmethod
+    def normalize(header: str) -> str:
+        """Normalize a header for matching."""
+        return header.lower().strip()
+    
+    def exact_fields(self, header: str) -> List[str]:
+        """Fields with an exact match for a normalized header."""
+        return self._exact.get(header, [])
+    
+    def pattern_score(self, field: str, header: str) -> float:
+        """Best pattern score of a normalized header for a field (0.0 if none match)."""
+        key = (field, header)
+        score = self._pattern_scores.get(key)
+        if score is None:
+            score = next((score for score, pattern in self._patterns[field] if pattern.search(header)), 0.0)
+            self._remember(self._pattern_scores, key, score)
+        return score
+    
+    def fuzzy_match(self, field: str, header: str) -> Tuple[float, Optional[str]]:
+        """Most similar fuzzy or exact match of a normalized header for a field."""
+        key = (field, header)
+        result = self._fuzzy_matches.get(key)
+        if result is None:
+            best_score = 0.0
+            best_match = None
+            for candidate, matcher in self._fuzzy[field]:
+                similarity = _ratio_above(matcher, header, max(best_score, self.FUZZY_THRESHOLD))
+                if similarity:
+                    best_score = similarity
+                    best_match = candidate
+            result = (best_score, best_match)
+            self._remember(self._fuzzy_matches, key, result)
+        return result
+    
+    def matches_template(self, header: str, column_pattern: str, regex_patterns: List[str]) -> bool:
+        """Check if a header matches a template's column pattern."""
+        column, patterns, matcher = self._compile_template(column_pattern, regex_patterns)
+        header_lower = self.normalize(header)
+        if header_lower == column or any(pattern.search(header_lower) for pattern in patterns):
+            return True
+        return bool(_ratio_above(matcher, header_lower, self.TEMPLATE_FUZZY_THRESHOLD))
+    
+    def template_column(self, column_pattern: str, regex_patterns: List[str],
+                        headers: Tuple[str, ...]) -> Optional[str]:
+        """First header of a layout matching a template's column pattern."""
+        columns = self._template_columns.get(headers)
+        if columns is None:
+            columns = self._template_columns[headers] = {}
+            if len(self._template_columns) > self.MAX_CACHED_LAYOUTS:
+                self._template_columns.popitem(last=False)
+        else:
+            self._template_columns.move_to_end(headers)
+        
+        key = (column_pattern, tuple(regex_patterns))
+        if key not in columns:
+            columns[key] = next(
+                (header for header in headers if self.matches_template(header, column_pattern, regex_patterns)),
+                None
+            )
+        return columns[key]
+    
+    def _compile_template(self, column_pattern: str, regex_patterns: List[str]
+                          ) -> Tuple[str, List[re.Pattern], difflib.SequenceMatcher]:
+        key = (column_pattern, tuple(regex_patterns))
+        compiled = self._template_patterns.get(key)
+        if compiled is None:
+            column = column_pattern.lower()
+            compiled = (
+                column,
+                [re.compile(pattern.lower()) for pattern in regex_patterns],
+                difflib.SequenceMatcher(None, '', column)
+            )
+            self._remember(self._template_patterns, key, compiled)
+        return compiled
+    
+    def _remember(self, cache: Dict, key, value):
+        if len(cache) >= self.MAX_CACHED_RESULTS:
+            cache.clear()
+        cache[key] = value
+
+
+class ColumnProfiler:
+    """
+    Profiles sampled column values against a set of value patterns.
+    
+    Rows are reservoir-sampled, and all patterns are evaluated in one pass
+    per distinct value with a combined regex of optional lookaheads, each
+    capturing an empty group when its pattern matches. Values are then
+    counted by which patterns they match.
+    """
+    
+    # Common value patterns reported in every profile
+    COMMON_PATTERNS = {
+        'email': r'^[^@]+@[^@]+\.[^@]+$',
+        'phone': r'^\+?\d[\d\s\-\(\)]{7,}$',
+        'name': r'^[A-Za-z\s\-\'\.]{2,50}$',
+        'numeric': r'^\d+$',
+        'alphanumeric': r'^[A-Za-z0-9\s]+$'
+    }
+    
+    # Rows profiled per column set
+    SAMPLE_SIZE = 1000
+    
+    # Distinct values kept as examples in a profile
+    EXAMPLE_VALUES = 5
+    
+    def __init__(self, patterns: Iterable[str] = (), sample_size: Optional[int] = None, seed: int = 0):
+        """
+        Compile the profiler.
+        
+        Args:
+            patterns: Value patterns to evaluate in addition to the common ones
+            sample_size: Rows to sample (defaults to SAMPLE_SIZE)
+            seed: Seed of the reservoir sampler, for repeatable profiles
+        """
+        self.patterns = list(dict.fromkeys(list(self.COMMON_PATTERNS.values()) + list(patterns)))
+        self.sample_size = sample_size or self.SAMPLE_SIZE
+        self.seed = seed
+        
+        self._groups = [f'_p{i}' for i in range(len(self.patterns))]
+        try:
+            with warnings.catch_warnings():
+                # Inline flags that are not at the start would apply to every pattern
+                warnings.simplefilter('error', DeprecationWarning)
+                self._combined = re.compile(''.join(
+                    f'(?:(?={pattern})(?P<{group}>))?' for group, pattern in zip(self._groups, self.patterns)
+                ))
+        except (re.error, DeprecationWarning):
+            # Patterns that cannot be combined (e.g. with inline flags) are matched one by one
+            self._combined = None
+            self._compiled = [re.compile(pattern) for pattern in self.patterns]
+    
+    def sample_rows(self, rows: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Reservoir-sample rows.
+        
+        Returns:
+            Tuple of (sampled rows in their original order if all fit, total rows)
+        """
+        sampler = random.Random(self.seed)
+        sample = []
+        total = 0
+        for total, row in enumerate(rows, 1):
+            if total <= self.sample_size:
+                sample.append(row)
+            else:
+                slot = sampler.randrange(total)
+                if slot < self.sample_size:
+                    sample[slot] = row
+        return sample, total
+    
+    def profile_columns(self, headers: List[str], rows: Iterable[Dict[str, Any]]) -> Dict[str, ColumnProfile]:
+        """
+        Profile the non-empty values of each column.
+        
+        Args:
+            headers: Columns to profile
+            rows: Data rows (only a sample is read into the profile)
+            
+        Returns:
+            Dictionary of column -> profile, for columns with values
+        """
+        sample, total_rows = self.sample_rows(rows)
+        profiles = {}
+        for header in headers:
+            column = [row.get(header, '') for row in sample]
+            values = Counter(str(value).strip() for value in column if value)
+            values.pop('', None)
+            
+            if values:
+                profile = self.profile_values(header, values)
+                profile.sampled_rows = len(sample)
+                profile.total_rows = total_rows
+                profiles[header] = profile
+        
+        return profiles
+    
+    def profile_values(self, column: str, values: Counter) -> ColumnProfile:
+        """Profile counted values of a column."""
+        total = sum(values.values())
+        divisor = total or 1
+        matches = self._match_counts(values)
+        pattern_ratios = {pattern: count / divisor for pattern, count in zip(self.patterns, matches)}
+        
+        return ColumnProfile(
+            column=column,
+            total_values=total,
+            unique_values=len(values),
+            avg_length=sum(len(value) * count for value, count in values.items()) / divisor,
+            patterns={name: pattern_ratios[pattern] for name, pattern in self.COMMON_PATTERNS.items()},
+            pattern_ratios=pattern_ratios,
+            sample_values=list(values)[:self.EXAMPLE_VALUES]
+        )
+    
+    def _match_counts(self, values: Counter) -> List[int]:
+        """Number of values matching each pattern."""
+        # Count values by the patterns they match; few distinct combinations occur
+        signatures = Counter()
+        if self._combined is None:
+            for value, count in values.items():
+                signatures[tuple(pattern.match(value) is not None or None for pattern in self._compiled)] += count
+        else:
+            match = self._combined.match
+            for value, count in values.items():
+                signatures[match(value).group(*self._groups)] += count
+        
+        matches = [0] * len(self.patterns)
+        for signature, count in signatures.items():
+            for i, group in enumerate(signature):
+                if group is not None:
+                    matches[i] += count
+        return matches
 
 
 class IntelligentColumnMapper:
@@ -173,6 +484,16 @@ class IntelligentColumnMapper:
             }
         }
         
+        # Compiled header matcher with memoized results
+        self._matcher = HeaderMatcher(self.field_definitions)
+        
+        # Profiler evaluating every field's value patterns at once
+        self._profiler = ColumnProfiler(
+            pattern
+            for config in self.field_definitions.values()
+            for pattern in config['data_patterns'] + config['negative_patterns']
+        )
+        
         # Load existing templates
         self.templates = self._load_templates()
         
@@ -224,9 +545,10 @@ class IntelligentColumnMapper:
         logger.debug(f"Fuzzy matching found {len(fuzzy_mappings)} mappings")
         
         # Step 5: Data pattern analysis if sample data available
+        column_profiles = self._profiler.profile_columns(headers, sample_data) if sample_data else {}
         data_mappings = {}
         if sample_data and learn_patterns:
-            data_mappings = self._analyze_data_patterns(headers, sample_data)
+            data_mappings = self._analyze_data_patterns(headers, sample_data, column_profiles)
             logger.debug(f"Data pattern analysis found {len(data_mappings)} mappings")
         
         # Step 6: Combine and resolve conflicts
@@ -261,7 +583,8 @@ class IntelligentColumnMapper:
             missing_required_fields=missing_required_fields,
             confidence_score=confidence_score,
             suggested_templates=suggested_templates,
-            transformation_suggestions=transformation_suggestions
+            transformation_suggestions=transformation_suggestions,
+            column_profiles=column_profiles
         )
         
         logger.info(f"Column mapping complete: {len(mappings)} mapped, "
@@ -276,22 +599,17 @@ class IntelligentColumnMapper:
         mappings = {}
         
         for header in headers:
-            header_lower = header.lower().strip()
-            
-            for field, config in self.field_definitions.items():
+            for field in self._matcher.exact_fields(self._matcher.normalize(header)):
                 if field in mappings:
                     continue  # Field already mapped
                 
-                for exact_match in config['exact_matches']:
-                    if header_lower == exact_match.lower():
-                        mappings[field] = ColumnMapping(
-                            source_column=header,
-                            target_field=field,
-                            confidence=MappingConfidence.EXACT,
-                            confidence_score=1.0,
-                            detection_method='exact_match'
-                        )
-                        break
+                mappings[field] = ColumnMapping(
+                    source_column=header,
+                    target_field=field,
+                    confidence=MappingConfidence.EXACT,
+                    confidence_score=1.0,
+                    detection_method='exact_match'
+                )
         
         return mappings
     
@@ -300,20 +618,13 @@ class IntelligentColumnMapper:
         mappings = {}
         
         for header in headers:
-            header_lower = header.lower().strip()
+            header_lower = self._matcher.normalize(header)
             
-            for field, config in self.field_definitions.items():
+            for field in self.field_definitions:
                 if field in mappings:
                     continue  # Field already mapped
                 
-                best_score = 0.0
-                for pattern in config['pattern_matches']:
-                    if re.search(pattern, header_lower):
-                        # Score based on pattern specificity
-                        score = 0.8 + (len(pattern) / 100.0)  # More specific patterns get higher scores
-                        if score > best_score:
-                            best_score = score
-                
+                best_score = self._matcher.pattern_score(field, header_lower)
                 if best_score > 0.0:
                     confidence = MappingConfidence.HIGH if best_score > 0.85 else MappingConfidence.MEDIUM
                     mappings[field] = ColumnMapping(
@@ -331,29 +642,14 @@ class IntelligentColumnMapper:
         mappings = {}
         
         for header in headers:
-            header_lower = header.lower().strip()
+            header_lower = self._matcher.normalize(header)
             
-            for field, config in self.field_definitions.items():
+            for field in self.field_definitions:
                 if field in mappings:
                     continue  # Field already mapped
                 
-                best_score = 0.0
-                best_match = None
-                
-                # Check fuzzy matches
-                for fuzzy_match in config['fuzzy_matches']:
-                    similarity = difflib.SequenceMatcher(None, header_lower, fuzzy_match.lower()).ratio()
-                    if similarity > best_score and similarity > 0.7:
-                        best_score = similarity
-                        best_match = fuzzy_match
-                
-                # Also check against exact matches with fuzzy logic
-                for exact_match in config['exact_matches']:
-                    similarity = difflib.SequenceMatcher(None, header_lower, exact_match.lower()).ratio()
-                    if similarity > best_score and similarity > 0.7:
-                        best_score = similarity
-                        best_match = exact_match
-                
+                # Fuzzy matches, then exact matches with fuzzy logic
+                best_score, best_match = self._matcher.fuzzy_match(field, header_lower)
                 if best_score > 0.7:
                     confidence = MappingConfidence.HIGH if best_score > 0.9 else MappingConfidence.MEDIUM
                     mappings[field] = ColumnMapping(
@@ -367,27 +663,25 @@ class IntelligentColumnMapper:
         
         return mappings
     
-    def _analyze_data_patterns(self, headers: List[str], sample_data: List[Dict[str, Any]]) -> Dict[str, ColumnMapping]:
+    def _analyze_data_patterns(self, headers: List[str], sample_data: List[Dict[str, Any]],
+                               column_profiles: Optional[Dict[str, ColumnProfile]] = None
+                               ) -> Dict[str, ColumnMapping]:
         """Analyze actual data patterns to infer column types."""
         mappings = {}
         
         if not sample_data:
             return mappings
         
-        # Analyze each column's data
-        column_analysis = {}
-        for header in headers:
-            values = []
-            for row in sample_data:
-                value = row.get(header, '')
-                if value and str(value).strip():
-                    values.append(str(value).strip())
-            
-            if values:
-                column_analysis[header] = self._analyze_column_values(values)
+        # Profile each column's data once for all fields
+        if column_profiles is None:
+            column_profiles = self._profiler.profile_columns(headers, sample_data)
         
         # Match patterns to fields
-        for header, analysis in column_analysis.items():
+        for header in headers:
+            profile = column_profiles.get(header)
+            if profile is None:
+                continue
+            
             best_field = None
             best_score = 0.0
             
@@ -396,20 +690,12 @@ class IntelligentColumnMapper:
                     continue  # Field already mapped
                 
                 # Check positive patterns
-                positive_score = 0.0
-                for pattern in config['data_patterns']:
-                    matches = sum(1 for value in analysis['values'] if re.match(pattern, value))
-                    if analysis['total_values'] > 0:
-                        match_ratio = matches / analysis['total_values']
-                        positive_score = max(positive_score, match_ratio)
+                positive_score = max((profile.pattern_ratios[pattern] for pattern in config['data_patterns']),
+                                     default=0.0)
                 
                 # Check negative patterns (should NOT match)
-                negative_score = 0.0
-                for pattern in config['negative_patterns']:
-                    matches = sum(1 for value in analysis['values'] if re.match(pattern, value))
-                    if analysis['total_values'] > 0:
-                        match_ratio = matches / analysis['total_values']
-                        negative_score = max(negative_score, match_ratio)
+                negative_score = max((profile.pattern_ratios[pattern] for pattern in config['negative_patterns']),
+                                     default=0.0)
                 
                 # Combined score (positive patterns good, negative patterns bad)
                 combined_score = positive_score - (negative_score * 0.5)
@@ -433,28 +719,14 @@ class IntelligentColumnMapper:
     
     def _analyze_column_values(self, values: List[str]) -> Dict[str, Any]:
         """Analyze a column's values to determine patterns."""
-        analysis = {
+        profile = self._profiler.profile_values('', Counter(values))
+        return {
             'values': values,
-            'total_values': len(values),
-            'unique_values': len(set(values)),
-            'avg_length': sum(len(v) for v in values) / len(values) if values else 0,
-            'patterns': {}
+            'total_values': profile.total_values,
+            'unique_values': profile.unique_values,
+            'avg_length': profile.avg_length,
+            'patterns': profile.patterns
         }
-        
-        # Common pattern checks
-        patterns = {
-            'email': r'^[^@]+@[^@]+\.[^@]+$',
-            'phone': r'^\+?\d[\d\s\-\(\)]{7,}$',
-            'name': r'^[A-Za-z\s\-\'\.]{2,50}$',
-            'numeric': r'^\d+$',
-            'alphanumeric': r'^[A-Za-z0-9\s]+$'
-        }
-        
-        for pattern_name, pattern in patterns.items():
-            matches = sum(1 for value in values if re.match(pattern, value))
-            analysis['patterns'][pattern_name] = matches / len(values) if values else 0
-        
-        return analysis
     
     def _apply_template_matching(self, headers: List[str], sample_data: Optional[List[Dict[str, Any]]]) -> Dict[str, ColumnMapping]:
         """Apply existing mapping templates to headers."""
@@ -464,6 +736,7 @@ class IntelligentColumnMapper:
             return mappings
         
         # Score each template against the headers
+        layout = tuple(headers)
         template_scores = []
         for template in self.templates:
             score = self._score_template_match(template, headers, sample_data)
@@ -478,17 +751,16 @@ class IntelligentColumnMapper:
             # Apply template mappings
             for field, column_pattern in best_template.mappings.items():
                 # Find matching column
-                for header in headers:
-                    if self._matches_template_pattern(header, column_pattern, best_template.patterns.get(field, [])):
-                        mappings[field] = ColumnMapping(
-                            source_column=header,
-                            target_field=field,
-                            confidence=MappingConfidence.HIGH,
-                            confidence_score=best_score,
-                            detection_method='template_match',
-                            suggestions=[f"From template: {best_template.name}"]
-                        )
-                        break
+                header = self._matcher.template_column(column_pattern, best_template.patterns.get(field, []), layout)
+                if header is not None:
+                    mappings[field] = ColumnMapping(
+                        source_column=header,
+                        target_field=field,
+                        confidence=MappingConfidence.HIGH,
+                        confidence_score=best_score,
+                        detection_method='template_match',
+                        suggestions=[f"From template: {best_template.name}"]
+                    )
         
         return mappings
     
@@ -497,14 +769,12 @@ class IntelligentColumnMapper:
         if not template.mappings:
             return 0.0
         
-        matches = 0
+        layout = tuple(headers)
         total_fields = len(template.mappings)
-        
-        for field, column_pattern in template.mappings.items():
-            for header in headers:
-                if self._matches_template_pattern(header, column_pattern, template.patterns.get(field, [])):
-                    matches += 1
-                    break
+        matches = sum(
+            1 for field, column_pattern in template.mappings.items()
+            if self._matcher.template_column(column_pattern, template.patterns.get(field, []), layout) is not None
+        )
         
         base_score = matches / total_fields if total_fields > 0 else 0.0
         
@@ -514,21 +784,8 @@ class IntelligentColumnMapper:
         return min(1.0, base_score + bonus)
     
     def _matches_template_pattern(self, header: str, column_pattern: str, regex_patterns: List[str]) -> bool:
-        """Check if a header matches a template pattern."""
-        header_lower = header.lower().strip()
-        
-        # Exact match
-        if header_lower == column_pattern.lower():
-            return True
-        
-        # Regex patterns
-        for pattern in regex_patterns:
-            if re.search(pattern.lower(), header_lower):
-                return True
-        
-        # Fuzzy match
-        similarity = difflib.SequenceMatcher(None, header_lower, column_pattern.lower()).ratio()
-        return similarity > 0.8
+        """Check if a header matches a template pattern (exact, regex or fuzzy)."""
+        return self._matcher.matches_template(header, column_pattern, regex_patterns)
     
     def _resolve_mapping_conflicts(self, all_mappings: Dict[str, Dict[str, ColumnMapping]], headers: List[str]) -> Dict[str, ColumnMapping]:
         """Resolve conflicts when multiple methods map to the same field or column."""
@@ -4,13 +4,18 @@ Enhanced with robust encoding detection, intelligent parsing, and comprehensive
 Supports CSV, Excel, Google Sheets, TSV, and other tabular formats.
 """
 
+import bisect
 import csv
+import multiprocessing
+import os
 import pandas as pd
 import re
 import io
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any, Union, Iterator
-from dataclasses import dataclass, field
+from typing import BinaryIO, List, Dict, Optional, Tuple, Any, Union, Iterator
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 import codecs
 import json
@@ -31,13 +36,80 @@ except ImportError:
     xlrd = None
 
 from .models import Customer
+from .customer_frame import normalize_customer_frame, frame_to_customers
 from .column_mapper import IntelligentColumnMapper, MappingResult, ColumnMapping
-from .data_validator import AdvancedDataValidator, ValidationResult
+from .data_validator import AdvancedDataValidator, DomainCache, DomainStatus, ValidationResult
+from .import_cache import ImportCache, get_import_cache
 from ..utils.exceptions import CSVProcessingError, ValidationError
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Per-process table processor used by parallel validation workers
+_worker_processor: Optional["AdvancedTableProcessor"] = None
+
+
+def _init_validation_worker(enable_domain_checking: bool) -> None:
+    """Create the table processor used by a validation worker process."""
+    global _worker_processor
+    # Workers get in-memory caches; only the parent process persists them
+    _worker_processor = AdvancedTableProcessor(
+        enable_domain_checking=enable_domain_checking,
+        validation_workers=1,
+        import_cache=ImportCache(),
+        domain_cache=DomainCache()
+    )
+
+
+def _validate_rows_in_worker(
+    rows: List[Dict[str, Any]],
+    customer_rows: List[Dict[str, str]],
+    column_mapping: Dict[str, str],
+    domain_statuses: Dict[str, DomainStatus]
+) -> List[List["ValidationIssue"]]:
+    """Validate a chunk of rows inside a worker process."""
+    # Domains were resolved and customer fields extracted by the parent process
+    _worker_processor.data_validator.email_validator.domain_cache.update(domain_statuses)
+    return _worker_processor._validate_rows(rows, column_mapping, customer_rows)
+
+
+# Carriage returns not followed by a line feed, which also end lines in text mode
+_BARE_CR = re.compile(r'(?<=\r)(?!\n)')
+
+
+def _is_line_safe_encoding(encoding: str) -> bool:
+    """Whether an encoding is ASCII-compatible, so newline bytes always end lines."""
+    try:
+        return b'\r\n,;"'.decode(encoding) == '\r\n,;"'
+    except (LookupError, UnicodeDecodeError):
+        return False
+
+
+def _iter_lines_with_offsets(raw: BinaryIO, encoding: str, position: List[Optional[int]]) -> Iterator[str]:
+    """
+    Decode the lines of a binary file as text mode with newline='' would.
+    
+    Before each line is yielded, position[0] is set to the byte offset after
+    it, or None if the line ends in a lone carriage return within a chunk.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    offset = 0
+    for line in raw:
+        offset += len(line)
+        text = decoder.decode(line)
+        if '\r' in text and not (text.endswith('\r\n') and text.count('\r') == 1):
+            pieces = [piece for piece in _BARE_CR.split(text) if piece]
+            for piece in pieces[:-1]:
+                position[0] = None
+                yield piece
+            text = pieces[-1]
+        position[0] = offset
+        yield text
+    
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
 
 class FileFormat(Enum):
     """Supported file formats."""
@@ -93,12 +165,37 @@ class FileStructure:
     line_terminator: str = '\n'
     sheet_names: Optional[List[str]] = None  # For Excel files
     active_sheet: Optional[str] = None  # For Excel files
+    rows_counted: bool = True  # False when total_rows only covers the sample
+    row_offsets: List[Tuple[int, int]] = field(default_factory=list)  # (data rows before, byte offset)
 
 
 # Backward compatibility alias
 CSVStructure = FileStructure
 
 
+def _structure_to_dict(structure: FileStructure) -> Dict[str, Any]:
+    """Convert a file structure to JSON-serializable data."""
+    data = asdict(structure)
+    data['file_format'] = structure.file_format.value
+    if structure.encoding:
+        data['encoding']['confidence'] = structure.encoding.confidence.value
+    return data
+
+
+def _structure_from_dict(data: Dict[str, Any]) -> FileStructure:
+    """Restore a file structure converted by _structure_to_dict."""
+    data = dict(data)
+    data['file_format'] = FileFormat(data['file_format'])
+    if data.get('encoding'):
+        encoding = dict(data['encoding'])
+        encoding['confidence'] = EncodingConfidence(encoding['confidence'])
+        data['encoding'] = EncodingResult(**encoding)
+    if data.get('delimiter'):
+        data['delimiter'] = DelimiterResult(**data['delimiter'])
+    data['row_offsets'] = [tuple(offset) for offset in data.get('row_offsets', [])]
+    return FileStructure(**data)
+
+
 @dataclass
 class ValidationIssue:
     """Individual validation issue."""
@@ -193,13 +290,41 @@ class AdvancedTableProcessor:
         '.ndjson': FileFormat.JSONL,
     }
 
-    def __init__(self, enable_domain_checking: bool = True):
-        """Initialize advanced table processor."""
+    # Files with fewer rows than this are always validated serially
+    PARALLEL_VALIDATION_MIN_ROWS = 20000
+
+    # Data rows between recorded byte offsets of CSV-like files
+    ROW_OFFSET_INTERVAL = 10000
+
+    def __init__(
+        self,
+        enable_domain_checking: bool = True,
+        validation_workers: Optional[int] = None,
+        import_cache: Optional[ImportCache] = None,
+        domain_cache: Optional[DomainCache] = None
+    ):
+        """
+        Initialize advanced table processor.
+        
+        Args:
+            enable_domain_checking: Whether to enable DNS domain checking
+            validation_workers: Worker processes for row validation of large
+                files; None uses one per CPU, 1 disables parallel validation
+            import_cache: Cache of analyzed files and chosen column mappings
+                (defaults to the shared cache in the application data directory)
+            domain_cache: Cache of email domain lookups (defaults to the
+                shared cache in the application data directory)
+        """
         self.last_structure: Optional[FileStructure] = None
         self.validation_cache: Dict[str, TableValidationReport] = {}
         self._encoding_cache: Dict[str, EncodingResult] = {}
+        self.import_cache = import_cache if import_cache is not None else get_import_cache()
         self.column_mapper = IntelligentColumnMapper()
-        self.data_validator = AdvancedDataValidator(enable_domain_checking=enable_domain_checking)
+        self.data_validator = AdvancedDataValidator(
+            enable_domain_checking=enable_domain_checking,
+            domain_cache=domain_cache
+        )
+        self.validation_workers = validation_workers if validation_workers is not None else (os.cpu_count() or 1)
     
     def detect_file_format(self, file_path: Path) -> FileFormat:
         """
@@ -654,17 +779,33 @@ class AdvancedTableProcessor:
         best_delimiter = max(scores.keys(), key=lambda d: scores[d])
         return DelimiterResult(best_delimiter, scores[best_delimiter], detected_by='pattern')
     
-    def analyze_file_structure(self, file_path: Path, sheet_name: Optional[str] = None) -> FileStructure:
+    def analyze_file_structure(
+        self,
+        file_path: Path,
+        sheet_name: Optional[str] = None,
+        count_rows: bool = True
+    ) -> FileStructure:
         """
         Comprehensive table file structure analysis supporting multiple formats.
         
         Args:
             file_path: Path to table file
             sheet_name: Sheet name for Excel files (optional)
+            count_rows: Scan the whole file to count rows; when False, CSV-like
+                files are only read up to the sample rows
             
         Returns:
             FileStructure with complete file analysis
         """
+        # Reuse the analysis of an unchanged file
+        fingerprint = self._import_fingerprint(file_path)
+        structure = self._cached_structure(file_path, fingerprint, sheet_name, count_rows)
+        if structure is not None:
+            self.last_structure = structure
+            logger.info(f"Using cached analysis of {file_path.name}: "
+                        f"{len(structure.headers)} columns, {structure.total_rows} rows")
+            return structure
+        
         try:
             # Step 1: Detect file format
             file_format = self.detect_file_format(file_path)
@@ -679,17 +820,126 @@ class AdvancedTableProcessor:
                 structure = self._analyze_jsonl_structure(file_path)
             else:
                 # Handle CSV-like formats (CSV, TSV, pipe-delimited, etc.)
-                structure = self._analyze_csv_like_structure(file_path, file_format)
+                structure = self._analyze_csv_like_structure(file_path, file_format, count_rows)
             
             self.last_structure = structure
             logger.info(f"Analyzed {file_format.value}: {len(structure.headers)} columns, {structure.total_rows} rows")
             
+            self._cache_structure(fingerprint, sheet_name, structure)
             return structure
             
         except Exception as e:
             logger.error(f"File structure analysis failed: {e}")
             raise CSVProcessingError(f"Failed to analyze table file structure: {e}")
     
+    def _import_fingerprint(self, file_path: Path) -> Optional[str]:
+        """Fingerprint a file for the import cache, or None if it cannot be read."""
+        try:
+            return self.import_cache.fingerprint(file_path)
+        except OSError:
+            return None
+    
+    def _cached_structure(
+        self,
+        file_path: Path,
+        fingerprint: Optional[str],
+        sheet_name: Optional[str],
+        count_rows: bool
+    ) -> Optional[FileStructure]:
+        """Get the cached structure of a file, or None if it must be analyzed."""
+        if fingerprint is None:
+            return None
+        
+        entry = self.import_cache.get(fingerprint)
+        data = (entry or {}).get('structures', {}).get(sheet_name or '')
+        if data is None:
+            return None
+        
+        try:
+            structure = _structure_from_dict(data)
+        except Exception as e:
+            logger.warning(f"Ignoring invalid import cache entry {fingerprint}: {e}")
+            return None
+        
+        if count_rows and not structure.rows_counted:
+            return None
+        
+        # Sample rows hold customer data and are not cached; read them again
+        try:
+            structure.sample_rows = self._read_sample_rows(file_path, structure, sheet_name)
+        except Exception as e:
+            logger.warning(f"Failed to read sample rows of {file_path.name}: {e}")
+            return None
+        return structure
+    
+    def _read_sample_rows(
+        self,
+        file_path: Path,
+        structure: FileStructure,
+        sheet_name: Optional[str],
+        count: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Read the first rows of a file with a known structure."""
+        if structure.file_format in [FileFormat.EXCEL_XLSX, FileFormat.EXCEL_XLS]:
+            chunks = self._stream_excel_rows(file_path, structure, count, sheet_name)
+        elif structure.file_format == FileFormat.JSON:
+            chunks = self._stream_json_rows(file_path, structure, count)
+        elif structure.file_format == FileFormat.JSONL:
+            chunks = self._stream_jsonl_rows(file_path, structure, count)
+        else:
+            chunks = self._stream_csv_like_rows(file_path, structure, count)
+        
+        try:
+            rows = next(chunks, [])
+        finally:
+            chunks.close()
+        
+        for row in rows:
+            row.pop('_row_number', None)
+        return rows
+    
+    def _cache_structure(self, fingerprint: Optional[str], sheet_name: Optional[str], structure: FileStructure) -> None:
+        """Store the analyzed structure of a file, without its sample rows, in the import cache."""
+        if fingerprint is None:
+            return
+        
+        data = _structure_to_dict(structure)
+        data['sample_rows'] = []
+        
+        entry = self.import_cache.get(fingerprint) or {}
+        structures = dict(entry.get('structures', {}))
+        structures[sheet_name or ''] = data
+        self.import_cache.update(fingerprint, structures=structures)
+    
+    def get_cached_column_mapping(self, file_path: Path) -> Optional[Dict[str, str]]:
+        """
+        Get the column mapping last used to load an unchanged file.
+        
+        Args:
+            file_path: Path to table file
+            
+        Returns:
+            Mapping of required fields to column names, or None if not cached
+        """
+        fingerprint = self._import_fingerprint(file_path)
+        if fingerprint is None:
+            return None
+        
+        entry = self.import_cache.get(fingerprint)
+        return (entry or {}).get('column_mapping')
+    
+    def remember_column_mapping(self, file_path: Path, column_mapping: Dict[str, str]) -> None:
+        """
+        Store the column mapping chosen for a file in the import cache.
+        
+        Args:
+            file_path: Path to table file
+            column_mapping: Mapping of required fields to column names
+        """
+        fingerprint = self._import_fingerprint(file_path)
+        if fingerprint is not None:
+            self.import_cache.update(fingerprint, column_mapping=dict(column_mapping))
+    
     def _analyze_excel_structure(self, file_path: Path, file_format: FileFormat, sheet_name: Optional[str] = None) -> FileStructure:
         """Analyze Excel file structure."""
         try:
@@ -851,7 +1101,12 @@ class AdvancedTableProcessor:
             logger.error(f"JSONL structure analysis failed: {e}")
             raise CSVProcessingError(f"Failed to analyze JSONL file: {e}")
     
-    def _analyze_csv_like_structure(self, file_path: Path, file_format: FileFormat) -> FileStructure:
+    def _analyze_csv_like_structure(
+        self,
+        file_path: Path,
+        file_format: FileFormat,
+        count_rows: bool = True
+    ) -> FileStructure:
         """Analyze CSV-like file structure (CSV, TSV, pipe-delimited, etc.)."""
         try:
             # Step 1: Detect encoding
@@ -875,7 +1130,8 @@ class AdvancedTableProcessor:
             structure = self._analyze_structure_streaming(
                 file_path, 
                 encoding_result, 
-                delimiter_result
+                delimiter_result,
+                count_rows=count_rows
             )
             
             # Update format
@@ -892,7 +1148,8 @@ class AdvancedTableProcessor:
         file_path: Path, 
         encoding_result: EncodingResult,
         delimiter_result: DelimiterResult,
-        sample_rows: int = 5
+        sample_rows: int = 5,
+        count_rows: bool = True
     ) -> FileStructure:
         """Analyze CSV structure using streaming approach for memory efficiency."""
         
@@ -900,12 +1157,22 @@ class AdvancedTableProcessor:
         sample_data = []
         total_rows = 0
         has_header = True
+        row_offsets = []
+        
+        # Byte offsets of rows can only be tracked for ASCII-compatible encodings
+        track_offsets = count_rows and _is_line_safe_encoding(encoding_result.encoding)
+        position: List[Optional[int]] = [None]
         
         try:
-            with open(file_path, 'r', encoding=encoding_result.encoding, newline='') as f:
+            with open(file_path, 'rb') as raw:
+                if track_offsets:
+                    lines = _iter_lines_with_offsets(raw, encoding_result.encoding, position)
+                else:
+                    lines = io.TextIOWrapper(raw, encoding=encoding_result.encoding, newline='')
+                
                 # Create CSV reader with detected parameters
                 reader = csv.reader(
-                    f,
+                    lines,
                     delimiter=delimiter_result.delimiter,
                     quotechar=delimiter_result.quote_char
                 )
@@ -939,9 +1206,18 @@ class AdvancedTableProcessor:
                 
                 # Read sample rows and count total
                 sample_count = 0
+                rows_counted = True
                 for row in reader:
+                    if sample_count >= sample_rows and not count_rows:
+                        rows_counted = False
+                        break
+                    
                     total_rows += 1
                     
+                    # Remember where the next rows start for chunked seeking
+                    if track_offsets and total_rows % self.ROW_OFFSET_INTERVAL == 0 and position[0] is not None:
+                        row_offsets.append((total_rows, position[0]))
+                    
                     if sample_count < sample_rows:
                         if len(row) == len(headers):
                             row_dict = dict(zip(headers, row))
@@ -961,7 +1237,9 @@ class AdvancedTableProcessor:
                 headers=headers,
                 total_rows=total_rows,
                 sample_rows=sample_data,
-                has_header=has_header
+                has_header=has_header,
+                rows_counted=rows_counted,
+                row_offsets=row_offsets
             )
             
         except Exception as e:
@@ -1009,7 +1287,8 @@ class AdvancedTableProcessor:
         file_path: Path, 
         structure: Optional[FileStructure] = None,
         chunk_size: int = 1000,
-        sheet_name: Optional[str] = None
+        sheet_name: Optional[str] = None,
+        start_row: int = 0
     ) -> Iterator[List[Dict[str, Any]]]:
         """
         Stream table rows in chunks for memory-efficient processing.
@@ -1020,6 +1299,8 @@ class AdvancedTableProcessor:
             structure: Pre-analyzed file structure (optional)
             chunk_size: Number of rows per chunk
             sheet_name: Sheet name for Excel files (optional)
+            start_row: Number of data rows to skip; CSV-like files seek to
+                the nearest recorded row offset instead of reading them
             
         Yields:
             Chunks of table rows as dictionaries
@@ -1029,14 +1310,25 @@ class AdvancedTableProcessor:
         
         try:
             if structure.file_format in [FileFormat.EXCEL_XLSX, FileFormat.EXCEL_XLS]:
-                yield from self._stream_excel_rows(file_path, structure, chunk_size, sheet_name)
+                chunks = self._stream_excel_rows(file_path, structure, chunk_size, sheet_name)
             elif structure.file_format == FileFormat.JSON:
-                yield from self._stream_json_rows(file_path, structure, chunk_size)
+                chunks = self._stream_json_rows(file_path, structure, chunk_size)
             elif structure.file_format == FileFormat.JSONL:
-                yield from self._stream_jsonl_rows(file_path, structure, chunk_size)
+                chunks = self._stream_jsonl_rows(file_path, structure, chunk_size)
             else:
                 # Handle CSV-like formats
-                yield from self._stream_csv_like_rows(file_path, structure, chunk_size)
+                yield from self._stream_csv_like_rows(file_path, structure, chunk_size, start_row)
+                return
+            
+            # Other formats cannot seek, so leading rows are dropped
+            skipped = 0
+            for chunk in chunks:
+                if skipped < start_row:
+                    drop = min(len(chunk), start_row - skipped)
+                    skipped += drop
+                    chunk = chunk[drop:]
+                if chunk:
+                    yield chunk
                 
         except Exception as e:
             logger.error(f"Table streaming failed: {e}")
@@ -1140,10 +1432,24 @@ class AdvancedTableProcessor:
             logger.error(f"JSONL streaming failed: {e}")
             raise CSVProcessingError(f"Failed to stream JSONL rows: {e}")
     
-    def _stream_csv_like_rows(self, file_path: Path, structure: FileStructure, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
-        """Stream CSV-like rows in chunks."""
+    def _stream_csv_like_rows(
+        self,
+        file_path: Path,
+        structure: FileStructure,
+        chunk_size: int,
+        start_row: int = 0
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream CSV-like rows in chunks, seeking to start_row via the recorded row offsets."""
         try:
-            with open(file_path, 'r', encoding=structure.encoding.encoding, newline='') as f:
+            # Find the last recorded offset at or before the first wanted row
+            rows_before, byte_offset = 0, 0
+            index = bisect.bisect_right(structure.row_offsets, (start_row, float('inf'))) - 1
+            if index >= 0:
+                rows_before, byte_offset = structure.row_offsets[index]
+            
+            with open(file_path, 'rb') as raw:
+                raw.seek(byte_offset)
+                f = io.TextIOWrapper(raw, encoding=structure.encoding.encoding, newline='')
                 reader = csv.reader(
                     f,
                     delimiter=structure.delimiter.delimiter,
@@ -1151,11 +1457,17 @@ class AdvancedTableProcessor:
                 )
                 
                 # Skip header if present
-                if structure.has_header:
+                if structure.has_header and byte_offset == 0:
                     next(reader, None)
                 
                 chunk = []
-                row_number = 1 if structure.has_header else 0
+                row_number = rows_before + (1 if structure.has_header else 0)
+                
+                # Skip the rows between the offset and the first wanted row
+                for _ in range(start_row - rows_before):
+                    if next(reader, None) is None:
+                        break
+                    row_number += 1
                 
                 for row in reader:
                     row_number += 1
@@ -1211,28 +1523,7 @@ class AdvancedTableProcessor:
         if structure is None:
             structure = self.analyze_file_structure(file_path, sheet_name)
         
-        report = TableValidationReport(
-            total_rows=structure.total_rows, 
-            valid_rows=0,
-            file_format=structure.file_format
-        )
-        
-        # Validate encoding (for text-based formats)
-        if structure.encoding and structure.encoding.confidence == EncodingConfidence.FALLBACK:
-            report.encoding_issues.append(
-                f"Low confidence encoding detection: {structure.encoding.encoding}"
-            )
-        
-        # Format-specific validation
-        if structure.file_format in [FileFormat.EXCEL_XLSX, FileFormat.EXCEL_XLS]:
-            if not structure.sheet_names:
-                report.format_issues.append("No sheets found in Excel file")
-            elif structure.active_sheet not in structure.sheet_names:
-                report.format_issues.append(f"Sheet '{structure.active_sheet}' not found in Excel file")
-        
-        elif structure.file_format in [FileFormat.JSON, FileFormat.JSONL]:
-            # JSON-specific validation is handled during structure analysis
-            pass
+        report = self._create_validation_report(structure)
         
         # Validate structure
         if not structure.headers:
@@ -1257,12 +1548,10 @@ class AdvancedTableProcessor:
         
         # Validate data rows
         valid_count = 0
-        for chunk in self.stream_table_rows(file_path, structure, chunk_size=500, sheet_name=sheet_name):
-            for row_data in chunk:
-                row_number = row_data.get('_row_number', 0)
-                
-                # Validate individual row
-                row_issues = self._validate_row_comprehensive(row_data, column_mapping, row_number)
+        for _, _, chunk_issues in self._iter_validated_chunks(
+            file_path, structure, column_mapping, chunk_size=500, sheet_name=sheet_name
+        ):
+            for row_issues in chunk_issues:
                 report.issues.extend(row_issues)
                 
                 if not any(issue.severity == 'error' for issue in row_issues):
@@ -1275,16 +1564,174 @@ class AdvancedTableProcessor:
         
         return report
     
+    def _validate_rows(
+        self,
+        rows: List[Dict[str, Any]],
+        column_mapping: Dict[str, str],
+        customer_rows: Optional[List[Dict[str, str]]] = None
+    ) -> List[List[ValidationIssue]]:
+        """Validate a chunk of rows, returning the issues of each row in order."""
+        if customer_rows is None:
+            customer_rows = [self._extract_customer_data(row_data, column_mapping) for row_data in rows]
+        return [
+            self._validate_row_comprehensive(
+                row_data, column_mapping, row_data.get('_row_number', 0), customer_data
+            )
+            for row_data, customer_data in zip(rows, customer_rows)
+        ]
+    
+    def _preresolve_domains(
+        self,
+        rows: List[Dict[str, Any]],
+        column_mapping: Dict[str, str]
+    ) -> Dict[str, DomainStatus]:
+        """Resolve the distinct email domains of a chunk concurrently before validation."""
+        email_column = column_mapping.get('email')
+        if not email_column:
+            return {}
+        return self.data_validator.preresolve_email_domains(row.get(email_column) for row in rows)
+    
+    def _start_validation_pool(self, workers: int) -> Optional[ProcessPoolExecutor]:
+        """Start a validation process pool, or return None if processes are unavailable."""
+        try:
+            return ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_validation_worker,
+                initargs=(self.data_validator.enable_domain_checking,)
+            )
+        except (OSError, ValueError, NotImplementedError) as e:
+            logger.warning(f"Parallel validation unavailable, validating serially: {e}")
+            return None
+    
+    def _iter_validated_chunks(
+        self,
+        file_path: Path,
+        structure: FileStructure,
+        column_mapping: Dict[str, str],
+        chunk_size: int = 500,
+        sheet_name: Optional[str] = None
+    ) -> Iterator[Tuple[List[Dict[str, Any]], List[Dict[str, str]], List[List[ValidationIssue]]]]:
+        """
+        Stream row chunks together with the customer fields and validation issues of each row.
+        
+        Customer fields are extracted once per row here and shared by
+        validation and loading. The email domains of each chunk are resolved
+        concurrently up front.
+        The first PARALLEL_VALIDATION_MIN_ROWS rows are validated in this
+        process; larger files hand the remaining chunks to a process pool.
+        Chunks are yielded in file order either way.
+        
+        Args:
+            file_path: Path to table file
+            structure: File structure
+            column_mapping: Column mapping configuration
+            chunk_size: Rows per chunk
+            sheet_name: Sheet name for Excel files (optional)
+            
+        Yields:
+            Tuples of (rows, per-row customer fields, per-row validation issues)
+        """
+        workers = self.validation_workers
+        executor = None
+        pending = deque()
+        rows_seen = 0
+        
+        def collect(chunk, customer_rows, future):
+            try:
+                issues = future.result()
+            except Exception as e:
+                logger.warning(f"Parallel validation failed, validating chunk serially: {e}")
+                issues = self._validate_rows(chunk, column_mapping, customer_rows)
+            return chunk, customer_rows, issues
+        
+        try:
+            for chunk in self.stream_table_rows(file_path, structure, chunk_size=chunk_size, sheet_name=sheet_name):
+                if executor is None and workers > 1 and rows_seen >= self.PARALLEL_VALIDATION_MIN_ROWS:
+                    executor = self._start_validation_pool(workers)
+                    if executor is None:
+                        workers = 1
+                rows_seen += len(chunk)
+                customer_rows = [self._extract_customer_data(row_data, column_mapping) for row_data in chunk]
+                domain_statuses = self._preresolve_domains(chunk, column_mapping)
+                
+                if executor is None:
+                    yield chunk, customer_rows, self._validate_rows(chunk, column_mapping, customer_rows)
+                    continue
+                
+                try:
+                    future = executor.submit(
+                        _validate_rows_in_worker, chunk, customer_rows, column_mapping, domain_statuses
+                    )
+                except Exception as e:
+                    # Pool is broken; finish the file serially
+                    logger.warning(f"Parallel validation stopped, continuing serially: {e}")
+                    while pending:
+                        yield collect(*pending.popleft())
+                    executor.shutdown(wait=False)
+                    executor, workers = None, 1
+                    yield chunk, customer_rows, self._validate_rows(chunk, column_mapping, customer_rows)
+                    continue
+                
+                # Keep a bounded number of chunks in flight
+                pending.append((chunk, customer_rows, future))
+                if len(pending) >= workers * 2:
+                    yield collect(*pending.popleft())
+            
+            while pending:
+                yield collect(*pending.popleft())
+        finally:
+            if executor is not None:
+                for _, _, future in pending:
+                    future.cancel()
+                executor.shutdown(wait=True)
+    
+    def _create_validation_report(self, structure: FileStructure) -> TableValidationReport:
+        """Create a validation report with encoding and format issues filled in."""
+        report = TableValidationReport(
+            total_rows=structure.total_rows, 
+            valid_rows=0,
+            file_format=structure.file_format
+        )
+        
+        # Validate encoding (for text-based formats)
+        if structure.encoding and structure.encoding.confidence == EncodingConfidence.FALLBACK:
+            report.encoding_issues.append(
+                f"Low confidence encoding detection: {structure.encoding.encoding}"
+            )
+        
+        # Format-specific validation
+        if structure.file_format in [FileFormat.EXCEL_XLSX, FileFormat.EXCEL_XLS]:
+            if not structure.sheet_names:
+                report.format_issues.append("No sheets found in Excel file")
+            elif structure.active_sheet not in structure.sheet_names:
+                report.format_issues.append(f"Sheet '{structure.active_sheet}' not found in Excel file")
+        
+        elif structure.file_format in [FileFormat.JSON, FileFormat.JSONL]:
+            # JSON-specific validation is handled during structure analysis
+            pass
+        
+        return report
+    
     # Backward compatibility alias
     def validate_csv_comprehensive(self, file_path: Path, structure: Optional[FileStructure] = None) -> TableValidationReport:
         """Backward compatibility method for CSV validation."""
         return self.validate_table_comprehensive(file_path, structure)
     
+    def _extract_customer_data(self, row_data: Dict[str, Any], column_mapping: Dict[str, str]) -> Dict[str, str]:
+        """Extract stripped customer fields from a streamed row using the column mapping."""
+        customer_data = {}
+        for field, column in column_mapping.items():
+            value = row_data.get(column, '').strip() if row_data.get(column) else ''
+            customer_data[field] = value
+        return customer_data
+    
     def _validate_row_comprehensive(
         self, 
         row_data: Dict[str, Any], 
         column_mapping: Dict[str, str],
-        row_number: int
+        row_number: int,
+        customer_data: Optional[Dict[str, str]] = None
     ) -> List[ValidationIssue]:
         """
         Comprehensive validation of a single CSV row using advanced data validator.
@@ -1293,6 +1740,7 @@ class AdvancedTableProcessor:
             row_data: Row data dictionary
             column_mapping: Column mapping configuration
             row_number: Row number for error reporting
+            customer_data: Already extracted customer fields (optional)
             
         Returns:
             List of validation issues found
@@ -1300,10 +1748,8 @@ class AdvancedTableProcessor:
         issues = []
         
         # Extract customer data using column mapping
-        customer_data = {}
-        for field, column in column_mapping.items():
-            value = row_data.get(column, '').strip() if row_data.get(column) else ''
-            customer_data[field] = value
+        if customer_data is None:
+            customer_data = self._extract_customer_data(row_data, column_mapping)
         
         # Use advanced data validator
         validation_result = self.data_validator.validate_customer_data(customer_data)
@@ -1472,11 +1918,16 @@ class AdvancedTableProcessor:
             Tuple of (valid customers, validation report)
         """
         try:
-            # Analyze file structure if not provided
+            # Analyze file structure if not provided; the validating pass
+            # counts rows itself, so only a sample is read up front
             if structure is None:
-                structure = self.analyze_file_structure(file_path, sheet_name)
+                structure = self.analyze_file_structure(
+                    file_path, sheet_name, count_rows=not validate_data
+                )
             
-            # Get column mapping
+            # Get column mapping, preferring the one last used for this file
+            if column_mapping is None:
+                column_mapping = self.get_cached_column_mapping(file_path)
             if column_mapping is None:
                 column_mapping = self._detect_intelligent_column_mapping(structure.headers)
             
@@ -1490,24 +1941,27 @@ class AdvancedTableProcessor:
                     f"Available columns: {', '.join(structure.headers)}"
                 )
             
-            # Perform comprehensive validation if requested
-            validation_report = None
             if validate_data:
-                validation_report = self.validate_table_comprehensive(file_path, structure, sheet_name)
+                # Validate rows and build customers in one streaming pass
+                customers, validation_report = self._load_customers_validated(
+                    file_path, structure, column_mapping, sheet_name
+                )
+                self._cache_structure(self._import_fingerprint(file_path), sheet_name, structure)
             else:
                 validation_report = TableValidationReport(
                     total_rows=structure.total_rows,
                     valid_rows=0,  # Will be updated during processing
                     file_format=structure.file_format
                 )
-            
-            # Load customers using appropriate method
-            if stream_processing or structure.total_rows > 5000:
-                customers = self._load_customers_streaming(file_path, structure, column_mapping, validation_report, sheet_name)
-            else:
-                customers = self._load_customers_batch(file_path, structure, column_mapping, validation_report, sheet_name)
+                
+                # Load customers using appropriate method
+                if stream_processing or structure.total_rows > 5000:
+                    customers = self._load_customers_streaming(file_path, structure, column_mapping, validation_report, sheet_name)
+                else:
+                    customers = self._load_customers_batch(file_path, structure, column_mapping, validation_report, sheet_name)
             
             validation_report.valid_rows = len(customers)
+            self.remember_column_mapping(file_path, column_mapping)
             
             logger.info(f"Loaded {len(customers)} customers from {structure.total_rows} rows "
                        f"({validation_report.success_rate:.1f}% success rate)")
@@ -1518,6 +1972,61 @@ class AdvancedTableProcessor:
             logger.error(f"Advanced customer loading failed: {e}")
             raise CSVProcessingError(f"Failed to load customers: {e}")
     
+    def _load_customers_validated(
+        self,
+        file_path: Path,
+        structure: FileStructure,
+        column_mapping: Dict[str, str],
+        sheet_name: Optional[str] = None
+    ) -> Tuple[List[Customer], TableValidationReport]:
+        """
+        Validate rows and build customers in a single streaming pass.
+        
+        Produces the same report as validate_table_comprehensive, but counts
+        rows while streaming instead of reading the file once per stage.
+        
+        Args:
+            file_path: Path to table file
+            structure: File structure (rows may be uncounted)
+            column_mapping: Column mapping used for validation and loading
+            sheet_name: Sheet name for Excel files (optional)
+            
+        Returns:
+            Tuple of (customers, validation report)
+        """
+        report = self._create_validation_report(structure)
+        customers = []
+        
+        if not structure.headers:
+            report.structure_issues.append("No columns detected in CSV file")
+            return customers, report
+        
+        total_rows = 0
+        for chunk, customer_rows, chunk_issues in self._iter_validated_chunks(
+            file_path, structure, column_mapping, chunk_size=1000, sheet_name=sheet_name
+        ):
+            for row_data, customer_data, row_issues in zip(chunk, customer_rows, chunk_issues):
+                total_rows += 1
+                row_number = row_data.get('_row_number', 0)
+                report.issues.extend(row_issues)
+                
+                try:
+                    customers.append(Customer.from_dict(customer_data))
+                except ValidationError as e:
+                    # Validation errors are already captured in the report
+                    logger.debug(f"Skipping invalid customer at row {row_number}: {e}")
+                except Exception as e:
+                    logger.warning(f"Unexpected error processing row {row_number}: {e}")
+        
+        structure.total_rows = total_rows
+        structure.rows_counted = True
+        report.total_rows = total_rows
+        
+        if total_rows == 0:
+            report.structure_issues.append("CSV file contains no data rows")
+        
+        return customers, report
+    
     def _load_customers_streaming(
         self, 
         file_path: Path, 
@@ -1533,10 +2042,7 @@ class AdvancedTableProcessor:
             for row_data in chunk:
                 try:
                     # Extract customer data
-                    customer_data = {}
-                    for field, column in column_mapping.items():
-                        value = row_data.get(column, '').strip() if row_data.get(column) else ''
-                        customer_data[field] = value
+                    customer_data = self._extract_customer_data(row_data, column_mapping)
                     
                     # Create customer
                     customer = Customer.from_dict(customer_data)
@@ -1561,8 +2067,6 @@ class AdvancedTableProcessor:
         sheet_name: Optional[str] = None
     ) -> List[Customer]:
         """Load customers using batch approach for smaller files."""
-        customers = []
-        
         try:
             # Read file based on format
             if structure.file_format in [FileFormat.EXCEL_XLSX, FileFormat.EXCEL_XLS]:
@@ -1588,34 +2092,9 @@ class AdvancedTableProcessor:
             # Remove completely empty rows
             df = df.dropna(how='all')
             
-            for index, row in df.iterrows():
-                try:
-                    # Extract customer data using column mapping
-                    customer_data = {}
-                    for field, column in column_mapping.items():
-                        if column in row:
-                            value = row[column]
-                            # Handle NaN values
-                            if pd.isna(value):
-                                customer_data[field] = ""
-                            else:
-                                customer_data[field] = str(value).strip()
-                        else:
-                            customer_data[field] = ""
-                    
-                    # Create and validate customer
-                    customer = Customer.from_dict(customer_data)
-                    customers.append(customer)
-                    
-                except ValidationError as e:
-                    # Validation errors are already captured in comprehensive validation
-                    logger.debug(f"Skipping invalid customer at row {index + 2}: {e}")
-                    continue
-                except Exception as e:
-                    logger.warning(f"Unexpected error processing row {index + 2}: {e}")
-                    continue
-            
-            return customers
+            # Normalize whole columns instead of building customers row by row
+            frame = normalize_customer_frame(df, column_mapping)
+            return frame_to_customers(frame)
             
         except Exception as e:
             logger.error(f"Batch customer loading failed: {e}")
@@ -0,0 +1,210 @@
+"""
+Columnar customer normalization and validation for pandas DataFrames.
+
+Applies the same cleaning and validation rules as the Customer model to whole
+columns at once, so large imports avoid per-row iteration and per-row regex
+calls. Customer objects are only materialized for the rows that are needed.
+"""
+
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .models import Customer
+
+
+CUSTOMER_FIELDS = ("name", "company", "phone", "email")
+
+# Patterns mirror Customer._format_phone_number, _is_valid_email and _is_valid_phone
+_PHONE_STRIP_PATTERN = r'[^\d+]'
+_PHONE_VALIDATION_STRIP_PATTERN = r'[\s\-\(\)\+]'
+_EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+_DIGITS_PATTERN = r'\d+'
+
+
+def _text_column(df: pd.DataFrame, column: Optional[str]) -> pd.Series:
+    """Return a column as stripped strings, with missing columns and NaN as ''."""
+    if column is None or column not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+
+    values = df[column]
+    return values.where(values.notna(), "").astype(str).str.strip()
+
+
+def extract_customer_columns(
+    df: pd.DataFrame,
+    column_mapping: Optional[Dict[str, str]] = None
+) -> pd.DataFrame:
+    """
+    Extract customer fields from a DataFrame as stripped strings.
+
+    Args:
+        df: Source DataFrame
+        column_mapping: Mapping of customer field to source column; defaults to
+            columns named after the fields
+
+    Returns:
+        DataFrame with name, company, phone and email columns
+    """
+    if column_mapping is None:
+        column_mapping = {field: field for field in CUSTOMER_FIELDS}
+
+    return pd.DataFrame(
+        {field: _text_column(df, column_mapping.get(field)) for field in CUSTOMER_FIELDS},
+        index=df.index
+    )
+
+
+def format_phone_numbers(phones: pd.Series) -> pd.Series:
+    """
+    Format a column of phone numbers like Customer._format_phone_number.
+
+    Args:
+        phones: Stripped phone strings
+
+    Returns:
+        Formatted phone strings
+    """
+    cleaned = phones.str.replace(_PHONE_STRIP_PATTERN, '', regex=True)
+    lengths = cleaned.str.len()
+    needs_prefix = (cleaned != '') & ~cleaned.str.startswith('+') & cleaned.str.fullmatch(_DIGITS_PATTERN)
+
+    formatted = cleaned.mask(needs_prefix & (lengths == 10), '+1' + cleaned)
+    return formatted.mask(needs_prefix & (lengths > 10), '+' + cleaned)
+
+
+def normalize_customer_frame(
+    df: pd.DataFrame,
+    column_mapping: Optional[Dict[str, str]] = None
+) -> pd.DataFrame:
+    """
+    Normalize customer fields for a whole DataFrame.
+
+    Produces the same values Customer.__post_init__ would for each row.
+
+    Args:
+        df: Source DataFrame
+        column_mapping: Mapping of customer field to source column
+
+    Returns:
+        DataFrame with normalized name, company, phone and email columns
+    """
+    frame = extract_customer_columns(df, column_mapping)
+    return normalize_extracted_columns(frame)
+
+
+def normalize_extracted_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize a frame returned by extract_customer_columns.
+
+    Args:
+        frame: Stripped customer columns
+
+    Returns:
+        New DataFrame with formatted phones and lowercase emails
+    """
+    normalized = frame.copy()
+    normalized["phone"] = format_phone_numbers(frame["phone"])
+    normalized["email"] = frame["email"].str.lower()
+    return normalized
+
+
+def valid_email_mask(emails: pd.Series) -> pd.Series:
+    """Return a boolean mask of emails matching Customer._is_valid_email."""
+    return emails.str.match(_EMAIL_PATTERN).fillna(False).astype(bool)
+
+
+def valid_phone_mask(phones: pd.Series) -> pd.Series:
+    """Return a boolean mask of phones matching Customer._is_valid_phone."""
+    cleaned = phones.str.replace(_PHONE_VALIDATION_STRIP_PATTERN, '', regex=True)
+    lengths = cleaned.str.len()
+    is_digits = cleaned.str.fullmatch(_DIGITS_PATTERN).fillna(False).astype(bool)
+    return is_digits & (lengths >= 8) & (lengths <= 15)
+
+
+def customer_frame_errors(
+    frame: pd.DataFrame,
+    required_fields: Optional[List[str]] = None
+) -> pd.Series:
+    """
+    Validate normalized customers column by column.
+
+    Applies the rules of Customer.validate to every row at once.
+
+    Args:
+        frame: Normalized customer columns
+        required_fields: List of required field names. If None, uses default validation.
+
+    Returns:
+        Series of error messages, '' for valid rows; messages match the text
+        of the ValidationError raised by Customer.validate
+    """
+    if required_fields is None:
+        required_fields = ["name", "email", "phone", "company"]
+
+    names, companies = frame["name"], frame["company"]
+    emails, phones = frame["email"], frame["phone"]
+    has_email, has_phone = emails != "", phones != ""
+
+    checks = [
+        (names == "", "Name is required"),
+        ((names != "") & (names.str.len() < 2), "Name must be at least 2 characters long"),
+    ]
+
+    if "company" in required_fields:
+        checks.append((companies == "", "Company is required"))
+
+    if "email" in required_fields:
+        checks.append((~has_email, "Email is required"))
+    checks.append((has_email & ~valid_email_mask(emails), "Invalid email format"))
+
+    if "phone" in required_fields:
+        checks.append((~has_phone, "Phone is required"))
+    checks.append((has_phone & ~valid_phone_mask(phones), "Invalid phone format"))
+
+    if "email" not in required_fields and "phone" not in required_fields:
+        checks.append((~has_email & ~has_phone, "Either email or phone is required for messaging"))
+
+    errors = pd.Series("", index=frame.index, dtype=object)
+    invalid = pd.Series(False, index=frame.index)
+    for mask, _ in checks:
+        invalid |= mask
+
+    if not invalid.any():
+        return errors
+
+    # Only rows with at least one failure need their messages assembled
+    failed = pd.DataFrame({message: mask[invalid] for mask, message in checks})
+    messages = [
+        "Customer validation failed: " + "; ".join(
+            message for message, failed_check in zip(failed.columns, row) if failed_check
+        )
+        for row in failed.itertuples(index=False, name=None)
+    ]
+    errors[invalid] = messages
+    return errors
+
+
+def frame_to_customers(
+    frame: pd.DataFrame,
+    mask: Optional[pd.Series] = None
+) -> List[Customer]:
+    """
+    Materialize Customer objects from normalized columns.
+
+    Args:
+        frame: Normalized customer columns
+        mask: Optional boolean mask selecting the rows to materialize
+
+    Returns:
+        List of customers in frame order
+    """
+    if mask is not None:
+        frame = frame[mask]
+
+    return [
+        Customer.from_normalized(name, company, phone, email)
+        for name, company, phone, email in zip(
+            frame["name"], frame["company"], frame["phone"], frame["email"]
+        )
+    ]
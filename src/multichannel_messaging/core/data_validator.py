@@ -2,15 +2,26 @@
 Advanced data validation framework with comprehensive email, phone, and business rule validation.
 """
 
+import atexit
+import json
+import multiprocessing
+import os
 import re
 import socket
-from typing import Dict, List, Optional, Tuple, Any, Set
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Any, Set
 from dataclasses import dataclass, field
 from enum import Enum
 from urllib.parse import urlparse
 
 from ..utils.logger import get_logger
 from ..utils.exceptions import CSVProcessingError
+from ..utils.platform_utils import get_app_data_dir
 
 logger = get_logger(__name__)
 
@@ -55,6 +66,13 @@ class ValidationCategory(Enum):
     CONSISTENCY = "consistency"
 
 
+class DomainStatus(Enum):
+    """Outcome of resolving an email domain."""
+    VALID = "valid"
+    NOT_FOUND = "not_found"  # DNS reports the domain or its MX record missing
+    UNRESOLVABLE = "unresolvable"  # Host lookup failed without DNS support
+
+
 @dataclass
 class ValidationIssue:
     """Individual validation issue with detailed information."""
@@ -109,11 +127,246 @@ class ValidationResult:
         }
 
 
+# Resolver signature: returns None when the lookup failed transiently
+DomainResolver = Callable[[str], Optional[DomainStatus]]
+
+
+def resolve_domain(domain: str) -> Optional[DomainStatus]:
+    """
+    Resolve an email domain using DNS MX lookup, or a host lookup without DNS support.
+    
+    Args:
+        domain: Domain to resolve
+        
+    Returns:
+        Domain status, or None if the lookup failed transiently
+    """
+    if DNS_AVAILABLE:
+        try:
+            dns.resolver.resolve(domain, 'MX')
+            return DomainStatus.VALID
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return DomainStatus.NOT_FOUND
+        except Exception as e:
+            logger.debug(f"DNS validation failed for {domain}: {e}")
+            return None
+    
+    try:
+        socket.gethostbyname(domain)
+        return DomainStatus.VALID
+    except socket.gaierror as e:
+        if e.errno == getattr(socket, 'EAI_AGAIN', None):
+            logger.debug(f"Temporary failure resolving {domain}: {e}")
+            return None
+        return DomainStatus.UNRESOLVABLE
+
+
+class DomainCache:
+    """
+    Thread-safe domain resolution cache with TTL expiry, LRU eviction and
+    optional JSON persistence.
+    """
+    
+    CACHE_VERSION = 1
+    
+    def __init__(
+        self,
+        cache_file: Optional[Path] = None,
+        ttl_seconds: float = 24 * 3600,
+        max_entries: int = 10000,
+        save_interval: float = 5.0
+    ):
+        """
+        Initialize domain cache.
+        
+        Args:
+            cache_file: JSON file to load from and save to (None keeps the cache in memory)
+            ttl_seconds: Seconds a resolution result stays valid
+            max_entries: Maximum number of domains kept; least recently used are evicted
+            save_interval: Minimum seconds between automatic saves
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.save_interval = save_interval
+        self._entries: "OrderedDict[str, Tuple[DomainStatus, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+        
+        if self.cache_file:
+            self.load()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def get(self, domain: str) -> Optional[DomainStatus]:
+        """Return the cached status of a domain, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry is None:
+                return None
+            
+            status, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[domain]
+                self._dirty = True
+                return None
+            
+            self._entries.move_to_end(domain)
+            return status
+    
+    def set(self, domain: str, status: DomainStatus) -> None:
+        """Cache the status of a domain."""
+        self.update({domain: status})
+    
+    def update(self, statuses: Dict[str, DomainStatus]) -> None:
+        """Cache the statuses of several domains."""
+        if not statuses:
+            return
+        
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            for domain, status in statuses.items():
+                self._entries[domain] = (status, expires_at)
+                self._entries.move_to_end(domain)
+            
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            
+            self._dirty = True
+    
+    def clear(self) -> None:
+        """Remove all cached domains."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+    
+    def load(self) -> int:
+        """
+        Load unexpired entries from the cache file.
+        
+        Returns:
+            Number of entries loaded
+        """
+        if not self.cache_file or not self.cache_file.exists():
+            return 0
+        
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            if data.get('version') != self.CACHE_VERSION:
+                return 0
+            
+            now = time.time()
+            loaded = [
+                (domain, (DomainStatus(status), expires_at))
+                for domain, (status, expires_at) in data.get('entries', {}).items()
+                if expires_at > now
+            ]
+        except Exception as e:
+            logger.warning(f"Failed to load domain cache from {self.cache_file}: {e}")
+            return 0
+        
+        with self._lock:
+            for domain, entry in loaded[-self.max_entries:]:
+                self._entries[domain] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        
+        return len(loaded)
+    
+    def save(self, force: bool = False) -> bool:
+        """
+        Write the cache file if entries changed.
+        
+        Args:
+            force: Save even if the save interval has not elapsed
+            
+        Returns:
+            True if the file was written
+        """
+        if not self.cache_file:
+            return False
+        
+        with self._lock:
+            if not self._dirty:
+                return False
+            if not force and time.time() - self._last_save < self.save_interval:
+                return False
+            
+            data = {
+                'version': self.CACHE_VERSION,
+                'entries': {
+                    domain: [status.value, expires_at]
+                    for domain, (status, expires_at) in self._entries.items()
+                }
+            }
+            self._dirty = False
+            self._last_save = time.time()
+        
+        temp_path = None
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # A temporary file of its own, so concurrent savers never interleave writes
+            with tempfile.NamedTemporaryFile(
+                'w', dir=self.cache_file.parent, prefix=self.cache_file.name,
+                suffix='.tmp', delete=False, encoding='utf-8'
+            ) as f:
+                temp_path = f.name
+                json.dump(data, f)
+            os.replace(temp_path, self.cache_file)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to save domain cache to {self.cache_file}: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
+            with self._lock:
+                self._dirty = True
+            return False
+
+
+_domain_cache: Optional[DomainCache] = None
+_domain_cache_lock = threading.Lock()
+
+
+def get_domain_cache() -> DomainCache:
+    """Get the process-wide domain cache, persisted in the application data directory."""
+    global _domain_cache
+    with _domain_cache_lock:
+        if _domain_cache is None:
+            try:
+                cache_file = get_app_data_dir() / "cache" / "domain_cache.json"
+            except Exception as e:
+                logger.warning(f"Domain cache will not be persisted: {e}")
+                cache_file = None
+            _domain_cache = DomainCache(cache_file)
+            # Child processes must not overwrite the file on exit
+            if multiprocessing.parent_process() is None:
+                atexit.register(_domain_cache.save, True)
+        return _domain_cache
+
+
 class EmailValidator:
     """Advanced email validation with domain checking and suggestions."""
     
-    def __init__(self):
-        """Initialize email validator."""
+    # Bounded parallelism for domain pre-resolution
+    MAX_RESOLVER_WORKERS = 16
+    
+    def __init__(
+        self,
+        domain_cache: Optional[DomainCache] = None,
+        resolver: Optional[DomainResolver] = None
+    ):
+        """
+        Initialize email validator.
+        
+        Args:
+            domain_cache: Domain resolution cache (defaults to the shared process-wide cache)
+            resolver: Domain lookup function (defaults to resolve_domain)
+        """
         # Common email domain typos and their corrections
         self.domain_corrections = {
             'gmail.co': 'gmail.com',
@@ -130,7 +383,8 @@ class EmailValidator:
         }
         
         # Cache for domain validation results
-        self._domain_cache: Dict[str, bool] = {}
+        self.domain_cache = domain_cache if domain_cache is not None else get_domain_cache()
+        self.resolver = resolver or resolve_domain
     
     def validate_email(self, email: str, check_domain: bool = True) -> List[ValidationIssue]:
         """
@@ -250,19 +504,6 @@ class EmailValidator:
         try:
             domain = email.split('@')[1]
             
-            # Check cache first
-            if domain in self._domain_cache:
-                if not self._domain_cache[domain]:
-                    issues.append(ValidationIssue(
-                        field='email',
-                        value=email,
-                        severity=ValidationSeverity.ERROR,
-                        category=ValidationCategory.DOMAIN,
-                        message=f"Email domain does not exist: {domain}",
-                        rule_name='email_domain_exists'
-                    ))
-                return issues
-            
             # Check for common typos first
             corrected_domain = self.domain_corrections.get(domain)
             if corrected_domain:
@@ -276,58 +517,82 @@ class EmailValidator:
                     rule_name='email_domain_typo'
                 ))
             
-            # DNS validation (if available)
-            if DNS_AVAILABLE:
-                try:
-                    # Check MX record
-                    mx_records = dns.resolver.resolve(domain, 'MX')
-                    if not mx_records:
-                        issues.append(ValidationIssue(
-                            field='email',
-                            value=email,
-                            severity=ValidationSeverity.WARNING,
-                            category=ValidationCategory.DOMAIN,
-                            message=f"No MX record found for domain: {domain}",
-                            rule_name='email_domain_mx'
-                        ))
-                    
-                    self._domain_cache[domain] = True
-                    
-                except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
-                    issues.append(ValidationIssue(
-                        field='email',
-                        value=email,
-                        severity=ValidationSeverity.ERROR,
-                        category=ValidationCategory.DOMAIN,
-                        message=f"Email domain does not exist: {domain}",
-                        rule_name='email_domain_exists'
-                    ))
-                    self._domain_cache[domain] = False
-                    
-                except Exception as e:
-                    logger.debug(f"DNS validation failed for {domain}: {e}")
-                    # Don't add error for DNS lookup failures, just log
-            else:
-                # Fallback: basic socket-based domain check
-                try:
-                    socket.gethostbyname(domain)
-                    self._domain_cache[domain] = True
-                except socket.gaierror:
-                    issues.append(ValidationIssue(
-                        field='email',
-                        value=email,
-                        severity=ValidationSeverity.WARNING,
-                        category=ValidationCategory.DOMAIN,
-                        message=f"Cannot resolve domain: {domain}",
-                        rule_name='email_domain_resolve'
-                    ))
-                    self._domain_cache[domain] = False
+            # Check cache first
+            status = self.domain_cache.get(domain)
+            if status is None:
+                status = self._resolve_domain(domain)
+            
+            if status == DomainStatus.NOT_FOUND:
+                issues.append(ValidationIssue(
+                    field='email',
+                    value=email,
+                    severity=ValidationSeverity.ERROR,
+                    category=ValidationCategory.DOMAIN,
+                    message=f"Email domain does not exist: {domain}",
+                    rule_name='email_domain_exists'
+                ))
+            elif status == DomainStatus.UNRESOLVABLE:
+                issues.append(ValidationIssue(
+                    field='email',
+                    value=email,
+                    severity=ValidationSeverity.WARNING,
+                    category=ValidationCategory.DOMAIN,
+                    message=f"Cannot resolve domain: {domain}",
+                    rule_name='email_domain_resolve'
+                ))
                 
         except Exception as e:
             logger.warning(f"Domain validation failed for {email}: {e}")
         
         return issues
     
+    def _resolve_domain(self, domain: str) -> Optional[DomainStatus]:
+        """Resolve a domain with the configured resolver and cache the result."""
+        try:
+            status = self.resolver(domain)
+        except Exception as e:
+            logger.debug(f"Domain lookup failed for {domain}: {e}")
+            return None
+        
+        if status is not None:
+            self.domain_cache.set(domain, status)
+        return status
+    
+    def resolve_domains(
+        self,
+        domains: Iterable[str],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, DomainStatus]:
+        """
+        Resolve distinct domains concurrently, skipping those already cached.
+        
+        Args:
+            domains: Domains to resolve
+            max_workers: Maximum concurrent lookups (defaults to MAX_RESOLVER_WORKERS)
+            
+        Returns:
+            Known statuses of the requested domains
+        """
+        statuses = {}
+        pending = []
+        for domain in set(domains):
+            status = self.domain_cache.get(domain)
+            if status is None:
+                pending.append(domain)
+            else:
+                statuses[domain] = status
+        
+        if pending:
+            workers = min(max_workers or self.MAX_RESOLVER_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for domain, status in zip(pending, executor.map(self._resolve_domain, pending)):
+                    if status is not None:
+                        statuses[domain] = status
+            
+            self.domain_cache.save()
+        
+        return statuses
+    
     def _validate_email_business_rules(self, email: str) -> List[ValidationIssue]:
         """Apply business rules for email validation."""
         issues = []
@@ -827,18 +1092,46 @@ class AdvancedDataValidator:
     Comprehensive data validation framework combining all validators.
     """
     
-    def __init__(self, enable_domain_checking: bool = True):
+    def __init__(
+        self,
+        enable_domain_checking: bool = True,
+        domain_resolver: Optional[DomainResolver] = None,
+        domain_cache: Optional[DomainCache] = None
+    ):
         """
         Initialize the advanced data validator.
         
         Args:
             enable_domain_checking: Whether to enable DNS domain checking
+            domain_resolver: Domain lookup function (defaults to resolve_domain)
+            domain_cache: Domain resolution cache (defaults to the shared process-wide cache)
         """
-        self.email_validator = EmailValidator()
+        self.email_validator = EmailValidator(domain_cache=domain_cache, resolver=domain_resolver)
         self.phone_validator = PhoneValidator()
         self.business_validator = BusinessRuleValidator()
         self.enable_domain_checking = enable_domain_checking
     
+    def preresolve_email_domains(self, emails: Iterable[str]) -> Dict[str, DomainStatus]:
+        """
+        Resolve the distinct domains of a batch of emails before validating them.
+        
+        Args:
+            emails: Email addresses
+            
+        Returns:
+            Known statuses of the domains (empty when domain checking is disabled)
+        """
+        if not self.enable_domain_checking:
+            return {}
+        
+        domains = set()
+        for email in emails:
+            email = str(email or '').strip().lower()
+            if not self.email_validator._validate_email_format(email):
+                domains.add(email.split('@', 1)[1])
+        
+        return self.email_validator.resolve_domains(domains)
+    
     def validate_customer_data(self, customer_data: Dict[str, Any]) -> ValidationResult:
         """
         Comprehensive validation of customer data.
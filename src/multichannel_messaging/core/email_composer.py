@@ -6,6 +6,7 @@ import html
 import re
 import tempfile
 import os
+from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -276,36 +277,18 @@ class EmailComposer:
         Returns:
             Dictionary with rendered content
         """
-        # Start with standard template rendering
-        rendered = template.render(customer)
-        
-        # Add custom variables if provided
-        if custom_variables:
-            subject = rendered.get('subject', '')
-            content = rendered.get('content', '')
-            
-            for key, value in custom_variables.items():
-                placeholder = f"{{{key}}}"
-                subject = subject.replace(placeholder, value)
-                content = content.replace(placeholder, value)
-            
-            rendered['subject'] = subject
-            rendered['content'] = content
-        
-        # Add system variables
-        import datetime
-        system_vars = {
-            'current_date': datetime.datetime.now().strftime('%Y-%m-%d'),
-            'current_time': datetime.datetime.now().strftime('%H:%M'),
-            'current_year': str(datetime.datetime.now().year)
+        # Custom variables take precedence over system variables, and customer
+        # data over both; all are filled in the same rendering pass
+        now = datetime.now()
+        extra_variables = {
+            'current_date': now.strftime('%Y-%m-%d'),
+            'current_time': now.strftime('%H:%M'),
+            'current_year': str(now.year)
         }
+        if custom_variables:
+            extra_variables.update(custom_variables)
         
-        for key, value in system_vars.items():
-            placeholder = f"{{{key}}}"
-            rendered['subject'] = rendered.get('subject', '').replace(placeholder, value)
-            rendered['content'] = rendered.get('content', '').replace(placeholder, value)
-        
-        return rendered
+        return template.render(customer, extra_variables)
     
     def _convert_to_html(self, plain_text: str, template_style: str = 'simple') -> str:
         """
@@ -0,0 +1,194 @@
+"""
+Persistent cache of analyzed import files.
+
+Detecting the format, encoding, delimiter, header and row count of an import
+file is repeated every time the same file is opened. The cache keeps that
+analysis, the column mapping chosen for the file and row offsets for seeking
+on disk, keyed by a fingerprint of the file content. Only structural fields
+are stored; no row contents are written to the cache.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..utils.logger import get_logger
+from ..utils.platform_utils import get_app_data_dir
+
+logger = get_logger(__name__)
+
+
+class ImportCache:
+    """
+    Thread-safe on-disk cache of import file analysis keyed by content fingerprint.
+    
+    Each entry is a JSON file named after the fingerprint of the analyzed file.
+    Entries beyond max_entries are removed, least recently used first.
+    """
+    
+    # Version 1 entries included sample rows and are removed when found
+    CACHE_VERSION = 2
+    
+    # Bytes hashed at the start and at the end of a file
+    FINGERPRINT_BLOCK_SIZE = 64 * 1024
+    
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = 100):
+        """
+        Initialize import cache.
+        
+        Args:
+            cache_dir: Directory holding the entry files (None keeps the cache in memory)
+            max_entries: Maximum number of files kept
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def fingerprint(cls, file_path: Path) -> str:
+        """
+        Fingerprint a file by size, modification time and hashes of its first and last blocks.
+        
+        Args:
+            file_path: File to fingerprint
+        
+        Returns:
+            Hex digest identifying the file content
+        """
+        stat = file_path.stat()
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode('ascii'))
+        with open(file_path, 'rb') as f:
+            digest.update(f.read(cls.FINGERPRINT_BLOCK_SIZE))
+            if stat.st_size > cls.FINGERPRINT_BLOCK_SIZE:
+                f.seek(max(cls.FINGERPRINT_BLOCK_SIZE, stat.st_size - cls.FINGERPRINT_BLOCK_SIZE))
+                digest.update(f.read(cls.FINGERPRINT_BLOCK_SIZE))
+        return digest.hexdigest()
+    
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the entry for a fingerprint, or None if not cached."""
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                entry = self._load(fingerprint)
+                if entry is None:
+                    return None
+                self._entries[fingerprint] = entry
+            else:
+                self._touch(fingerprint)
+            return copy.deepcopy(entry)
+    
+    def update(self, fingerprint: str, **fields: Any) -> None:
+        """
+        Add fields to the entry for a fingerprint and write it.
+        
+        Args:
+            fingerprint: File fingerprint
+            **fields: JSON-serializable entry fields
+        """
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                entry = self._load(fingerprint) or {}
+            entry = {**entry, **copy.deepcopy(fields)}
+            self._entries[fingerprint] = entry
+            self._save(fingerprint, entry)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            if self.cache_dir and self.cache_dir.exists():
+                for entry_file in self.cache_dir.glob("*.json"):
+                    try:
+                        entry_file.unlink()
+                    except OSError as e:
+                        logger.warning(f"Failed to remove import cache entry {entry_file}: {e}")
+    
+    def _entry_file(self, fingerprint: str) -> Path:
+        return self.cache_dir / f"{fingerprint}.json"
+    
+    def _load(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        if not self.cache_dir:
+            return None
+        
+        entry_file = self._entry_file(fingerprint)
+        try:
+            with open(entry_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load import cache entry {entry_file}: {e}")
+            return None
+        
+        if data.get('version') != self.CACHE_VERSION:
+            try:
+                entry_file.unlink()
+            except OSError:
+                pass
+            return None
+        self._touch(fingerprint)
+        return data.get('entry', {})
+    
+    def _touch(self, fingerprint: str) -> None:
+        """Mark an entry file as recently used."""
+        if self.cache_dir:
+            try:
+                os.utime(self._entry_file(fingerprint))
+            except OSError:
+                pass
+    
+    def _save(self, fingerprint: str, entry: Dict[str, Any]) -> None:
+        if not self.cache_dir:
+            if len(self._entries) > self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry_file = self._entry_file(fingerprint)
+            temp_file = entry_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.CACHE_VERSION, 'entry': entry}, f, ensure_ascii=False)
+            temp_file.replace(entry_file)
+            self._evict()
+        except Exception as e:
+            logger.warning(f"Failed to save import cache entry for {fingerprint}: {e}")
+    
+    def _evict(self) -> None:
+        """Remove the least recently used entry files beyond max_entries."""
+        entry_files = list(self.cache_dir.glob("*.json"))
+        if len(entry_files) <= self.max_entries:
+            return
+        
+        entry_files.sort(key=lambda path: path.stat().st_mtime)
+        for entry_file in entry_files[:len(entry_files) - self.max_entries]:
+            self._entries.pop(entry_file.stem, None)
+            try:
+                entry_file.unlink()
+            except OSError as e:
+                logger.warning(f"Failed to remove import cache entry {entry_file}: {e}")
+
+
+_import_cache: Optional[ImportCache] = None
+_import_cache_lock = threading.Lock()
+
+
+def get_import_cache() -> ImportCache:
+    """Get the process-wide import cache, persisted in the application data directory."""
+    global _import_cache
+    with _import_cache_lock:
+        if _import_cache is None:
+            try:
+                cache_dir = get_app_data_dir() / "cache" / "imports"
+            except Exception as e:
+                logger.warning(f"Import cache will not be persisted: {e}")
+                cache_dir = None
+            _import_cache = ImportCache(cache_dir)
+        return _import_cache
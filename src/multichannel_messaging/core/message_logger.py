@@ -3,7 +3,9 @@ Message logging and analytics system for tracking user messaging activity.
 Provides comprehensive logging, analytics, and user control over sent messages.
 """
 
+import itertools
 import json
+import queue
 import sqlite3
 import threading
 import time
@@ -149,15 +151,87 @@ class MessageLogger:
     - Automatic error recovery
     - Connection pooling
     - Comprehensive logging of all operations
+    - Optional buffered (group-commit) write pipeline
     """
 
-    def __init__(self, db_path: Optional[str] = None, user_id: str = "default_user"):
+    # Statements used by the buffered writer; each queued write maps to one
+    # of these so consecutive writes of the same kind can go to executemany.
+    _BUFFERED_SQL = {
+        "message": """
+            INSERT INTO message_logs (
+                id, timestamp, user_id, session_id, channel, template_id, template_name,
+                recipient_email, recipient_name, recipient_phone, recipient_company,
+                message_status, message_id, delivery_status, error_message,
+                sent_at, delivered_at, read_at, response_received, content_preview, metadata
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        "status": """
+            UPDATE message_logs
+            SET message_status = ?,
+                message_id = COALESCE(?, message_id),
+                delivery_status = COALESCE(?, delivery_status),
+                error_message = COALESCE(?, error_message),
+                sent_at = COALESCE(?, sent_at),
+                delivered_at = COALESCE(?, delivered_at),
+                read_at = COALESCE(?, read_at)
+            WHERE id = ?
+        """,
+        "system": """
+            INSERT INTO system_logs (id, timestamp, level, component, message, details, user_id, session_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+    }
+
+    # Session counter columns, in the order used for counter deltas
+    _SESSION_COUNTERS = (
+        "total_messages",
+        "successful_messages",
+        "failed_messages",
+        "pending_messages",
+        "cancelled_messages",
+    )
+
+    # Message status -> index of the session counter it is counted in
+    _STATUS_COUNTER_INDEX = {
+        MessageStatus.SENT.value: 1,
+        MessageStatus.FAILED.value: 2,
+        MessageStatus.PENDING.value: 3,
+        MessageStatus.CANCELLED.value: 4,
+    }
+
+    # Applies a counter delta in place; SET expressions see the old row values
+    _SESSION_DELTA_SQL = """
+        UPDATE session_summaries
+        SET total_messages = total_messages + ?,
+            successful_messages = successful_messages + ?,
+            failed_messages = failed_messages + ?,
+            pending_messages = pending_messages + ?,
+            cancelled_messages = cancelled_messages + ?,
+            success_rate = CASE WHEN total_messages + ? > 0
+                THEN (successful_messages + ?) * 100.0 / (total_messages + ?)
+                ELSE 0.0 END
+        WHERE session_id = ?
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        user_id: str = "default_user",
+        buffered: bool = False,
+        batch_size: int = 500,
+        flush_interval_ms: int = 200,
+    ):
         """
         Initialize the message logger.
 
         Args:
             db_path: Path to SQLite database file
             user_id: Unique identifier for the user
+            buffered: Queue writes and commit them in batches from a
+                background writer thread instead of one commit per write
+            batch_size: Maximum number of queued writes per transaction
+            flush_interval_ms: Maximum time a queued write waits before
+                being committed
         """
         self.user_id = user_id
         self.logger = logging.getLogger(__name__)
@@ -165,10 +239,31 @@ class MessageLogger:
         # Thread safety
         self._lock = threading.RLock()
 
+        # Buffered write pipeline (started once the database is available)
+        self._buffered = buffered
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = max(1, flush_interval_ms) / 1000.0
+        self._write_queue: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stats = {"batches": 0, "rows": 0, "failed_rows": 0}
+        # Failed rows already reported by flush()
+        self._reported_failed_rows = 0
+
+        # Last known (session_id, status) of messages logged by this instance,
+        # used to turn status transitions into session counter deltas
+        self._message_states: Dict[str, Tuple[str, str]] = {}
+        self._states_lock = threading.Lock()
+
         # Connection settings
         self._max_retries = 3
         self._retry_delay = 0.1  # seconds
         self._connection_timeout = 30  # seconds
+        self._statement_cache_size = 256
+
+        # Connection pool: one serialized writer, one read-only connection per thread
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._reader_conns: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._thread_local = threading.local()
 
         # Set up database with Windows-safe path handling
         if db_path is None:
@@ -200,6 +295,13 @@ class MessageLogger:
         self._operation_count = 0
         self._last_maintenance = datetime.now()
 
+        # Sessions left open by a crash may have counters missing their last deltas
+        if self._is_database_available():
+            self.reconcile_session_stats(open_only=True)
+
+        if self._buffered and self._is_database_available():
+            self._start_writer()
+
     def _is_database_available(self) -> bool:
         """Check if database is available for operations."""
         return getattr(self, "_database_available", False)
@@ -236,86 +338,176 @@ class MessageLogger:
                         "Message logging will be disabled due to database initialization failure"
                     )
 
-    @contextmanager
-    def _get_connection(self, retries: int = None):
+    def _open_connection(self, read_only: bool = False) -> sqlite3.Connection:
         """
-        Get a database connection with automatic retry and error handling.
+        Open and configure a long-lived database connection.
+
+        Pragmas are applied once here rather than on every operation.
 
         Args:
-            retries: Number of retries (defaults to self._max_retries)
+            read_only: Open the database in read-only mode for queries
 
-        Yields:
-            sqlite3.Connection: Database connection
+        Returns:
+            sqlite3.Connection: Configured connection
         """
-        if retries is None:
-            retries = self._max_retries
-
-        conn = None
-        for attempt in range(retries):
+        if read_only:
             try:
-                # Ensure database is available
-                if not self._is_database_available():
-                    raise sqlite3.Error("Database not available")
-
-                # Create connection with timeout
+                conn = sqlite3.connect(
+                    f"{self.db_path.resolve().as_uri()}?mode=ro",
+                    uri=True,
+                    timeout=self._connection_timeout,
+                    check_same_thread=False,
+                    cached_statements=self._statement_cache_size,
+                )
+            except sqlite3.Error:
+                # Read-only opens can fail on some platforms while WAL files are missing
                 conn = sqlite3.connect(
                     str(self.db_path),
                     timeout=self._connection_timeout,
                     check_same_thread=False,
+                    cached_statements=self._statement_cache_size,
                 )
+            conn.execute("PRAGMA query_only = ON")
+        else:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=self._connection_timeout,
+                check_same_thread=False,
+                cached_statements=self._statement_cache_size,
+            )
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+
+        # Configure connection for optimal performance and reliability
+        conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")  # 256MB mmap
+
+        # Enable row factory for easier data access
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _discard_connection(self, conn: Optional[sqlite3.Connection]) -> None:
+        """Close a connection that is no longer usable."""
+        if conn is None:
+            return
 
-                # Configure connection for optimal performance and reliability
-                conn.execute("PRAGMA foreign_keys = ON")
-                conn.execute("PRAGMA journal_mode = WAL")
-                conn.execute("PRAGMA synchronous = NORMAL")
-                conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
-                conn.execute("PRAGMA temp_store = MEMORY")
-                conn.execute("PRAGMA mmap_size = 268435456")  # 256MB mmap
+        try:
+            conn.close()
+        except Exception:
+            pass
 
-                # Enable row factory for easier data access
-                conn.row_factory = sqlite3.Row
+    @contextmanager
+    def _get_connection(self, retries: int = None):
+        """
+        Get the shared writer connection with automatic retry and error handling.
 
-                yield conn
-                return
+        All writes go through a single long-lived connection serialized by
+        ``self._lock``. A connection that fails is discarded and reopened on
+        the next call.
 
-            except sqlite3.Error as e:
-                if conn:
-                    try:
-                        conn.close()
-                    except:
-                        pass
-                    conn = None
+        Args:
+            retries: Number of retries (defaults to self._max_retries)
 
-                self.logger.warning(
-                    f"Database connection attempt {attempt + 1} failed: {e}"
-                )
+        Yields:
+            sqlite3.Connection: Database connection
+        """
+        if retries is None:
+            retries = self._max_retries
 
-                if attempt < retries - 1:
-                    time.sleep(self._retry_delay * (2**attempt))
-                else:
+        with self._lock:
+            for attempt in range(retries):
+                try:
+                    # Ensure database is available
+                    if not self._is_database_available():
+                        raise sqlite3.Error("Database not available")
+
+                    if self._writer_conn is None:
+                        self._writer_conn = self._open_connection()
+                    break
+
+                except sqlite3.Error as e:
+                    self._discard_connection(self._writer_conn)
+                    self._writer_conn = None
+
+                    self.logger.warning(
+                        f"Database connection attempt {attempt + 1} failed: {e}"
+                    )
+
+                    if attempt < retries - 1:
+                        time.sleep(self._retry_delay * (2**attempt))
+                    else:
+                        self.logger.error(
+                            f"Failed to connect to database after {retries} attempts"
+                        )
+                        self._database_available = False
+                        raise
+
+                except Exception as e:
+                    self._discard_connection(self._writer_conn)
+                    self._writer_conn = None
                     self.logger.error(
-                        f"Failed to connect to database after {retries} attempts"
+                        f"Unexpected error during database connection: {e}"
                     )
-                    self._database_available = False
                     raise
 
+            conn = self._writer_conn
+            try:
+                yield conn
             except Exception as e:
-                if conn:
-                    try:
-                        conn.close()
-                    except:
-                        pass
-                    conn = None
-
-                self.logger.error(f"Unexpected error during database connection: {e}")
+                # Leave no half-finished transaction on the shared connection
+                try:
+                    conn.rollback()
+                    broken = isinstance(e, sqlite3.OperationalError)
+                except sqlite3.Error:
+                    broken = True
+
+                if broken:
+                    # Reconnect on the next call
+                    self._discard_connection(conn)
+                    if self._writer_conn is conn:
+                        self._writer_conn = None
                 raise
 
-            finally:
-                if conn:
-                    try:
-                        conn.close()
-                    except:
-                        pass
+    @contextmanager
+    def _read_connection(self):
+        """
+        Get this thread's read-only connection, opening it on first use.
+
+        Yields:
+            sqlite3.Connection: Read-only database connection
+        """
+        conn = getattr(self._thread_local, "conn", None)
+        if conn is None:
+            conn = self._open_connection(read_only=True)
+            self._thread_local.conn = conn
+            with self._lock:
+                # Close the connections of threads that have exited since
+                for thread in [t for t in self._reader_conns if not t.is_alive()]:
+                    self._discard_connection(self._reader_conns.pop(thread))
+                self._reader_conns[threading.current_thread()] = conn
+
+        try:
+            yield conn
+        except sqlite3.Error:
+            self._thread_local.conn = None
+            with self._lock:
+                if self._reader_conns.get(threading.current_thread()) is conn:
+                    del self._reader_conns[threading.current_thread()]
+            self._discard_connection(conn)
+            raise
+
+    def _close_connections(self) -> None:
+        """Close the writer connection and all reader connections."""
+        with self._lock:
+            self._discard_connection(self._writer_conn)
+            self._writer_conn = None
+
+            for conn in self._reader_conns.values():
+                self._discard_connection(conn)
+            self._reader_conns = {}
+            self._thread_local = threading.local()
 
     def _execute_with_retry(
         self, query: str, params: tuple = (), fetch: str = None
@@ -380,6 +572,365 @@ class MessageLogger:
         except Exception as e:
             self.logger.warning(f"Database maintenance failed: {e}")
 
+    def _start_writer(self) -> None:
+        """Start the background writer thread used in buffered mode."""
+        if self._writer_thread and self._writer_thread.is_alive():
+            return
+
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="MessageLoggerWriter", daemon=True
+        )
+        self._writer_thread.start()
+
+    def _is_writer_running(self) -> bool:
+        """Check whether buffered writes are being handled by the writer thread."""
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    def _enqueue_write(self, kind: str, params: tuple) -> None:
+        """Queue a write for the background writer."""
+        self._write_queue.put((kind, params))
+
+    def _writer_loop(self) -> None:
+        """
+        Drain the write queue, committing one transaction per batch.
+
+        A batch is written when it reaches ``batch_size`` rows, when its
+        oldest row has waited ``flush_interval_ms``, or when a flush/stop
+        marker is received.
+        """
+        pending: List[Tuple[str, Any]] = []
+        deadline: Optional[float] = None
+
+        while True:
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+
+            try:
+                kind, payload = self._write_queue.get(timeout=timeout)
+            except queue.Empty:
+                kind, payload = None, None
+
+            if kind in ("flush", "stop"):
+                self._write_batch(pending)
+                pending = []
+                deadline = None
+                payload.set()
+                if kind == "stop":
+                    return
+                continue
+
+            if kind is not None:
+                pending.append((kind, payload))
+                if deadline is None:
+                    deadline = time.monotonic() + self._flush_interval
+
+            if pending and (
+                len(pending) >= self._batch_size or time.monotonic() >= deadline
+            ):
+                self._write_batch(pending)
+                pending = []
+                deadline = None
+
+    def _write_batch(self, items: List[Tuple[str, Any]]) -> None:
+        """Write a batch of queued operations in a single transaction."""
+        if not items:
+            return
+
+        # Counter deltas are summed per session and applied once per batch
+        deltas: Dict[str, List[int]] = {}
+        writes = []
+        for kind, params in items:
+            if kind == "delta":
+                session_id, delta = params
+                total = deltas.setdefault(session_id, [0] * len(delta))
+                for i, value in enumerate(delta):
+                    total[i] += value
+            else:
+                writes.append((kind, params))
+
+        with self._lock:
+            try:
+                with self._get_connection() as conn:
+                    # Keep queue order; group runs of the same statement
+                    for kind, group in itertools.groupby(writes, key=lambda i: i[0]):
+                        conn.executemany(
+                            self._BUFFERED_SQL[kind], [params for _, params in group]
+                        )
+
+                    conn.executemany(
+                        self._SESSION_DELTA_SQL,
+                        [
+                            self._session_delta_params(session_id, delta)
+                            for session_id, delta in deltas.items()
+                        ],
+                    )
+
+                    conn.commit()
+
+                self._operation_count += len(items)
+                self._writer_stats["batches"] += 1
+                self._writer_stats["rows"] += len(items)
+
+            except Exception as e:
+                # The transaction was rolled back; retry row by row so only
+                # the offending rows are lost
+                self.logger.warning(
+                    f"Buffered write of {len(items)} operations failed, "
+                    f"retrying individually: {e}"
+                )
+                self._write_items_individually(items)
+
+    def _write_items_individually(self, items: List[Tuple[str, Any]]) -> None:
+        """Write queued operations one transaction each; must hold self._lock."""
+        written = 0
+        for kind, params in items:
+            if kind == "delta":
+                sql, params = self._SESSION_DELTA_SQL, self._session_delta_params(*params)
+            else:
+                sql = self._BUFFERED_SQL[kind]
+
+            try:
+                with self._get_connection() as conn:
+                    conn.execute(sql, params)
+                    conn.commit()
+                written += 1
+            except Exception as e:
+                self._writer_stats["failed_rows"] += 1
+                self.logger.error(f"Buffered {kind} write failed: {e}")
+
+        self._operation_count += written
+        self._writer_stats["batches"] += 1
+        self._writer_stats["rows"] += written
+
+    def _session_delta_params(self, session_id: str, delta: List[int]) -> tuple:
+        """Build the parameters of _SESSION_DELTA_SQL for a counter delta."""
+        return (*delta, delta[0], delta[1], delta[0], session_id)
+
+    def _track_message_status(
+        self, log_id: str, status: str, session_id: Optional[str] = None
+    ) -> Optional[Tuple[str, List[int]]]:
+        """
+        Record a message's new status and return the session counter delta.
+
+        Args:
+            log_id: Log entry ID
+            status: New message status value
+            session_id: Session of a newly logged message; None for an update
+                of an existing message
+
+        Returns:
+            (session_id, delta) or None if the message is unknown
+        """
+        delta = [0] * len(self._SESSION_COUNTERS)
+
+        if session_id is not None:
+            delta[0] = 1
+            previous = None
+        else:
+            with self._states_lock:
+                previous = self._message_states.get(log_id)
+            if previous is None:
+                previous = self._load_message_state(log_id)
+            if previous is None:
+                return None
+
+            session_id, old_status = previous
+            old_index = self._STATUS_COUNTER_INDEX.get(old_status)
+            if old_index is not None:
+                delta[old_index] -= 1
+
+        new_index = self._STATUS_COUNTER_INDEX.get(status)
+        if new_index is not None:
+            delta[new_index] += 1
+
+        with self._states_lock:
+            self._message_states[log_id] = (session_id, status)
+
+        return session_id, delta
+
+    def _load_message_state(self, log_id: str) -> Optional[Tuple[str, str]]:
+        """Load the session and status of a message not logged by this instance."""
+        try:
+            with self._read_connection() as conn:
+                row = conn.execute(
+                    "SELECT session_id, message_status FROM message_logs WHERE id = ?",
+                    (log_id,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to load message state for {log_id}: {e}")
+            return None
+
+        return (row[0], row[1]) if row else None
+
+    def _apply_session_delta(self, change: Optional[Tuple[str, List[int]]]) -> None:
+        """Apply a session counter delta, directly or through the buffered writer."""
+        if change is None or not any(change[1]):
+            return
+
+        session_id, delta = change
+        if self._is_writer_running():
+            self._enqueue_write("delta", (session_id, delta))
+            return
+
+        result = self._execute_with_retry(
+            self._SESSION_DELTA_SQL, self._session_delta_params(session_id, delta)
+        )
+        if result is None:
+            self.logger.warning(
+                f"Failed to update session counters for {session_id}; "
+                "run reconcile_session_stats() to rebuild them"
+            )
+
+    def reconcile_session_stats(
+        self, session_id: Optional[str] = None, open_only: bool = False
+    ) -> int:
+        """
+        Rebuild session counters from message_logs.
+
+        Counters are normally maintained incrementally; use this to repair
+        them after a crash or an interrupted buffered write.
+
+        Args:
+            session_id: Session to rebuild (defaults to all of the user's sessions)
+            open_only: Only rebuild sessions that were never ended
+
+        Returns:
+            Number of sessions rebuilt
+        """
+        if not self._is_database_available():
+            return 0
+
+        self._wait_for_writer()
+
+        query = "SELECT session_id FROM session_summaries WHERE user_id = ?"
+        params: List[Any] = [self.user_id]
+        if session_id:
+            query += " AND session_id = ?"
+            params.append(session_id)
+        if open_only:
+            query += " AND end_time IS NULL"
+
+        try:
+            with self._get_connection() as conn:
+                session_ids = [row[0] for row in conn.execute(query, params)]
+                for sid in session_ids:
+                    self._refresh_session_stats(conn, sid)
+                conn.commit()
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to reconcile session stats: {e}")
+            return 0
+
+        if session_ids:
+            self._log_system_event(
+                "INFO",
+                "session",
+                "Session stats reconciled",
+                {"sessions": len(session_ids), "open_only": open_only},
+            )
+
+        return len(session_ids)
+
+    def _refresh_session_stats(self, conn: sqlite3.Connection, session_id: str) -> None:
+        """Recalculate session counters from message_logs on an open connection."""
+        stats = conn.execute(
+            """
+            SELECT 
+                COUNT(*) as total,
+                SUM(CASE WHEN message_status = 'sent' THEN 1 ELSE 0 END) as successful,
+                SUM(CASE WHEN message_status = 'failed' THEN 1 ELSE 0 END) as failed,
+                SUM(CASE WHEN message_status = 'pending' THEN 1 ELSE 0 END) as pending,
+                SUM(CASE WHEN message_status = 'cancelled' THEN 1 ELSE 0 END) as cancelled
+            FROM message_logs 
+            WHERE session_id = ?
+        """,
+            (session_id,),
+        ).fetchone()
+
+        total = stats[0] or 0
+        successful = stats[1] or 0
+        conn.execute(
+            """
+            UPDATE session_summaries 
+            SET total_messages = ?, successful_messages = ?, failed_messages = ?,
+                pending_messages = ?, cancelled_messages = ?, success_rate = ?
+            WHERE session_id = ?
+        """,
+            (
+                total,
+                successful,
+                stats[2] or 0,
+                stats[3] or 0,
+                stats[4] or 0,
+                (successful / total * 100) if total > 0 else 0,
+                session_id,
+            ),
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Commit all queued writes.
+
+        In unbuffered mode writes are committed immediately and this is a no-op.
+
+        Args:
+            timeout: Maximum seconds to wait for the writer (None waits forever)
+
+        Returns:
+            True if every write queued before the call has been committed,
+            False on timeout or if any write failed since the previous flush
+        """
+        if not self._wait_for_writer(timeout):
+            return False
+
+        # The writer may have hit a failure before this call was made, so
+        # compare against what the previous flush reported
+        failed_rows = self._writer_stats["failed_rows"]
+        reported, self._reported_failed_rows = self._reported_failed_rows, failed_rows
+        return failed_rows == reported
+
+    def _wait_for_writer(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the writer has committed everything queued so far.
+
+        Unlike flush() this leaves write failures for the next flush() to
+        report, so internal reads can catch up without hiding them.
+
+        Args:
+            timeout: Maximum seconds to wait for the writer (None waits forever)
+
+        Returns:
+            False on timeout, True otherwise
+        """
+        if not self._is_writer_running():
+            return True
+
+        done = threading.Event()
+        self._write_queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def _stop_writer(self, timeout: Optional[float] = None) -> None:
+        """Flush outstanding writes and stop the background writer."""
+        if not self._is_writer_running():
+            return
+
+        done = threading.Event()
+        self._write_queue.put(("stop", done))
+        done.wait(timeout)
+        self._writer_thread.join(timeout)
+        self._writer_thread = None
+
+    def get_writer_stats(self) -> Dict[str, Any]:
+        """Get statistics for the buffered write pipeline."""
+        return {
+            "buffered": self._buffered,
+            "writer_running": self._is_writer_running(),
+            "queued": self._write_queue.qsize(),
+            "batch_size": self._batch_size,
+            "flush_interval_ms": int(self._flush_interval * 1000),
+            **self._writer_stats,
+        }
+
     def _init_database(self) -> None:
         """Initialize the SQLite database with required tables."""
         try:
@@ -574,24 +1125,23 @@ class MessageLogger:
             event_id = str(uuid.uuid4())
             timestamp = datetime.now().isoformat()
             details_json = json.dumps(details) if details else None
-
-            self._execute_with_retry(
-                """
-                INSERT INTO system_logs (id, timestamp, level, component, message, details, user_id, session_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    event_id,
-                    timestamp,
-                    level,
-                    component,
-                    message,
-                    details_json,
-                    self.user_id,
-                    getattr(self, 'current_session_id', None),
-                ),
+            params = (
+                event_id,
+                timestamp,
+                level,
+                component,
+                message,
+                details_json,
+                self.user_id,
+                getattr(self, 'current_session_id', None),
             )
 
+            if self._is_writer_running():
+                self._enqueue_write("system", params)
+                return
+
+            self._execute_with_retry(self._BUFFERED_SQL["system"], params)
+
         except Exception as e:
             # Don't let system logging failures break the main functionality
             self.logger.warning(f"Failed to log system event: {e}")
@@ -748,8 +1298,16 @@ class MessageLogger:
 
         # Save with comprehensive error handling
         try:
-            self._save_log_entry(log_entry)
-            self._update_session_stats()
+            if self._is_writer_running():
+                self._enqueue_write("message", self._log_entry_params(log_entry))
+            else:
+                self._save_log_entry(log_entry)
+
+            self._apply_session_delta(
+                self._track_message_status(
+                    log_id, log_entry.message_status, log_entry.session_id
+                )
+            )
 
             self._log_system_event(
                 "INFO",
@@ -802,6 +1360,38 @@ class MessageLogger:
             )
             return
 
+        if self._is_writer_running():
+            now = datetime.now().isoformat()
+            self._enqueue_write(
+                "status",
+                (
+                    status.value,
+                    message_id or None,
+                    delivery_status or None,
+                    error_message or None,
+                    now if status == MessageStatus.SENT else None,
+                    now if status == MessageStatus.DELIVERED else None,
+                    now if status == MessageStatus.READ else None,
+                    log_id,
+                ),
+            )
+            self._apply_session_delta(
+                self._track_message_status(log_id, status.value)
+            )
+            self._log_system_event(
+                "INFO",
+                "logging",
+                "Message status updated",
+                {
+                    "log_id": log_id,
+                    "new_status": status.value,
+                    "message_id": message_id,
+                    "delivery_status": delivery_status,
+                    "has_error": bool(error_message),
+                },
+            )
+            return
+
         try:
             # Build dynamic update query
             update_fields = ["message_status = ?"]
@@ -832,6 +1422,9 @@ class MessageLogger:
 
             params.append(log_id)
 
+            # Counter delta for the transition, derived from the previous status
+            change = self._track_message_status(log_id, status.value)
+
             # Execute update with retry logic
             result = self._execute_with_retry(
                 f"""
@@ -843,7 +1436,7 @@ class MessageLogger:
             )
 
             if result is not None and result > 0:
-                self._update_session_stats()
+                self._apply_session_delta(change)
                 self._log_system_event(
                     "INFO",
                     "logging",
@@ -857,9 +1450,14 @@ class MessageLogger:
                     },
                 )
             else:
+                # Forget the tracked status so it is reloaded from the database
+                with self._states_lock:
+                    self._message_states.pop(log_id, None)
                 self.logger.warning(f"No message found with log_id: {log_id}")
 
         except Exception as e:
+            with self._states_lock:
+                self._message_states.pop(log_id, None)
             self.logger.error(f"Failed to update message status for {log_id}: {e}")
             self._log_system_event(
                 "ERROR",
@@ -878,6 +1476,7 @@ class MessageLogger:
         if not self.current_session_id:
             return None
 
+        self._wait_for_writer()
         end_time = datetime.now()
 
         if not self._is_database_available():
@@ -910,7 +1509,7 @@ class MessageLogger:
                 )
 
                 # Update session record
-                with sqlite3.connect(str(self.db_path)) as conn:
+                with self._get_connection() as conn:
                     conn.execute(
                         """
                         UPDATE session_summaries 
@@ -959,6 +1558,13 @@ class MessageLogger:
             f"Successful: {session_summary.successful_messages}"
         )
 
+        with self._states_lock:
+            self._message_states = {
+                log_id: state
+                for log_id, state in self._message_states.items()
+                if state[0] != session_summary.session_id
+            }
+
         self.current_session_id = None
         self.session_start_time = None
 
@@ -981,6 +1587,7 @@ class MessageLogger:
         Returns:
             List of message log entries
         """
+        self._wait_for_writer()
         start_date = datetime.now() - timedelta(days=days)
 
         query = """
@@ -999,8 +1606,7 @@ class MessageLogger:
 
         query += " ORDER BY timestamp DESC"
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_connection() as conn:
             cursor = conn.execute(query, params)
             rows = cursor.fetchall()
 
@@ -1016,10 +1622,10 @@ class MessageLogger:
         Returns:
             List of session summaries
         """
+        self._wait_for_writer()
         start_date = datetime.now() - timedelta(days=days)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT * FROM session_summaries 
@@ -1045,6 +1651,7 @@ class MessageLogger:
         Returns:
             Analytics report
         """
+        self._wait_for_writer()
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         report_id = f"{self.user_id}_{days}d_{end_date.strftime('%Y%m%d')}"
@@ -1172,9 +1779,10 @@ class MessageLogger:
         Returns:
             Number of records deleted
         """
+        self._wait_for_writer()
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             # Delete old message logs
             cursor = conn.execute(
                 """
@@ -1221,7 +1829,8 @@ class MessageLogger:
         Returns:
             Dictionary with key statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        self._wait_for_writer()
+        with self._read_connection() as conn:
             # Messages in last 30 days
             cursor = conn.execute(
                 """
@@ -1291,12 +1900,15 @@ class MessageLogger:
             "tables": {},
             "indexes": {},
             "errors": [],
+            "writer": self.get_writer_stats(),
         }
 
         if not self._is_database_available():
             health_info["errors"].append("Database not available")
             return health_info
 
+        self._wait_for_writer()
+
         try:
             # Get database file size
             if self.db_path.exists():
@@ -1349,6 +1961,7 @@ class MessageLogger:
             self.logger.info("Starting database repair...")
 
             # Try to reconnect
+            self._close_connections()
             self._init_database_with_retries()
 
             if not self._is_database_available():
@@ -1405,6 +2018,8 @@ class MessageLogger:
             if not self._is_database_available():
                 raise sqlite3.Error("Database not available for backup")
 
+            self._wait_for_writer()
+
             # Create backup using SQLite backup API
             with self._get_connection() as source_conn:
                 with sqlite3.connect(str(backup_path)) as backup_conn:
@@ -1450,6 +2065,10 @@ class MessageLogger:
                 },
             )
 
+            # Commit anything still queued by the buffered writer
+            self._stop_writer()
+            self._close_connections()
+
             self.logger.info("Message logger closed successfully")
 
         except Exception as e:
@@ -1465,41 +2084,37 @@ class MessageLogger:
 
     # Private helper methods
 
+    def _log_entry_params(self, entry: MessageLogEntry) -> tuple:
+        """Build the message_logs insert parameters for a log entry."""
+        return (
+            entry.id,
+            entry.timestamp.isoformat(),
+            entry.user_id,
+            entry.session_id,
+            entry.channel,
+            entry.template_id,
+            entry.template_name,
+            entry.recipient_email,
+            entry.recipient_name,
+            entry.recipient_phone or "",
+            entry.recipient_company or "",
+            entry.message_status,
+            entry.message_id,
+            entry.delivery_status,
+            entry.error_message,
+            entry.sent_at.isoformat() if entry.sent_at else None,
+            entry.delivered_at.isoformat() if entry.delivered_at else None,
+            entry.read_at.isoformat() if entry.read_at else None,
+            int(entry.response_received),
+            entry.content_preview,
+            json.dumps(entry.metadata) if entry.metadata else "{}",
+        )
+
     def _save_log_entry(self, entry: MessageLogEntry) -> None:
         """Save a log entry to the database with robust error handling."""
         try:
             result = self._execute_with_retry(
-                """
-                INSERT INTO message_logs (
-                    id, timestamp, user_id, session_id, channel, template_id, template_name,
-                    recipient_email, recipient_name, recipient_phone, recipient_company,
-                    message_status, message_id, delivery_status, error_message,
-                    sent_at, delivered_at, read_at, response_received, content_preview, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    entry.id,
-                    entry.timestamp.isoformat(),
-                    entry.user_id,
-                    entry.session_id,
-                    entry.channel,
-                    entry.template_id,
-                    entry.template_name,
-                    entry.recipient_email,
-                    entry.recipient_name,
-                    entry.recipient_phone or "",
-                    entry.recipient_company or "",
-                    entry.message_status,
-                    entry.message_id,
-                    entry.delivery_status,
-                    entry.error_message,
-                    entry.sent_at.isoformat() if entry.sent_at else None,
-                    entry.delivered_at.isoformat() if entry.delivered_at else None,
-                    entry.read_at.isoformat() if entry.read_at else None,
-                    int(entry.response_received),
-                    entry.content_preview,
-                    json.dumps(entry.metadata) if entry.metadata else "{}",
-                ),
+                self._BUFFERED_SQL["message"], self._log_entry_params(entry)
             )
 
             if result is None:
@@ -1509,84 +2124,11 @@ class MessageLogger:
             self.logger.error(f"Failed to save log entry {entry.id}: {e}")
             raise
 
-    def _update_session_stats(self) -> None:
-        """Update session statistics based on current messages with robust error handling."""
-        if not self.current_session_id or not self._is_database_available():
-            return
-
-        try:
-            # Get current session statistics
-            stats = self._execute_with_retry(
-                """
-                SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN message_status = 'sent' THEN 1 ELSE 0 END) as successful,
-                    SUM(CASE WHEN message_status = 'failed' THEN 1 ELSE 0 END) as failed,
-                    SUM(CASE WHEN message_status = 'pending' THEN 1 ELSE 0 END) as pending,
-                    SUM(CASE WHEN message_status = 'cancelled' THEN 1 ELSE 0 END) as cancelled
-                FROM message_logs 
-                WHERE session_id = ?
-            """,
-                (self.current_session_id,),
-                fetch="one",
-            )
-
-            if stats:
-                total = stats[0] or 0
-                successful = stats[1] or 0
-                failed = stats[2] or 0
-                pending = stats[3] or 0
-                cancelled = stats[4] or 0
-                success_rate = (successful / total * 100) if total > 0 else 0
-
-                # Update session summary
-                result = self._execute_with_retry(
-                    """
-                    UPDATE session_summaries 
-                    SET total_messages = ?, successful_messages = ?, failed_messages = ?,
-                        pending_messages = ?, cancelled_messages = ?, success_rate = ?
-                    WHERE session_id = ?
-                """,
-                    (
-                        total,
-                        successful,
-                        failed,
-                        pending,
-                        cancelled,
-                        success_rate,
-                        self.current_session_id,
-                    ),
-                )
-
-                if result is not None:
-                    self._log_system_event(
-                        "DEBUG",
-                        "session",
-                        "Session stats updated",
-                        {
-                            "session_id": self.current_session_id,
-                            "total": total,
-                            "successful": successful,
-                            "failed": failed,
-                            "success_rate": success_rate,
-                        },
-                    )
-
-        except Exception as e:
-            self.logger.error(f"Failed to update session stats: {e}")
-            self._log_system_event(
-                "ERROR",
-                "session",
-                "Session stats update failed",
-                {"session_id": self.current_session_id, "error": str(e)},
-            )
-
     def _generate_session_summary(
         self, session_id: str, end_time: datetime
     ) -> SessionSummary:
         """Generate a session summary."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_connection() as conn:
 
             # Get session info
             session_row = conn.execute(
@@ -1647,7 +2189,7 @@ class MessageLogger:
         self, report_id: str, start_date: datetime, end_date: datetime
     ) -> AnalyticsReport:
         """Generate a comprehensive analytics report."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read_connection() as conn:
             # Basic statistics
             cursor = conn.execute(
                 """
@@ -1755,7 +2297,7 @@ class MessageLogger:
 
         # Get errors for this session
         try:
-            with sqlite3.connect(str(self.db_path)) as conn:
+            with self._read_connection() as conn:
                 cursor = conn.execute(
                     """
                     SELECT error_message FROM message_logs 
@@ -1796,7 +2338,7 @@ class MessageLogger:
 
     def _get_cached_report(self, report_id: str) -> Optional[AnalyticsReport]:
         """Get cached analytics report if available and recent."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read_connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT report_data, generated_at FROM analytics_cache 
@@ -1819,7 +2361,7 @@ class MessageLogger:
 
     def _cache_report(self, report: AnalyticsReport) -> None:
         """Cache an analytics report."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO analytics_cache 
@@ -5,9 +5,10 @@ Core data models for Multi-Channel Bulk Messaging System.
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Mapping, Optional, Any
 from enum import Enum
 
+from .template_renderer import CompiledText, compile_text
 from ..utils.exceptions import ValidationError
 
 
@@ -163,6 +164,25 @@ class Customer:
             email=data.get("email", "")
         )
 
+    @classmethod
+    def from_normalized(cls, name: str, company: str, phone: str, email: str) -> "Customer":
+        """
+        Create customer from values that are already cleaned and formatted.
+
+        Skips the formatting in __post_init__; used by the columnar import
+        path, which applies the same normalization to whole columns.
+        """
+        customer = cls.__new__(cls)
+        customer.__dict__.update(
+            name=name,
+            company=company,
+            phone=phone,
+            email=email,
+            whatsapp_opt_in=cls.whatsapp_opt_in,
+            preferred_channel=cls.preferred_channel
+        )
+        return customer
+
 
 @dataclass
 class MessageTemplate:
@@ -222,45 +242,85 @@ class MessageTemplate:
         if errors:
             raise ValidationError(f"Template validation failed: {'; '.join(errors)}")
     
-    def render(self, customer: Customer) -> Dict[str, str]:
+    def render(
+        self,
+        customer: Customer,
+        extra_variables: Optional[Mapping[str, str]] = None
+    ) -> Dict[str, str]:
         """
         Render template with customer data for all channels.
         
         Args:
             customer: Customer data to use for rendering
+            extra_variables: Values for placeholders not filled from customer data
             
         Returns:
             Dictionary with rendered content for each channel
         """
-        customer_data = customer.to_dict()
-        result = {}
+        return self._render_compiled(self.compile(), customer.to_dict(), extra_variables or {})
+    
+    def render_many(
+        self,
+        customers: Iterable[Customer],
+        extra_variables: Optional[Mapping[str, str]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Render template for a batch of customers.
         
-        # Render email content
-        if "email" in self.channels:
-            rendered_subject = self.subject
-            rendered_content = self.content
-            
-            for var in self.variables:
-                placeholder = f"{{{var}}}"
-                value = str(customer_data.get(var, placeholder))
-                rendered_subject = rendered_subject.replace(placeholder, value)
-                rendered_content = rendered_content.replace(placeholder, value)
+        Args:
+            customers: Customers to render the template for
+            extra_variables: Values for placeholders not filled from customer data
             
-            result["subject"] = rendered_subject
-            result["content"] = rendered_content
+        Returns:
+            Rendered content for each customer, in input order
+        """
+        compiled = self.compile()
+        extra_variables = extra_variables or {}
+        return [
+            self._render_compiled(compiled, customer.to_dict(), extra_variables)
+            for customer in customers
+        ]
+    
+    def compile(self) -> Dict[str, CompiledText]:
+        """
+        Get the compiled form of this template's content.
+        
+        The result is cached on the template and rebuilt when its content,
+        channels or variables change.
+        
+        Returns:
+            Compiled text keyed by rendered output name
+        """
+        key = (self.subject, self.content, self.whatsapp_content,
+               tuple(self.channels), tuple(self.variables))
+        cached = self.__dict__.get("_compiled")
+        if cached is not None and cached[0] == key:
+            return cached[1]
         
-        # Render WhatsApp content
+        sources = {}
+        if "email" in self.channels:
+            sources["subject"] = self.subject
+            sources["content"] = self.content
         if "whatsapp" in self.channels:
-            rendered_whatsapp = self.whatsapp_content
-            
-            for var in self.variables:
-                placeholder = f"{{{var}}}"
-                value = str(customer_data.get(var, placeholder))
-                rendered_whatsapp = rendered_whatsapp.replace(placeholder, value)
-            
-            result["whatsapp_content"] = rendered_whatsapp
+            sources["whatsapp_content"] = self.whatsapp_content
         
-        return result
+        compiled = {name: compile_text(text, self.variables) for name, text in sources.items()}
+        # Stored outside the dataclass fields so it never reaches asdict() or __eq__
+        self.__dict__["_compiled"] = (key, compiled)
+        return compiled
+    
+    def _render_compiled(
+        self,
+        compiled: Dict[str, CompiledText],
+        customer_data: Dict[str, str],
+        extra_variables: Mapping[str, str]
+    ) -> Dict[str, str]:
+        """Fill compiled content; declared variables take customer data over extra values."""
+        values = dict(extra_variables)
+        for var in self.variables:
+            if var in customer_data:
+                values[var] = customer_data[var]
+        return {name: text.render(values) for name, text in compiled.items()}
     
     def supports_channel(self, channel: str) -> bool:
         """
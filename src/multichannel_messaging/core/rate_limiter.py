@@ -6,18 +6,23 @@ quota tracking with real-time usage monitoring, queue management for handling
 rate limit exceeded scenarios, and quota alerts with automatic throttling.
 """
 
+import heapq
+import itertools
+import os
 import time
 import threading
-from typing import Dict, List, Optional, Callable, Any, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Callable, Any, Sequence, Tuple, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
-from queue import Queue, PriorityQueue, Empty
 import json
 from pathlib import Path
 
 from ..utils.logger import get_logger
 from ..utils.exceptions import QuotaExceededError, ConfigurationError
+from ..utils.platform_utils import get_app_data_dir
 from ..core.i18n_manager import get_i18n_manager
 
 logger = get_logger(__name__)
@@ -69,13 +74,53 @@ class QuotaConfig:
 
 @dataclass
 class QuotaUsage:
-    """Current usage information for a quota."""
+    """
+    Current usage information for a quota.
+    
+    Requests inside the sliding window are kept as epoch-second timestamps in
+    two time-ordered deques (regular and burst); the usage counters always
+    equal their lengths, so recording and expiring requests is O(1) amortized.
+    """
     quota_type: QuotaType
     current_usage: int = 0
     burst_usage: int = 0
     window_start: datetime = field(default_factory=datetime.now)
     last_reset: datetime = field(default_factory=datetime.now)
-    request_timestamps: List[datetime] = field(default_factory=list)
+    regular_timestamps: Deque[float] = field(default_factory=deque)
+    burst_timestamps: Deque[float] = field(default_factory=deque)
+    
+    def record(self, timestamp: float, use_burst: bool = False):
+        """Record a request made at the given epoch time."""
+        if use_burst:
+            self.burst_timestamps.append(timestamp)
+            self.burst_usage += 1
+        else:
+            self.regular_timestamps.append(timestamp)
+            self.current_usage += 1
+    
+    def expire(self, cutoff: float):
+        """Drop requests made at or before the cutoff epoch time."""
+        regular = self.regular_timestamps
+        while regular and regular[0] <= cutoff:
+            regular.popleft()
+        self.current_usage = len(regular)
+        
+        burst = self.burst_timestamps
+        while burst and burst[0] <= cutoff:
+            burst.popleft()
+        self.burst_usage = len(burst)
+    
+    def clear(self):
+        """Drop all recorded requests."""
+        self.regular_timestamps.clear()
+        self.burst_timestamps.clear()
+        self.current_usage = 0
+        self.burst_usage = 0
+    
+    def oldest_timestamp(self, skip: int = 0) -> Optional[float]:
+        """Return the timestamp of the oldest request after skipping `skip` requests."""
+        merged = heapq.merge(self.regular_timestamps, self.burst_timestamps)
+        return next(itertools.islice(merged, skip, None), None)
     
     def get_usage_percentage(self, config: QuotaConfig) -> float:
         """Get current usage as percentage of limit."""
@@ -127,6 +172,8 @@ class QueuedRequest:
     callback: Callable[[], Any]
     args: Tuple = field(default_factory=tuple)
     kwargs: Dict[str, Any] = field(default_factory=dict)
+    quota_types: Tuple[QuotaType, ...] = field(default_factory=tuple)
+    reserved_quotas: Dict[QuotaType, bool] = field(default_factory=dict)
     
     def __lt__(self, other):
         """Compare requests for priority queue ordering."""
@@ -153,29 +200,54 @@ class IntelligentRateLimiter:
         quota_configs: List[QuotaConfig],
         storage_path: Optional[Path] = None,
         alert_callback: Optional[Callable[[QuotaAlert], None]] = None,
-        enable_persistence: bool = True
+        enable_persistence: bool = True,
+        flush_interval: float = 1.0,
+        dispatch_workers: int = 4
     ):
         """
         Initialize the intelligent rate limiter.
         
         Args:
             quota_configs: List of quota configurations
-            storage_path: Path to store persistent quota data
+            storage_path: Path to store persistent quota data (defaults to
+                quota_data.json in the application data directory)
             alert_callback: Callback function for quota alerts
             enable_persistence: Enable persistent quota tracking
+            flush_interval: Seconds between writes of recorded requests to the event log
+            dispatch_workers: Threads that run callbacks of queued requests
         """
         self.quota_configs = {config.quota_type: config for config in quota_configs}
         self.quota_usage = {config.quota_type: QuotaUsage(config.quota_type) for config in quota_configs}
-        self.storage_path = storage_path or Path("quota_data.json")
+        self.storage_path = storage_path or get_app_data_dir() / "quota_data.json"
         self.alert_callback = alert_callback
         self.enable_persistence = enable_persistence
+        self.flush_interval = flush_interval
         
         # Thread safety
         self._lock = threading.RLock()
-        self._queue_lock = threading.Lock()
+        self._queue_lock = threading.RLock()
+        
+        # Persistence: a snapshot file plus an append-only log of requests
+        # recorded since that snapshot, written by a background thread
+        self.event_log_path = self.storage_path.with_suffix(".log")
+        self._persist_lock = threading.RLock()
+        self._pending_events: List[Tuple[str, float, bool]] = []
+        self._logged_events = 0
+        self._snapshot_entries = 0
+        self._snapshot_requested = False
+        self._generation = 0
+        self._event_log = None
+        self._persist_stop = threading.Event()
+        self._persist_thread: Optional[threading.Thread] = None
         
-        # Request queue management
-        self.request_queue = PriorityQueue()
+        # Request queue management: one priority heap per set of quota types,
+        # dispatched by a single thread onto a callback executor
+        self.dispatch_workers = dispatch_workers
+        self._dispatch_queues: Dict[Tuple[QuotaType, ...], List[QueuedRequest]] = {}
+        self._dispatch_condition = threading.Condition(self._queue_lock)
+        self._queue_metrics: Dict[Tuple[QuotaType, ...], Dict[str, Any]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._reservations = threading.local()
         self.queue_processor_running = False
         self.queue_thread: Optional[threading.Thread] = None
         
@@ -196,6 +268,7 @@ class IntelligentRateLimiter:
         # Load persistent data
         if self.enable_persistence:
             self._load_quota_data()
+            self._start_persistence()
         
         # Start queue processor
         self._start_queue_processor()
@@ -223,6 +296,17 @@ class IntelligentRateLimiter:
             # Update usage based on time window
             self._update_usage_window(quota_type)
             
+            # Capacity already taken by the dispatcher for this queued request
+            reserved = self._get_reservations()
+            if quota_type in reserved:
+                return True, "Reserved by dispatcher", {
+                    "current_usage": usage.current_usage,
+                    "limit": config.limit,
+                    "remaining": max(0, config.limit - usage.current_usage),
+                    "using_burst": reserved[quota_type],
+                    "reserved": True
+                }
+            
             # Check regular capacity
             if usage.current_usage < config.limit:
                 return True, "Within regular capacity", {
@@ -248,7 +332,7 @@ class IntelligentRateLimiter:
                     }
             
             # Calculate time until next available slot
-            next_available = self._calculate_next_available_time(quota_type)
+            next_available = self._calculate_next_available_time(quota_type, use_burst)
             
             return False, f"Quota exceeded for {quota_type.value}", {
                 "current_usage": usage.current_usage,
@@ -278,15 +362,18 @@ class IntelligentRateLimiter:
             usage = self.quota_usage[quota_type]
             config = self.quota_configs[quota_type]
             
+            # Already recorded when the dispatcher reserved it
+            reserved = self._get_reservations()
+            if quota_type in reserved:
+                del reserved[quota_type]
+                return True
+            
             # Update usage
-            now = datetime.now()
-            usage.request_timestamps.append(now)
+            timestamp = time.time()
+            usage.record(timestamp, use_burst)
             
             if use_burst:
-                usage.burst_usage += 1
                 self.stats["burst_requests"] += 1
-            else:
-                usage.current_usage += 1
             
             self.stats["total_requests"] += 1
             self.stats["allowed_requests"] += 1
@@ -294,16 +381,16 @@ class IntelligentRateLimiter:
             # Check for alerts
             self._check_quota_alerts(quota_type)
             
-            # Persist data
+            # Persisted by the background flush
             if self.enable_persistence:
-                self._save_quota_data()
+                self._pending_events.append((quota_type.value, timestamp, use_burst))
             
             logger.debug(f"Recorded request for {quota_type.value}: usage={usage.current_usage}/{config.limit}")
             return True
     
     def queue_request(
         self,
-        quota_type: QuotaType,
+        quota_type: Union[QuotaType, Sequence[QuotaType]],
         callback: Callable[[], Any],
         priority: int = 5,
         request_id: Optional[str] = None,
@@ -313,8 +400,13 @@ class IntelligentRateLimiter:
         """
         Queue a request to be processed when quota allows.
         
+        The callback runs on a dispatcher thread once every listed quota has
+        capacity; that capacity is recorded at dispatch time, so rate checks
+        made by the callback itself for the same quotas pass without counting
+        the request twice.
+        
         Args:
-            quota_type: Type of quota this request counts against
+            quota_type: Type of quota, or types of quotas, this request counts against
             callback: Function to call when quota allows
             priority: Request priority (lower numbers = higher priority)
             request_id: Optional request identifier
@@ -327,22 +419,54 @@ class IntelligentRateLimiter:
         if request_id is None:
             request_id = f"req_{int(time.time() * 1000000)}"
         
+        quota_types = (quota_type,) if isinstance(quota_type, QuotaType) else tuple(quota_type)
+        unknown = [qt for qt in quota_types if qt not in self.quota_configs]
+        if unknown:
+            logger.warning(f"Ignoring unknown quota types for request {request_id}: "
+                           f"{', '.join(qt.value for qt in unknown)}")
+            quota_types = tuple(qt for qt in quota_types if qt in self.quota_configs)
+        
         queued_request = QueuedRequest(
             priority=priority,
             timestamp=datetime.now(),
             request_id=request_id,
             callback=callback,
             args=args,
-            kwargs=kwargs
+            kwargs=kwargs,
+            quota_types=quota_types
         )
         
-        with self._queue_lock:
-            self.request_queue.put(queued_request)
+        with self._dispatch_condition:
+            heapq.heappush(self._dispatch_queues.setdefault(quota_types, []), queued_request)
+            self._get_queue_metrics(quota_types)["queued"] += 1
             self.stats["queued_requests"] += 1
+            self._dispatch_condition.notify()
         
         logger.debug(f"Queued request {request_id} with priority {priority}")
         return request_id
     
+    def get_queue_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get depth and latency metrics for each dispatch queue.
+        
+        Returns:
+            Metrics keyed by the quota types of each queue, joined with '+'
+        """
+        with self._queue_lock:
+            metrics = {}
+            for quota_types, queue_metrics in self._queue_metrics.items():
+                dispatched = queue_metrics["dispatched"]
+                metrics[self._queue_name(quota_types)] = {
+                    "depth": len(self._dispatch_queues.get(quota_types, [])),
+                    "queued": queue_metrics["queued"],
+                    "dispatched": dispatched,
+                    "completed": queue_metrics["completed"],
+                    "failed": queue_metrics["failed"],
+                    "average_wait_seconds": queue_metrics["total_wait"] / dispatched if dispatched else 0.0,
+                    "max_wait_seconds": queue_metrics["max_wait"]
+                }
+            return metrics
+    
     def get_quota_status(self, quota_type: Optional[QuotaType] = None) -> Dict[str, Any]:
         """
         Get current quota status information.
@@ -383,12 +507,14 @@ class IntelligentRateLimiter:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get rate limiter statistics."""
+        queue_metrics = self.get_queue_metrics()
+        queue_size = sum(metrics["depth"] for metrics in queue_metrics.values())
+        
         with self._lock:
-            queue_size = self.request_queue.qsize()
-            
             return {
                 **self.stats,
                 "queue_size": queue_size,
+                "queues": queue_metrics,
                 "active_quotas": len(self.quota_configs),
                 "recent_alerts": len(self.recent_alerts),
                 "queue_processor_running": self.queue_processor_running
@@ -414,14 +540,12 @@ class IntelligentRateLimiter:
                 return False
             
             usage = self.quota_usage[quota_type]
-            usage.current_usage = 0
-            usage.burst_usage = 0
+            usage.clear()
             usage.window_start = datetime.now()
             usage.last_reset = datetime.now()
-            usage.request_timestamps.clear()
             
             if self.enable_persistence:
-                self._save_quota_data()
+                self._snapshot_requested = True
             
             logger.info(f"Reset quota for {quota_type.value}")
             return True
@@ -447,59 +571,42 @@ class IntelligentRateLimiter:
             self._check_quota_alerts(quota_type)
             
             if self.enable_persistence:
-                self._save_quota_data()
+                self._snapshot_requested = True
             
             logger.info(f"Updated quota config for {quota_type.value}")
             return True
     
     def _update_usage_window(self, quota_type: QuotaType):
-        """Update usage based on time window."""
+        """Expire requests that have left the sliding window."""
         config = self.quota_configs[quota_type]
         usage = self.quota_usage[quota_type]
-        now = datetime.now()
+        now = time.time()
         
-        # Check if window has expired
-        window_end = usage.window_start + timedelta(seconds=config.window_seconds)
+        usage.expire(now - config.window_seconds)
         
-        if now >= window_end:
-            # Reset usage for new window
-            usage.current_usage = 0
-            usage.burst_usage = 0
-            usage.window_start = now
-            usage.request_timestamps.clear()
-        else:
-            # Clean up old timestamps within current window
-            window_start_time = now - timedelta(seconds=config.window_seconds)
-            usage.request_timestamps = [
-                ts for ts in usage.request_timestamps 
-                if ts >= window_start_time
-            ]
-            
-            # Update usage based on remaining timestamps
-            usage.current_usage = len([
-                ts for ts in usage.request_timestamps 
-                if ts >= usage.window_start
-            ])
-    
-    def _calculate_next_available_time(self, quota_type: QuotaType) -> Optional[datetime]:
+        oldest = usage.oldest_timestamp()
+        usage.window_start = datetime.fromtimestamp(oldest) if oldest is not None else datetime.now()
+    
+    def _calculate_next_available_time(self, quota_type: QuotaType, use_burst: bool = True) -> Optional[datetime]:
         """Calculate when the next request slot will be available."""
         config = self.quota_configs[quota_type]
         usage = self.quota_usage[quota_type]
+        now = time.time()
         
-        if not usage.request_timestamps:
-            return datetime.now()
-        
-        # Find the oldest request that would need to expire
-        sorted_timestamps = sorted(usage.request_timestamps)
-        
-        if len(sorted_timestamps) < config.limit:
+        # A regular slot frees when enough regular requests have expired
+        excess = usage.current_usage - config.limit
+        if excess < 0:
             return datetime.now()
+        next_available = usage.regular_timestamps[excess] + config.window_seconds
         
-        # The oldest request that needs to expire for a new slot
-        oldest_blocking = sorted_timestamps[-(config.limit)]
-        next_available = oldest_blocking + timedelta(seconds=config.window_seconds)
+        # A burst slot frees when enough requests of either kind have expired
+        if use_burst and config.burst_capacity > 0:
+            total_excess = usage.current_usage + usage.burst_usage - (config.limit + config.burst_capacity)
+            if total_excess < 0:
+                return datetime.now()
+            next_available = min(next_available, usage.oldest_timestamp(total_excess) + config.window_seconds)
         
-        return max(next_available, datetime.now())
+        return datetime.fromtimestamp(max(next_available, now))
     
     def _check_quota_alerts(self, quota_type: QuotaType):
         """Check if quota alerts should be triggered."""
@@ -556,70 +663,261 @@ class IntelligentRateLimiter:
             logger.warning(f"Quota alert: {message}")
     
     def _start_queue_processor(self):
-        """Start the background queue processor."""
+        """Start the background queue dispatcher."""
         if self.queue_processor_running:
             return
         
         self.queue_processor_running = True
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.dispatch_workers,
+            thread_name_prefix="rate-limiter-dispatch"
+        )
         self.queue_thread = threading.Thread(target=self._process_queue, daemon=True)
         self.queue_thread.start()
         logger.debug("Queue processor started")
     
     def _process_queue(self):
-        """Process queued requests when quota allows."""
-        while self.queue_processor_running:
-            try:
-                # Get next request with timeout
+        """Dispatch queued requests as soon as their quotas have capacity."""
+        with self._dispatch_condition:
+            while self.queue_processor_running:
                 try:
-                    request = self.request_queue.get(timeout=1.0)
-                except Empty:
-                    continue
-                
-                # Check if we can process this request
-                # Note: This is a simplified implementation
-                # In practice, you'd need to associate quota_type with the request
-                
-                try:
-                    # Execute the callback
-                    result = request.callback(*request.args, **request.kwargs)
-                    logger.debug(f"Processed queued request {request.request_id}")
+                    request, wait_seconds = self._reserve_next_request()
+                    if request is None:
+                        # Sleep until the earliest slot frees or a request arrives
+                        self._dispatch_condition.wait(timeout=wait_seconds)
+                        continue
+                    
+                    self._executor.submit(self._run_queued_request, request)
+                    
                 except Exception as e:
-                    logger.error(f"Error processing queued request {request.request_id}: {e}")
-                finally:
-                    self.request_queue.task_done()
-                
+                    logger.error(f"Error in queue processor: {e}")
+                    self._dispatch_condition.wait(timeout=1.0)
+    
+    def _reserve_next_request(self) -> Tuple[Optional[QueuedRequest], Optional[float]]:
+        """
+        Pop the highest-priority queued request whose quotas have capacity.
+        
+        Must be called with the queue lock held.
+        
+        Returns:
+            Tuple of (request, None) when one was reserved, otherwise
+            (None, seconds until the earliest slot frees or None if idle)
+        """
+        heads = sorted(
+            (queue[0], quota_types)
+            for quota_types, queue in self._dispatch_queues.items() if queue
+        )
+        
+        earliest_wait = None
+        for request, quota_types in heads:
+            wait_seconds = self._try_reserve(request)
+            if wait_seconds is None:
+                heapq.heappop(self._dispatch_queues[quota_types])
+                metrics = self._get_queue_metrics(quota_types)
+                waited = (datetime.now() - request.timestamp).total_seconds()
+                metrics["dispatched"] += 1
+                metrics["total_wait"] += waited
+                metrics["max_wait"] = max(metrics["max_wait"], waited)
+                return request, None
+            
+            earliest_wait = wait_seconds if earliest_wait is None else min(earliest_wait, wait_seconds)
+        
+        return None, earliest_wait
+    
+    def try_reserve(self, quota_types: Sequence[QuotaType]) -> Tuple[Optional[Dict[QuotaType, bool]], float]:
+        """
+        Record one request against all quotas if every one has capacity.
+        
+        Callers that reserve up front must not record the request again.
+        
+        Args:
+            quota_types: Quotas the request counts against
+            
+        Returns:
+            Tuple of (burst usage per quota, 0.0) if reserved, otherwise
+            (None, seconds until capacity may be available)
+        """
+        with self._lock:
+            decisions = {}
+            wait_seconds = 0.0
+            blocked = False
+            
+            for quota_type in quota_types:
+                can_proceed, _, details = self.can_make_request(quota_type)
+                if not can_proceed:
+                    blocked = True
+                    wait_seconds = max(wait_seconds, details.get("wait_seconds") or 0.0)
+                decisions[quota_type] = details.get("using_burst", False)
+            
+            if blocked:
+                # Never spin when the next slot is due right now
+                return None, max(wait_seconds, 0.001)
+            
+            for quota_type, using_burst in decisions.items():
+                self.record_request(quota_type, use_burst=using_burst)
+            
+            return decisions, 0.0
+    
+    def _try_reserve(self, request: QueuedRequest) -> Optional[float]:
+        """
+        Record the request against all its quotas if every one has capacity.
+        
+        Returns:
+            None if reserved, otherwise seconds until capacity may be available
+        """
+        decisions, wait_seconds = self.try_reserve(request.quota_types)
+        if decisions is None:
+            return wait_seconds
+        
+        request.reserved_quotas = decisions
+        return None
+    
+    def _run_queued_request(self, request: QueuedRequest):
+        """Run a dispatched request's callback with its quota reservation active."""
+        self._reservations.quotas = dict(request.reserved_quotas)
+        succeeded = False
+        try:
+            request.callback(*request.args, **request.kwargs)
+            succeeded = True
+            logger.debug(f"Processed queued request {request.request_id}")
+        except Exception as e:
+            logger.error(f"Error processing queued request {request.request_id}: {e}")
+        finally:
+            self._reservations.quotas = {}
+            with self._queue_lock:
+                metrics = self._get_queue_metrics(request.quota_types)
+                metrics["completed" if succeeded else "failed"] += 1
+    
+    def _get_reservations(self) -> Dict[QuotaType, bool]:
+        """Return the quotas reserved for the queued request running on this thread."""
+        return getattr(self._reservations, "quotas", {})
+    
+    def _get_queue_metrics(self, quota_types: Tuple[QuotaType, ...]) -> Dict[str, Any]:
+        """Return the metrics record for a dispatch queue, creating it if needed."""
+        metrics = self._queue_metrics.get(quota_types)
+        if metrics is None:
+            metrics = {"queued": 0, "dispatched": 0, "completed": 0, "failed": 0,
+                       "total_wait": 0.0, "max_wait": 0.0}
+            self._queue_metrics[quota_types] = metrics
+        return metrics
+    
+    @staticmethod
+    def _queue_name(quota_types: Tuple[QuotaType, ...]) -> str:
+        """Return a readable name for a dispatch queue."""
+        return "+".join(qt.value for qt in quota_types) or "unlimited"
+    
+    def _start_persistence(self):
+        """Write a fresh snapshot and start the background flush thread."""
+        self._save_quota_data()
+        self._persist_thread = threading.Thread(target=self._persistence_loop, daemon=True)
+        self._persist_thread.start()
+    
+    def _stop_persistence(self):
+        """Stop the flush thread and write a final snapshot."""
+        self._persist_stop.set()
+        if self._persist_thread and self._persist_thread.is_alive():
+            self._persist_thread.join(timeout=5)
+        
+        self._save_quota_data()
+        
+        with self._persist_lock:
+            if self._event_log:
+                self._event_log.close()
+                self._event_log = None
+    
+    def _persistence_loop(self):
+        """Flush recorded requests to the event log every flush interval."""
+        while not self._persist_stop.wait(self.flush_interval):
+            self._flush_quota_events()
+    
+    def _flush_quota_events(self):
+        """Append pending requests to the event log, compacting into a snapshot when due."""
+        with self._persist_lock:
+            with self._lock:
+                # Compact once the log holds as many events as the snapshot,
+                # which keeps the cost of snapshots amortized per request
+                log_size = self._logged_events + len(self._pending_events)
+                compact = self._snapshot_requested or log_size > max(10000, self._snapshot_entries)
+                events, self._pending_events = self._pending_events, []
+            
+            if compact:
+                self._save_quota_data()
+                return
+            
+            if not events:
+                return
+            
+            try:
+                self._event_log.write(''.join(
+                    json.dumps([quota_type, timestamp, int(use_burst)]) + "\n"
+                    for quota_type, timestamp, use_burst in events
+                ))
+                self._event_log.flush()
+                self._logged_events += len(events)
             except Exception as e:
-                logger.error(f"Error in queue processor: {e}")
-                time.sleep(1)
+                # State is still in memory; recover with a snapshot on the next flush
+                logger.warning(f"Failed to append quota events: {e}")
+                self._snapshot_requested = True
     
     def _save_quota_data(self):
-        """Save quota data to persistent storage."""
+        """Atomically write a compact snapshot of all quotas and start a new event log."""
         if not self.enable_persistence:
             return
         
-        try:
-            data = {
-                "timestamp": datetime.now().isoformat(),
-                "quotas": {}
-            }
-            
-            for quota_type, usage in self.quota_usage.items():
-                data["quotas"][quota_type.value] = {
-                    "current_usage": usage.current_usage,
-                    "burst_usage": usage.burst_usage,
-                    "window_start": usage.window_start.isoformat(),
-                    "last_reset": usage.last_reset.isoformat(),
-                    "request_timestamps": [ts.isoformat() for ts in usage.request_timestamps]
+        with self._persist_lock:
+            with self._lock:
+                self._generation += 1
+                data = {
+                    "timestamp": datetime.now().isoformat(),
+                    "generation": self._generation,
+                    "quotas": {}
                 }
+                
+                for quota_type, usage in self.quota_usage.items():
+                    data["quotas"][quota_type.value] = {
+                        "current_usage": usage.current_usage,
+                        "burst_usage": usage.burst_usage,
+                        "window_start": usage.window_start.isoformat(),
+                        "last_reset": usage.last_reset.isoformat(),
+                        "regular_timestamps": list(usage.regular_timestamps),
+                        "burst_timestamps": list(usage.burst_timestamps)
+                    }
+                
+                # Everything recorded so far is part of this snapshot
+                self._pending_events = []
+                self._snapshot_requested = False
+                self._logged_events = 0
+                self._snapshot_entries = sum(
+                    usage.current_usage + usage.burst_usage for usage in self.quota_usage.values()
+                )
             
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            try:
+                self._replace_file(self.storage_path, json.dumps(data, separators=(',', ':')))
                 
-        except Exception as e:
-            logger.warning(f"Failed to save quota data: {e}")
+                # The log header ties the log to this snapshot; a log left over
+                # from an older snapshot is ignored on load
+                if self._event_log:
+                    self._event_log.close()
+                    self._event_log = None
+                self._replace_file(self.event_log_path, json.dumps({"generation": self._generation}) + "\n")
+                if not self._persist_stop.is_set():
+                    self._event_log = open(self.event_log_path, 'a')
+                    
+            except Exception as e:
+                logger.warning(f"Failed to save quota data: {e}")
+                self._snapshot_requested = True
+    
+    def _replace_file(self, path: Path, content: str):
+        """Write a file atomically via a temporary file and rename."""
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, 'w') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
     
     def _load_quota_data(self):
-        """Load quota data from persistent storage."""
+        """Load the quota snapshot and replay the event log recorded after it."""
         if not self.enable_persistence or not self.storage_path.exists():
             return
         
@@ -627,39 +925,90 @@ class IntelligentRateLimiter:
             with open(self.storage_path, 'r') as f:
                 data = json.load(f)
             
+            self._generation = data.get("generation", 0)
+            timestamps: Dict[QuotaType, Tuple[List[float], List[float]]] = {}
+            
             for quota_type_str, quota_data in data.get("quotas", {}).items():
                 try:
                     quota_type = QuotaType(quota_type_str)
                     if quota_type in self.quota_usage:
                         usage = self.quota_usage[quota_type]
-                        usage.current_usage = quota_data.get("current_usage", 0)
-                        usage.burst_usage = quota_data.get("burst_usage", 0)
                         usage.window_start = datetime.fromisoformat(quota_data.get("window_start", datetime.now().isoformat()))
                         usage.last_reset = datetime.fromisoformat(quota_data.get("last_reset", datetime.now().isoformat()))
-                        usage.request_timestamps = [
-                            datetime.fromisoformat(ts) 
-                            for ts in quota_data.get("request_timestamps", [])
-                        ]
+                        
+                        # Older files stored ISO timestamps for all requests
+                        regular = quota_data.get("regular_timestamps")
+                        if regular is None:
+                            regular = [
+                                datetime.fromisoformat(ts).timestamp()
+                                for ts in quota_data.get("request_timestamps", [])
+                            ]
+                        
+                        timestamps[quota_type] = (list(regular), list(quota_data.get("burst_timestamps", [])))
                 except (ValueError, KeyError) as e:
                     logger.warning(f"Invalid quota data for {quota_type_str}: {e}")
             
-            logger.info("Loaded quota data from persistent storage")
+            replayed = self._replay_event_log(timestamps)
+            
+            for quota_type, (regular, burst) in timestamps.items():
+                usage = self.quota_usage[quota_type]
+                usage.regular_timestamps = deque(sorted(regular))
+                usage.burst_timestamps = deque(sorted(burst))
+                usage.current_usage = len(usage.regular_timestamps)
+                usage.burst_usage = len(usage.burst_timestamps)
+                self._update_usage_window(quota_type)
+            
+            logger.info(f"Loaded quota data from persistent storage ({replayed} logged requests)")
             
         except Exception as e:
             logger.warning(f"Failed to load quota data: {e}")
     
+    def _replay_event_log(self, timestamps: Dict[QuotaType, Tuple[List[float], List[float]]]) -> int:
+        """Add requests from an event log that belongs to the loaded snapshot."""
+        if not self.event_log_path.exists():
+            return 0
+        
+        replayed = 0
+        with open(self.event_log_path, 'r') as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                return 0
+            if header.get("generation") != self._generation:
+                return 0
+            
+            for line in f:
+                try:
+                    quota_type_str, timestamp, use_burst = json.loads(line)
+                    quota_type = QuotaType(quota_type_str)
+                except (ValueError, TypeError):
+                    # A partially written line from an interrupted flush
+                    continue
+                
+                if quota_type in self.quota_usage:
+                    regular, burst = timestamps.setdefault(quota_type, ([], []))
+                    (burst if use_burst else regular).append(timestamp)
+                    replayed += 1
+        
+        return replayed
+    
     def shutdown(self):
         """Shutdown the rate limiter and clean up resources."""
         logger.info("Shutting down rate limiter...")
         
-        # Stop queue processor
-        self.queue_processor_running = False
+        # Stop queue dispatcher; queued requests that were not dispatched are dropped
+        with self._dispatch_condition:
+            self.queue_processor_running = False
+            self._dispatch_condition.notify_all()
         if self.queue_thread and self.queue_thread.is_alive():
             self.queue_thread.join(timeout=5)
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         
         # Save final quota data
         if self.enable_persistence:
-            self._save_quota_data()
+            self._stop_persistence()
         
         logger.info("Rate limiter shutdown complete")
     
@@ -8,13 +8,29 @@ Provides comprehensive template management including:
 - Version control and backup
 """
 
+import atexit
+import bisect
+import difflib
+import heapq
 import json
+import math
+import os
+import re
 import shutil
+import threading
+import weakref
+import zipfile
+import zlib
+from collections import OrderedDict
+from collections.abc import MutableMapping
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple
 from dataclasses import asdict, replace
 
+import numpy as np
+
 from .models import MessageTemplate
 from .config_manager import ConfigManager
 from ..utils.exceptions import ValidationError
@@ -22,35 +38,243 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Template managers with usage data that must be flushed at interpreter exit
+_active_managers: "weakref.WeakSet[TemplateManager]" = weakref.WeakSet()
+
+
+def _write_json_atomic(file_path: Path, data: Any, compact: bool = False):
+    """Write JSON to a temporary file and move it over the target."""
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        if compact:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        else:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, file_path)
+
+
+class LazyStore(MutableMapping):
+    """
+    Mapping whose keys are known up front and whose values are loaded on first access.
+    
+    Values that fail to load (the loader returns None) are dropped from the
+    store. With max_resident set, the least recently used values beyond that
+    number are released and loaded again when next accessed.
+    """
+    
+    def __init__(self, loader: Callable[[str], Optional[Any]], keys: Iterable[str] = (),
+                 max_resident: Optional[int] = None):
+        self._loader = loader
+        self._keys: Dict[str, None] = dict.fromkeys(keys)
+        self._resident: "OrderedDict[str, Any]" = OrderedDict()
+        self.max_resident = max_resident
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._resident:
+            self._resident.move_to_end(key)
+            return self._resident[key]
+        if key not in self._keys:
+            raise KeyError(key)
+        
+        value = self._loader(key)
+        if value is None:
+            del self._keys[key]
+            raise KeyError(key)
+        self._make_resident(key, value)
+        return value
+    
+    def __setitem__(self, key: str, value: Any):
+        self._keys[key] = None
+        self._make_resident(key, value)
+    
+    def __delitem__(self, key: str):
+        del self._keys[key]
+        self._resident.pop(key, None)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys))
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def is_loaded(self, key: str) -> bool:
+        """Check whether a value is resident without loading it."""
+        return key in self._resident
+    
+    def items(self) -> List[Tuple[str, Any]]:
+        """Load and return all loadable items."""
+        items = []
+        for key in list(self._keys):
+            try:
+                items.append((key, self[key]))
+            except KeyError:
+                continue
+        return items
+    
+    def values(self) -> List[Any]:
+        """Load and return all loadable values."""
+        return [value for _, value in self.items()]
+    
+    def _make_resident(self, key: str, value: Any):
+        self._resident[key] = value
+        self._resident.move_to_end(key)
+        if self.max_resident is not None:
+            while len(self._resident) > self.max_resident:
+                self._resident.popitem(last=False)
+
+
+@atexit.register
+def _flush_active_managers():
+    """Flush pending template usage of all live managers."""
+    for manager in list(_active_managers):
+        # Skip managers whose library was removed (e.g. temporary directories)
+        if manager.templates_dir.exists():
+            manager.flush_usage()
+
+
+def _template_to_fields(template: MessageTemplate) -> Dict[str, Any]:
+    """Serialize the versioned fields of a template."""
+    return {
+        "id": template.id,
+        "name": template.name,
+        "channels": list(template.channels),
+        "subject": template.subject,
+        "content": template.content,
+        "whatsapp_content": template.whatsapp_content,
+        "language": template.language,
+        "variables": list(template.variables),
+        "created_at": template.created_at.isoformat(),
+        "updated_at": template.updated_at.isoformat()
+    }
+
+
+def _template_from_fields(template_data: Dict[str, Any]) -> MessageTemplate:
+    """Build a template from serialized version fields."""
+    template = MessageTemplate(
+        id=template_data["id"],
+        name=template_data["name"],
+        channels=list(template_data.get("channels", ["email"])),
+        subject=template_data.get("subject", ""),
+        content=template_data.get("content", ""),
+        whatsapp_content=template_data.get("whatsapp_content", ""),
+        language=template_data.get("language", "en"),
+        variables=list(template_data.get("variables", []))
+    )
+    
+    if "created_at" in template_data:
+        template.created_at = datetime.fromisoformat(template_data["created_at"])
+    if "updated_at" in template_data:
+        template.updated_at = datetime.fromisoformat(template_data["updated_at"])
+    
+    return template
+
+
+def _diff_text(old: str, new: str) -> List[List[Any]]:
+    """Encode `new` as line replacements [start, end, text] against `old`."""
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+    return [
+        [i1, i2, "".join(new_lines[j1:j2])]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def _patch_text(old: str, patch: List[List[Any]]) -> str:
+    """Apply line replacements produced by _diff_text."""
+    old_lines = old.splitlines(keepends=True)
+    parts = []
+    position = 0
+    for start, end, text in patch:
+        parts.extend(old_lines[position:start])
+        parts.append(text)
+        position = end
+    parts.extend(old_lines[position:])
+    return "".join(parts)
+
+
+def _encode_delta(base: Dict[str, Any], fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Encode the fields that changed since `base`.
+    
+    Long text fields are stored as line patches when that is smaller than the
+    new value; other changed fields are stored in full.
+    """
+    delta = {}
+    for name, value in fields.items():
+        old_value = base.get(name)
+        if value == old_value:
+            continue
+        if (isinstance(value, str) and isinstance(old_value, str)
+                and len(value) >= TemplateVersionHistory.TEXT_PATCH_MIN_LENGTH):
+            patch = _diff_text(old_value, value)
+            if len(json.dumps(patch, ensure_ascii=False)) < len(value):
+                delta[name] = {"patch": patch}
+                continue
+        delta[name] = value
+    return delta
+
+
+def _apply_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a delta produced by _encode_delta to a copy of `base`."""
+    fields = dict(base)
+    for name, value in delta.items():
+        if isinstance(value, dict):
+            fields[name] = _patch_text(base.get(name) or "", value["patch"])
+        else:
+            fields[name] = value
+    return fields
+
+
+def _fields_at(records: List[Dict[str, Any]], position: int) -> Dict[str, Any]:
+    """Template fields of a version record, replayed from the nearest snapshot before it."""
+    start = position
+    while "template" not in records[start]:
+        start -= 1
+    fields = records[start]["template"]
+    for record in records[start + 1:position + 1]:
+        fields = _apply_delta(fields, record["delta"])
+    return fields
+
+
+def _reconstruct_template(records: List[Dict[str, Any]], position: int) -> MessageTemplate:
+    return _template_from_fields(_fields_at(records, position))
+
 
 class TemplateVersion:
     """Represents a single version of a template."""
     
-    def __init__(self, version_id: str, template: MessageTemplate, author: str = "system", 
-                 message: str = "", parent_version: str = None):
+    def __init__(self, version_id: str, template: Optional[MessageTemplate], author: str = "system",
+                 message: str = "", parent_version: str = None,
+                 template_loader: Optional[Callable[[], MessageTemplate]] = None):
         self.version_id = version_id
-        self.template = template
+        self._template = template
+        self._template_loader = template_loader  # Reconstructs the template on first access
         self.author = author
         self.message = message
         self.parent_version = parent_version
         self.created_at = datetime.now()
         self.is_active = False  # Only one version can be active at a time
-        
+    
+    @property
+    def template(self) -> MessageTemplate:
+        """The template as of this version, reconstructed and cached on first access."""
+        if self._template is None and self._template_loader is not None:
+            self._template = self._template_loader()
+        return self._template
+    
+    @template.setter
+    def template(self, template: MessageTemplate):
+        self._template = template
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "version_id": self.version_id,
-            "template": {
-                "id": self.template.id,
-                "name": self.template.name,
-                "channels": self.template.channels,
-                "subject": self.template.subject,
-                "content": self.template.content,
-                "whatsapp_content": self.template.whatsapp_content,
-                "language": self.template.language,
-                "variables": self.template.variables,
-                "created_at": self.template.created_at.isoformat(),
-                "updated_at": self.template.updated_at.isoformat()
-            },
+            "template": _template_to_fields(self.template),
             "author": self.author,
             "message": self.message,
             "parent_version": self.parent_version,
@@ -60,26 +284,9 @@ class TemplateVersion:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TemplateVersion":
-        template_data = data["template"]
-        template = MessageTemplate(
-            id=template_data["id"],
-            name=template_data["name"],
-            channels=template_data.get("channels", ["email"]),
-            subject=template_data.get("subject", ""),
-            content=template_data.get("content", ""),
-            whatsapp_content=template_data.get("whatsapp_content", ""),
-            language=template_data.get("language", "en"),
-            variables=template_data.get("variables", [])
-        )
-        
-        if "created_at" in template_data:
-            template.created_at = datetime.fromisoformat(template_data["created_at"])
-        if "updated_at" in template_data:
-            template.updated_at = datetime.fromisoformat(template_data["updated_at"])
-        
         version = cls(
             version_id=data["version_id"],
-            template=template,
+            template=_template_from_fields(data["template"]),
             author=data.get("author", "system"),
             message=data.get("message", ""),
             parent_version=data.get("parent_version")
@@ -92,81 +299,299 @@ class TemplateVersion:
         return version
 
 
+class TemplateVersionHistory(dict):
+    """
+    Versions of one template (version_id -> TemplateVersion) backed by a log.
+    
+    Every version is a log record holding either a full snapshot of the
+    template fields or a delta against the previous record, with a snapshot
+    at least every SNAPSHOT_INTERVAL records. Deleted versions stay in the
+    log as the base of later deltas until the history is compacted.
+    """
+    
+    # Records between full snapshots (bounds the deltas applied per reconstruction)
+    SNAPSHOT_INTERVAL = 25
+    
+    # Shorter text fields are stored in full rather than as line patches
+    TEXT_PATCH_MIN_LENGTH = 64
+    
+    def __init__(self):
+        super().__init__()
+        self.records: List[Dict[str, Any]] = []  # Version records in log order
+        self.positions: Dict[str, int] = {}  # version_id -> index in records (including deleted)
+        self.active_version: Optional[str] = None
+        self.deleted_count = 0
+        self.needs_rewrite = False  # Loaded from a legacy file; rewrite as a log on next save
+        self._last_fields: Optional[Dict[str, Any]] = None
+        self._since_snapshot = 0
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "TemplateVersionHistory":
+        """Replay log records (versions and deletions) into a history."""
+        history = cls()
+        for record in records:
+            if "deleted" in record:
+                history.discard(record["deleted"])
+            else:
+                history._add_record(record)
+        return history
+    
+    @classmethod
+    def from_legacy(cls, data: Dict[str, Any]) -> "TemplateVersionHistory":
+        """Load a history saved as one JSON document of full versions."""
+        history = cls()
+        for version_data in data.get("versions", {}).values():
+            version = TemplateVersion.from_dict(version_data)
+            history._add_record(history._make_record(version, version_data["template"], snapshot=True))
+        active_version = data.get("active_version")
+        if active_version in history:
+            history.set_active(active_version)
+        history.needs_rewrite = True
+        return history
+    
+    def add_version(self, version: TemplateVersion, active: bool = False) -> Dict[str, Any]:
+        """Append a new version and return its log record."""
+        fields = _template_to_fields(version.template)
+        snapshot = not self.records or self._since_snapshot >= self.SNAPSHOT_INTERVAL - 1
+        record = self._make_record(version, fields, snapshot, active)
+        self._add_record(record)
+        self._last_fields = fields
+        return record
+    
+    def discard(self, version_id: str) -> bool:
+        """Remove a version, keeping its record as the base of later deltas."""
+        version = self.pop(version_id, None)
+        if version is None:
+            return False
+        if self.active_version == version_id:
+            self.active_version = None
+        self.deleted_count += 1
+        return True
+    
+    def set_active(self, version_id: str):
+        """Mark a version as the active one."""
+        current = self.get(self.active_version) if self.active_version else None
+        if current is not None:
+            current.is_active = False
+        self.active_version = version_id
+        self[version_id].is_active = True
+    
+    def reconstruct(self, version_id: str) -> MessageTemplate:
+        """Build the template of a version from its nearest snapshot."""
+        return _reconstruct_template(self.records, self.positions[version_id])
+    
+    def compacted(self) -> "TemplateVersionHistory":
+        """Re-encode the live versions into a new history without deleted records."""
+        history = TemplateVersionHistory()
+        fields = None
+        for record in self.records:
+            fields = record["template"] if "template" in record else _apply_delta(fields, record["delta"])
+            version = self.get(record["version_id"])
+            if version is None:
+                continue
+            snapshot = not history.records or history._since_snapshot >= self.SNAPSHOT_INTERVAL - 1
+            history._add_record(history._make_record(
+                version, fields, snapshot, active=version.version_id == self.active_version
+            ))
+            history._last_fields = fields
+        return history
+    
+    def iter_log(self) -> Iterator[Dict[str, Any]]:
+        """Yield the records needed to replay this history."""
+        for record in self.records:
+            yield record
+            if record["version_id"] not in self:
+                yield {"deleted": record["version_id"]}
+    
+    def _make_record(self, version: TemplateVersion, fields: Dict[str, Any], snapshot: bool,
+                     active: bool = False) -> Dict[str, Any]:
+        record = {
+            "version_id": version.version_id,
+            "author": version.author,
+            "message": version.message,
+            "parent_version": version.parent_version,
+            "created_at": version.created_at.isoformat()
+        }
+        if snapshot:
+            record["template"] = fields
+        else:
+            record["delta"] = _encode_delta(self._base_fields(), fields)
+        if active:
+            record["active"] = True
+        return record
+    
+    def _add_record(self, record: Dict[str, Any]):
+        version_id = record["version_id"]
+        self.positions[version_id] = len(self.records)
+        self.records.append(record)
+        
+        if "template" in record:
+            self._since_snapshot = 0
+        else:
+            self._since_snapshot += 1
+        self._last_fields = None  # Reconstructed from the log when next needed
+        
+        version = TemplateVersion(
+            version_id=version_id,
+            template=None,
+            author=record.get("author", "system"),
+            message=record.get("message", ""),
+            parent_version=record.get("parent_version"),
+            # Bound to the records rather than the history to avoid a reference cycle
+            template_loader=partial(_reconstruct_template, self.records, self.positions[version_id])
+        )
+        if "created_at" in record:
+            version.created_at = datetime.fromisoformat(record["created_at"])
+        self[version_id] = version
+        
+        if record.get("active"):
+            self.set_active(version_id)
+    
+    def _base_fields(self) -> Dict[str, Any]:
+        """Fields of the last record, the base of the next delta."""
+        if self._last_fields is None:
+            self._last_fields = _fields_at(self.records, len(self.records) - 1)
+        return self._last_fields
+
+
 class TemplateVersionManager:
     """Manages template versions with Git-like functionality."""
     
-    def __init__(self, templates_dir: Path):
+    # Version histories kept in memory; others are reloaded from disk on access
+    MAX_RESIDENT_HISTORIES = 32
+    
+    def __init__(self, templates_dir: Path, max_resident_histories: int = MAX_RESIDENT_HISTORIES):
         self.templates_dir = templates_dir
         self.versions_dir = templates_dir / "versions"
         self.versions_dir.mkdir(exist_ok=True)
         
-        # In-memory version storage
-        self.versions: Dict[str, Dict[str, TemplateVersion]] = {}  # template_id -> {version_id -> version}
         self.active_versions: Dict[str, str] = {}  # template_id -> active_version_id
         
-        self._load_versions()
+        # Version histories, read from disk when a template's history is first needed.
+        # Histories are append-only logs (<id>.jsonl); <id>.json is the legacy format.
+        history_ids = dict.fromkeys(
+            version_file.stem for pattern in ("*.jsonl", "*.json")
+            for version_file in self.versions_dir.glob(pattern)
+        )
+        self.versions: LazyStore = LazyStore(  # template_id -> TemplateVersionHistory
+            self._load_versions,
+            history_ids,
+            max_resident=max_resident_histories
+        )
+    
+    def _log_file(self, template_id: str) -> Path:
+        return self.versions_dir / f"{template_id}.jsonl"
+    
+    def _load_versions(self, template_id: str) -> Optional[TemplateVersionHistory]:
+        """Load the version history of one template from disk."""
+        log_file = self._log_file(template_id)
+        legacy_file = self.versions_dir / f"{template_id}.json"
+        version_file = log_file if log_file.exists() else legacy_file
+        try:
+            if version_file is log_file:
+                records, complete = self._read_log(log_file)
+                history = TemplateVersionHistory.from_records(records)
+                # Rewrite rather than append after an incomplete record
+                history.needs_rewrite = not complete
+            else:
+                with open(legacy_file, 'r', encoding='utf-8') as f:
+                    history = TemplateVersionHistory.from_legacy(json.load(f))
+            
+            if history.active_version:
+                self.active_versions[template_id] = history.active_version
+            
+            return history
+        except Exception as e:
+            logger.error(f"Failed to load versions from {version_file}: {e}")
+            return None
     
-    def _load_versions(self):
-        """Load all versions from disk."""
-        for version_file in self.versions_dir.glob("*.json"):
+    def _read_log(self, log_file: Path) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Read log records, ignoring a record left incomplete by an interrupted write.
+        
+        Returns:
+            The records and whether the log was complete
+        """
+        records = []
+        complete = True
+        with open(log_file, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
             try:
-                with open(version_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                template_id = data["template_id"]
-                versions_data = data.get("versions", {})
-                active_version = data.get("active_version")
-                
-                self.versions[template_id] = {}
-                for version_id, version_data in versions_data.items():
-                    version = TemplateVersion.from_dict(version_data)
-                    self.versions[template_id][version_id] = version
-                
-                if active_version:
-                    self.active_versions[template_id] = active_version
-                    if active_version in self.versions[template_id]:
-                        self.versions[template_id][active_version].is_active = True
-                
-            except Exception as e:
-                logger.error(f"Failed to load versions from {version_file}: {e}")
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                if line_number < len(lines):
+                    raise
+                logger.warning(f"Ignoring incomplete version record at end of {log_file}")
+                complete = False
+        return records, complete
+    
+    def _append_records(self, template_id: str, records: List[Dict[str, Any]]):
+        """Append records to a template's version log."""
+        history = self.versions.get(template_id)
+        if history is None:
+            return
+        if history.needs_rewrite or history.deleted_count > max(len(history), history.SNAPSHOT_INTERVAL):
+            self._save_versions(template_id)
+            return
+        
+        try:
+            with open(self._log_file(template_id), 'a', encoding='utf-8') as f:
+                f.write("".join(
+                    json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+                    for record in records
+                ))
+        except Exception as e:
+            logger.error(f"Failed to save versions for template {template_id}: {e}")
     
     def _save_versions(self, template_id: str):
-        """Save versions for a specific template to disk."""
+        """Rewrite a template's version log, dropping deleted versions."""
         if template_id not in self.versions:
             return
         
-        version_file = self.versions_dir / f"{template_id}.json"
+        log_file = self._log_file(template_id)
         
         try:
-            versions_data = {}
-            for version_id, version in self.versions[template_id].items():
-                versions_data[version_id] = version.to_dict()
+            history = self.versions[template_id].compacted()
+            tmp_path = log_file.with_name(log_file.name + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for record in history.iter_log():
+                    f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            os.replace(tmp_path, log_file)
             
-            data = {
-                "template_id": template_id,
-                "versions": versions_data,
-                "active_version": self.active_versions.get(template_id),
-                "updated_at": datetime.now().isoformat()
-            }
+            legacy_file = self.versions_dir / f"{template_id}.json"
+            if legacy_file.exists():
+                legacy_file.unlink()
             
-            with open(version_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.versions[template_id] = history
             
             logger.debug(f"Saved versions for template {template_id}")
         except Exception as e:
             logger.error(f"Failed to save versions for template {template_id}: {e}")
     
-    def create_version(self, template: MessageTemplate, author: str = "system", 
+    def _new_version_id(self, history: TemplateVersionHistory, base_id: str) -> str:
+        """Make a version ID unique within a history (including deleted versions)."""
+        version_id = base_id
+        suffix = 1
+        while version_id in history.positions:
+            version_id = f"{base_id}_{suffix}"
+            suffix += 1
+        return version_id
+    
+    def create_version(self, template: MessageTemplate, author: str = "system",
                       message: str = "", parent_version: str = None) -> str:
         """Create a new version of a template."""
         template_id = template.id
         
-        # Generate version ID (timestamp-based for simplicity)
-        version_id = f"v{int(datetime.now().timestamp())}"
+        # Ensure template has a history (loading it sets the active version)
+        versions = self.versions.get(template_id)
+        if versions is None:
+            versions = self.versions[template_id] = TemplateVersionHistory()
         
-        # Ensure template has versions dict
-        if template_id not in self.versions:
-            self.versions[template_id] = {}
+        # Generate version ID (timestamp-based for simplicity)
+        version_id = self._new_version_id(versions, f"v{int(datetime.now().timestamp())}")
         
         # If no parent specified, use current active version
         if parent_version is None:
@@ -181,56 +606,40 @@ class TemplateVersionManager:
             parent_version=parent_version
         )
         
-        # Store version
-        self.versions[template_id][version_id] = version
-        
-        # Set as active version
-        self._set_active_version(template_id, version_id)
+        # Store version as the active one; the stored copy is independent of `template`
+        record = versions.add_version(version, active=True)
+        self.active_versions[template_id] = version_id
         
-        # Save to disk
-        self._save_versions(template_id)
+        # Append to the version log
+        self._append_records(template_id, [record])
         
         logger.info(f"Created version {version_id} for template {template_id}")
         return version_id
     
-    def _set_active_version(self, template_id: str, version_id: str):
-        """Set the active version for a template."""
-        if template_id not in self.versions or version_id not in self.versions[template_id]:
-            return False
-        
-        # Deactivate current active version
-        current_active = self.active_versions.get(template_id)
-        if current_active and current_active in self.versions[template_id]:
-            self.versions[template_id][current_active].is_active = False
-        
-        # Set new active version
-        self.active_versions[template_id] = version_id
-        self.versions[template_id][version_id].is_active = True
-        
-        return True
-    
     def get_active_version(self, template_id: str) -> Optional[TemplateVersion]:
         """Get the active version of a template."""
+        versions = self.versions.get(template_id)
         active_version_id = self.active_versions.get(template_id)
-        if not active_version_id or template_id not in self.versions:
+        if not active_version_id or versions is None:
             return None
         
-        return self.versions[template_id].get(active_version_id)
+        return versions.get(active_version_id)
     
     def get_version(self, template_id: str, version_id: str) -> Optional[TemplateVersion]:
         """Get a specific version of a template."""
-        if template_id not in self.versions:
+        versions = self.versions.get(template_id)
+        if versions is None:
             return None
         
-        return self.versions[template_id].get(version_id)
+        return versions.get(version_id)
     
     def get_version_history(self, template_id: str) -> List[TemplateVersion]:
         """Get version history for a template, sorted by creation date."""
-        if template_id not in self.versions:
+        versions = self.versions.get(template_id)
+        if versions is None:
             return []
         
-        versions = list(self.versions[template_id].values())
-        return sorted(versions, key=lambda v: v.created_at, reverse=True)
+        return sorted(versions.values(), key=lambda v: v.created_at, reverse=True)
     
     def rollback_to_version(self, template_id: str, version_id: str) -> Optional[MessageTemplate]:
         """Rollback to a specific version (creates a new version)."""
@@ -238,8 +647,8 @@ class TemplateVersionManager:
         if not target_version:
             return None
         
-        # Create a new version based on the target version
-        rollback_template = target_version.template
+        # Create a new version based on a fresh copy of the target version
+        rollback_template = self.versions[template_id].reconstruct(version_id)
         rollback_template.updated_at = datetime.now()
         
         new_version_id = self.create_version(
@@ -303,6 +712,10 @@ class TemplateVersionManager:
     
     def branch_template(self, template_id: str, branch_name: str, base_version: str = None) -> str:
         """Create a branch from a template version."""
+        versions = self.versions.get(template_id)
+        if versions is None:
+            return None
+        
         if base_version is None:
             base_version = self.active_versions.get(template_id)
         
@@ -311,7 +724,9 @@ class TemplateVersionManager:
             return None
         
         # Create branch version ID
-        branch_version_id = f"branch_{branch_name}_{int(datetime.now().timestamp())}"
+        branch_version_id = self._new_version_id(
+            versions, f"branch_{branch_name}_{int(datetime.now().timestamp())}"
+        )
         
         # Create branch version
         branch_template = base_version_obj.template
@@ -323,8 +738,8 @@ class TemplateVersionManager:
             parent_version=base_version
         )
         
-        self.versions[template_id][branch_version_id] = branch_version
-        self._save_versions(template_id)
+        record = versions.add_version(branch_version)
+        self._append_records(template_id, [record])
         
         logger.info(f"Created branch '{branch_name}' for template {template_id}")
         return branch_version_id
@@ -332,6 +747,9 @@ class TemplateVersionManager:
     def merge_versions(self, template_id: str, source_version: str, target_version: str = None, 
                       author: str = "system") -> Optional[str]:
         """Merge one version into another (creates a new version)."""
+        if self.versions.get(template_id) is None:
+            return None
+        
         if target_version is None:
             target_version = self.active_versions.get(template_id)
         
@@ -343,7 +761,7 @@ class TemplateVersionManager:
         
         # For simplicity, merge takes the source version's content
         # In a real implementation, this would handle conflicts
-        merged_template = source_ver.template
+        merged_template = self.versions[template_id].reconstruct(source_version)
         merged_template.updated_at = datetime.now()
         
         merge_version_id = self.create_version(
@@ -366,8 +784,9 @@ class TemplateVersionManager:
             logger.warning(f"Cannot delete active version {version_id}")
             return False
         
-        del self.versions[template_id][version_id]
-        self._save_versions(template_id)
+        # Later versions may be stored as deltas against it, so record a deletion
+        self.versions[template_id].discard(version_id)
+        self._append_records(template_id, [{"deleted": version_id}])
         
         logger.info(f"Deleted version {version_id} for template {template_id}")
         return True
@@ -396,7 +815,7 @@ class TemplateVersionManager:
                 versions_to_delete.append(version_id)
         
         for version_id in versions_to_delete:
-            del self.versions[template_id][version_id]
+            self.versions[template_id].discard(version_id)
         
         if versions_to_delete:
             self._save_versions(template_id)
@@ -417,18 +836,23 @@ class TemplateAnalytics:
         self.ab_tests: Dict[str, Dict[str, Any]] = {}  # test_id -> test_data
         self.campaign_results: Dict[str, Dict[str, Any]] = {}  # campaign_id -> results
         
+        # Analytics files changed in memory but not yet written
+        self._dirty_files: Set[str] = set()
+        
         self._load_analytics_data()
     
-    def _load_analytics_data(self):
-        """Load analytics data from disk."""
-        analytics_files = {
+    def _analytics_files(self) -> Dict[str, Dict[str, Any]]:
+        """Map analytics file names to the data they store."""
+        return {
             "usage_stats.json": self.usage_stats,
             "performance_metrics.json": self.performance_metrics,
             "ab_tests.json": self.ab_tests,
             "campaign_results.json": self.campaign_results
         }
-        
-        for filename, data_dict in analytics_files.items():
+    
+    def _load_analytics_data(self):
+        """Load analytics data from disk."""
+        for filename, data_dict in self._analytics_files().items():
             file_path = self.analytics_dir / filename
             if file_path.exists():
                 try:
@@ -438,26 +862,36 @@ class TemplateAnalytics:
                 except Exception as e:
                     logger.error(f"Failed to load {filename}: {e}")
     
-    def _save_analytics_data(self):
-        """Save analytics data to disk."""
-        analytics_files = {
-            "usage_stats.json": self.usage_stats,
-            "performance_metrics.json": self.performance_metrics,
-            "ab_tests.json": self.ab_tests,
-            "campaign_results.json": self.campaign_results
-        }
+    def _save_analytics_data(self, filenames: List[str] = None):
+        """
+        Save analytics data to disk.
         
-        for filename, data_dict in analytics_files.items():
-            file_path = self.analytics_dir / filename
+        Args:
+            filenames: Analytics files to write; all of them if not given
+        """
+        analytics_files = self._analytics_files()
+        
+        for filename in filenames or list(analytics_files):
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data_dict, f, indent=2, ensure_ascii=False)
+                _write_json_atomic(self.analytics_dir / filename, analytics_files[filename])
+                self._dirty_files.discard(filename)
             except Exception as e:
                 logger.error(f"Failed to save {filename}: {e}")
     
+    def flush(self):
+        """Write analytics files changed since the last save."""
+        if self._dirty_files:
+            self._save_analytics_data(sorted(self._dirty_files))
+    
     def record_template_usage(self, template_id: str, channel: str, success: bool = True, 
-                             response_time: float = None, context: Dict[str, Any] = None):
-        """Record template usage for analytics."""
+                             response_time: float = None, context: Dict[str, Any] = None,
+                             persist: bool = True):
+        """
+        Record template usage for analytics.
+        
+        With persist=False the usage statistics are only marked dirty and
+        written by the next flush().
+        """
         if template_id not in self.usage_stats:
             self.usage_stats[template_id] = {
                 "total_uses": 0,
@@ -504,7 +938,10 @@ class TemplateAnalytics:
             # Keep only last 50 contexts
             stats["contexts"] = stats["contexts"][-50:]
         
-        self._save_analytics_data()
+        if persist:
+            self._save_analytics_data(["usage_stats.json"])
+        else:
+            self._dirty_files.add("usage_stats.json")
     
     def get_template_analytics(self, template_id: str) -> Dict[str, Any]:
         """Get comprehensive analytics for a template."""
@@ -588,7 +1025,7 @@ class TemplateAnalytics:
             }
         }
         
-        self._save_analytics_data()
+        self._save_analytics_data(["ab_tests.json"])
         return test_id
     
     def get_top_performing_templates(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -609,63 +1046,160 @@ class TemplateAnalytics:
 class TemplateSearchIndex:
     """Full-text search index for templates with advanced search capabilities."""
     
+    TOKEN_PATTERN = re.compile(r"\w+")
+    
+    # BM25 term frequency saturation and document length normalization
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+    
+    # Score added when a query term matches a word of the template name
+    NAME_MATCH_BONUS = 1.0
+    
+    # Version of the persisted index layout
+    FORMAT_VERSION = 2
+    
     def __init__(self):
-        self.index = {}  # template_id -> searchable_content
-        self.tag_index = {}  # tag -> set of template_ids
-        self.category_index = {}  # category_id -> set of template_ids
-        self.usage_index = {}  # template_id -> usage_score
+        self.postings: Dict[str, Dict[str, int]] = {}  # term -> {template_id: term frequency}
+        self.doc_lengths: Dict[str, int] = {}  # template_id -> number of terms
+        self.tag_index: Dict[str, Set[str]] = {}  # tag -> set of template_ids
+        self.category_index: Dict[str, Set[str]] = {}  # category_id -> set of template_ids
+        self.usage_index: Dict[str, int] = {}  # template_id -> usage_score
+        
+        # Template name words, used for the name bonus and suggestions
+        self.name_postings: Dict[str, Set[str]] = {}  # name term -> set of template_ids
+        
+        # Reverse maps so a template can be removed without scanning the index
+        self._doc_terms: Dict[str, Dict[str, int]] = {}  # template_id -> {term: frequency}
+        self._doc_name_terms: Dict[str, Set[str]] = {}
+        self._doc_tags: Dict[str, Set[str]] = {}
+        self._doc_category: Dict[str, str] = {}
+        
+        self._total_length = 0
         
+        # BM25 length normalization per template, cleared when any template changes
+        self._length_norms: Optional[Dict[str, float]] = None
+        
+        # Sorted vocabularies for prefix lookup, rebuilt when terms are added or removed
+        self._sorted_terms: Optional[List[str]] = None
+        self._sorted_name_terms: Optional[List[str]] = None
+    
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """Split text into lowercase word terms."""
+        return cls.TOKEN_PATTERN.findall(text.lower())
+    
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+    
+    def __contains__(self, template_id: str) -> bool:
+        return template_id in self.doc_lengths
+    
+    def term_counts(self, template_id: str) -> Optional[Dict[str, int]]:
+        """Term frequencies of an indexed template, or None if it is not indexed."""
+        return self._doc_terms.get(template_id)
+    
     def add_template(self, template: MessageTemplate, metadata: Dict[str, Any]):
         """Add or update a template in the search index."""
         template_id = template.id
+        tags = [tag.lower() for tag in metadata.get("tags", [])]
         
         # Build searchable content
         searchable_parts = [
-            template.name.lower(),
-            template.subject.lower(),
-            template.content.lower(),
-            template.whatsapp_content.lower(),
-            metadata.get("description", "").lower(),
-            " ".join(template.variables).lower(),
-            " ".join(template.channels).lower()
+            template.name,
+            template.subject,
+            template.content,
+            template.whatsapp_content,
+            metadata.get("description", ""),
+            " ".join(template.variables),
+            " ".join(template.channels),
+            " ".join(tags)
         ]
         
-        # Add tags to searchable content
-        tags = metadata.get("tags", [])
-        searchable_parts.extend([tag.lower() for tag in tags])
+        term_counts: Dict[str, int] = {}
+        for part in searchable_parts:
+            for term in self.tokenize(part):
+                term_counts[term] = term_counts.get(term, 0) + 1
+        
+        self._index_document(
+            template_id,
+            term_counts,
+            set(self.tokenize(template.name)),
+            set(tags),
+            metadata.get("category_id", "general")
+        )
         
-        # Store in main index
-        self.index[template_id] = " ".join(filter(None, searchable_parts))
+        # Update usage index
+        self.usage_index[template_id] = metadata.get("usage_count", 0)
+    
+    def _index_document(self, template_id: str, term_counts: Dict[str, int], name_terms: Set[str],
+                        tags: Set[str], category_id: str):
+        """Insert a template's terms, replacing any previous entry."""
+        self._unindex_document(template_id)
+        
+        for term, count in term_counts.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                self._sorted_terms = None
+            postings[template_id] = count
+        self._doc_terms[template_id] = term_counts
+        
+        length = sum(term_counts.values())
+        self.doc_lengths[template_id] = length
+        self._total_length += length
+        self._length_norms = None
+        
+        for term in name_terms:
+            if term not in self.name_postings:
+                self.name_postings[term] = set()
+                self._sorted_name_terms = None
+            self.name_postings[term].add(template_id)
+        self._doc_name_terms[template_id] = name_terms
         
-        # Update tag index
         for tag in tags:
-            tag_lower = tag.lower()
-            if tag_lower not in self.tag_index:
-                self.tag_index[tag_lower] = set()
-            self.tag_index[tag_lower].add(template_id)
+            self.tag_index.setdefault(tag, set()).add(template_id)
+        self._doc_tags[template_id] = tags
         
-        # Update category index
-        category_id = metadata.get("category_id", "general")
-        if category_id not in self.category_index:
-            self.category_index[category_id] = set()
-        self.category_index[category_id].add(template_id)
+        self.category_index.setdefault(category_id, set()).add(template_id)
+        self._doc_category[template_id] = category_id
+    
+    def _unindex_document(self, template_id: str):
+        """Remove a template's terms, tags and category membership."""
+        term_counts = self._doc_terms.pop(template_id, None)
+        if term_counts is None:
+            return
         
-        # Update usage index
-        self.usage_index[template_id] = metadata.get("usage_count", 0)
+        for term in term_counts:
+            postings = self.postings[term]
+            del postings[template_id]
+            if not postings:
+                del self.postings[term]
+                self._sorted_terms = None
+        
+        self._total_length -= self.doc_lengths.pop(template_id)
+        self._length_norms = None
+        
+        for term in self._doc_name_terms.pop(template_id, ()):
+            ids = self.name_postings[term]
+            ids.discard(template_id)
+            if not ids:
+                del self.name_postings[term]
+                self._sorted_name_terms = None
+        
+        for tag in self._doc_tags.pop(template_id, ()):
+            ids = self.tag_index.get(tag)
+            if ids is not None:
+                ids.discard(template_id)
+                if not ids:
+                    del self.tag_index[tag]
+        
+        category_id = self._doc_category.pop(template_id, None)
+        if category_id in self.category_index:
+            self.category_index[category_id].discard(template_id)
     
     def remove_template(self, template_id: str):
         """Remove a template from the search index."""
-        # Remove from main index
-        if template_id in self.index:
-            del self.index[template_id]
-        
-        # Remove from tag index
-        for tag_set in self.tag_index.values():
-            tag_set.discard(template_id)
-        
-        # Remove from category index
-        for category_set in self.category_index.values():
-            category_set.discard(template_id)
+        self._unindex_document(template_id)
         
         # Remove from usage index
         if template_id in self.usage_index:
@@ -676,65 +1210,181 @@ class TemplateSearchIndex:
         """
         Search templates with scoring and filtering.
         
+        Each query word matches indexed words it is a prefix of, so partially
+        typed queries find results. Matches are scored with BM25, plus a bonus
+        for words in the template name and a capped usage boost.
+        
         Returns:
             List of (template_id, relevance_score) tuples, sorted by relevance
         """
         if not query.strip() and not tags and not category_id and not channels:
             return []
         
-        query_lower = query.lower().strip()
-        results = []
-        
-        # Get candidate templates based on filters
-        candidates = set(self.index.keys())
+        # Get candidate templates based on filters (None means all templates)
+        candidates: Optional[Set[str]] = None
         
         if category_id:
-            candidates &= self.category_index.get(category_id, set())
+            candidates = self.category_index.get(category_id, set())
         
         if tags:
             tag_candidates = set()
             for tag in tags:
                 tag_candidates |= self.tag_index.get(tag.lower(), set())
-            candidates &= tag_candidates
+            candidates = tag_candidates if candidates is None else candidates & tag_candidates
         
-        # Score each candidate template
-        for template_id in candidates:
-            if template_id not in self.index:
-                continue
-                
-            content = self.index[template_id]
-            score = self._calculate_relevance_score(query_lower, content, template_id)
-            
-            if score > 0:
-                results.append((template_id, score))
+        query_terms = self.tokenize(query)
+        if not query_terms:
+            template_ids = self.doc_lengths if candidates is None else candidates
+            results = [(template_id, 1.0) for template_id in template_ids if template_id in self.doc_lengths]
+        else:
+            scores = self._score_query(query_terms, candidates)
+            results = [
+                (template_id, score + min(self.usage_index.get(template_id, 0) * 0.1, 2.0))  # Cap at 2.0 boost
+                for template_id, score in scores.items()
+            ]
         
         # Sort by relevance score (descending) and limit results
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:limit]
+        return heapq.nlargest(limit, results, key=lambda x: x[1])
+    
+    def _score_query(self, query_terms: List[str], candidates: Optional[Set[str]]) -> Dict[str, float]:
+        """Compute BM25 scores with name bonuses for templates matching any query term."""
+        scores: Dict[str, float] = {}
+        document_count = len(self.doc_lengths)
+        if not document_count:
+            return scores
+        
+        norms = self._get_length_norms()
+        k1 = self.BM25_K1
+        
+        for query_term in query_terms:
+            for term in self._expand_prefix(query_term, self.postings, "_sorted_terms"):
+                postings = self.postings[term]
+                weight = (k1 + 1) * math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                
+                if candidates is not None:
+                    if len(candidates) < len(postings):
+                        matches = [(tid, postings[tid]) for tid in candidates if tid in postings]
+                    else:
+                        matches = [(tid, f) for tid, f in postings.items() if tid in candidates]
+                else:
+                    matches = postings.items()
+                
+                for template_id, frequency in matches:
+                    scores[template_id] = scores.get(template_id, 0.0) + \
+                        weight * frequency / (frequency + norms[template_id])
+            
+            name_matches = set()
+            for term in self._expand_prefix(query_term, self.name_postings, "_sorted_name_terms"):
+                name_matches |= self.name_postings[term]
+            for template_id in name_matches:
+                if template_id in scores:
+                    scores[template_id] += self.NAME_MATCH_BONUS
+        
+        return scores
+    
+    def _get_length_norms(self) -> Dict[str, float]:
+        """Return the BM25 length normalization term of each template."""
+        if self._length_norms is None:
+            k1, b = self.BM25_K1, self.BM25_B
+            average_length = self._total_length / len(self.doc_lengths)
+            self._length_norms = {
+                template_id: k1 * (1 - b + b * length / average_length)
+                for template_id, length in self.doc_lengths.items()
+            }
+        return self._length_norms
     
-    def _calculate_relevance_score(self, query: str, content: str, template_id: str) -> float:
-        """Calculate relevance score for a template."""
-        if not query:
-            return 1.0
+    def _expand_prefix(self, prefix: str, vocabulary: Dict[str, Any], sorted_attr: str) -> List[str]:
+        """Return the terms of a vocabulary that start with prefix."""
+        sorted_terms = getattr(self, sorted_attr)
+        if sorted_terms is None:
+            sorted_terms = sorted(vocabulary)
+            setattr(self, sorted_attr, sorted_terms)
         
-        score = 0.0
-        query_terms = query.split()
+        start = bisect.bisect_left(sorted_terms, prefix)
+        end = bisect.bisect_left(sorted_terms, prefix + "\uffff", start)
+        return sorted_terms[start:end]
+    
+    def suggest_template_ids(self, partial_query: str) -> Set[str]:
+        """
+        Find templates whose name matches a partially typed query.
         
-        for term in query_terms:
-            if term in content:
-                # Exact match gets higher score
-                score += content.count(term) * 2.0
-                
-                # Bonus for matches in template name (assumed to be at start of content)
-                if content.startswith(term) or f" {term}" in content[:100]:
-                    score += 1.0
+        All query words but the last must be words of the name; the last may
+        be the start of one.
+        
+        Returns:
+            Set of matching template IDs
+        """
+        terms = self.tokenize(partial_query)
+        if not terms:
+            return set(self.doc_lengths)
+        
+        matches: Optional[Set[str]] = None
+        for term in terms[:-1]:
+            ids = self.name_postings.get(term, set())
+            matches = set(ids) if matches is None else matches & ids
+        
+        prefix_matches = set()
+        for term in self._expand_prefix(terms[-1], self.name_postings, "_sorted_name_terms"):
+            prefix_matches |= self.name_postings[term]
+        
+        return prefix_matches if matches is None else matches & prefix_matches
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the index compactly.
+        
+        Templates are numbered once and postings stored as flat
+        [template number, frequency, ...] lists.
+        """
+        template_ids = list(self.doc_lengths)
+        numbers = {template_id: number for number, template_id in enumerate(template_ids)}
+        
+        postings = {}
+        for term, term_postings in self.postings.items():
+            flat = []
+            for template_id, frequency in term_postings.items():
+                flat.append(numbers[template_id])
+                flat.append(frequency)
+            postings[term] = flat
         
-        # Boost score based on usage frequency
-        usage_count = self.usage_index.get(template_id, 0)
-        usage_boost = min(usage_count * 0.1, 2.0)  # Cap at 2.0 boost
-        score += usage_boost
+        return {
+            "version": self.FORMAT_VERSION,
+            "templates": template_ids,
+            "name_terms": [sorted(self._doc_name_terms[tid]) for tid in template_ids],
+            "tags": [sorted(self._doc_tags[tid]) for tid in template_ids],
+            "categories": [self._doc_category[tid] for tid in template_ids],
+            "postings": postings,
+            "usage_index": self.usage_index
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TemplateSearchIndex":
+        """
+        Restore an index saved with to_dict().
         
-        return score
+        Data in an older layout yields an empty index, to be rebuilt from the
+        templates.
+        """
+        index = cls()
+        if data.get("version") != cls.FORMAT_VERSION:
+            return index
+        
+        template_ids = data["templates"]
+        doc_terms: List[Dict[str, int]] = [{} for _ in template_ids]
+        for term, flat in data["postings"].items():
+            for position in range(0, len(flat), 2):
+                doc_terms[flat[position]][term] = flat[position + 1]
+        
+        for number, template_id in enumerate(template_ids):
+            index._index_document(
+                template_id,
+                doc_terms[number],
+                set(data["name_terms"][number]),
+                set(data["tags"][number]),
+                data["categories"][number]
+            )
+        index.usage_index = data.get("usage_index", {})
+        return index
     
     def get_popular_tags(self, limit: int = 20) -> List[Tuple[str, int]]:
         """Get most popular tags by usage."""
@@ -769,32 +1419,122 @@ class TemplateSearchIndex:
 
 
 class TemplateRecommendationEngine:
-    """Recommendation engine for templates based on usage patterns."""
+    """
+    Recommendation engine for templates based on usage patterns.
     
-    def __init__(self):
-        self.usage_patterns = {}  # template_id -> usage_metadata
-        self.similarity_cache = {}  # (template_id1, template_id2) -> similarity_score
+    The usage count, last use, channel mix and hashed content terms of every
+    template with a usage pattern are kept in NumPy arrays, one row per
+    template, so a template is compared with all others in one vectorized
+    computation. Similarity rows of recently queried templates are cached
+    and updated entry by entry as usage is recorded.
+    """
+    
+    # Weights of usage frequency, recency, channel mix and content similarity
+    USAGE_WEIGHT = 0.5
+    RECENCY_WEIGHT = 0.2
+    CHANNEL_WEIGHT = 0.15
+    CONTENT_WEIGHT = 0.15
+    
+    # Similarity of a feature that is unknown for either template
+    NEUTRAL_SIMILARITY = 0.5
+    
+    # Minimum similarity for a template to be recommended as similar
+    MIN_SIMILARITY = 0.1
+    
+    # Channel mix columns; other channels share the last column
+    CHANNELS = ("email", "whatsapp")
+    
+    # Length of hashed content term vectors
+    CONTENT_FEATURES = 128
+    
+    # Number of templates whose similarity rows are cached
+    SIMILARITY_CACHE_SIZE = 128
+    
+    def __init__(self, content_terms: Optional[Callable[[str], Optional[Dict[str, int]]]] = None):
+        """
+        Initialize the recommendation engine.
         
-    def record_usage(self, template_id: str, context: Dict[str, Any] = None):
+        Args:
+            content_terms: Returns the term frequencies of a template's content,
+                or None if unknown; templates are compared on usage only without it
+        """
+        self.usage_patterns = {}  # template_id -> usage_metadata
+        self._content_terms = content_terms
+        
+        # Cached similarity rows: row i of similarity_matrix holds a template's similarity
+        # to every template, updated column by column as features change
+        self.similarity_cache: "OrderedDict[str, int]" = OrderedDict()  # template_id -> matrix row
+        self.similarity_matrix = np.zeros((0, 0), dtype=np.float32)
+        self._free_slots: List[int] = []
+        
+        # Feature arrays; rows [0, len(self._ids)) are in use
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}  # template_id -> row
+        self._counts = np.zeros(0)
+        self._last_used = np.zeros(0)  # POSIX timestamps, NaN if never used
+        self._channel_mix = np.zeros((0, len(self.CHANNELS) + 1), dtype=np.float32)  # L2-normalized
+        self._has_channels = np.zeros(0, dtype=bool)
+        self._content = np.zeros((0, self.CONTENT_FEATURES), dtype=np.float32)  # L2-normalized
+        self._has_content = np.zeros(0, dtype=bool)
+        self._stale_content: Set[str] = set()  # Templates whose content features must be computed
+    
+    def record_usage(self, template_id: str, context: Dict[str, Any] = None, channel: str = None):
         """Record template usage for recommendation learning."""
         if template_id not in self.usage_patterns:
             self.usage_patterns[template_id] = {
                 "usage_count": 0,
                 "last_used": None,
                 "contexts": [],
-                "success_rate": 0.0
+                "success_rate": 0.0,
+                "channels": {}
             }
         
         pattern = self.usage_patterns[template_id]
         pattern["usage_count"] += 1
         pattern["last_used"] = datetime.now()
         
+        if channel:
+            channels = pattern.setdefault("channels", {})
+            channels[channel] = channels.get(channel, 0) + 1
+        
         if context:
             pattern["contexts"].append(context)
             # Keep only recent contexts (last 50)
             pattern["contexts"] = pattern["contexts"][-50:]
+        
+        self._update_row(template_id)
+    
+    def set_usage_pattern(self, template_id: str, pattern: Dict[str, Any]):
+        """Restore a stored usage pattern."""
+        self.usage_patterns[template_id] = pattern
+        self._update_row(template_id)
+    
+    def update_content(self, template_id: str):
+        """Recompute a template's content features when it is next compared."""
+        if template_id in self._rows:
+            self._stale_content.add(template_id)
     
-    def get_recommendations(self, template_id: str = None, category_id: str = None, 
+    def remove_template(self, template_id: str):
+        """Forget a template's usage pattern and features."""
+        self.usage_patterns.pop(template_id, None)
+        row = self._rows.pop(template_id, None)
+        if row is None:
+            return
+        
+        # Move the last row into the freed one
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+            for array in (self._counts, self._last_used, self._channel_mix, self._has_channels,
+                          self._content, self._has_content):
+                array[row] = array[last]
+        self._ids.pop()
+        self._stale_content.discard(template_id)
+        self._clear_similarity_cache()
+    
+    def get_recommendations(self, template_id: str = None, category_id: str = None,
                           limit: int = 5) -> List[Tuple[str, float, str]]:
         """
         Get template recommendations.
@@ -803,89 +1543,231 @@ class TemplateRecommendationEngine:
             List of (template_id, confidence_score, reason) tuples
         """
         recommendations = []
+        recommended = set()
         
         if template_id and template_id in self.usage_patterns:
             # Find similar templates based on usage patterns
-            similar_templates = self._find_similar_templates(template_id)
-            for similar_id, similarity in similar_templates[:limit]:
+            for similar_id, similarity in self._find_similar_templates(template_id, limit):
                 recommendations.append((similar_id, similarity, "Similar usage pattern"))
+                recommended.add(similar_id)
         
         # Add popular templates in category
         if category_id:
-            popular_in_category = self._get_popular_in_category(category_id, limit)
-            for pop_id, popularity in popular_in_category:
-                if not any(rec[0] == pop_id for rec in recommendations):
+            for pop_id, popularity in self._get_popular_in_category(category_id, limit):
+                if pop_id not in recommended:
                     recommendations.append((pop_id, popularity, "Popular in category"))
+                    recommended.add(pop_id)
         
         # Add recently used templates
-        recent_templates = self._get_recently_used(limit)
-        for recent_id, recency in recent_templates:
-            if not any(rec[0] == recent_id for rec in recommendations):
+        for recent_id, recency in self._get_recently_used(limit):
+            if recent_id not in recommended:
                 recommendations.append((recent_id, recency, "Recently used"))
+                recommended.add(recent_id)
         
         # Sort by confidence score and limit
         recommendations.sort(key=lambda x: x[1], reverse=True)
         return recommendations[:limit]
     
-    def _find_similar_templates(self, template_id: str) -> List[Tuple[str, float]]:
-        """Find templates with similar usage patterns."""
+    def _find_similar_templates(self, template_id: str, limit: int = None) -> List[Tuple[str, float]]:
+        """Find templates with similar usage patterns, most similar first."""
         if template_id not in self.usage_patterns:
             return []
         
-        target_pattern = self.usage_patterns[template_id]
-        similarities = []
-        
-        for other_id, other_pattern in self.usage_patterns.items():
-            if other_id == template_id:
-                continue
-            
-            # Calculate similarity based on usage frequency and recency
-            similarity = self._calculate_pattern_similarity(target_pattern, other_pattern)
-            if similarity > 0.1:  # Minimum threshold
-                similarities.append((other_id, similarity))
-        
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities
-    
-    def _calculate_pattern_similarity(self, pattern1: Dict, pattern2: Dict) -> float:
-        """Calculate similarity between two usage patterns."""
-        # Simple similarity based on usage frequency and recency
-        usage_similarity = min(pattern1["usage_count"], pattern2["usage_count"]) / \
-                          max(pattern1["usage_count"], pattern2["usage_count"], 1)
-        
-        # Recency similarity (both used recently = higher similarity)
-        recency_similarity = 0.5
-        if pattern1["last_used"] and pattern2["last_used"]:
-            time_diff = abs((pattern1["last_used"] - pattern2["last_used"]).days)
-            recency_similarity = max(0, 1.0 - (time_diff / 30.0))  # 30-day window
-        
-        return (usage_similarity * 0.7) + (recency_similarity * 0.3)
+        self._sync_rows()
+        scores = self._similarity_row(template_id)
+        return self._top(scores, limit, self.MIN_SIMILARITY)
     
     def _get_popular_in_category(self, category_id: str, limit: int) -> List[Tuple[str, float]]:
         """Get popular templates in a specific category."""
         # This would need access to template metadata - simplified for now
-        popular = []
-        for template_id, pattern in self.usage_patterns.items():
-            popularity = min(pattern["usage_count"] / 10.0, 1.0)  # Normalize to 0-1
-            popular.append((template_id, popularity))
-        
-        popular.sort(key=lambda x: x[1], reverse=True)
-        return popular[:limit]
+        self._sync_rows()
+        n = len(self._ids)
+        popularity = np.minimum(self._counts[:n] / 10.0, 1.0)  # Normalize to 0-1
+        return self._top(popularity, limit)
     
     def _get_recently_used(self, limit: int) -> List[Tuple[str, float]]:
         """Get recently used templates."""
-        recent = []
-        now = datetime.now()
-        
-        for template_id, pattern in self.usage_patterns.items():
-            if pattern["last_used"]:
-                days_ago = (now - pattern["last_used"]).days
-                recency_score = max(0, 1.0 - (days_ago / 7.0))  # 7-day window
-                if recency_score > 0:
-                    recent.append((template_id, recency_score))
-        
-        recent.sort(key=lambda x: x[1], reverse=True)
-        return recent[:limit]
+        self._sync_rows()
+        n = len(self._ids)
+        with np.errstate(invalid="ignore"):
+            days_ago = np.floor((datetime.now().timestamp() - self._last_used[:n]) / 86400.0)
+            recency = np.maximum(0.0, 1.0 - days_ago / 7.0)  # 7-day window
+        return self._top(np.nan_to_num(recency, nan=0.0), limit, 0.0)
+    
+    def _top(self, scores: np.ndarray, limit: Optional[int], min_score: Optional[float] = None
+             ) -> List[Tuple[str, float]]:
+        """Return the highest scores as (template_id, score), best first."""
+        n = len(scores)
+        if limit is None or limit >= n:
+            top = np.argsort(scores, kind="stable")[::-1]
+        elif limit <= 0:
+            return []
+        else:
+            top = np.argpartition(scores, n - limit)[n - limit:]
+            top = top[np.argsort(scores[top], kind="stable")[::-1]]
+        
+        if min_score is not None:
+            top = top[scores[top] > min_score]
+        return [(self._ids[row], float(scores[row])) for row in top]
+    
+    def _similarity_row(self, template_id: str) -> np.ndarray:
+        """Similarity of a template to every template (cached; -inf for itself)."""
+        self._refresh_content()
+        n = len(self._ids)
+        slot = self.similarity_cache.get(template_id)
+        if slot is not None:
+            self.similarity_cache.move_to_end(template_id)
+            return self.similarity_matrix[slot, :n]
+        
+        if self.similarity_matrix.shape[1] != len(self._counts):
+            self.similarity_matrix = np.empty((self.SIMILARITY_CACHE_SIZE, len(self._counts)), dtype=np.float32)
+            self._clear_similarity_cache()
+        if not self._free_slots:
+            _, slot = self.similarity_cache.popitem(last=False)
+            self._free_slots.append(slot)
+        slot = self._free_slots.pop()
+        
+        row = self._rows[template_id]
+        scores = self.similarity_matrix[slot]
+        scores[:n] = self._similarity(row, slice(0, n))
+        scores[row] = -np.inf
+        self.similarity_cache[template_id] = slot
+        return scores[:n]
+    
+    def _clear_similarity_cache(self):
+        self.similarity_cache.clear()
+        self._free_slots = list(range(len(self.similarity_matrix)))
+    
+    def _uncache(self, template_id: str):
+        slot = self.similarity_cache.pop(template_id, None)
+        if slot is not None:
+            self._free_slots.append(slot)
+    
+    def _update_similarity_column(self, row: int):
+        """Recompute one template's column of the cached rows (similarity is symmetric)."""
+        if not self.similarity_cache:
+            return
+        slots = np.fromiter(self.similarity_cache.values(), dtype=np.intp, count=len(self.similarity_cache))
+        rows = np.fromiter((self._rows[cached_id] for cached_id in self.similarity_cache),
+                           dtype=np.intp, count=len(self.similarity_cache))
+        self.similarity_matrix[slots, row] = self._similarity(row, rows)
+    
+    def _similarity(self, row: int, others) -> np.ndarray:
+        """Similarity of one template's row to the rows selected by `others`."""
+        counts = self._counts[others]
+        count = self._counts[row]
+        usage = np.minimum(counts, count) / np.maximum(np.maximum(counts, count), 1.0)
+        
+        # Recency similarity (both used recently = higher similarity), 30-day window
+        last_used = self._last_used[others]
+        with np.errstate(invalid="ignore"):
+            days_apart = np.floor(np.abs(last_used - self._last_used[row]) / 86400.0)
+            recency = np.maximum(0.0, 1.0 - days_apart / 30.0)
+        recency = np.nan_to_num(recency, nan=self.NEUTRAL_SIMILARITY)
+        
+        channel = self._cosine(self._channel_mix, self._has_channels, row, others)
+        content = self._cosine(self._content, self._has_content, row, others)
+        
+        return (usage * self.USAGE_WEIGHT + recency * self.RECENCY_WEIGHT
+                + channel * self.CHANNEL_WEIGHT + content * self.CONTENT_WEIGHT)
+    
+    def _cosine(self, vectors: np.ndarray, known: np.ndarray, row: int, others) -> np.ndarray:
+        """Cosine similarity of normalized vectors, neutral where either is unknown."""
+        if not known[row]:
+            return np.full(len(self._counts[others]), self.NEUTRAL_SIMILARITY)
+        return np.where(known[others], vectors[others] @ vectors[row], self.NEUTRAL_SIMILARITY)
+    
+    def _sync_rows(self):
+        """Rebuild the feature arrays if usage_patterns was changed directly."""
+        if len(self._ids) == len(self.usage_patterns):
+            return
+        self._ids = []
+        self._rows = {}
+        self._clear_similarity_cache()
+        for template_id in self.usage_patterns:
+            self._update_row(template_id)
+    
+    def _update_row(self, template_id: str):
+        """Write a template's usage features and update cached similarities."""
+        pattern = self.usage_patterns[template_id]
+        row = self._rows.get(template_id)
+        if row is None:
+            row = self._add_row(template_id)
+        
+        self._counts[row] = pattern["usage_count"]
+        last_used = pattern.get("last_used")
+        self._last_used[row] = last_used.timestamp() if last_used else np.nan
+        
+        mix = np.zeros(len(self.CHANNELS) + 1)
+        for channel, count in pattern.get("channels", {}).items():
+            column = self.CHANNELS.index(channel) if channel in self.CHANNELS else len(self.CHANNELS)
+            mix[column] += count
+        norm = np.linalg.norm(mix)
+        self._channel_mix[row] = mix / norm if norm else 0.0
+        self._has_channels[row] = bool(norm)
+        
+        self._update_cached_similarities(template_id, row)
+    
+    def _add_row(self, template_id: str) -> int:
+        row = len(self._ids)
+        if row == len(self._counts):
+            capacity = max(64, row * 2)
+            self._counts = self._grow(self._counts, capacity)
+            self._last_used = self._grow(self._last_used, capacity)
+            self._channel_mix = self._grow(self._channel_mix, capacity)
+            self._has_channels = self._grow(self._has_channels, capacity)
+            self._content = self._grow(self._content, capacity)
+            self._has_content = self._grow(self._has_content, capacity)
+            
+            # Cached rows are as wide as the old capacity; reallocated on the next query
+            self.similarity_matrix = np.zeros((0, 0), dtype=np.float32)
+            self._clear_similarity_cache()
+        
+        self._ids.append(template_id)
+        self._rows[template_id] = row
+        self._content[row] = 0.0
+        self._has_content[row] = False
+        self._stale_content.add(template_id)
+        return row
+    
+    @staticmethod
+    def _grow(array: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+    
+    def _update_cached_similarities(self, template_id: str, row: int):
+        """Update one template's entry in each cached similarity row."""
+        self._uncache(template_id)
+        if not self.similarity_cache:
+            return
+        if template_id in self._stale_content:
+            # Also updates the template's column
+            self._refresh_content()
+        else:
+            self._update_similarity_column(row)
+    
+    def _refresh_content(self):
+        """Compute hashed content term vectors of templates whose content changed."""
+        if not self._stale_content:
+            return
+        
+        stale, self._stale_content = self._stale_content, set()
+        for template_id in stale:
+            row = self._rows.get(template_id)
+            if row is None:
+                continue
+            terms = self._content_terms(template_id) if self._content_terms else None
+            vector = np.zeros(self.CONTENT_FEATURES, dtype=np.float32)
+            for term, frequency in (terms or {}).items():
+                vector[zlib.crc32(term.encode("utf-8")) % self.CONTENT_FEATURES] += 1.0 + math.log(frequency)
+            norm = np.linalg.norm(vector)
+            self._content[row] = vector / norm if norm else 0.0
+            self._has_content[row] = bool(norm)
+            
+            # Cached rows of templates whose own content changed are recomputed
+            self._uncache(template_id)
+            self._update_similarity_column(row)
 
 
 class TemplateCategory:
@@ -967,10 +1849,64 @@ class TemplateCategory:
         return descendants
 
 
+def _build_import_template(template_data: Dict[str, Any]) -> MessageTemplate:
+    """Create a template from imported data (validated on construction)."""
+    return MessageTemplate(
+        id=template_data.get("id", f"imported_{int(datetime.now().timestamp())}"),
+        name=template_data.get("name", "Imported Template"),
+        channels=template_data.get("channels", ["email"]),
+        subject=template_data.get("subject", ""),
+        content=template_data.get("content", ""),
+        whatsapp_content=template_data.get("whatsapp_content", ""),
+        language=template_data.get("language", "en"),
+        variables=template_data.get("variables", [])
+    )
+
+
+def _parse_import_source(read: Callable[[], bytes]) -> Dict[str, Any]:
+    """
+    Parse one import document and build its templates.
+    
+    Supports bulk exports, single template exports and bare template data.
+    
+    Returns:
+        Dictionary with the document's "categories" and its "entries", a list
+        of (template, template_data, metadata, error) tuples where template
+        is None if it could not be built
+    """
+    data = json.loads(read())
+    
+    if "templates" in data:
+        metadata = data.get("metadata", {})
+        documents = [(template_data, metadata.get(template_id, {}))
+                     for template_id, template_data in data["templates"].items()]
+    elif "template" in data:
+        documents = [(data["template"], data.get("metadata", {}))]
+    else:
+        documents = [(data, {})]
+    
+    entries = []
+    for template_data, template_metadata in documents:
+        try:
+            entries.append((_build_import_template(template_data), template_data, template_metadata, None))
+        except Exception as e:
+            entries.append((None, template_data, template_metadata, f"Import error: {e}"))
+    
+    return {"categories": data.get("categories", {}) if "templates" in data else {}, "entries": entries}
+
+
 class TemplateManager:
     """Comprehensive template management system with advanced categorization."""
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: ConfigManager, usage_flush_interval: float = 5.0):
+        """
+        Initialize the template manager.
+        
+        Args:
+            config_manager: Configuration manager providing the templates path
+            usage_flush_interval: Seconds that usage updates are batched in memory
+                before being written; 0 writes them immediately
+        """
         self.config_manager = config_manager
         self.templates_dir = config_manager.get_templates_path()
         self.categories_file = self.templates_dir / "categories.json"
@@ -983,15 +1919,26 @@ class TemplateManager:
         
         # Load data
         self._categories: Dict[str, TemplateCategory] = {}
-        self._templates: Dict[str, MessageTemplate] = {}
+        # Template bodies are read from their files on first access
+        self._templates: LazyStore = LazyStore(self._load_template)
         self._template_metadata: Dict[str, Dict[str, Any]] = {}
         
         # Initialize advanced features
         self.search_index = TemplateSearchIndex()
-        self.recommendation_engine = TemplateRecommendationEngine()
+        self.recommendation_engine = TemplateRecommendationEngine(
+            content_terms=lambda template_id: self.search_index.term_counts(template_id)
+        )
         self.version_manager = TemplateVersionManager(self.templates_dir)
         self.analytics = TemplateAnalytics(self.templates_dir)
         
+        # Deferred usage persistence. The flush timer runs on its own thread, so
+        # public mutators of templates, metadata and categories hold the lock too
+        self.usage_flush_interval = usage_flush_interval
+        self._usage_lock = threading.RLock()
+        self._dirty_files: Set[str] = set()
+        self._usage_flush_timer: Optional[threading.Timer] = None
+        _active_managers.add(self)
+        
         self._load_categories()
         self._load_templates()
         self._load_search_index()
@@ -1073,15 +2020,15 @@ class TemplateManager:
                 "updated_at": datetime.now().isoformat()
             }
             
-            with open(self.categories_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_json_atomic(self.categories_file, data)
+            self._dirty_files.discard("categories")
             
             logger.debug("Saved template categories")
         except Exception as e:
             logger.error(f"Failed to save categories: {e}")
     
     def _load_templates(self):
-        """Load all templates from the templates directory."""
+        """Load the templates index; template files are read when first accessed."""
         if not self.templates_index_file.exists():
             return
         
@@ -1089,20 +2036,38 @@ class TemplateManager:
             with open(self.templates_index_file, 'r', encoding='utf-8') as f:
                 index_data = json.load(f)
             
-            for template_id, metadata in index_data.get("templates", {}).items():
-                template_file = self.templates_dir / f"{template_id}.json"
-                if template_file.exists():
-                    template = self._load_template_file(template_file)
-                    if template:
-                        self._templates[template_id] = template
-                        self._template_metadata[template_id] = metadata
+            templates_metadata = index_data.get("templates", {})
+            self._template_metadata.update(templates_metadata)
+            self._templates = LazyStore(self._load_template, templates_metadata)
             
-            logger.info(f"Loaded {len(self._templates)} templates")
+            logger.info(f"Indexed {len(self._templates)} templates")
         except Exception as e:
             logger.error(f"Failed to load templates index: {e}")
     
-    def _load_template_file(self, template_file: Path) -> Optional[MessageTemplate]:
-        """Load a single template file."""
+    def _load_template(self, template_id: str) -> Optional[MessageTemplate]:
+        """Load a template on first access; forget it if its file can't be loaded."""
+        template_file = self.templates_dir / f"{template_id}.json"
+        if not template_file.exists():
+            logger.warning(f"Template file missing for indexed template {template_id}")
+            template = None
+        else:
+            template = self._load_template_file(template_file)
+        
+        if template is None:
+            self._forget_template(template_id)
+        return template
+    
+    def _forget_template(self, template_id: str):
+        """Drop the index entries of a template whose file is missing or unreadable."""
+        with self._usage_lock:
+            self._template_metadata.pop(template_id, None)
+            self.search_index.remove_template(template_id)
+            self.recommendation_engine.remove_template(template_id)
+            self._dirty_files.update(("index", "search_index", "recommendations"))
+            self._schedule_usage_flush()
+    
+    def _load_template_file(self, template_file: Path) -> Optional[MessageTemplate]:
+        """Load a single template file."""
         try:
             with open(template_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -1168,8 +2133,8 @@ class TemplateManager:
                 "updated_at": datetime.now().isoformat()
             }
             
-            with open(self.templates_index_file, 'w', encoding='utf-8') as f:
-                json.dump(index_data, f, indent=2, ensure_ascii=False)
+            _write_json_atomic(self.templates_index_file, index_data)
+            self._dirty_files.discard("index")
             
             logger.debug("Updated templates index")
         except Exception as e:
@@ -1185,10 +2150,7 @@ class TemplateManager:
                 data = json.load(f)
             
             # Restore search index state
-            self.search_index.index = data.get("index", {})
-            self.search_index.tag_index = {k: set(v) for k, v in data.get("tag_index", {}).items()}
-            self.search_index.category_index = {k: set(v) for k, v in data.get("category_index", {}).items()}
-            self.search_index.usage_index = data.get("usage_index", {})
+            self.search_index = TemplateSearchIndex.from_dict(data)
             
             logger.debug("Loaded search index")
         except Exception as e:
@@ -1197,16 +2159,11 @@ class TemplateManager:
     def _save_search_index(self):
         """Save search index to file."""
         try:
-            data = {
-                "index": self.search_index.index,
-                "tag_index": {k: list(v) for k, v in self.search_index.tag_index.items()},
-                "category_index": {k: list(v) for k, v in self.search_index.category_index.items()},
-                "usage_index": self.search_index.usage_index,
-                "updated_at": datetime.now().isoformat()
-            }
+            data = self.search_index.to_dict()
+            data["updated_at"] = datetime.now().isoformat()
             
-            with open(self.search_index_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_json_atomic(self.search_index_file, data, compact=True)
+            self._dirty_files.discard("search_index")
             
             logger.debug("Saved search index")
         except Exception as e:
@@ -1226,7 +2183,7 @@ class TemplateManager:
             for template_id, pattern in usage_patterns.items():
                 if "last_used" in pattern and pattern["last_used"]:
                     pattern["last_used"] = datetime.fromisoformat(pattern["last_used"])
-                self.recommendation_engine.usage_patterns[template_id] = pattern
+                self.recommendation_engine.set_usage_pattern(template_id, pattern)
             
             logger.debug("Loaded recommendation engine data")
         except Exception as e:
@@ -1247,8 +2204,8 @@ class TemplateManager:
                 "updated_at": datetime.now().isoformat()
             }
             
-            with open(self.recommendations_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_json_atomic(self.recommendations_file, data)
+            self._dirty_files.discard("recommendations")
             
             logger.debug("Saved recommendation engine data")
         except Exception as e:
@@ -1256,14 +2213,21 @@ class TemplateManager:
     
     def _rebuild_search_index_if_needed(self):
         """Rebuild search index if it's empty or outdated."""
-        if not self.search_index.index and self._templates:
+        if len(self.search_index) != len(self._templates) or \
+                any(template_id not in self.search_index for template_id in self._templates):
             logger.info("Rebuilding search index...")
+            self.search_index = TemplateSearchIndex()
             for template_id, template in self._templates.items():
                 metadata = self._template_metadata.get(template_id, {})
                 self.search_index.add_template(template, metadata)
             self._save_search_index()
             logger.info(f"Rebuilt search index for {len(self._templates)} templates")
     
+    def _index_template(self, template: MessageTemplate, metadata: Dict[str, Any]):
+        """Update a template's search entry and the content features derived from it."""
+        self.search_index.add_template(template, metadata)
+        self.recommendation_engine.update_content(template.id)
+    
     # Public API methods
     
     def get_categories(self) -> List[TemplateCategory]:
@@ -1277,75 +2241,78 @@ class TemplateManager:
     def create_category(self, id: str, name: str, description: str = "", color: str = "#007ACC", 
                        parent_id: str = None, icon: str = None, sort_order: int = 0) -> TemplateCategory:
         """Create a new template category with hierarchical support."""
-        if id in self._categories:
-            raise ValidationError(f"Category with ID '{id}' already exists")
-        
-        # Validate parent category exists if specified
-        if parent_id and parent_id not in self._categories:
-            raise ValidationError(f"Parent category '{parent_id}' does not exist")
-        
-        category = TemplateCategory(id, name, description, color, parent_id, icon, sort_order)
-        self._categories[id] = category
-        self._save_categories()
-        
-        logger.info(f"Created category: {name} (parent: {parent_id})")
-        return category
+        with self._usage_lock:
+            if id in self._categories:
+                raise ValidationError(f"Category with ID '{id}' already exists")
+            
+            # Validate parent category exists if specified
+            if parent_id and parent_id not in self._categories:
+                raise ValidationError(f"Parent category '{parent_id}' does not exist")
+            
+            category = TemplateCategory(id, name, description, color, parent_id, icon, sort_order)
+            self._categories[id] = category
+            self._save_categories()
+            
+            logger.info(f"Created category: {name} (parent: {parent_id})")
+            return category
     
     def update_category(self, category_id: str, name: str = None, description: str = None, 
                        color: str = None, parent_id: str = None, icon: str = None, 
                        sort_order: int = None) -> bool:
         """Update an existing category."""
-        if category_id not in self._categories:
-            return False
-        
-        # Validate parent category exists if specified
-        if parent_id is not None and parent_id != "" and parent_id not in self._categories:
-            raise ValidationError(f"Parent category '{parent_id}' does not exist")
-        
-        # Prevent circular references
-        if parent_id and self._would_create_circular_reference(category_id, parent_id):
-            raise ValidationError("Cannot set parent category: would create circular reference")
-        
-        category = self._categories[category_id]
-        if name is not None:
-            category.name = name
-        if description is not None:
-            category.description = description
-        if color is not None:
-            category.color = color
-        if parent_id is not None:
-            category.parent_id = parent_id if parent_id != "" else None
-        if icon is not None:
-            category.icon = icon
-        if sort_order is not None:
-            category.sort_order = sort_order
-        
-        category.updated_at = datetime.now()
-        self._save_categories()
-        logger.info(f"Updated category: {category_id}")
-        return True
+        with self._usage_lock:
+            if category_id not in self._categories:
+                return False
+            
+            # Validate parent category exists if specified
+            if parent_id is not None and parent_id != "" and parent_id not in self._categories:
+                raise ValidationError(f"Parent category '{parent_id}' does not exist")
+            
+            # Prevent circular references
+            if parent_id and self._would_create_circular_reference(category_id, parent_id):
+                raise ValidationError("Cannot set parent category: would create circular reference")
+            
+            category = self._categories[category_id]
+            if name is not None:
+                category.name = name
+            if description is not None:
+                category.description = description
+            if color is not None:
+                category.color = color
+            if parent_id is not None:
+                category.parent_id = parent_id if parent_id != "" else None
+            if icon is not None:
+                category.icon = icon
+            if sort_order is not None:
+                category.sort_order = sort_order
+            
+            category.updated_at = datetime.now()
+            self._save_categories()
+            logger.info(f"Updated category: {category_id}")
+            return True
     
     def delete_category(self, category_id: str, move_to_category: str = "general") -> bool:
         """Delete a category (moves templates and child categories)."""
-        if category_id not in self._categories:
-            return False
-        
-        # Move child categories to parent or root level
-        category = self._categories[category_id]
-        for child_category in category.get_children(self._categories):
-            child_category.parent_id = category.parent_id
-        
-        # Move templates to specified category
-        for template_id, metadata in self._template_metadata.items():
-            if metadata.get("category_id") == category_id:
-                metadata["category_id"] = move_to_category
-        
-        del self._categories[category_id]
-        self._save_categories()
-        self._update_templates_index()
-        
-        logger.info(f"Deleted category: {category_id}")
-        return True
+        with self._usage_lock:
+            if category_id not in self._categories:
+                return False
+            
+            # Move child categories to parent or root level
+            category = self._categories[category_id]
+            for child_category in category.get_children(self._categories):
+                child_category.parent_id = category.parent_id
+            
+            # Move templates to specified category
+            for template_id, metadata in self._template_metadata.items():
+                if metadata.get("category_id") == category_id:
+                    metadata["category_id"] = move_to_category
+            
+            del self._categories[category_id]
+            self._save_categories()
+            self._update_templates_index()
+            
+            logger.info(f"Deleted category: {category_id}")
+            return True
     
     def _would_create_circular_reference(self, category_id: str, new_parent_id: str) -> bool:
         """Check if setting a new parent would create a circular reference."""
@@ -1449,155 +2416,176 @@ class TemplateManager:
                      description: str = "", tags: List[str] = None, author: str = "system",
                      commit_message: str = "") -> bool:
         """Save a new or updated template with versioning and advanced indexing."""
-        try:
-            # Validate template
-            template.validate()
-            
-            # Validate category exists
-            if category_id not in self._categories:
-                logger.warning(f"Category {category_id} does not exist, using 'general'")
-                category_id = "general"
-            
-            # Auto-suggest tags if none provided
-            if not tags:
-                tags = self.suggest_tags_for_template(template)
-            
-            # Determine if this is a new template or update
-            is_new_template = template.id not in self._templates
-            
-            # Update timestamp
-            if is_new_template:
-                template.created_at = datetime.now()
-                template.updated_at = datetime.now()
-                if not commit_message:
-                    commit_message = f"Initial version of template '{template.name}'"
-            else:
-                template.updated_at = datetime.now()
-                if not commit_message:
-                    commit_message = f"Updated template '{template.name}'"
+        with self._usage_lock:
+            try:
+                version_id = self._stage_template(template, category_id, description, tags, author, commit_message)
                 
-                # Create backup if template exists
-                self._create_template_backup(template.id)
-            
-            # Create version in version control system
-            version_id = self.version_manager.create_version(
-                template=template,
-                author=author,
-                message=commit_message
-            )
-            
-            # Save template
-            self._templates[template.id] = template
-            self._save_template_file(template)
-            
-            # Update metadata
-            self._template_metadata[template.id] = {
-                "category_id": category_id,
-                "description": description,
-                "tags": tags or [],
-                "created_at": template.created_at.isoformat(),
-                "updated_at": template.updated_at.isoformat(),
-                "usage_count": self._template_metadata.get(template.id, {}).get("usage_count", 0),
-                "current_version": version_id
-            }
-            
-            # Update search index
-            self.search_index.add_template(template, self._template_metadata[template.id])
-            
-            # Update category template count
-            if category_id in self._categories:
+                # Update category template counts and write the indexes
                 self._update_category_counts()
-            
-            self._update_templates_index()
-            self._save_search_index()
-            
-            logger.info(f"Saved template: {template.name} (version: {version_id}) with tags: {tags}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to save template {template.id}: {e}")
-            return False
+                self._update_templates_index()
+                self._save_search_index()
+                
+                tags = self._template_metadata[template.id]["tags"]
+                logger.info(f"Saved template: {template.name} (version: {version_id}) with tags: {tags}")
+                return True
+                
+            except Exception as e:
+                logger.error(f"Failed to save template {template.id}: {e}")
+                return False
     
-    def update_template(self, template_id: str, **updates) -> bool:
-        """Update an existing template."""
-        if template_id not in self._templates:
-            return False
+    def _stage_template(self, template: MessageTemplate, category_id: str = "general",
+                        description: str = "", tags: List[str] = None, author: str = "system",
+                        commit_message: str = "") -> str:
+        """
+        Version and write a template and update its metadata and search entry.
         
-        try:
-            template = self._templates[template_id]
-            
-            # Create backup before updating
-            self._create_template_backup(template_id)
-            
-            # Apply updates
-            for field, value in updates.items():
-                if hasattr(template, field):
-                    setattr(template, field, value)
-            
+        The templates index, search index and category counts are not written;
+        callers write them once after staging one or more templates.
+        
+        Returns:
+            The ID of the created version
+        """
+        # Validate template
+        template.validate()
+        
+        # Validate category exists
+        if category_id not in self._categories:
+            logger.warning(f"Category {category_id} does not exist, using 'general'")
+            category_id = "general"
+        
+        # Auto-suggest tags if none provided
+        if not tags:
+            tags = self.suggest_tags_for_template(template)
+        
+        # Determine if this is a new template or update
+        is_new_template = template.id not in self._templates
+        
+        # Update timestamp
+        if is_new_template:
+            template.created_at = datetime.now()
             template.updated_at = datetime.now()
+            if not commit_message:
+                commit_message = f"Initial version of template '{template.name}'"
+        else:
+            template.updated_at = datetime.now()
+            if not commit_message:
+                commit_message = f"Updated template '{template.name}'"
             
-            # Validate and save
-            template.validate()
-            self._save_template_file(template)
-            
-            # Update metadata timestamp
-            if template_id in self._template_metadata:
-                self._template_metadata[template_id]["updated_at"] = template.updated_at.isoformat()
-                self._update_templates_index()
-            
-            logger.info(f"Updated template: {template_id}")
-            return True
+            # Create backup if template exists
+            self._create_template_backup(template.id)
+        
+        # Create version in version control system
+        version_id = self.version_manager.create_version(
+            template=template,
+            author=author,
+            message=commit_message
+        )
+        
+        # Save template
+        self._templates[template.id] = template
+        self._save_template_file(template)
+        
+        # Update metadata
+        self._template_metadata[template.id] = {
+            "category_id": category_id,
+            "description": description,
+            "tags": tags or [],
+            "created_at": template.created_at.isoformat(),
+            "updated_at": template.updated_at.isoformat(),
+            "usage_count": self._template_metadata.get(template.id, {}).get("usage_count", 0),
+            "current_version": version_id
+        }
+        
+        # Update search index
+        self._index_template(template, self._template_metadata[template.id])
+        
+        return version_id
+    
+    def update_template(self, template_id: str, **updates) -> bool:
+        """Update an existing template."""
+        with self._usage_lock:
+            if template_id not in self._templates:
+                return False
             
-        except Exception as e:
-            logger.error(f"Failed to update template {template_id}: {e}")
-            return False
+            try:
+                template = self._templates[template_id]
+                
+                # Create backup before updating
+                self._create_template_backup(template_id)
+                
+                # Apply updates
+                for field, value in updates.items():
+                    if hasattr(template, field):
+                        setattr(template, field, value)
+                
+                template.updated_at = datetime.now()
+                
+                # Validate and save
+                template.validate()
+                self._save_template_file(template)
+                
+                # Update metadata timestamp
+                if template_id in self._template_metadata:
+                    self._template_metadata[template_id]["updated_at"] = template.updated_at.isoformat()
+                    self._update_templates_index()
+                
+                # Re-index the changed content
+                self._index_template(template, self._template_metadata.get(template_id, {}))
+                self._save_search_index()
+                
+                logger.info(f"Updated template: {template_id}")
+                return True
+                
+            except Exception as e:
+                logger.error(f"Failed to update template {template_id}: {e}")
+                return False
     
     def delete_template(self, template_id: str) -> bool:
         """Delete a template with full cleanup."""
-        if template_id not in self._templates:
-            return False
-        
-        try:
-            # Create backup before deletion
-            self._create_template_backup(template_id)
-            
-            # Remove from search index
-            self.search_index.remove_template(template_id)
-            
-            # Remove from recommendation engine
-            if template_id in self.recommendation_engine.usage_patterns:
-                del self.recommendation_engine.usage_patterns[template_id]
-            
-            # Remove from memory
-            del self._templates[template_id]
-            if template_id in self._template_metadata:
-                del self._template_metadata[template_id]
-            
-            # Remove file
-            template_file = self.templates_dir / f"{template_id}.json"
-            if template_file.exists():
-                template_file.unlink()
-            
-            # Update category counts
-            self._update_category_counts()
-            
-            self._update_templates_index()
-            self._save_search_index()
-            self._save_recommendations()
-            
-            logger.info(f"Deleted template: {template_id}")
-            return True
+        with self._usage_lock:
+            if template_id not in self._templates:
+                return False
             
-        except Exception as e:
-            logger.error(f"Failed to delete template {template_id}: {e}")
-            return False
+            try:
+                # Create backup before deletion
+                self._create_template_backup(template_id)
+                
+                # Remove from search index
+                self.search_index.remove_template(template_id)
+                
+                # Remove from recommendation engine
+                self.recommendation_engine.remove_template(template_id)
+                
+                # Remove from memory
+                del self._templates[template_id]
+                if template_id in self._template_metadata:
+                    del self._template_metadata[template_id]
+                
+                # Remove file
+                template_file = self.templates_dir / f"{template_id}.json"
+                if template_file.exists():
+                    template_file.unlink()
+                
+                # Update category counts
+                self._update_category_counts()
+                
+                self._update_templates_index()
+                self._save_search_index()
+                self._save_recommendations()
+                
+                logger.info(f"Deleted template: {template_id}")
+                return True
+                
+            except Exception as e:
+                logger.error(f"Failed to delete template {template_id}: {e}")
+                return False
     
     def duplicate_template(self, template_id: str, new_name: str, new_id: str = None) -> Optional[MessageTemplate]:
         """Create a duplicate of an existing template."""
-        if template_id not in self._templates:
+        original = self._templates.get(template_id)
+        if original is None:
             return None
         
-        original = self._templates[template_id]
         original_metadata = self._template_metadata.get(template_id, {})
         
         # Generate new ID if not provided
@@ -1656,10 +2644,10 @@ class TemplateManager:
         seen_templates = set()
         
         for template_id, score in sorted(results, key=lambda x: x[1], reverse=True):
-            if template_id in seen_templates or template_id not in self._templates:
+            template = self._templates.get(template_id)
+            if template_id in seen_templates or template is None:
                 continue
             
-            template = self._templates[template_id]
             template_results.append((template, score))
             seen_templates.add(template_id)
             
@@ -1670,12 +2658,11 @@ class TemplateManager:
     
     def get_template_suggestions(self, partial_query: str, limit: int = 10) -> List[str]:
         """Get template name suggestions based on partial query."""
-        partial_lower = partial_query.lower()
-        suggestions = []
-        
-        for template in self._templates.values():
-            if partial_lower in template.name.lower():
-                suggestions.append(template.name)
+        templates = (
+            self._templates.get(template_id)
+            for template_id in self.search_index.suggest_template_ids(partial_query)
+        )
+        suggestions = [template.name for template in templates if template is not None]
         
         return sorted(suggestions)[:limit]
     
@@ -1695,68 +2682,75 @@ class TemplateManager:
         
         matching_templates = []
         
-        for template_id, metadata in self._template_metadata.items():
+        # Loading a template whose file is gone removes its metadata
+        for template_id, metadata in list(self._template_metadata.items()):
             template_tags = set(tag.lower() for tag in metadata.get("tags", []))
             search_tags = set(tag.lower() for tag in tags)
             
             if match_all:
                 # All tags must be present
-                if search_tags.issubset(template_tags):
-                    matching_templates.append(self._templates[template_id])
+                matches = search_tags.issubset(template_tags)
             else:
                 # Any tag can be present
-                if search_tags.intersection(template_tags):
-                    matching_templates.append(self._templates[template_id])
+                matches = bool(search_tags.intersection(template_tags))
+            
+            template = self._templates.get(template_id) if matches else None
+            if template is not None:
+                matching_templates.append(template)
         
         return matching_templates
     
     def add_template_tags(self, template_id: str, tags: List[str]) -> bool:
         """Add tags to a template."""
-        if template_id not in self._template_metadata:
-            return False
-        
-        metadata = self._template_metadata[template_id]
-        existing_tags = set(metadata.get("tags", []))
-        new_tags = set(tags)
-        
-        # Add new tags
-        all_tags = list(existing_tags.union(new_tags))
-        metadata["tags"] = all_tags
-        metadata["updated_at"] = datetime.now().isoformat()
-        
-        # Update search index
-        if template_id in self._templates:
-            self.search_index.add_template(self._templates[template_id], metadata)
-        
-        self._update_templates_index()
-        self._save_search_index()
-        
-        logger.info(f"Added tags {tags} to template {template_id}")
-        return True
+        with self._usage_lock:
+            if template_id not in self._template_metadata:
+                return False
+            
+            metadata = self._template_metadata[template_id]
+            existing_tags = set(metadata.get("tags", []))
+            new_tags = set(tags)
+            
+            # Add new tags
+            all_tags = list(existing_tags.union(new_tags))
+            metadata["tags"] = all_tags
+            metadata["updated_at"] = datetime.now().isoformat()
+            
+            # Update search index
+            template = self._templates.get(template_id)
+            if template is not None:
+                self._index_template(template, metadata)
+            
+            self._update_templates_index()
+            self._save_search_index()
+            
+            logger.info(f"Added tags {tags} to template {template_id}")
+            return True
     
     def remove_template_tags(self, template_id: str, tags: List[str]) -> bool:
         """Remove tags from a template."""
-        if template_id not in self._template_metadata:
-            return False
-        
-        metadata = self._template_metadata[template_id]
-        existing_tags = set(metadata.get("tags", []))
-        remove_tags = set(tags)
-        
-        # Remove tags
-        remaining_tags = list(existing_tags - remove_tags)
-        metadata["tags"] = remaining_tags
-        metadata["updated_at"] = datetime.now().isoformat()
-        
-        # Update search index
-        if template_id in self._templates:
-            self.search_index.add_template(self._templates[template_id], metadata)
-        
-        self._update_templates_index()
-        self._save_search_index()
-        
-        logger.info(f"Removed tags {tags} from template {template_id}")
-        return True
+        with self._usage_lock:
+            if template_id not in self._template_metadata:
+                return False
+            
+            metadata = self._template_metadata[template_id]
+            existing_tags = set(metadata.get("tags", []))
+            remove_tags = set(tags)
+            
+            # Remove tags
+            remaining_tags = list(existing_tags - remove_tags)
+            metadata["tags"] = remaining_tags
+            metadata["updated_at"] = datetime.now().isoformat()
+            
+            # Update search index
+            template = self._templates.get(template_id)
+            if template is not None:
+                self._index_template(template, metadata)
+            
+            self._update_templates_index()
+            self._save_search_index()
+            
+            logger.info(f"Removed tags {tags} from template {template_id}")
+            return True
     
     def get_template_usage_stats(self) -> Dict[str, Any]:
         """Get template usage statistics."""
@@ -1786,8 +2780,17 @@ class TemplateManager:
     def increment_template_usage(self, template_id: str, channel: str = "email", 
                                 success: bool = True, response_time: float = None,
                                 context: Dict[str, Any] = None):
-        """Increment usage count for a template and record usage pattern with analytics."""
-        if template_id in self._template_metadata:
+        """
+        Increment usage count for a template and record usage pattern with analytics.
+        
+        Usage is applied in memory right away; the affected files are written
+        in one batch after usage_flush_interval seconds, on flush_usage() or
+        when the manager is closed.
+        """
+        with self._usage_lock:
+            if template_id not in self._template_metadata:
+                return
+            
             # Update metadata
             self._template_metadata[template_id]["usage_count"] = \
                 self._template_metadata[template_id].get("usage_count", 0) + 1
@@ -1798,7 +2801,7 @@ class TemplateManager:
                 self._template_metadata[template_id]["usage_count"]
             
             # Record usage in recommendation engine
-            self.recommendation_engine.record_usage(template_id, context)
+            self.recommendation_engine.record_usage(template_id, context, channel=channel)
             
             # Record usage in analytics system
             self.analytics.record_template_usage(
@@ -1806,20 +2809,63 @@ class TemplateManager:
                 channel=channel,
                 success=success,
                 response_time=response_time,
-                context=context
+                context=context,
+                persist=False
             )
             
+            self._dirty_files.update(("index", "search_index", "recommendations"))
+            
             # Update category usage count
             category_id = self._template_metadata[template_id].get("category_id")
             if category_id and category_id in self._categories:
                 self._categories[category_id].usage_count += 1
+                self._dirty_files.add("categories")
             
-            self._update_templates_index()
-            self._save_search_index()
-            self._save_recommendations()
+            self._schedule_usage_flush()
             
             logger.debug(f"Incremented usage for template {template_id} on {channel} channel")
     
+    def flush_usage(self):
+        """Write all files with usage changes that have not been saved yet."""
+        with self._usage_lock:
+            if self._usage_flush_timer is not None:
+                self._usage_flush_timer.cancel()
+                self._usage_flush_timer = None
+            
+            savers = {
+                "index": self._update_templates_index,
+                "search_index": self._save_search_index,
+                "recommendations": self._save_recommendations,
+                "categories": self._save_categories
+            }
+            for name in sorted(self._dirty_files):
+                savers[name]()
+            
+            self.analytics.flush()
+    
+    def close(self):
+        """Flush pending usage data; call at the end of a session or on shutdown."""
+        self.flush_usage()
+        _active_managers.discard(self)
+    
+    def _schedule_usage_flush(self):
+        """Start the flush timer unless one is already pending."""
+        if self.usage_flush_interval <= 0:
+            self.flush_usage()
+            return
+        
+        if self._usage_flush_timer is None:
+            self._usage_flush_timer = threading.Timer(self.usage_flush_interval, self._flush_usage_on_timer)
+            self._usage_flush_timer.daemon = True
+            self._usage_flush_timer.start()
+    
+    def _flush_usage_on_timer(self):
+        """Flush pending usage from the timer thread."""
+        with self._usage_lock:
+            if self._usage_flush_timer is threading.current_thread():
+                self._usage_flush_timer = None
+            self.flush_usage()
+    
     def get_template_recommendations(self, template_id: str = None, category_id: str = None, 
                                    limit: int = 5) -> List[Tuple[MessageTemplate, float, str]]:
         """Get template recommendations based on usage patterns."""
@@ -1832,17 +2878,18 @@ class TemplateManager:
         # Convert to template objects
         template_recommendations = []
         for rec_id, confidence, reason in recommendations:
-            if rec_id in self._templates:
-                template_recommendations.append((self._templates[rec_id], confidence, reason))
+            rec_template = self._templates.get(rec_id)
+            if rec_template is not None:
+                template_recommendations.append((rec_template, confidence, reason))
         
         return template_recommendations
     
     def get_similar_templates(self, template_id: str, limit: int = 5) -> List[Tuple[MessageTemplate, float]]:
         """Get templates similar to the specified template."""
-        if template_id not in self._templates:
+        template = self._templates.get(template_id)
+        if template is None:
             return []
         
-        template = self._templates[template_id]
         metadata = self._template_metadata.get(template_id, {})
         
         # Search for similar content
@@ -1856,8 +2903,9 @@ class TemplateManager:
         # Filter out the original template and convert to template objects
         similar_templates = []
         for sim_id, score in similar_results:
-            if sim_id != template_id and sim_id in self._templates:
-                similar_templates.append((self._templates[sim_id], score))
+            sim_template = self._templates.get(sim_id) if sim_id != template_id else None
+            if sim_template is not None:
+                similar_templates.append((sim_template, score))
         
         return similar_templates[:limit]
     
@@ -1941,32 +2989,33 @@ class TemplateManager:
     
     def rollback_template(self, template_id: str, version_id: str, author: str = "system") -> bool:
         """Rollback a template to a specific version."""
-        try:
-            rolled_back_template = self.version_manager.rollback_to_version(template_id, version_id)
-            if not rolled_back_template:
+        with self._usage_lock:
+            try:
+                rolled_back_template = self.version_manager.rollback_to_version(template_id, version_id)
+                if not rolled_back_template:
+                    return False
+                
+                # Update the current template
+                self._templates[template_id] = rolled_back_template
+                self._save_template_file(rolled_back_template)
+                
+                # Update metadata
+                if template_id in self._template_metadata:
+                    self._template_metadata[template_id]["updated_at"] = rolled_back_template.updated_at.isoformat()
+                    self._template_metadata[template_id]["current_version"] = self.version_manager.active_versions.get(template_id)
+                
+                # Update search index
+                self._index_template(rolled_back_template, self._template_metadata.get(template_id, {}))
+                
+                self._update_templates_index()
+                self._save_search_index()
+                
+                logger.info(f"Rolled back template {template_id} to version {version_id}")
+                return True
+                
+            except Exception as e:
+                logger.error(f"Failed to rollback template {template_id} to version {version_id}: {e}")
                 return False
-            
-            # Update the current template
-            self._templates[template_id] = rolled_back_template
-            self._save_template_file(rolled_back_template)
-            
-            # Update metadata
-            if template_id in self._template_metadata:
-                self._template_metadata[template_id]["updated_at"] = rolled_back_template.updated_at.isoformat()
-                self._template_metadata[template_id]["current_version"] = self.version_manager.active_versions.get(template_id)
-            
-            # Update search index
-            self.search_index.add_template(rolled_back_template, self._template_metadata.get(template_id, {}))
-            
-            self._update_templates_index()
-            self._save_search_index()
-            
-            logger.info(f"Rolled back template {template_id} to version {version_id}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to rollback template {template_id} to version {version_id}: {e}")
-            return False
     
     def compare_template_versions(self, template_id: str, version1_id: str, version2_id: str) -> Dict[str, Any]:
         """Compare two versions of a template."""
@@ -1990,36 +3039,37 @@ class TemplateManager:
     def merge_template_versions(self, template_id: str, source_version: str, 
                                target_version: str = None, author: str = "system") -> Optional[str]:
         """Merge one template version into another."""
-        try:
-            merge_version_id = self.version_manager.merge_versions(
-                template_id, source_version, target_version, author
-            )
-            
-            if merge_version_id:
-                # Update current template with merged version
-                merged_version = self.version_manager.get_active_version(template_id)
-                if merged_version:
-                    self._templates[template_id] = merged_version.template
-                    self._save_template_file(merged_version.template)
-                    
-                    # Update metadata
-                    if template_id in self._template_metadata:
-                        self._template_metadata[template_id]["updated_at"] = merged_version.template.updated_at.isoformat()
-                        self._template_metadata[template_id]["current_version"] = merge_version_id
-                    
-                    # Update search index
-                    self.search_index.add_template(merged_version.template, self._template_metadata.get(template_id, {}))
+        with self._usage_lock:
+            try:
+                merge_version_id = self.version_manager.merge_versions(
+                    template_id, source_version, target_version, author
+                )
+                
+                if merge_version_id:
+                    # Update current template with merged version
+                    merged_version = self.version_manager.get_active_version(template_id)
+                    if merged_version:
+                        self._templates[template_id] = merged_version.template
+                        self._save_template_file(merged_version.template)
+                        
+                        # Update metadata
+                        if template_id in self._template_metadata:
+                            self._template_metadata[template_id]["updated_at"] = merged_version.template.updated_at.isoformat()
+                            self._template_metadata[template_id]["current_version"] = merge_version_id
+                        
+                        # Update search index
+                        self._index_template(merged_version.template, self._template_metadata.get(template_id, {}))
+                        
+                        self._update_templates_index()
+                        self._save_search_index()
                     
-                    self._update_templates_index()
-                    self._save_search_index()
+                    logger.info(f"Merged versions for template {template_id}")
                 
-                logger.info(f"Merged versions for template {template_id}")
-            
-            return merge_version_id
-            
-        except Exception as e:
-            logger.error(f"Failed to merge versions for template {template_id}: {e}")
-            return None
+                return merge_version_id
+                
+            except Exception as e:
+                logger.error(f"Failed to merge versions for template {template_id}: {e}")
+                return None
     
     def delete_template_version(self, template_id: str, version_id: str) -> bool:
         """Delete a specific version of a template."""
@@ -2082,8 +3132,8 @@ class TemplateManager:
         enriched_results = []
         for result in top_templates:
             template_id = result["template_id"]
-            if template_id in self._templates:
-                template = self._templates[template_id]
+            template = self._templates.get(template_id)
+            if template is not None:
                 metadata = self._template_metadata.get(template_id, {})
                 
                 enriched_results.append({
@@ -2176,8 +3226,8 @@ class TemplateManager:
                 if last_used_str:
                     try:
                         last_used = datetime.fromisoformat(last_used_str)
-                        if last_used >= cutoff_date and template_id in self._templates:
-                            template = self._templates[template_id]
+                        template = self._templates.get(template_id) if last_used >= cutoff_date else None
+                        if template is not None:
                             recent_activity.append({
                                 "template_id": template_id,
                                 "template_name": template.name,
@@ -2230,8 +3280,8 @@ class TemplateManager:
             # Add detailed analytics for each template
             templates_to_analyze = template_ids if template_ids else list(self._templates.keys())
             for template_id in templates_to_analyze:
-                if template_id in self._templates:
-                    template = self._templates[template_id]
+                template = self._templates.get(template_id)
+                if template is not None:
                     report_data["detailed_analytics"][template_id] = {
                         "template_info": {
                             "id": template.id,
@@ -2256,222 +3306,191 @@ class TemplateManager:
     
     # Enhanced Import/Export System
     
+    # Name of the archive entry holding export info and categories
+    ARCHIVE_MANIFEST = "manifest.json"
+    
     def bulk_import_templates(self, import_path: Path, category_id: str = None,
                              progress_callback: Optional[callable] = None,
                              validation_mode: str = "strict") -> Dict[str, Any]:
         """
         Bulk import templates with progress tracking and validation.
         
+        Import files are parsed and validated one after another, so errors are
+        reported in file order. Accepted templates are then saved in a single
+        commit that writes each template file once and the templates index,
+        search index and categories once.
+        
         Args:
-            import_path: Path to import file or directory
+            import_path: Path to import file, export archive or directory
             category_id: Default category for imported templates
             progress_callback: Callback function for progress updates
             validation_mode: "strict", "lenient", or "skip" validation
-            
+        
         Returns:
             Dictionary with import results and statistics
         """
-        import_results = {
-            "total_processed": 0,
-            "successful_imports": 0,
-            "failed_imports": 0,
-            "skipped_imports": 0,
-            "imported_templates": [],
-            "errors": [],
-            "warnings": []
-        }
-        
-        try:
-            # Determine import type (single file or directory)
-            if import_path.is_file():
-                files_to_process = [import_path]
-            elif import_path.is_dir():
-                # Find all JSON files in directory
-                files_to_process = list(import_path.glob("*.json"))
-            else:
-                import_results["errors"].append(f"Import path does not exist: {import_path}")
-                return import_results
-            
-            total_files = len(files_to_process)
-            import_results["total_processed"] = total_files
+        with self._usage_lock:
+            import_results = {
+                "total_processed": 0,
+                "successful_imports": 0,
+                "failed_imports": 0,
+                "skipped_imports": 0,
+                "imported_templates": [],
+                "errors": [],
+                "warnings": []
+            }
             
-            for i, file_path in enumerate(files_to_process):
-                if progress_callback:
-                    progress_callback(i, total_files, f"Processing {file_path.name}")
+            archive = None
+            try:
+                # Determine import type (archive, single file or directory)
+                if import_path.is_file() and zipfile.is_zipfile(import_path):
+                    archive = zipfile.ZipFile(import_path)
+                    manifest = json.loads(archive.read(self.ARCHIVE_MANIFEST))
+                    self._import_categories(manifest.get("categories", {}), import_results)
+                    sources = [
+                        (Path(name).name, partial(archive.read, name))
+                        for name in archive.namelist()
+                        if name.endswith(".json") and name != self.ARCHIVE_MANIFEST
+                    ]
+                elif import_path.is_file():
+                    sources = [(import_path.name, import_path.read_bytes)]
+                elif import_path.is_dir():
+                    # Find all JSON files in directory
+                    sources = [(file_path.name, file_path.read_bytes) for file_path in import_path.glob("*.json")]
+                else:
+                    import_results["errors"].append(f"Import path does not exist: {import_path}")
+                    return import_results
                 
-                try:
-                    # Load and validate file
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                total_files = len(sources)
+                import_results["total_processed"] = total_files
+                
+                # Parse and validate each file, resolving IDs and categories in file order
+                staged = []
+                taken_ids = set(self._templates)
+                for i, (name, read) in enumerate(sources):
+                    if progress_callback:
+                        progress_callback(i, total_files, f"Processing {name}")
                     
-                    # Handle different import formats
-                    if "templates" in data:
-                        # Bulk export format
-                        templates_data = data["templates"]
-                        categories_data = data.get("categories", {})
-                        metadata = data.get("metadata", {})
-                        
-                        # Import categories first
-                        for cat_id, cat_data in categories_data.items():
-                            if cat_id not in self._categories:
-                                try:
-                                    category = TemplateCategory.from_dict(cat_data)
-                                    self._categories[cat_id] = category
-                                    import_results["warnings"].append(f"Imported category: {category.name}")
-                                except Exception as e:
-                                    import_results["warnings"].append(f"Failed to import category {cat_id}: {e}")
-                        
-                        # Import templates
-                        for template_id, template_data in templates_data.items():
-                            result = self._import_single_template(
-                                template_data, 
-                                metadata.get(template_id, {}),
-                                category_id,
-                                validation_mode
-                            )
-                            
-                            if result["success"]:
-                                import_results["successful_imports"] += 1
-                                import_results["imported_templates"].append(result["template_id"])
-                            else:
-                                import_results["failed_imports"] += 1
-                                import_results["errors"].extend(result["errors"])
+                    try:
+                        parsed = _parse_import_source(read)
+                    except Exception as e:
+                        import_results["failed_imports"] += 1
+                        import_results["errors"].append(f"Failed to process {name}: {e}")
+                        continue
                     
-                    elif "template" in data:
-                        # Single template export format
-                        template_data = data["template"]
-                        template_metadata = data.get("metadata", {})
-                        
-                        result = self._import_single_template(
-                            template_data,
-                            template_metadata,
-                            category_id,
-                            validation_mode
-                        )
+                    # Import categories first
+                    self._import_categories(parsed["categories"], import_results)
+                    
+                    for template, template_data, metadata, error in parsed["entries"]:
+                        if template is None:
+                            result = {"success": False, "errors": [error], "warnings": []}
+                        else:
+                            result = self._prepare_import_template(
+                                template, metadata, category_id, validation_mode, taken_ids
+                            )
                         
+                        import_results["warnings"].extend(result["warnings"])
                         if result["success"]:
-                            import_results["successful_imports"] += 1
-                            import_results["imported_templates"].append(result["template_id"])
+                            taken_ids.add(template.id)
+                            staged.append((template, result["category_id"], metadata))
                         else:
                             import_results["failed_imports"] += 1
                             import_results["errors"].extend(result["errors"])
+                
+                # Commit: write each template, then the indexes and categories once
+                for i, (template, template_category, metadata) in enumerate(staged):
+                    if progress_callback:
+                        progress_callback(i, len(staged), f"Saving {template.id}")
                     
-                    else:
-                        # Try to import as direct template data
-                        result = self._import_single_template(
-                            data,
-                            {},
-                            category_id,
-                            validation_mode
+                    try:
+                        self._stage_template(
+                            template=template,
+                            category_id=template_category,
+                            description=metadata.get("description", "Imported template"),
+                            tags=metadata.get("tags", []),
+                            author="import_system",
+                            commit_message="Imported template from external source"
                         )
-                        
-                        if result["success"]:
-                            import_results["successful_imports"] += 1
-                            import_results["imported_templates"].append(result["template_id"])
-                        else:
-                            import_results["failed_imports"] += 1
-                            import_results["errors"].extend(result["errors"])
+                        import_results["successful_imports"] += 1
+                        import_results["imported_templates"].append(template.id)
+                    except Exception as e:
+                        import_results["failed_imports"] += 1
+                        import_results["errors"].append(f"Failed to save imported template {template.id}: {e}")
                 
-                except Exception as e:
-                    import_results["failed_imports"] += 1
-                    import_results["errors"].append(f"Failed to process {file_path.name}: {e}")
-            
-            # Save updated categories and update search index
-            if import_results["successful_imports"] > 0:
-                self._save_categories()
-                self._update_templates_index()
-                self._save_search_index()
+                if import_results["successful_imports"] > 0:
+                    # Saves the imported categories with their counts
+                    self._update_category_counts()
+                    self._update_templates_index()
+                    self._save_search_index()
                 
-                # Update category counts
-                self._update_category_counts()
-            
-            if progress_callback:
-                progress_callback(total_files, total_files, "Import completed")
-            
-            logger.info(f"Bulk import completed: {import_results['successful_imports']} successful, "
-                       f"{import_results['failed_imports']} failed")
+                if progress_callback:
+                    progress_callback(total_files, total_files, "Import completed")
+                
+                logger.info(f"Bulk import completed: {import_results['successful_imports']} successful, "
+                           f"{import_results['failed_imports']} failed")
             
-        except Exception as e:
-            import_results["errors"].append(f"Bulk import failed: {e}")
-            logger.error(f"Bulk import failed: {e}")
-        
-        return import_results
+            except Exception as e:
+                import_results["errors"].append(f"Bulk import failed: {e}")
+                logger.error(f"Bulk import failed: {e}")
+            finally:
+                if archive is not None:
+                    archive.close()
+            
+            return import_results
+    
+    def _import_categories(self, categories_data: Dict[str, Any], import_results: Dict[str, Any]):
+        """Add imported categories that do not exist yet."""
+        for cat_id, cat_data in categories_data.items():
+            if cat_id not in self._categories:
+                try:
+                    category = TemplateCategory.from_dict(cat_data)
+                    self._categories[cat_id] = category
+                    import_results["warnings"].append(f"Imported category: {category.name}")
+                except Exception as e:
+                    import_results["warnings"].append(f"Failed to import category {cat_id}: {e}")
     
-    def _import_single_template(self, template_data: Dict[str, Any], metadata: Dict[str, Any],
-                               default_category: str = None, validation_mode: str = "strict") -> Dict[str, Any]:
-        """Import a single template with validation."""
+    def _prepare_import_template(self, template: MessageTemplate, metadata: Dict[str, Any],
+                                 default_category: str = None, validation_mode: str = "strict",
+                                 taken_ids: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """Resolve the ID and category of an imported template before it is saved."""
         result = {
             "success": False,
             "template_id": None,
+            "category_id": None,
             "errors": [],
             "warnings": []
         }
-        
-        try:
-            # Create template object
-            template = MessageTemplate(
-                id=template_data.get("id", f"imported_{int(datetime.now().timestamp())}"),
-                name=template_data.get("name", "Imported Template"),
-                channels=template_data.get("channels", ["email"]),
-                subject=template_data.get("subject", ""),
-                content=template_data.get("content", ""),
-                whatsapp_content=template_data.get("whatsapp_content", ""),
-                language=template_data.get("language", "en"),
-                variables=template_data.get("variables", [])
-            )
-            
-            # Handle ID conflicts
-            original_id = template.id
-            if template.id in self._templates:
-                if validation_mode == "strict":
-                    result["errors"].append(f"Template ID '{template.id}' already exists")
-                    return result
-                elif validation_mode == "lenient":
-                    # Generate new ID
-                    timestamp = int(datetime.now().timestamp())
-                    template.id = f"{original_id}_imported_{timestamp}"
-                    result["warnings"].append(f"Template ID changed from '{original_id}' to '{template.id}'")
-            
-            # Validate template
-            if validation_mode != "skip":
-                try:
-                    template.validate()
-                except ValidationError as e:
-                    if validation_mode == "strict":
-                        result["errors"].append(f"Template validation failed: {e}")
-                        return result
-                    else:
-                        result["warnings"].append(f"Template validation warning: {e}")
-            
-            # Determine category
-            category_id = metadata.get("category_id") or default_category or "general"
-            if category_id not in self._categories:
-                if validation_mode == "strict":
-                    result["errors"].append(f"Category '{category_id}' does not exist")
-                    return result
-                else:
-                    category_id = "general"
-                    result["warnings"].append(f"Category not found, using 'general'")
-            
-            # Save template
-            success = self.save_template(
-                template=template,
-                category_id=category_id,
-                description=metadata.get("description", f"Imported template"),
-                tags=metadata.get("tags", []),
-                author="import_system",
-                commit_message=f"Imported template from external source"
-            )
-            
-            if success:
-                result["success"] = True
-                result["template_id"] = template.id
+        taken_ids = set(self._templates) if taken_ids is None else taken_ids
+        
+        # Handle ID conflicts (with the library and earlier templates of the import)
+        original_id = template.id
+        if template.id in taken_ids:
+            if validation_mode == "strict":
+                result["errors"].append(f"Template ID '{template.id}' already exists")
+                return result
+            elif validation_mode == "lenient":
+                # Generate new ID
+                timestamp = int(datetime.now().timestamp())
+                template.id = f"{original_id}_imported_{timestamp}"
+                suffix = 1
+                while template.id in taken_ids:
+                    template.id = f"{original_id}_imported_{timestamp}_{suffix}"
+                    suffix += 1
+                result["warnings"].append(f"Template ID changed from '{original_id}' to '{template.id}'")
+        
+        # Determine category
+        category_id = metadata.get("category_id") or default_category or "general"
+        if category_id not in self._categories:
+            if validation_mode == "strict":
+                result["errors"].append(f"Category '{category_id}' does not exist")
+                return result
             else:
-                result["errors"].append("Failed to save imported template")
-        
-        except Exception as e:
-            result["errors"].append(f"Import error: {e}")
+                category_id = "general"
+                result["warnings"].append(f"Category not found, using 'general'")
         
+        result["success"] = True
+        result["template_id"] = template.id
+        result["category_id"] = category_id
         return result
     
     def validate_import_file(self, import_path: Path) -> Dict[str, Any]:
@@ -2496,31 +3515,41 @@ class TemplateManager:
                 validation_result["errors"].append("Import file does not exist")
                 return validation_result
             
-            with open(import_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Detect format
-            if "templates" in data and "export_info" in data:
-                validation_result["format"] = "bulk_export_v2"
-                templates_data = data["templates"]
-                categories_data = data.get("categories", {})
-            elif "templates" in data:
-                validation_result["format"] = "bulk_export_v1"
-                templates_data = data["templates"]
-                categories_data = data.get("categories", {})
-            elif "template" in data:
-                validation_result["format"] = "single_template"
-                templates_data = {data["template"]["id"]: data["template"]}
-                categories_data = {}
+            if zipfile.is_zipfile(import_path):
+                validation_result["format"] = "archive"
+                with zipfile.ZipFile(import_path) as archive:
+                    categories_data = json.loads(archive.read(self.ARCHIVE_MANIFEST)).get("categories", {})
+                    templates_data = {}
+                    for name in archive.namelist():
+                        if name.endswith(".json") and name != self.ARCHIVE_MANIFEST:
+                            template_data = json.loads(archive.read(name))["template"]
+                            templates_data[template_data["id"]] = template_data
             else:
-                # Try to parse as direct template
-                if "id" in data and "name" in data:
-                    validation_result["format"] = "direct_template"
-                    templates_data = {data["id"]: data}
+                with open(import_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                
+                # Detect format
+                if "templates" in data and "export_info" in data:
+                    validation_result["format"] = "bulk_export_v2"
+                    templates_data = data["templates"]
+                    categories_data = data.get("categories", {})
+                elif "templates" in data:
+                    validation_result["format"] = "bulk_export_v1"
+                    templates_data = data["templates"]
+                    categories_data = data.get("categories", {})
+                elif "template" in data:
+                    validation_result["format"] = "single_template"
+                    templates_data = {data["template"]["id"]: data["template"]}
                     categories_data = {}
                 else:
-                    validation_result["errors"].append("Unrecognized file format")
-                    return validation_result
+                    # Try to parse as direct template
+                    if "id" in data and "name" in data:
+                        validation_result["format"] = "direct_template"
+                        templates_data = {data["id"]: data}
+                        categories_data = {}
+                    else:
+                        validation_result["errors"].append("Unrecognized file format")
+                        return validation_result
             
             validation_result["template_count"] = len(templates_data)
             validation_result["category_count"] = len(categories_data)
@@ -2589,6 +3618,11 @@ class TemplateManager:
         """
         Enhanced bulk export with comprehensive options.
         
+        Templates are streamed one by one into a zip archive holding a
+        manifest (export info and categories) and one single-template export
+        per template. An export path ending in ".json" writes the whole export
+        as one JSON document instead.
+        
         Args:
             template_ids: List of template IDs to export (None for all)
             export_path: Export file path
@@ -2597,92 +3631,96 @@ class TemplateManager:
             include_analytics: Include analytics data
             include_versions: Include version history
             progress_callback: Progress callback function
-            
+        
         Returns:
             Path to exported file or None if failed
         """
         try:
             if export_path is None:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                export_path = self.templates_dir / "exports" / f"bulk_export_{timestamp}.json"
+                export_path = self.templates_dir / "exports" / f"bulk_export_{timestamp}.zip"
             
             # Determine templates to export
             templates_to_export = template_ids if template_ids else list(self._templates.keys())
             total_templates = len(templates_to_export)
             
-            export_data = {
-                "export_info": {
-                    "exported_at": datetime.now().isoformat(),
-                    "version": "2.0",
-                    "total_templates": total_templates,
-                    "export_options": {
-                        "include_categories": include_categories,
-                        "include_metadata": include_metadata,
-                        "include_analytics": include_analytics,
-                        "include_versions": include_versions
-                    }
-                },
-                "templates": {},
-                "metadata": {},
-                "categories": {},
-                "analytics": {},
-                "versions": {}
+            export_info = {
+                "exported_at": datetime.now().isoformat(),
+                "version": "2.0",
+                "total_templates": total_templates,
+                "export_options": {
+                    "include_categories": include_categories,
+                    "include_metadata": include_metadata,
+                    "include_analytics": include_analytics,
+                    "include_versions": include_versions
+                }
             }
             
             # Export categories
+            categories = {}
             if include_categories:
                 for cat_id, category in self._categories.items():
-                    export_data["categories"][cat_id] = category.to_dict()
+                    categories[cat_id] = category.to_dict()
             
-            # Export templates and related data
-            for i, template_id in enumerate(templates_to_export):
-                if progress_callback:
-                    progress_callback(i, total_templates, f"Exporting {template_id}")
-                
-                if template_id not in self._templates:
-                    continue
-                
-                template = self._templates[template_id]
-                
-                # Export template data
-                export_data["templates"][template_id] = {
-                    "id": template.id,
-                    "name": template.name,
-                    "channels": template.channels,
-                    "subject": template.subject,
-                    "content": template.content,
-                    "whatsapp_content": template.whatsapp_content,
-                    "language": template.language,
-                    "variables": template.variables,
-                    "created_at": template.created_at.isoformat(),
-                    "updated_at": template.updated_at.isoformat()
-                }
-                
-                # Export metadata
-                if include_metadata and template_id in self._template_metadata:
-                    export_data["metadata"][template_id] = self._template_metadata[template_id].copy()
-                
-                # Export analytics
-                if include_analytics:
-                    analytics_data = self.get_template_analytics(template_id)
-                    export_data["analytics"][template_id] = analytics_data
-                
-                # Export versions
-                if include_versions:
-                    versions_data = self.get_template_versions(template_id)
-                    export_data["versions"][template_id] = versions_data
+            def export_entries():
+                """Yield (template_id, entry) for each template, reporting progress."""
+                for i, template_id in enumerate(templates_to_export):
+                    if progress_callback:
+                        progress_callback(i, total_templates, f"Exporting {template_id}")
+                    
+                    template = self._templates.get(template_id)
+                    if template is None:
+                        continue
+                    
+                    entry = {"template": _template_to_fields(template)}
+                    
+                    # Export metadata
+                    if include_metadata and template_id in self._template_metadata:
+                        entry["metadata"] = self._template_metadata[template_id].copy()
+                    
+                    # Export analytics
+                    if include_analytics:
+                        entry["analytics"] = self.get_template_analytics(template_id)
+                    
+                    # Export versions
+                    if include_versions:
+                        entry["versions"] = self.get_template_versions(template_id)
+                    
+                    yield template_id, entry
             
             # Save export file
             export_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            tmp_path = export_path.with_name(export_path.name + ".tmp")
+            if export_path.suffix.lower() == ".json":
+                export_data = {
+                    "export_info": export_info,
+                    "templates": {},
+                    "metadata": {},
+                    "categories": categories,
+                    "analytics": {},
+                    "versions": {}
+                }
+                for template_id, entry in export_entries():
+                    export_data["templates"][template_id] = entry.pop("template")
+                    for section, value in entry.items():
+                        export_data[section][template_id] = value
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+            else:
+                with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                    archive.writestr(self.ARCHIVE_MANIFEST, json.dumps(
+                        {"export_info": export_info, "categories": categories}, ensure_ascii=False
+                    ))
+                    for template_id, entry in export_entries():
+                        archive.writestr(f"templates/{template_id}.json", json.dumps(entry, ensure_ascii=False))
+            os.replace(tmp_path, export_path)
             
             if progress_callback:
                 progress_callback(total_templates, total_templates, "Export completed")
             
             logger.info(f"Bulk exported {total_templates} templates to {export_path}")
             return export_path
-            
+        
         except Exception as e:
             logger.error(f"Bulk export failed: {e}")
             return None
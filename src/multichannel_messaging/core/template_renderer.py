@@ -0,0 +1,83 @@
+"""
+Compiled placeholder rendering for message templates.
+
+Template text is parsed once into literal segments and ``{variable}`` slots,
+so rendering a message is a single formatting pass instead of one
+``str.replace`` over the whole text per variable.
+"""
+
+import re
+from typing import Dict, Iterable, Mapping, Tuple
+
+
+# Placeholder names picked up even when they are not declared template variables
+PLACEHOLDER_NAME_PATTERN = r"\w+"
+
+
+class CompiledText:
+    """Text split into literal segments and named placeholder slots."""
+
+    __slots__ = ("text", "slots", "_format", "_fields")
+
+    def __init__(self, text: str, format_string: str, slots: Tuple[str, ...]):
+        """
+        Initialize compiled text.
+
+        Args:
+            text: Original template text
+            format_string: Text with literal braces escaped and each slot
+                replaced by the positional field of its variable
+            slots: Distinct variable names in order of first appearance
+        """
+        self.text = text
+        self.slots = slots
+        self._format = format_string
+        self._fields = tuple((name, f"{{{name}}}") for name in slots)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """
+        Fill slots from a mapping.
+
+        Args:
+            values: Variable values; slots without a value keep their placeholder
+
+        Returns:
+            Rendered text
+        """
+        if not self._fields:
+            return self.text
+        return self._format.format(*[values.get(name, placeholder) for name, placeholder in self._fields])
+
+
+def compile_text(text: str, variables: Iterable[str] = ()) -> CompiledText:
+    """
+    Parse template text into a compiled form.
+
+    Args:
+        text: Template text containing ``{variable}`` placeholders
+        variables: Declared variable names, matched even when they are not
+            plain word characters
+
+    Returns:
+        Compiled text
+    """
+    names = sorted({var for var in variables if var}, key=len, reverse=True)
+    alternatives = [re.escape(name) for name in names] + [PLACEHOLDER_NAME_PATTERN]
+    pattern = re.compile(r"\{(" + "|".join(alternatives) + r")\}")
+
+    slot_indexes: Dict[str, int] = {}
+    parts = []
+    position = 0
+    for match in pattern.finditer(text):
+        parts.append(_escape_format(text[position:match.start()]))
+        index = slot_indexes.setdefault(match.group(1), len(slot_indexes))
+        parts.append(f"{{{index}}}")
+        position = match.end()
+    parts.append(_escape_format(text[position:]))
+
+    return CompiledText(text, "".join(parts), tuple(slot_indexes))
+
+
+def _escape_format(literal: str) -> str:
+    """Escape braces so a literal segment survives str.format."""
+    return literal.replace("{", "{{").replace("}", "}}")
@@ -13,7 +13,7 @@ import time
 import threading
 import hashlib
 import hmac
-from typing import Dict, List, Optional, Callable, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Callable, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
@@ -41,6 +41,19 @@ class MessageStatus(Enum):
     UNKNOWN = "unknown"
 
 
+# Progress of a message through its statuses; a status never moves to a lower rank
+_STATUS_RANK = {
+    MessageStatus.UNKNOWN: 0,
+    MessageStatus.QUEUED: 0,
+    MessageStatus.SENDING: 1,
+    MessageStatus.SENT: 2,
+    MessageStatus.DELIVERED: 3,
+    MessageStatus.READ: 4,
+    MessageStatus.FAILED: 5,
+    MessageStatus.DELETED: 5
+}
+
+
 class WebhookEventType(Enum):
     """Types of webhook events."""
     MESSAGE_STATUS = "message_status"
@@ -77,25 +90,67 @@ class MessageDeliveryRecord:
     conversation_id: Optional[str] = None
     pricing_model: Optional[str] = None
     
-    def update_status(self, new_status: MessageStatus, timestamp: Optional[datetime] = None, error_info: Optional[Dict[str, str]] = None):
-        """Update message status with timestamp."""
+    def update_status(self, new_status: MessageStatus, timestamp: Optional[datetime] = None, error_info: Optional[Dict[str, str]] = None) -> bool:
+        """Update message status with timestamp; return False if the update is stale."""
+        changes = self.status_changes(new_status, timestamp, error_info, self.status, self.updated_at)
+        for name, value in changes.items():
+            setattr(self, name, value)
+        return bool(changes)
+    
+    @staticmethod
+    def status_changes(
+        new_status: MessageStatus,
+        timestamp: Optional[datetime] = None,
+        error_info: Optional[Dict[str, str]] = None,
+        current_status: Optional[MessageStatus] = None,
+        current_time: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the fields a status update changes.
+        
+        Shared by update_status and the batched DeliveryTracker.apply_status_updates
+        so both apply the same transition rules. Webhooks can arrive out of
+        order, so an update ranking below the current status is stale, as is
+        one of the same rank that is older than the current status. Timestamps
+        are only compared within a rank because the send time is taken from
+        the local clock while webhook timestamps come from the server.
+        
+        Args:
+            new_status: New status
+            timestamp: Status timestamp (defaults to now)
+            error_info: Error code and message if the status is failed
+            current_status: Status the update applies to (optional)
+            current_time: Time the current status was reached (optional)
+            
+        Returns:
+            Dictionary of field names to new values, empty if the update is stale
+        """
         if timestamp is None:
             timestamp = datetime.now()
         
-        self.status = new_status
-        self.updated_at = timestamp
+        if current_status is not None:
+            new_rank = _STATUS_RANK.get(new_status, 0)
+            current_rank = _STATUS_RANK.get(current_status, 0)
+            if new_rank < current_rank:
+                return {}
+            if new_rank == current_rank and current_time is not None and timestamp < current_time:
+                return {}
+        
+        changes: Dict[str, Any] = {'status': new_status, 'updated_at': timestamp}
         
         if new_status == MessageStatus.SENT:
-            self.sent_at = timestamp
+            changes['sent_at'] = timestamp
         elif new_status == MessageStatus.DELIVERED:
-            self.delivered_at = timestamp
+            changes['delivered_at'] = timestamp
         elif new_status == MessageStatus.READ:
-            self.read_at = timestamp
+            changes['read_at'] = timestamp
         elif new_status == MessageStatus.FAILED:
-            self.failed_at = timestamp
+            changes['failed_at'] = timestamp
             if error_info:
-                self.error_code = error_info.get('code')
-                self.error_message = error_info.get('message')
+                changes['error_code'] = error_info.get('code')
+                changes['error_message'] = error_info.get('message')
+        
+        return changes
     
     def can_retry(self) -> bool:
         """Check if message can be retried."""
@@ -139,6 +194,16 @@ class MessageDeliveryRecord:
         }
 
 
+@dataclass
+class StatusUpdate:
+    """A message status transition parsed from a webhook payload."""
+    message_id: str
+    status: MessageStatus
+    timestamp: Optional[datetime] = None
+    error_info: Optional[Dict[str, str]] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
 @dataclass
 class WebhookEvent:
     """Webhook event data."""
@@ -295,7 +360,8 @@ class DeliveryTracker:
             error_info: Error information if status is failed
             
         Returns:
-            True if updated successfully
+            True if updated successfully, False if the message is not tracked
+            or the update is older than its current status
         """
         with self._lock:
             # Get record from cache or database
@@ -307,7 +373,9 @@ class DeliveryTracker:
                     return False
             
             # Update status
-            record.update_status(status, timestamp, error_info)
+            if not record.update_status(status, timestamp, error_info):
+                logger.debug(f"Ignored stale status {status.value} for message {message_id}")
+                return False
             
             # Save to database
             self._save_record(record)
@@ -318,6 +386,71 @@ class DeliveryTracker:
             logger.debug(f"Updated message {message_id} status to {status.value}")
             return True
     
+    def apply_status_updates(self, updates: Iterable[StatusUpdate]) -> int:
+        """
+        Apply many status updates in a single transaction.
+        
+        Updates are coalesced per message in arrival order on top of the
+        stored status, so the stored row ends up as if update_message_status
+        had been called for each one, and only the columns they change are
+        written. Stale updates and updates for messages that are not tracked
+        are ignored.
+        
+        Args:
+            updates: Status updates to apply
+            
+        Returns:
+            Number of messages updated
+        """
+        updates = list(updates)
+        if not updates:
+            return 0
+        
+        with self._lock:
+            updated = 0
+            with self._get_db_connection() as conn:
+                with conn:
+                    stored = self._load_status_states(conn, {update.message_id for update in updates})
+                    
+                    changes: Dict[str, Dict[str, Any]] = {}
+                    for update in updates:
+                        if update.message_id in stored:
+                            self._coalesce_status(
+                                changes.setdefault(update.message_id, {}), stored[update.message_id], update
+                            )
+                    
+                    # Group messages by the set of columns they change so each group is one executemany
+                    groups: Dict[Tuple[str, ...], List[tuple]] = {}
+                    for message_id, columns in changes.items():
+                        if not columns:
+                            continue
+                        names = tuple(sorted(columns))
+                        groups.setdefault(names, []).append(
+                            tuple(self._column_value(columns[name]) for name in names) + (message_id,)
+                        )
+                    
+                    for names, rows in groups.items():
+                        assignments = ", ".join(f"{name} = ?" for name in names)
+                        cursor = conn.executemany(
+                            f"UPDATE delivery_records SET {assignments} WHERE message_id = ?",
+                            rows
+                        )
+                        updated += cursor.rowcount
+            
+            # Keep cached records in step with the database
+            for message_id, columns in changes.items():
+                record = self.recent_records.get(message_id)
+                if record:
+                    for name, value in columns.items():
+                        setattr(record, name, value)
+        
+        untracked = len({update.message_id for update in updates} - stored.keys())
+        if untracked:
+            logger.warning(f"Ignored status updates for {untracked} untracked messages")
+        
+        logger.debug(f"Applied status updates to {updated} messages")
+        return updated
+    
     def get_message_status(self, message_id: str) -> Optional[MessageDeliveryRecord]:
         """
         Get current status of a message.
@@ -557,6 +690,43 @@ class DeliveryTracker:
             conn.execute(query, values)
             conn.commit()
     
+    @staticmethod
+    def _load_status_states(conn, message_ids) -> Dict[str, Tuple[MessageStatus, datetime]]:
+        """Load the stored status and update time of the given tracked messages."""
+        message_ids = list(message_ids)
+        states = {}
+        # Stay below SQLite's limit on query parameters
+        for start in range(0, len(message_ids), 500):
+            chunk = message_ids[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = conn.execute(
+                f"SELECT message_id, status, updated_at FROM delivery_records WHERE message_id IN ({placeholders})",
+                chunk
+            )
+            for message_id, status, updated_at in cursor:
+                states[message_id] = (MessageStatus(status), datetime.fromisoformat(updated_at))
+        return states
+    
+    @staticmethod
+    def _coalesce_status(columns: Dict[str, Any], stored: Tuple[MessageStatus, datetime], update: StatusUpdate):
+        """Fold a status update into the pending column changes of its message, unless it is stale."""
+        columns.update(MessageDeliveryRecord.status_changes(
+            update.status,
+            update.timestamp,
+            update.error_info,
+            current_status=columns.get('status', stored[0]),
+            current_time=columns.get('updated_at', stored[1])
+        ))
+    
+    @staticmethod
+    def _column_value(value: Any) -> Any:
+        """Convert a record attribute to its database column value."""
+        if isinstance(value, MessageStatus):
+            return value.value
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+    
     def _load_record(self, message_id: str) -> Optional[MessageDeliveryRecord]:
         """Load record from database."""
         query = "SELECT * FROM delivery_records WHERE message_id = ?"
@@ -618,6 +788,14 @@ class WebhookManager:
     - Error handling and retry logic
     """
     
+    # Map WhatsApp status to our enum
+    STATUS_MAPPING = {
+        'sent': MessageStatus.SENT,
+        'delivered': MessageStatus.DELIVERED,
+        'read': MessageStatus.READ,
+        'failed': MessageStatus.FAILED
+    }
+    
     def __init__(
         self,
         webhook_secret: str,
@@ -701,8 +879,97 @@ class WebhookManager:
             logger.error(f"Webhook processing failed: {e}")
             return False
     
+    def process_webhook_batch(self, payloads: Iterable[Tuple[str, Optional[str]]]) -> int:
+        """
+        Process many webhook payloads, applying their status updates together.
+        
+        Each payload is verified and parsed once; the status updates of all
+        payloads are then written to the delivery tracker in one transaction.
+        
+        Args:
+            payloads: (payload, signature) pairs; signature may be None
+            
+        Returns:
+            Number of payloads processed successfully
+        """
+        processed, status_updates = self.parse_webhook_batch(payloads)
+        return processed if self.apply_status_updates(status_updates) else 0
+    
+    def parse_webhook_batch(
+        self,
+        payloads: Iterable[Tuple[str, Optional[str]]]
+    ) -> Tuple[int, List[StatusUpdate]]:
+        """
+        Verify and parse webhook payloads without applying their status updates.
+        
+        Args:
+            payloads: (payload, signature) pairs; signature may be None
+            
+        Returns:
+            Tuple of (payloads parsed successfully, their status updates in order)
+        """
+        status_updates: List[StatusUpdate] = []
+        processed = 0
+        
+        for payload, signature in payloads:
+            if signature and not self.verify_webhook_signature(payload, signature):
+                logger.warning("Webhook signature verification failed")
+                continue
+            
+            try:
+                data = json.loads(payload)
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid webhook JSON payload: {e}")
+                continue
+            
+            if self._collect_webhook_data(data, status_updates):
+                processed += 1
+        
+        return processed, status_updates
+    
+    def apply_status_updates(self, status_updates: List[StatusUpdate]) -> bool:
+        """
+        Write parsed status updates to the delivery tracker and report them.
+        
+        Args:
+            status_updates: Status updates from parse_webhook_batch
+            
+        Returns:
+            True if the updates were written
+        """
+        try:
+            self._apply_status_updates(status_updates)
+        except Exception as e:
+            logger.error(f"Webhook batch processing failed: {e}")
+            return False
+        
+        return True
+    
     def _process_webhook_data(self, data: Dict[str, Any], signature: Optional[str] = None) -> bool:
         """Process parsed webhook data."""
+        status_updates: List[StatusUpdate] = []
+        if not self._collect_webhook_data(data, status_updates):
+            return False
+        
+        try:
+            self._apply_status_updates(status_updates)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Webhook data processing failed: {e}")
+            return False
+    
+    def _collect_webhook_data(self, data: Dict[str, Any], status_updates: List[StatusUpdate]) -> bool:
+        """
+        Route parsed webhook data, collecting status updates instead of applying them.
+        
+        Args:
+            data: Parsed webhook payload
+            status_updates: List receiving the payload's status updates
+            
+        Returns:
+            True if the payload structure was valid
+        """
         try:
             # WhatsApp webhook structure
             if 'entry' not in data:
@@ -715,7 +982,7 @@ class WebhookManager:
                 
                 for change in entry['changes']:
                     if change.get('field') == 'messages':
-                        self._process_message_webhook(change['value'])
+                        self._process_message_webhook(change['value'], status_updates)
                     elif change.get('field') == 'message_template_status_update':
                         self._process_template_status_webhook(change['value'])
             
@@ -725,20 +992,22 @@ class WebhookManager:
             logger.error(f"Webhook data processing failed: {e}")
             return False
     
-    def _process_message_webhook(self, value: Dict[str, Any]):
+    def _process_message_webhook(self, value: Dict[str, Any], status_updates: List[StatusUpdate]):
         """Process message-related webhook events."""
-        # Process message status updates
+        # Collect message status updates
         if 'statuses' in value:
             for status_update in value['statuses']:
-                self._process_status_update(status_update)
+                update = self._parse_status_update(status_update)
+                if update:
+                    status_updates.append(update)
         
         # Process incoming messages (for read receipts, etc.)
         if 'messages' in value:
             for message in value['messages']:
                 self._process_incoming_message(message)
     
-    def _process_status_update(self, status_update: Dict[str, Any]):
-        """Process message status update."""
+    def _parse_status_update(self, status_update: Dict[str, Any]) -> Optional[StatusUpdate]:
+        """Parse a message status update, or return None if it is invalid."""
         try:
             message_id = status_update.get('id')
             status_str = status_update.get('status')
@@ -746,17 +1015,9 @@ class WebhookManager:
             
             if not message_id or not status_str:
                 logger.warning("Invalid status update: missing id or status")
-                return
+                return None
             
-            # Map WhatsApp status to our enum
-            status_mapping = {
-                'sent': MessageStatus.SENT,
-                'delivered': MessageStatus.DELIVERED,
-                'read': MessageStatus.READ,
-                'failed': MessageStatus.FAILED
-            }
-            
-            status = status_mapping.get(status_str, MessageStatus.UNKNOWN)
+            status = self.STATUS_MAPPING.get(status_str, MessageStatus.UNKNOWN)
             
             # Parse timestamp
             timestamp = None
@@ -777,32 +1038,41 @@ class WebhookManager:
                         'message': error.get('title', 'Unknown error')
                     }
             
-            # Update delivery tracker
-            success = self.delivery_tracker.update_message_status(
+            return StatusUpdate(
                 message_id=message_id,
                 status=status,
                 timestamp=timestamp,
-                error_info=error_info
+                error_info=error_info,
+                data=status_update
             )
             
-            if success:
-                logger.debug(f"Updated message {message_id} status to {status.value}")
-            
-            # Create webhook event
+        except Exception as e:
+            logger.error(f"Status update processing failed: {e}")
+            return None
+    
+    def _apply_status_updates(self, status_updates: List[StatusUpdate]):
+        """Write collected status updates to the delivery tracker and report them."""
+        if not status_updates:
+            return
+        
+        self.delivery_tracker.apply_status_updates(status_updates)
+        
+        if not self.event_callback:
+            return
+        
+        for update in status_updates:
             event = WebhookEvent(
                 event_type=WebhookEventType.MESSAGE_STATUS,
-                timestamp=timestamp or datetime.now(),
-                data=status_update,
+                timestamp=update.timestamp or datetime.now(),
+                data=update.data,
                 verified=True,
                 processed=True
             )
             
-            # Trigger callback
-            if self.event_callback:
+            try:
                 self.event_callback(event)
-            
-        except Exception as e:
-            logger.error(f"Status update processing failed: {e}")
+            except Exception as e:
+                logger.error(f"Status update processing failed: {e}")
     
     def _process_incoming_message(self, message: Dict[str, Any]):
         """Process incoming message (for analytics, etc.)."""
@@ -896,6 +1166,10 @@ class WhatsAppDeliverySystem:
         """Process webhook payload."""
         return self.webhook_manager.process_webhook(payload, signature)
     
+    def process_webhook_batch(self, payloads: Iterable[Tuple[str, Optional[str]]]) -> int:
+        """Process many webhook payloads in one delivery tracker transaction."""
+        return self.webhook_manager.process_webhook_batch(payloads)
+    
     def get_analytics(self, days: int = 30) -> DeliveryAnalytics:
         """Get delivery analytics."""
         return self.delivery_tracker.get_delivery_analytics(days)
@@ -0,0 +1,405 @@
+"""
+Local HTTP receiver for WhatsApp webhooks.
+
+Accepts webhook deliveries on a lightweight stdlib HTTP server, verifies
+their signatures, acknowledges them immediately and hands the payloads to a
+pool of worker threads that parse them; a single thread applies the parsed
+status updates to the delivery tracker in batches.
+"""
+
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from ..utils.logger import get_logger
+from .webhook_manager import WebhookManager
+
+logger = get_logger(__name__)
+
+# Queue entry telling a worker to exit
+_STOP = object()
+
+
+class _WebhookRequestHandler(BaseHTTPRequestHandler):
+    """Request handler delegating to the WebhookReceiver owning the server."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    # Headers and body are written separately; don't let Nagle hold back the body
+    disable_nagle_algorithm = True
+    
+    def do_GET(self):
+        """Answer the webhook subscription verification handshake."""
+        status, body = self.server.receiver._handle_verification(self.path)
+        self._respond(status, body)
+    
+    def do_POST(self):
+        """Verify and enqueue a webhook delivery."""
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        receiver = self.server.receiver
+        if length > receiver.max_body_size:
+            self.close_connection = True
+            self._respond(413, "Payload too large")
+            return
+        
+        body = self.rfile.read(length) if length else b""
+        status, message, headers = receiver._handle_delivery(
+            self.path, body, self.headers.get("X-Hub-Signature-256")
+        )
+        self._respond(status, message, headers)
+    
+    def _respond(self, status: int, body: str, headers: Optional[Dict[str, str]] = None):
+        content = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+    
+    def log_message(self, format, *args):
+        logger.debug(f"Webhook receiver: {format % args}")
+
+
+class _WebhookHTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server that knows its WebhookReceiver."""
+    
+    daemon_threads = True
+    request_queue_size = 128
+    
+    def __init__(self, address, receiver: "WebhookReceiver"):
+        self.receiver = receiver
+        super().__init__(address, _WebhookRequestHandler)
+
+
+class WebhookReceiver:
+    """
+    Built-in webhook endpoint feeding delivery receipts to a worker pool.
+    
+    Signed POST requests are acknowledged as soon as they are queued; the
+    workers drain the queue in batches and parse them through
+    WebhookManager.parse_webhook_batch. One applier thread writes the parsed
+    updates through WebhookManager.apply_status_updates, so a burst of
+    receipts becomes a few transactions instead of one per status and no two
+    transactions race each other. Parsed batches can still reach the applier
+    out of order; the delivery tracker ignores updates older than the stored
+    status, so a late "delivered" cannot overwrite "read". When the queue is
+    full new deliveries get 503 with Retry-After, which makes the sender back
+    off and redeliver instead of the receiver buffering without bound.
+    """
+    
+    def __init__(
+        self,
+        webhook_manager: WebhookManager,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/webhook",
+        verify_token: Optional[str] = None,
+        require_signature: bool = True,
+        workers: int = 2,
+        max_queue_size: int = 10000,
+        batch_size: int = 200,
+        max_body_size: int = 1024 * 1024,
+        retry_after: int = 1
+    ):
+        """
+        Initialize webhook receiver.
+        
+        Args:
+            webhook_manager: Manager verifying signatures and applying payloads
+            host: Interface to listen on (localhost by default)
+            port: Port to listen on (0 picks a free port)
+            path: URL path receiving webhooks
+            verify_token: Token expected in the subscription verification handshake
+            require_signature: Reject deliveries without an X-Hub-Signature-256 header
+            workers: Worker threads parsing queued payloads (one more thread applies them)
+            max_queue_size: Payloads queued before deliveries are refused
+            batch_size: Maximum payloads a worker applies in one batch
+            max_body_size: Largest accepted request body in bytes
+            retry_after: Seconds sent in Retry-After when the queue is full
+        """
+        self.webhook_manager = webhook_manager
+        self.host = host
+        self.port = port
+        self.path = path
+        self.verify_token = verify_token
+        self.require_signature = require_signature
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.max_body_size = max_body_size
+        self.retry_after = retry_after
+        
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._server: Optional[_WebhookHTTPServer] = None
+        self._server_thread: Optional[threading.Thread] = None
+        self._worker_threads: List[threading.Thread] = []
+        
+        # Parsed batches waiting for the applier thread
+        self._apply_queue: queue.Queue = queue.Queue(maxsize=max(1, workers) * 2)
+        self._apply_thread: Optional[threading.Thread] = None
+        
+        # Payloads accepted but not yet applied, for flush()
+        self._pending = 0
+        self._idle = threading.Condition()
+        
+        # Metrics
+        self._metrics_lock = threading.Lock()
+        self._metrics = self._empty_metrics()
+    
+    @property
+    def url(self) -> str:
+        """URL webhook deliveries should be posted to."""
+        return f"http://{self.host}:{self.port}{self.path}"
+    
+    def start(self) -> "WebhookReceiver":
+        """
+        Start the HTTP server and the worker pool.
+        
+        Returns:
+            The receiver, for chaining
+        """
+        if self._server:
+            return self
+        
+        self._server = _WebhookHTTPServer((self.host, self.port), self)
+        self.port = self._server.server_address[1]
+        
+        self._apply_thread = threading.Thread(target=self._apply_loop, name="webhook-applier", daemon=True)
+        self._apply_thread.start()
+        
+        self._worker_threads = [
+            threading.Thread(target=self._worker_loop, name=f"webhook-worker-{i}", daemon=True)
+            for i in range(max(1, self.workers))
+        ]
+        for thread in self._worker_threads:
+            thread.start()
+        
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, name="webhook-receiver", daemon=True
+        )
+        self._server_thread.start()
+        
+        logger.info(f"Webhook receiver listening on {self.url}")
+        return self
+    
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop accepting deliveries, apply the queued ones and stop the workers.
+        
+        Args:
+            timeout: Seconds to wait for each thread to finish (None waits indefinitely)
+        """
+        if not self._server:
+            return
+        
+        self._server.shutdown()
+        self._server.server_close()
+        self._server_thread.join()
+        self._server = None
+        
+        # Workers exit after draining everything queued ahead of their stop entry
+        for _ in self._worker_threads:
+            self._queue.put(_STOP)
+        for thread in self._worker_threads:
+            thread.join(timeout)
+        self._worker_threads = []
+        
+        # The applier exits after the batches the workers handed over
+        self._apply_queue.put(_STOP)
+        self._apply_thread.join(timeout)
+        self._apply_thread = None
+        
+        logger.info("Webhook receiver stopped")
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every accepted delivery has been applied.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        
+        Returns:
+            True if the queue drained within the timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get delivery counters and queue depth.
+        
+        Returns:
+            Dictionary with received, accepted and rejected deliveries, applied
+            and failed payloads, batches and current and peak queue depth
+        """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        
+        metrics["queue_depth"] = self._queue.qsize()
+        metrics["max_queue_size"] = self.max_queue_size
+        metrics["avg_batch_size"] = (
+            metrics["processed_payloads"] + metrics["failed_payloads"]
+        ) / metrics["batches"] if metrics["batches"] else 0.0
+        return metrics
+    
+    def reset_metrics(self):
+        """Reset delivery counters."""
+        with self._metrics_lock:
+            self._metrics = self._empty_metrics()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+    
+    @staticmethod
+    def _empty_metrics() -> Dict[str, Any]:
+        return {
+            "received": 0,
+            "accepted": 0,
+            "rejected_signature": 0,
+            "rejected_backpressure": 0,
+            "processed_payloads": 0,
+            "failed_payloads": 0,
+            "batches": 0,
+            "peak_queue_depth": 0,
+            "processing_seconds": 0.0
+        }
+    
+    def _count(self, name: str, amount: int = 1):
+        with self._metrics_lock:
+            self._metrics[name] += amount
+    
+    def _handle_verification(self, request_path: str):
+        """Return the response status and body for a GET request."""
+        url = urlparse(request_path)
+        if url.path != self.path:
+            return 404, "Not found"
+        
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if (
+            self.verify_token is not None and
+            query.get("hub.mode") == "subscribe" and
+            query.get("hub.verify_token") == self.verify_token
+        ):
+            return 200, query.get("hub.challenge", "")
+        
+        logger.warning("Webhook subscription verification failed")
+        return 403, "Verification failed"
+    
+    def _handle_delivery(self, request_path: str, body: bytes, signature: Optional[str]):
+        """Verify and enqueue a POSTed delivery; return status, body and extra headers."""
+        if urlparse(request_path).path != self.path:
+            return 404, "Not found", {}
+        
+        self._count("received")
+        
+        try:
+            payload = body.decode("utf-8")
+        except UnicodeDecodeError:
+            return 400, "Invalid encoding", {}
+        
+        if signature:
+            if not self.webhook_manager.verify_webhook_signature(payload, signature):
+                self._count("rejected_signature")
+                logger.warning("Webhook signature verification failed")
+                return 403, "Invalid signature", {}
+        elif self.require_signature:
+            self._count("rejected_signature")
+            return 401, "Missing signature", {}
+        
+        with self._idle:
+            self._pending += 1
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            with self._idle:
+                self._pending -= 1
+                self._idle.notify_all()
+            self._count("rejected_backpressure")
+            return 503, "Busy", {"Retry-After": str(self.retry_after)}
+        
+        depth = self._queue.qsize()
+        with self._metrics_lock:
+            self._metrics["accepted"] += 1
+            self._metrics["peak_queue_depth"] = max(self._metrics["peak_queue_depth"], depth)
+        return 200, "OK", {}
+    
+    def _worker_loop(self):
+        """Parse queued payloads in batches until a stop entry is reached."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._apply_queue.put(self._parse_batch(batch))
+    
+    def _parse_batch(self, batch: List[str]):
+        """Parse a batch of verified payloads; return what the applier needs."""
+        start_time = time.perf_counter()
+        try:
+            # Signatures were checked when the deliveries were accepted
+            processed, updates = self.webhook_manager.parse_webhook_batch((payload, None) for payload in batch)
+        except Exception as e:
+            logger.error(f"Webhook batch parsing failed: {e}")
+            processed, updates = 0, []
+        return len(batch), processed, updates, time.perf_counter() - start_time
+    
+    def _apply_loop(self):
+        """Apply parsed batches, merging those waiting, until a stop entry is reached."""
+        stopping = False
+        while not stopping:
+            item = self._apply_queue.get()
+            if item is _STOP:
+                break
+            
+            parsed = [item]
+            while True:
+                try:
+                    item = self._apply_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                parsed.append(item)
+            
+            self._apply_batches(parsed)
+    
+    def _apply_batches(self, parsed: List[tuple]):
+        """Apply the status updates of parsed batches and update the metrics."""
+        start_time = time.perf_counter()
+        updates = [update for _, _, batch_updates, _ in parsed for update in batch_updates]
+        applied = self.webhook_manager.apply_status_updates(updates)
+        
+        payloads = sum(size for size, _, _, _ in parsed)
+        processed = sum(count for _, count, _, _ in parsed) if applied else 0
+        parse_seconds = sum(seconds for _, _, _, seconds in parsed)
+        
+        with self._metrics_lock:
+            self._metrics["batches"] += 1
+            self._metrics["processed_payloads"] += processed
+            self._metrics["failed_payloads"] += payloads - processed
+            self._metrics["processing_seconds"] += parse_seconds + time.perf_counter() - start_time
+        
+        with self._idle:
+            self._pending -= payloads
+            self._idle.notify_all()
@@ -174,6 +174,7 @@ class CSVPreviewThread(QThread):
         self.file_path = file_path
         self.configuration = configuration
         self.processor = AdvancedTableProcessor()
+        self.cached_column_mapping: Optional[Dict[str, str]] = None
     
     def run(self):
         """Load and process CSV file for preview."""
@@ -182,6 +183,7 @@ class CSVPreviewThread(QThread):
             
             # Analyze file structure
             structure = self.processor.analyze_file_structure(file_path)
+            self.cached_column_mapping = self.processor.get_cached_column_mapping(file_path)
             
             # Load preview data
             if structure.file_format.value in ['csv', 'tsv']:
@@ -214,6 +216,7 @@ class CSVImportConfigDialog(QDialog):
         self.file_structure: Optional[FileStructure] = None
         self.preview_data: Optional[pd.DataFrame] = None
         self.processed_data: Optional[pd.DataFrame] = None
+        self.cached_column_mapping: Dict[str, str] = {}  # Field -> CSV column last used for this file
         
         # Initialize i18n
         self.i18n = get_i18n_manager()
@@ -525,6 +528,7 @@ class CSVImportConfigDialog(QDialog):
         """Handle preview data ready."""
         self.file_structure = file_structure
         self.preview_data = preview_data
+        self.cached_column_mapping = self.preview_thread.cached_column_mapping or {}
         
         # Update encoding and delimiter from detected values
         if file_structure.encoding:
@@ -556,6 +560,7 @@ class CSVImportConfigDialog(QDialog):
         
         # Available field mappings
         field_options = ["", "name", "email", "phone", "company"]
+        cached_fields = {column: field for field, column in self.cached_column_mapping.items()}
         
         for i, column in enumerate(columns):
             # CSV column name
@@ -567,8 +572,8 @@ class CSVImportConfigDialog(QDialog):
             mapping_combo = QComboBox()
             mapping_combo.addItems(field_options)
             
-            # Try to auto-detect mapping
-            auto_mapping = self.auto_detect_mapping(str(column))
+            # Restore the mapping last used for this file, else try to auto-detect it
+            auto_mapping = cached_fields.get(str(column)) or self.auto_detect_mapping(str(column))
             if auto_mapping:
                 mapping_combo.setCurrentText(auto_mapping)
             
@@ -992,6 +997,12 @@ class CSVImportConfigDialog(QDialog):
             QMessageBox.warning(self, self.i18n.tr("warning"), self.i18n.tr("no_data_to_import"))
             return
         
+        # Remember the mapping for the next time this file is opened
+        self.preview_thread.processor.remember_column_mapping(
+            Path(self.file_path),
+            {field: column for column, field in self.configuration.column_mapping.items()}
+        )
+        
         # Emit signal with configuration and processed data
         self.configuration_ready.emit(self.configuration, self.processed_data)
         self.accept()
\ No newline at end of file
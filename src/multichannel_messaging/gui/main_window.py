@@ -36,6 +36,12 @@ from PySide6.QtGui import QAction, QFont, QIcon
 
 from ..core.config_manager import ConfigManager
 from ..core.csv_processor import CSVProcessor
+from ..core.customer_frame import (
+    customer_frame_errors,
+    extract_customer_columns,
+    frame_to_customers,
+    normalize_extracted_columns,
+)
 from ..core.models import Customer, MessageTemplate, MessageChannel
 from ..core.template_manager import TemplateManager
 from ..core.whatsapp_multi_message_manager import WhatsAppMultiMessageManager
@@ -1252,69 +1258,38 @@ CSC-Reach Team""",
     def on_csv_configuration_ready(self, configuration, processed_data):
         """Handle CSV configuration and processed data from the configuration dialog."""
         try:
-            # Convert processed DataFrame to Customer objects
-            customers = []
-            errors = []
-
-            for index, row in processed_data.iterrows():
-                try:
-                    # Extract customer data based on configuration mapping
-                    customer_data = {
-                        "name": str(row.get("name", "")).strip(),
-                        "company": str(row.get("company", "")).strip(),
-                        "email": str(row.get("email", "")).strip(),
-                        "phone": str(row.get("phone", "")).strip(),
-                    }
-
-                    # Skip rows with missing required data
-                    if not customer_data["name"]:
-                        continue
-
-                    # Check channel requirements
-                    if (
-                        "email" in configuration.messaging_channels
-                        and not customer_data["email"]
-                    ):
-                        errors.append(
-                            {
-                                "row_number": index + 1,
-                                "error": "Email is required for email messaging",
-                            }
-                        )
-                        continue
-
-                    if (
-                        "whatsapp" in configuration.messaging_channels
-                        and not customer_data["phone"]
-                    ):
-                        errors.append(
-                            {
-                                "row_number": index + 1,
-                                "error": "Phone number is required for WhatsApp messaging",
-                            }
-                        )
-                        continue
-
-                    # Create Customer object
-                    customer = Customer(
-                        name=customer_data["name"],
-                        company=customer_data["company"],
-                        email=customer_data["email"],
-                        phone=customer_data["phone"],
-                    )
-                    
-                    # Validate with flexible requirements based on selected channels
-                    required_fields = ["name"]  # Name is always required
-                    if "email" in configuration.messaging_channels:
-                        required_fields.append("email")
-                    if "whatsapp" in configuration.messaging_channels:
-                        required_fields.append("phone")
-                    
-                    customer.validate(required_fields)
-                    customers.append(customer)
+            # Normalize and validate whole columns, then build Customer
+            # objects only for the rows that pass
+            raw_data = extract_customer_columns(processed_data)
+            customer_frame = normalize_extracted_columns(raw_data)
+
+            # Validate with flexible requirements based on selected channels
+            required_fields = ["name"]  # Name is always required
+            if "email" in configuration.messaging_channels:
+                required_fields.append("email")
+            if "whatsapp" in configuration.messaging_channels:
+                required_fields.append("phone")
+
+            row_errors = customer_frame_errors(customer_frame, required_fields)
+
+            # Check channel requirements before field validation
+            if "whatsapp" in configuration.messaging_channels:
+                row_errors = row_errors.mask(
+                    raw_data["phone"] == "",
+                    "Phone number is required for WhatsApp messaging",
+                )
+            if "email" in configuration.messaging_channels:
+                row_errors = row_errors.mask(
+                    raw_data["email"] == "", "Email is required for email messaging"
+                )
 
-                except Exception as e:
-                    errors.append({"row_number": index + 1, "error": str(e)})
+            # Skip rows with missing required data
+            has_name = raw_data["name"] != ""
+            customers = frame_to_customers(customer_frame, has_name & (row_errors == ""))
+            errors = [
+                {"row_number": index + 1, "error": error}
+                for index, error in row_errors[has_name & (row_errors != "")].items()
+            ]
 
             # Show errors if any
             if errors:
@@ -3052,4 +3027,7 @@ CSC-Reach streamlines business communication processes with professional email t
             self.sending_thread.stop()
             self.sending_thread.wait(3000)  # Wait up to 3 seconds
 
+        # Write batched template usage
+        self.template_manager.close()
+
         event.accept()
@@ -4,6 +4,7 @@ Main entry point for the Multi-Channel Bulk Messaging System.
 Enhanced with comprehensive application management and health monitoring.
 """
 
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -83,4 +84,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for process pools in frozen builds
+    multiprocessing.freeze_support()
     main()
@@ -3,5 +3,6 @@ API clients for external service integrations.
 """
 
 from .whatsapp_api_client import WhatsAppAPIClient
+from .async_whatsapp_api_client import AsyncWhatsAppAPIClient, OutgoingMessage, SendResult
 
-__all__ = ['WhatsAppAPIClient']
+__all__ = ['WhatsAppAPIClient', 'AsyncWhatsAppAPIClient', 'OutgoingMessage', 'SendResult']
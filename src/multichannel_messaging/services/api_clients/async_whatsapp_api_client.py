@@ -0,0 +1,258 @@
+"""
+Asyncio variant of the WhatsApp Business API client for high-volume sending.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+import requests
+
+from ...utils.exceptions import QuotaExceededError
+from ...utils.logger import get_logger
+from ...core.rate_limiter import QuotaType
+from .whatsapp_api_client import WhatsAppAPIClient
+
+logger = get_logger(__name__)
+
+
+# Quotas every sent message counts against
+MESSAGE_QUOTAS = (
+    QuotaType.MESSAGES_PER_MINUTE,
+    QuotaType.MESSAGES_PER_HOUR,
+    QuotaType.MESSAGES_PER_DAY
+)
+
+
+@dataclass
+class OutgoingMessage:
+    """A message to send; text messages set message, template messages set template_name."""
+    to: str
+    message: Optional[str] = None
+    template_name: Optional[str] = None
+    language_code: str = "en"
+    parameters: Optional[List[str]] = None
+
+
+@dataclass
+class SendResult:
+    """Outcome of sending one message with send_many."""
+    index: int
+    to: str
+    success: bool
+    message_id: Optional[str] = None
+    response: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class AsyncWhatsAppAPIClient:
+    """
+    Asyncio client that keeps many WhatsApp API requests in flight.
+    
+    Wraps a WhatsAppAPIClient and shares its session, rate limiter, health
+    metrics, request logs and delivery tracking. Each message reserves its
+    quota before it is sent and rate limit waits and retry backoff are awaited
+    instead of blocking a thread; only the HTTP exchange itself runs on a
+    bounded pool of worker threads using the pooled session.
+    """
+    
+    def __init__(
+        self,
+        client: WhatsAppAPIClient,
+        max_in_flight: Optional[int] = None,
+        max_quota_wait: float = 60.0
+    ):
+        """
+        Initialize async WhatsApp API client.
+        
+        Args:
+            client: Client providing the session, rate limiter and error handling
+            max_in_flight: Maximum concurrent HTTP requests (defaults to the connection pool size)
+            max_quota_wait: Seconds a request may wait for quota before QuotaExceededError
+        """
+        self.client = client
+        self.max_in_flight = max_in_flight or client.pool_maxsize
+        self.max_quota_wait = max_quota_wait
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_in_flight,
+            thread_name_prefix="whatsapp-send"
+        )
+    
+    async def _reserve_quota(self) -> None:
+        """
+        Wait until one message can be recorded against every message quota.
+        
+        Raises:
+            QuotaExceededError: If no capacity frees within max_quota_wait
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_quota_wait
+        
+        while True:
+            decisions, wait_seconds = self.client.rate_limiter.try_reserve(MESSAGE_QUOTAS)
+            if decisions is not None:
+                return
+            
+            if loop.time() + wait_seconds > deadline:
+                raise QuotaExceededError(f"Quota exceeded; next slot in {wait_seconds:.1f} seconds")
+            await asyncio.sleep(wait_seconds)
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to WhatsApp API, retrying like WhatsAppAPIClient._make_request.
+        
+        The request's quota is reserved once, before the first attempt. Retry
+        delays and Retry-After pauses come from the wrapped client's retry
+        scheduler and are awaited.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            data: Request payload
+            params: Query parameters
+        
+        Returns:
+            API response as dictionary
+        
+        Raises:
+            WhatsAppAPIError: If API request fails
+            QuotaExceededError: If rate limits are exceeded
+        """
+        await self._reserve_quota()
+        
+        loop = asyncio.get_running_loop()
+        client = self.client
+        retry_count = 0
+        
+        while True:
+            # Honor a Retry-After received by any request
+            pause = client.retry_scheduler.pause_remaining()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            
+            request_log = client._new_request_log(method, endpoint, data, params, retry_count)
+            try:
+                try:
+                    response, response_time = await loop.run_in_executor(
+                        self._executor, client._send_http_request, method, endpoint, data, params
+                    )
+                except requests.exceptions.RequestException as e:
+                    response_data, delay = client._evaluate_attempt(request_log, retry_count, transport_error=e)
+                else:
+                    response_data, delay = client._evaluate_attempt(
+                        request_log, retry_count, response, response_time
+                    )
+            finally:
+                client._finish_request(request_log)
+            
+            if delay is None:
+                return response_data
+            
+            logger.info(f"Retrying {method} {endpoint} in {delay:.1f} seconds...")
+            await asyncio.sleep(delay)
+            retry_count += 1
+    
+    async def send_text_message(self, to: str, message: str) -> Dict[str, Any]:
+        """
+        Send a text message via WhatsApp.
+        
+        Args:
+            to: Recipient phone number (with country code)
+            message: Message text
+        
+        Returns:
+            API response with message ID and status
+        """
+        payload = self.client._build_text_payload(to, message)
+        response = await self._make_request("POST", self.client._messages_endpoint(), payload)
+        self.client._track_sent_message(response, to, message_content=message)
+        return response
+    
+    async def send_template_message(
+        self,
+        to: str,
+        template_name: str,
+        language_code: str = "en",
+        parameters: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a template message via WhatsApp.
+        
+        Args:
+            to: Recipient phone number
+            template_name: Name of the approved template
+            language_code: Template language code (default: en)
+            parameters: Template parameter values
+        
+        Returns:
+            API response with message ID and status
+        """
+        payload = self.client._build_template_payload(to, template_name, language_code, parameters)
+        response = await self._make_request("POST", self.client._messages_endpoint(), payload)
+        self.client._track_sent_message(response, to, template_name=template_name)
+        return response
+    
+    async def send_many(self, messages: Iterable[OutgoingMessage]) -> AsyncIterator[SendResult]:
+        """
+        Send messages concurrently, yielding each result as it completes.
+        
+        At most max_in_flight messages are sent at once; messages are taken
+        from the iterable only as capacity frees, so it may be a generator.
+        
+        Args:
+            messages: Messages to send
+        
+        Yields:
+            SendResult per message, in completion order
+        """
+        pending = iter(enumerate(messages))
+        results: asyncio.Queue = asyncio.Queue()
+        
+        async def worker():
+            for index, outgoing in pending:
+                await results.put(await self._send_one(index, outgoing))
+            await results.put(None)
+        
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.max_in_flight)]
+        try:
+            remaining = len(workers)
+            while remaining:
+                result = await results.get()
+                if result is None:
+                    remaining -= 1
+                else:
+                    yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    
+    async def _send_one(self, index: int, outgoing: OutgoingMessage) -> SendResult:
+        """Send one message of send_many, capturing any error in the result."""
+        try:
+            if outgoing.template_name:
+                response = await self.send_template_message(
+                    outgoing.to, outgoing.template_name, outgoing.language_code, outgoing.parameters
+                )
+            else:
+                response = await self.send_text_message(outgoing.to, outgoing.message or "")
+        except Exception as e:
+            logger.error(f"Failed to send message to {outgoing.to}: {e}")
+            return SendResult(index=index, to=outgoing.to, success=False, error=str(e))
+        
+        message_id = None
+        if response.get('messages'):
+            message_id = response['messages'][0].get('id')
+        return SendResult(index=index, to=outgoing.to, success=True, message_id=message_id, response=response)
+    
+    def shutdown(self):
+        """Stop the HTTP worker threads; the wrapped client stays open."""
+        self._executor.shutdown(wait=True)
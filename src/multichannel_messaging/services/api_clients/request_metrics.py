@@ -0,0 +1,197 @@
+"""
+Constant-memory request logs and latency statistics for API clients.
+"""
+
+import json
+import math
+import threading
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+    
+    Latencies are counted in microsecond buckets whose width grows with the
+    value, so percentiles are accurate to within 1/2**SUB_BUCKET_BITS of the
+    value while memory stays fixed regardless of how many are recorded.
+    """
+    
+    # 64 buckets per power of two: about 1.6% relative error
+    SUB_BUCKET_BITS = 6
+    
+    # Largest tracked latency is 2**MAX_EXPONENT microseconds (about 12 days)
+    MAX_EXPONENT = 40
+    
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._sub_buckets = 1 << self.SUB_BUCKET_BITS
+        self._max_value = (1 << (self.MAX_EXPONENT + 1)) - 1
+        self._counts = [0] * ((self.MAX_EXPONENT - self.SUB_BUCKET_BITS + 2) << self.SUB_BUCKET_BITS)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+    
+    def record(self, seconds: float) -> None:
+        """Record one latency in seconds."""
+        microseconds = min(max(int(seconds * 1_000_000), 0), self._max_value)
+        index = self._index(microseconds)
+        with self._lock:
+            self._counts[index] += 1
+            if self.count == 0 or seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+            self.count += 1
+            self.total += seconds
+    
+    def percentile(self, percent: float) -> float:
+        """
+        Get the latency at a percentile.
+        
+        Args:
+            percent: Percentile between 0 and 100
+        
+        Returns:
+            Latency in seconds, or 0.0 if nothing was recorded
+        """
+        return self.percentiles([percent])[percent]
+    
+    def percentiles(self, percents: List[float]) -> Dict[float, float]:
+        """
+        Get the latencies at several percentiles in one pass.
+        
+        Args:
+            percents: Percentiles between 0 and 100
+        
+        Returns:
+            Latency in seconds per percentile
+        """
+        with self._lock:
+            if self.count == 0:
+                return {percent: 0.0 for percent in percents}
+            
+            targets = sorted((max(1, math.ceil(percent / 100 * self.count)), percent) for percent in percents)
+            results = {}
+            cumulative = 0
+            position = 0
+            for index, bucket_count in enumerate(self._counts):
+                if not bucket_count:
+                    continue
+                cumulative += bucket_count
+                while position < len(targets) and targets[position][0] <= cumulative:
+                    value = self._value_at(index) / 1_000_000
+                    results[targets[position][1]] = min(max(value, self.min), self.max)
+                    position += 1
+                if position == len(targets):
+                    break
+            return results
+    
+    def reset(self) -> None:
+        """Remove all recorded latencies."""
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self.count = 0
+            self.total = 0.0
+            self.min = 0.0
+            self.max = 0.0
+    
+    def _index(self, microseconds: int) -> int:
+        """Return the bucket of a latency in microseconds."""
+        exponent = microseconds.bit_length() - 1
+        if exponent < self.SUB_BUCKET_BITS:
+            return microseconds
+        shift = exponent - self.SUB_BUCKET_BITS
+        return ((shift + 1) << self.SUB_BUCKET_BITS) + (microseconds >> shift) - self._sub_buckets
+    
+    def _value_at(self, index: int) -> float:
+        """Return the midpoint in microseconds of a bucket."""
+        row, sub_bucket = divmod(index, self._sub_buckets)
+        if row == 0:
+            return float(sub_bucket)
+        shift = row - 1
+        lower = (sub_bucket + self._sub_buckets) << shift
+        return lower + ((1 << shift) - 1) / 2
+
+
+class RequestLogBuffer:
+    """
+    Fixed-capacity ring buffer of request log entries.
+    
+    Once full, each new entry replaces the oldest. If a spill path is given,
+    replaced entries are appended to it as JSON lines instead of being lost.
+    """
+    
+    def __init__(self, capacity: int = 1000, spill_path: Optional[Path] = None):
+        """
+        Initialize request log buffer.
+        
+        Args:
+            capacity: Maximum number of entries kept in memory
+            spill_path: JSON lines file receiving entries evicted from memory (optional)
+        """
+        self.capacity = capacity
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.spilled = 0
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._spill_file = None
+        self._lock = threading.Lock()
+    
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Add an entry, evicting the oldest one if the buffer is full."""
+        with self._lock:
+            if self.spill_path and len(self._entries) == self.capacity:
+                self._spill(self._entries[0])
+            self._entries.append(entry)
+    
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get the most recent entries.
+        
+        Args:
+            limit: Maximum number of entries to return
+        
+        Returns:
+            Up to limit entries, oldest first
+        """
+        with self._lock:
+            if limit <= 0:
+                return []
+            return list(islice(self._entries, max(0, len(self._entries) - limit), None))
+    
+    def clear(self) -> None:
+        """Remove all entries held in memory."""
+        with self._lock:
+            self._entries.clear()
+    
+    def close(self) -> None:
+        """Close the spill file."""
+        with self._lock:
+            if self._spill_file:
+                self._spill_file.close()
+                self._spill_file = None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def _spill(self, entry: Dict[str, Any]) -> None:
+        """Append an evicted entry to the spill file; must be called with the lock held."""
+        try:
+            if self._spill_file is None:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spill_file = open(self.spill_path, 'a', encoding='utf-8')
+            self._spill_file.write(json.dumps(entry, default=str) + "\n")
+            self._spill_file.flush()
+            self.spilled += 1
+        except Exception as e:
+            logger.warning(f"Failed to spill request log to {self.spill_path}: {e}")
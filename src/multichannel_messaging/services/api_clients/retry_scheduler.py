@@ -0,0 +1,190 @@
+"""
+Central retry scheduling for WhatsApp Business API requests.
+"""
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RetryScheduler:
+    """
+    Time-ordered delay queue for retrying failed API requests.
+    
+    Failed requests are parked in the queue instead of sleeping on the
+    sending thread; a single timer thread hands each one to a small worker
+    pool once its delay has passed. Backoff delays are jittered so parked
+    retries do not fire in lockstep, and a Retry-After hint pauses every
+    request sent through the scheduler, not just the one that received it.
+    """
+    
+    # Upper bounds in seconds of the retry delay histogram buckets
+    DELAY_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+    
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 30.0, max_workers: int = 4):
+        """
+        Initialize retry scheduler.
+        
+        Args:
+            base_delay: Backoff delay in seconds before the first retry
+            max_delay: Maximum backoff delay in seconds
+            max_workers: Threads that run due retries
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_workers = max_workers
+        
+        self._queue: List[Tuple[float, int, Future, Callable[[], Any]]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._paused_until = 0.0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Metrics
+        self._retry_counts: Counter = Counter()
+        self._delay_histogram = [0] * (len(self.DELAY_BUCKETS) + 1)
+    
+    def backoff_delay(self, retry_count: int, retry_after: Optional[float] = None) -> float:
+        """
+        Compute the delay before a retry.
+        
+        Args:
+            retry_count: Retries already made for the request
+            retry_after: Delay requested by the server, if any
+        
+        Returns:
+            Delay in seconds: half the capped exponential backoff plus up to
+            the other half at random, or the server's delay plus jitter
+        """
+        if retry_after is not None:
+            return retry_after + random.uniform(0, self.base_delay)
+        
+        delay = min(self.base_delay * (2 ** retry_count), self.max_delay)
+        return delay / 2 + random.uniform(0, delay / 2)
+    
+    def defer_all(self, seconds: float) -> None:
+        """Pause all requests sent through the scheduler for the given number of seconds."""
+        with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    def pause_remaining(self) -> float:
+        """Return the seconds left of a pause requested with defer_all."""
+        with self._condition:
+            return max(0.0, self._paused_until - time.monotonic())
+    
+    def record_retry(self, reason: str, delay: float) -> None:
+        """
+        Count a retry for the health metrics.
+        
+        Args:
+            reason: Why the request is retried (rate_limited, api_error, timeout, connection)
+            delay: Delay before the retry in seconds
+        """
+        bucket = next(
+            (i for i, bound in enumerate(self.DELAY_BUCKETS) if delay <= bound),
+            len(self.DELAY_BUCKETS)
+        )
+        with self._condition:
+            self._retry_counts[reason] += 1
+            self._delay_histogram[bucket] += 1
+    
+    def schedule(self, callback: Callable[[], Any], delay: float) -> Future:
+        """
+        Park a callback in the delay queue.
+        
+        Args:
+            callback: Function to run once the delay has passed
+            delay: Delay in seconds
+        
+        Returns:
+            Future resolved with the callback's result
+        """
+        future: Future = Future()
+        with self._condition:
+            if not self._running:
+                self._start()
+            heapq.heappush(self._queue, (time.monotonic() + delay, next(self._sequence), future, callback))
+            self._condition.notify()
+        return future
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get retry counts and the distribution of retry delays.
+        
+        Returns:
+            Dictionary with retries per reason, the delay histogram keyed by
+            bucket upper bound, parked retries and the remaining global pause
+        """
+        labels = [f"<={bound:g}s" for bound in self.DELAY_BUCKETS] + [f">{self.DELAY_BUCKETS[-1]:g}s"]
+        with self._condition:
+            return {
+                "total_retries": sum(self._retry_counts.values()),
+                "retries_by_reason": dict(self._retry_counts),
+                "delay_histogram": dict(zip(labels, self._delay_histogram)),
+                "pending_retries": len(self._queue),
+                "paused_seconds": max(0.0, self._paused_until - time.monotonic())
+            }
+    
+    def reset_metrics(self) -> None:
+        """Reset retry counts and the delay histogram."""
+        with self._condition:
+            self._retry_counts.clear()
+            self._delay_histogram = [0] * (len(self.DELAY_BUCKETS) + 1)
+    
+    def _start(self) -> None:
+        """Start the timer thread; must be called with the condition held."""
+        self._running = True
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="whatsapp-retry")
+        self._thread = threading.Thread(target=self._run, name="whatsapp-retry-timer", daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        """Hand parked callbacks to the workers as they become due."""
+        with self._condition:
+            while self._running:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                
+                wait_seconds = self._queue[0][0] - time.monotonic()
+                if wait_seconds > 0:
+                    self._condition.wait(timeout=wait_seconds)
+                    continue
+                
+                _, _, future, callback = heapq.heappop(self._queue)
+                self._executor.submit(self._execute, future, callback)
+    
+    @staticmethod
+    def _execute(future: Future, callback: Callable[[], Any]) -> None:
+        """Run a due callback and resolve its future."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(callback())
+        except BaseException as e:
+            future.set_exception(e)
+    
+    def shutdown(self) -> None:
+        """Stop the timer thread and cancel parked callbacks."""
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            pending, self._queue = self._queue, []
+            self._condition.notify_all()
+        
+        for _, _, future, _ in pending:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+        logger.debug(f"Retry scheduler stopped; cancelled {len(pending)} parked retries")
@@ -5,9 +5,11 @@ Enhanced WhatsApp Business API client with advanced connection pooling, retry lo
 import json
 import time
 import threading
+from concurrent.futures import Future
 from typing import Dict, List, Optional, Tuple, Any, Callable
 from urllib.parse import urljoin
 from datetime import datetime, timedelta
+from pathlib import Path
 from dataclasses import dataclass, field
 import requests
 from requests.adapters import HTTPAdapter
@@ -19,6 +21,8 @@ from ...utils.logger import get_logger
 from ...core.i18n_manager import get_i18n_manager
 from ...core.rate_limiter import IntelligentRateLimiter, QuotaType, QuotaConfig, WHATSAPP_BUSINESS_QUOTAS
 from ...core.webhook_manager import WhatsAppDeliverySystem, MessageStatus
+from .request_metrics import LatencyHistogram, RequestLogBuffer
+from .retry_scheduler import RetryScheduler
 
 logger = get_logger(__name__)
 i18n = get_i18n_manager()
@@ -32,9 +36,17 @@ class APIHealthMetrics:
     failed_requests: int = 0
     rate_limited_requests: int = 0
     average_response_time: float = 0.0
+    p50_response_time: float = 0.0
+    p95_response_time: float = 0.0
+    p99_response_time: float = 0.0
+    max_response_time: float = 0.0
     last_request_time: Optional[datetime] = None
     last_error: Optional[str] = None
     consecutive_failures: int = 0
+    total_retries: int = 0
+    retries_by_reason: Dict[str, int] = field(default_factory=dict)
+    retry_delay_histogram: Dict[str, int] = field(default_factory=dict)
+    pending_retries: int = 0
     
     @property
     def success_rate(self) -> float:
@@ -132,7 +144,10 @@ class WhatsAppAPIClient:
         enable_health_monitoring: bool = True,
         health_check_callback: Optional[Callable[[APIHealthMetrics], None]] = None,
         webhook_secret: Optional[str] = None,
-        enable_delivery_tracking: bool = True
+        enable_delivery_tracking: bool = True,
+        retry_scheduler: Optional[RetryScheduler] = None,
+        request_log_capacity: int = 1000,
+        request_log_path: Optional[Path] = None
     ):
         """
         Initialize enhanced WhatsApp API client.
@@ -150,6 +165,10 @@ class WhatsAppAPIClient:
             health_check_callback: Callback function for health status changes
             webhook_secret: Secret for webhook signature verification
             enable_delivery_tracking: Enable message delivery tracking
+            retry_scheduler: Scheduler for retries of failed requests (optional)
+            request_log_capacity: Number of recent request logs kept in memory
+            request_log_path: JSON lines file receiving request logs evicted
+                from memory (optional; older logs are dropped without it)
         """
         self.access_token = access_token
         self.phone_number_id = phone_number_id
@@ -157,12 +176,14 @@ class WhatsAppAPIClient:
         self.base_url = base_url or self.CLOUD_API_BASE_URL
         self.timeout = timeout
         self.max_retries = max_retries
+        self.pool_maxsize = pool_maxsize
         
         # Health monitoring
         self.enable_health_monitoring = enable_health_monitoring
         self.health_metrics = APIHealthMetrics()
         self.health_check_callback = health_check_callback
         self._health_lock = threading.Lock()
+        self.latency_histogram = LatencyHistogram()
         
         # Advanced rate limiting with intelligent quota management
         self.rate_limiter = IntelligentRateLimiter(
@@ -172,9 +193,11 @@ class WhatsAppAPIClient:
         )
         self._rate_limit_lock = threading.Lock()
         
+        # Retries of failed requests, shared by all sending threads
+        self.retry_scheduler = retry_scheduler or RetryScheduler()
+        
         # Request logging
-        self.request_logs: List[Dict[str, Any]] = []
-        self._log_lock = threading.Lock()
+        self.request_logs = RequestLogBuffer(request_log_capacity, request_log_path)
         
         # Delivery tracking system
         self.delivery_system: Optional[WhatsAppDeliverySystem] = None
@@ -187,14 +210,9 @@ class WhatsAppAPIClient:
         # Configure enhanced session with connection pooling
         self.session = requests.Session()
         
-        # Enhanced retry strategy with exponential backoff
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=2,  # Exponential backoff
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST"],
-            raise_on_status=False  # Handle status codes manually
-        )
+        # Retries are parked in the retry scheduler so each request has a
+        # single retry budget; urllib3 must not retry on its own
+        retry_strategy = Retry(total=0, raise_on_status=False)
         
         # Use enhanced adapter with connection pooling
         adapter = EnhancedHTTPAdapter(
@@ -220,18 +238,21 @@ class WhatsAppAPIClient:
         method: str, 
         endpoint: str, 
         data: Optional[Dict] = None,
-        params: Optional[Dict] = None,
-        retry_count: int = 0
+        params: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """
         Make HTTP request to WhatsApp API with enhanced error handling and monitoring.
         
+        Waits for the request to finish, including retries parked in the
+        retry scheduler, so the calling thread is held for the whole backoff.
+        Bulk senders should use submit_text_message (or _submit_request)
+        instead and collect the futures.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
             data: Request payload
             params: Query parameters
-            retry_count: Current retry attempt count
             
         Returns:
             API response as dictionary
@@ -240,6 +261,28 @@ class WhatsAppAPIClient:
             WhatsAppAPIError: If API request fails
             QuotaExceededError: If rate limits are exceeded
         """
+        return self._submit_request(method, endpoint, data, params).result()
+    
+    def _submit_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None
+    ) -> Future:
+        """
+        Check rate limits and make the first attempt of a request on the calling thread.
+        
+        If the request has to be retried, the retry is parked in the retry
+        scheduler and the calling thread is free to return.
+        
+        Returns:
+            Future resolved with the API response, or with the error once
+            the request will not be retried
+            
+        Raises:
+            QuotaExceededError: If rate limits are exceeded
+        """
         # Check rate limits before making request using intelligent rate limiter
         can_proceed, reason, details = self.rate_limiter.can_make_request(QuotaType.MESSAGES_PER_MINUTE)
         if not can_proceed:
@@ -257,172 +300,319 @@ class WhatsAppAPIClient:
             else:
                 raise QuotaExceededError(reason)
         
-        url = urljoin(self.base_url, endpoint)
-        request_start_time = datetime.now()
+        future: Future = Future()
+        request = (method, endpoint, data, params, details, threading.get_ident())
+        self._run_attempt(future, request, retry_count=0)
+        return future
+    
+    def _run_attempt(self, future: Future, request: Tuple, retry_count: int) -> None:
+        """
+        Make one attempt of a submitted request and resolve or re-park it.
         
-        # Log request details (sanitized)
-        request_log = {
-            "timestamp": request_start_time.isoformat(),
-            "method": method,
-            "endpoint": endpoint,
-            "has_data": data is not None,
-            "has_params": params is not None,
-            "retry_count": retry_count
-        }
+        Args:
+            future: Future of the submitted request
+            request: Tuple of (method, endpoint, data, params, rate limit details, submitting thread)
+            retry_count: Retries already made
+        """
+        method, endpoint, data, params, details, origin_thread = request
+        
+        # Honor a Retry-After received by any request
+        pause = self.retry_scheduler.pause_remaining()
+        if pause > 0:
+            self._park_attempt(future, request, retry_count, pause)
+            return
+        
+        request_log = self._new_request_log(method, endpoint, data, params, retry_count)
         
         try:
             logger.debug(f"Making {method} request to {endpoint} (attempt {retry_count + 1})")
-            
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
-                timeout=self.timeout
-            )
-            
-            response_time = (datetime.now() - request_start_time).total_seconds()
-            
-            # Update request log
-            request_log.update({
-                "status_code": response.status_code,
-                "response_time": response_time,
-                "success": response.ok
-            })
-            
-            # Handle specific status codes
-            if response.status_code == 429:
-                # Rate limiting
-                retry_after = int(response.headers.get('Retry-After', 60))
-                logger.warning(f"Rate limited. Retry after {retry_after} seconds")
-                
-                request_log["rate_limited"] = True
-                request_log["retry_after"] = retry_after
-                
-                with self._health_lock:
-                    self.health_metrics.rate_limited_requests += 1
-                
-                # Wait and retry if we haven't exceeded max retries
-                if retry_count < self.max_retries:
-                    time.sleep(retry_after)
-                    return self._make_request(method, endpoint, data, params, retry_count + 1)
-                else:
-                    raise QuotaExceededError(i18n.tr("rate_limit_max_retries_exceeded"))
-            
-            # Parse response
             try:
-                response_data = response.json()
-            except json.JSONDecodeError:
-                response_data = {"text": response.text, "raw_response": True}
-            
-            # Handle API errors
-            if not response.ok:
-                error_info = self._extract_detailed_error_info(response_data, response.status_code)
-                request_log["error"] = error_info
-                
-                logger.error(f"API request failed: {error_info['message']}")
-                
-                # Update health metrics
-                with self._health_lock:
-                    self.health_metrics.failed_requests += 1
-                    self.health_metrics.consecutive_failures += 1
-                    self.health_metrics.last_error = error_info['message']
-                
-                # Determine if we should retry based on error type
-                if self._should_retry_error(error_info['code'], retry_count):
-                    wait_time = min(2 ** retry_count, 30)  # Exponential backoff, max 30s
-                    logger.info(f"Retrying request in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                    return self._make_request(method, endpoint, data, params, retry_count + 1)
-                
-                # Raise appropriate exception based on error code
-                if error_info['code'] in [131014, 131016]:
-                    raise QuotaExceededError(error_info['message'])
-                else:
-                    raise WhatsAppAPIError(error_info['message'])
-            
-            # Success - update metrics and rate limiting
+                response, response_time = self._send_http_request(method, endpoint, data, params)
+            except requests.exceptions.RequestException as e:
+                response_data, delay = self._evaluate_attempt(request_log, retry_count, transport_error=e)
+            else:
+                response_data, delay = self._evaluate_attempt(request_log, retry_count, response, response_time)
+        except Exception as e:
+            future.set_exception(e)
+            return
+        finally:
+            self._finish_request(request_log)
+        
+        if delay is not None:
+            logger.info(f"Retrying {method} {endpoint} in {delay:.1f} seconds...")
+            self._park_attempt(future, request, retry_count + 1, delay)
+            return
+        
+        # A dispatcher reservation already counted this request, but is only
+        # visible on the thread that submitted it
+        if not (details.get('reserved') and threading.get_ident() != origin_thread):
+            # Success - update rate limiting
             using_burst = details.get('using_burst', False)
             self.rate_limiter.record_request(QuotaType.MESSAGES_PER_MINUTE, use_burst=using_burst)
             
             # Also record for hourly and daily quotas
             self.rate_limiter.record_request(QuotaType.MESSAGES_PER_HOUR, use_burst=False)
             self.rate_limiter.record_request(QuotaType.MESSAGES_PER_DAY, use_burst=False)
+        
+        future.set_result(response_data)
+    
+    def _park_attempt(self, future: Future, request: Tuple, retry_count: int, delay: float) -> None:
+        """Park the next attempt of a request in the retry scheduler."""
+        parked = self.retry_scheduler.schedule(
+            lambda: self._run_attempt(future, request, retry_count), delay
+        )
+        
+        def on_cancelled(parked_future):
+            if parked_future.cancelled() and not future.done():
+                future.set_exception(ServiceUnavailableError(i18n.tr("whatsapp_service_unavailable")))
+        
+        parked.add_done_callback(on_cancelled)
+    
+    def _evaluate_attempt(
+        self,
+        request_log: Dict[str, Any],
+        retry_count: int,
+        response: Optional[requests.Response] = None,
+        response_time: float = 0.0,
+        transport_error: Optional[requests.exceptions.RequestException] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
+        """
+        Classify the outcome of a request attempt.
+        
+        Args:
+            request_log: Log entry of the attempt
+            retry_count: Retries already made
+            response: HTTP response, if one was received
+            response_time: Response time in seconds
+            transport_error: Exception raised by the session instead of a response
             
-            with self._health_lock:
-                self.health_metrics.successful_requests += 1
-                self.health_metrics.consecutive_failures = 0
-                self.health_metrics.last_request_time = datetime.now()
-                
-                # Update average response time
-                total_requests = self.health_metrics.total_requests
-                current_avg = self.health_metrics.average_response_time
-                self.health_metrics.average_response_time = (
-                    (current_avg * total_requests + response_time) / (total_requests + 1)
-                )
-            
-            logger.debug(f"API request successful in {response_time:.2f}s")
-            return response_data
+        Returns:
+            Tuple of (response data, None) on success, or (None, delay in
+            seconds) if the request should be retried
             
-        except requests.exceptions.Timeout as e:
-            request_log["error"] = {"type": "timeout", "message": str(e)}
-            logger.error(f"Request timeout: {e}")
+        Raises:
+            WhatsAppAPIError: If the request failed and will not be retried
+            QuotaExceededError: If rate limited or over quota after the last retry
+        """
+        if transport_error is not None:
+            error = self._handle_transport_error(transport_error, request_log)
+            if not isinstance(transport_error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+                raise error
+            return None, self._plan_retry(request_log["error"]["type"], retry_count, error)
+        
+        response_data, retry_after, error_info = self._handle_response(response, response_time, request_log)
+        
+        if retry_after is not None:
+            error = QuotaExceededError(i18n.tr("rate_limit_max_retries_exceeded"))
+            return None, self._plan_retry("rate_limited", retry_count, error, retry_after)
+        
+        if error_info is not None:
+            error = self._error_from_info(error_info)
+            if not self._is_retryable_error(error_info['code']):
+                raise error
+            return None, self._plan_retry("api_error", retry_count, error)
+        
+        return response_data, None
+    
+    def _plan_retry(
+        self,
+        reason: str,
+        retry_count: int,
+        error: Exception,
+        retry_after: Optional[float] = None
+    ) -> float:
+        """
+        Spend one retry from the request's budget and return the delay before it.
+        
+        Args:
+            reason: Why the request is retried
+            retry_count: Retries already made
+            error: Exception to raise when the budget is spent
+            retry_after: Delay requested by the server, applied to all requests
             
-            with self._health_lock:
-                self.health_metrics.failed_requests += 1
-                self.health_metrics.consecutive_failures += 1
+        Returns:
+            Delay in seconds before the retry
             
-            if retry_count < self.max_retries:
-                wait_time = min(2 ** retry_count, 30)
-                logger.info(f"Retrying after timeout in {wait_time} seconds...")
-                time.sleep(wait_time)
-                return self._make_request(method, endpoint, data, params, retry_count + 1)
+        Raises:
+            The given error if no retries are left
+        """
+        if retry_count >= self.max_retries:
+            raise error
+        
+        if retry_after is not None:
+            self.retry_scheduler.defer_all(retry_after)
+        
+        delay = self.retry_scheduler.backoff_delay(retry_count, retry_after)
+        self.retry_scheduler.record_retry(reason, delay)
+        return delay
+    
+    def _new_request_log(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict],
+        params: Optional[Dict],
+        retry_count: int
+    ) -> Dict[str, Any]:
+        """Create the sanitized log entry of a request attempt."""
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "method": method,
+            "endpoint": endpoint,
+            "has_data": data is not None,
+            "has_params": params is not None,
+            "retry_count": retry_count
+        }
+    
+    def _send_http_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None
+    ) -> Tuple[requests.Response, float]:
+        """
+        Send one HTTP request on the pooled session.
+        
+        Returns:
+            Tuple of (response, response time in seconds)
+        """
+        url = urljoin(self.base_url, endpoint)
+        request_start_time = time.perf_counter()
+        response = self.session.request(
+            method=method,
+            url=url,
+            json=data,
+            params=params,
+            timeout=self.timeout
+        )
+        return response, time.perf_counter() - request_start_time
+    
+    def _handle_response(
+        self,
+        response: requests.Response,
+        response_time: float,
+        request_log: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[int], Optional[Dict[str, Any]]]:
+        """
+        Classify an API response and update the request log and health metrics.
+        
+        Args:
+            response: HTTP response
+            response_time: Response time in seconds
+            request_log: Log entry of the request attempt
             
-            raise WhatsAppAPIError(i18n.tr("request_timeout_exceeded"))
+        Returns:
+            Tuple of (response data, Retry-After seconds if rate limited,
+            error info if the API reported an error)
+        """
+        request_log.update({
+            "status_code": response.status_code,
+            "response_time": response_time,
+            "success": response.ok
+        })
+        self.latency_histogram.record(response_time)
+        
+        # Handle specific status codes
+        if response.status_code == 429:
+            # Rate limiting
+            retry_after = int(response.headers.get('Retry-After', 60))
+            logger.warning(f"Rate limited. Retry after {retry_after} seconds")
             
-        except requests.exceptions.ConnectionError as e:
-            request_log["error"] = {"type": "connection", "message": str(e)}
-            logger.error(f"Connection error: {e}")
+            request_log["rate_limited"] = True
+            request_log["retry_after"] = retry_after
             
             with self._health_lock:
-                self.health_metrics.failed_requests += 1
-                self.health_metrics.consecutive_failures += 1
-            
-            if retry_count < self.max_retries:
-                wait_time = min(2 ** retry_count, 30)
-                logger.info(f"Retrying after connection error in {wait_time} seconds...")
-                time.sleep(wait_time)
-                return self._make_request(method, endpoint, data, params, retry_count + 1)
+                self.health_metrics.rate_limited_requests += 1
             
-            raise ServiceUnavailableError(i18n.tr("whatsapp_service_unavailable"))
+            return None, retry_after, None
+        
+        # Parse response
+        try:
+            response_data = response.json()
+        except json.JSONDecodeError:
+            response_data = {"text": response.text, "raw_response": True}
+        
+        # Handle API errors
+        if not response.ok:
+            error_info = self._extract_detailed_error_info(response_data, response.status_code)
+            request_log["error"] = error_info
             
-        except requests.exceptions.RequestException as e:
-            request_log["error"] = {"type": "request", "message": str(e)}
-            logger.error(f"Request failed: {e}")
+            logger.error(f"API request failed: {error_info['message']}")
             
+            # Update health metrics
             with self._health_lock:
                 self.health_metrics.failed_requests += 1
                 self.health_metrics.consecutive_failures += 1
+                self.health_metrics.last_error = error_info['message']
             
-            raise WhatsAppAPIError(f"Request failed: {e}")
-            
-        finally:
-            # Update total request count and log the request
-            with self._health_lock:
-                self.health_metrics.total_requests += 1
+            return response_data, None, error_info
+        
+        with self._health_lock:
+            self.health_metrics.successful_requests += 1
+            self.health_metrics.consecutive_failures = 0
+            self.health_metrics.last_request_time = datetime.now()
             
-            with self._log_lock:
-                self.request_logs.append(request_log)
-                # Keep only last 1000 requests to prevent memory issues
-                if len(self.request_logs) > 1000:
-                    self.request_logs = self.request_logs[-1000:]
+            # Update average response time
+            total_requests = self.health_metrics.total_requests
+            current_avg = self.health_metrics.average_response_time
+            self.health_metrics.average_response_time = (
+                (current_avg * total_requests + response_time) / (total_requests + 1)
+            )
+        
+        logger.debug(f"API request successful in {response_time:.2f}s")
+        return response_data, None, None
+    
+    def _error_from_info(self, error_info: Dict[str, Any]) -> Exception:
+        """Return the exception to raise for an API error that will not be retried."""
+        if error_info['code'] in [131014, 131016]:
+            return QuotaExceededError(error_info['message'])
+        return WhatsAppAPIError(error_info['message'])
+    
+    def _handle_transport_error(self, error: requests.exceptions.RequestException, request_log: Dict[str, Any]) -> Exception:
+        """
+        Record a request that got no response and classify it.
+        
+        Args:
+            error: Exception raised by the session
+            request_log: Log entry of the request attempt
             
-            # Trigger health check callback if configured
-            if self.enable_health_monitoring and self.health_check_callback:
-                try:
-                    self.health_check_callback(self.health_metrics)
-                except Exception as e:
-                    logger.warning(f"Health check callback failed: {e}")
+        Returns:
+            The exception to raise if the request will not be retried
+        """
+        if isinstance(error, requests.exceptions.Timeout):
+            request_log["error"] = {"type": "timeout", "message": str(error)}
+            logger.error(f"Request timeout: {error}")
+            result = WhatsAppAPIError(i18n.tr("request_timeout_exceeded"))
+        elif isinstance(error, requests.exceptions.ConnectionError):
+            request_log["error"] = {"type": "connection", "message": str(error)}
+            logger.error(f"Connection error: {error}")
+            result = ServiceUnavailableError(i18n.tr("whatsapp_service_unavailable"))
+        else:
+            request_log["error"] = {"type": "request", "message": str(error)}
+            logger.error(f"Request failed: {error}")
+            result = WhatsAppAPIError(f"Request failed: {error}")
+        
+        with self._health_lock:
+            self.health_metrics.failed_requests += 1
+            self.health_metrics.consecutive_failures += 1
+        
+        return result
+    
+    def _finish_request(self, request_log: Dict[str, Any]) -> None:
+        """Count a finished request attempt, log it and notify the health callback."""
+        # Update total request count and log the request
+        with self._health_lock:
+            self.health_metrics.total_requests += 1
+        
+        self.request_logs.append(request_log)
+        
+        # Trigger health check callback if configured
+        if self.enable_health_monitoring and self.health_check_callback:
+            try:
+                self.health_check_callback(self.health_metrics)
+            except Exception as e:
+                logger.warning(f"Health check callback failed: {e}")
     
     def _extract_detailed_error_info(self, response_data: Dict, status_code: int) -> Dict[str, Any]:
         """
@@ -510,6 +700,9 @@ class WhatsAppAPIClient:
         """
         Send a text message via WhatsApp.
         
+        Waits for the message to be sent, including retries parked in the
+        retry scheduler; use submit_text_message to send without waiting.
+        
         Args:
             to: Recipient phone number (with country code)
             message: Message text
@@ -520,50 +713,52 @@ class WhatsAppAPIClient:
         Raises:
             WhatsAppAPIError: If message sending fails
         """
-        # Validate phone number format
-        if not self.validate_phone_number(to):
-            raise WhatsAppAPIError(f"Invalid phone number format: {to}")
-        
-        # Prepare message payload
-        payload = {
-            "messaging_product": "whatsapp",
-            "to": to,
-            "type": "text",
-            "text": {
-                "body": message
-            }
-        }
+        try:
+            return self.submit_text_message(to, message).result()
+        except WhatsAppAPIError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to send text message to {to}: {e}")
+            raise WhatsAppAPIError(f"Failed to send text message: {e}")
+    
+    def submit_text_message(self, to: str, message: str) -> Future:
+        """
+        Send a text message via WhatsApp without waiting for retries.
         
-        endpoint = f"{self.phone_number_id}/messages"
+        The first attempt is made on the calling thread. If it has to be
+        retried, the retry is parked in the retry scheduler and the returned
+        future is resolved later, so callers sending many messages can keep
+        submitting while earlier ones wait out their backoff.
         
-        try:
-            response = self._make_request("POST", endpoint, payload)
+        Args:
+            to: Recipient phone number (with country code)
+            message: Message text
             
-            # Extract message ID from response
-            message_id = None
-            if 'messages' in response and response['messages']:
-                message_id = response['messages'][0].get('id')
+        Returns:
+            Future resolved with the API response, or with WhatsAppAPIError
+            once the message will not be retried
             
-            # Start delivery tracking if enabled
-            if self.delivery_system and message_id:
-                self.delivery_system.track_message(
-                    message_id=message_id,
-                    phone_number=to,
-                    message_content=message
-                )
-                
-                # Update status to sent
-                self.delivery_system.delivery_tracker.update_message_status(
-                    message_id=message_id,
-                    status=MessageStatus.SENT
-                )
+        Raises:
+            QuotaExceededError: If rate limits are exceeded
+        """
+        payload = self._build_text_payload(to, message)
+        request_future = self._submit_request("POST", self._messages_endpoint(), payload)
+        message_future: Future = Future()
+        
+        def on_done(future):
+            try:
+                response = future.result()
+                message_id = self._track_sent_message(response, to, message_content=message)
+            except Exception as e:
+                logger.error(f"Failed to send text message to {to}: {e}")
+                message_future.set_exception(WhatsAppAPIError(f"Failed to send text message: {e}"))
+                return
             
             logger.info(f"Text message sent successfully. Message ID: {message_id}")
-            return response
-            
-        except Exception as e:
-            logger.error(f"Failed to send text message to {to}: {e}")
-            raise WhatsAppAPIError(f"Failed to send text message: {e}")
+            message_future.set_result(response)
+        
+        request_future.add_done_callback(on_done)
+        return message_future
     
     def send_template_message(
         self, 
@@ -584,6 +779,56 @@ class WhatsAppAPIClient:
         Returns:
             API response with message ID and status
         """
+        payload = self._build_template_payload(to, template_name, language_code, parameters)
+        
+        try:
+            response = self._make_request("POST", self._messages_endpoint(), payload)
+            message_id = self._track_sent_message(response, to, template_name=template_name)
+            
+            logger.info(f"Template message sent successfully. Message ID: {message_id}")
+            return response
+            
+        except Exception as e:
+            logger.error(f"Failed to send template message to {to}: {e}")
+            raise WhatsAppAPIError(f"Failed to send template message: {e}")
+    
+    def _messages_endpoint(self) -> str:
+        """Return the endpoint messages are sent to."""
+        return f"{self.phone_number_id}/messages"
+    
+    def _build_text_payload(self, to: str, message: str) -> Dict[str, Any]:
+        """
+        Build the payload of a text message.
+        
+        Raises:
+            WhatsAppAPIError: If the phone number is invalid
+        """
+        # Validate phone number format
+        if not self.validate_phone_number(to):
+            raise WhatsAppAPIError(f"Invalid phone number format: {to}")
+        
+        return {
+            "messaging_product": "whatsapp",
+            "to": to,
+            "type": "text",
+            "text": {
+                "body": message
+            }
+        }
+    
+    def _build_template_payload(
+        self,
+        to: str,
+        template_name: str,
+        language_code: str = "en",
+        parameters: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the payload of a template message.
+        
+        Raises:
+            WhatsAppAPIError: If the phone number is invalid
+        """
         # Validate phone number
         if not self.validate_phone_number(to):
             raise WhatsAppAPIError(f"Invalid phone number format: {to}")
@@ -603,42 +848,45 @@ class WhatsAppAPIClient:
                 "parameters": [{"type": "text", "text": param} for param in parameters]
             }]
         
-        payload = {
+        return {
             "messaging_product": "whatsapp",
             "to": to,
             "type": "template",
             "template": template_payload
         }
+    
+    def _track_sent_message(self, response: Dict[str, Any], to: str, **tracking: Any) -> Optional[str]:
+        """
+        Start delivery tracking of a sent message.
         
-        endpoint = f"{self.phone_number_id}/messages"
-        
-        try:
-            response = self._make_request("POST", endpoint, payload)
-            
-            message_id = None
-            if 'messages' in response and response['messages']:
-                message_id = response['messages'][0].get('id')
-            
-            # Start delivery tracking if enabled
-            if self.delivery_system and message_id:
-                self.delivery_system.track_message(
-                    message_id=message_id,
-                    phone_number=to,
-                    template_name=template_name
-                )
-                
-                # Update status to sent
-                self.delivery_system.delivery_tracker.update_message_status(
-                    message_id=message_id,
-                    status=MessageStatus.SENT
-                )
+        Args:
+            response: API response of the send request
+            to: Recipient phone number
+            **tracking: Message content or template name to track
             
-            logger.info(f"Template message sent successfully. Message ID: {message_id}")
-            return response
+        Returns:
+            Message ID from the response, if any
+        """
+        # Extract message ID from response
+        message_id = None
+        if 'messages' in response and response['messages']:
+            message_id = response['messages'][0].get('id')
+        
+        # Start delivery tracking if enabled
+        if self.delivery_system and message_id:
+            self.delivery_system.track_message(
+                message_id=message_id,
+                phone_number=to,
+                **tracking
+            )
             
-        except Exception as e:
-            logger.error(f"Failed to send template message to {to}: {e}")
-            raise WhatsAppAPIError(f"Failed to send template message: {e}")
+            # Update status to sent
+            self.delivery_system.delivery_tracker.update_message_status(
+                message_id=message_id,
+                status=MessageStatus.SENT
+            )
+        
+        return message_id
     
     def get_message_status(self, message_id: str) -> Dict[str, Any]:
         """
@@ -752,6 +1000,8 @@ class WhatsAppAPIClient:
         Returns:
             Current health metrics
         """
+        retry_metrics = self.retry_scheduler.get_metrics()
+        latency = self.latency_histogram.percentiles([50, 95, 99])
         with self._health_lock:
             return APIHealthMetrics(
                 total_requests=self.health_metrics.total_requests,
@@ -759,9 +1009,17 @@ class WhatsAppAPIClient:
                 failed_requests=self.health_metrics.failed_requests,
                 rate_limited_requests=self.health_metrics.rate_limited_requests,
                 average_response_time=self.health_metrics.average_response_time,
+                p50_response_time=latency[50],
+                p95_response_time=latency[95],
+                p99_response_time=latency[99],
+                max_response_time=self.latency_histogram.max,
                 last_request_time=self.health_metrics.last_request_time,
                 last_error=self.health_metrics.last_error,
-                consecutive_failures=self.health_metrics.consecutive_failures
+                consecutive_failures=self.health_metrics.consecutive_failures,
+                total_retries=retry_metrics["total_retries"],
+                retries_by_reason=retry_metrics["retries_by_reason"],
+                retry_delay_histogram=retry_metrics["delay_histogram"],
+                pending_retries=retry_metrics["pending_retries"]
             )
     
     def get_rate_limit_status(self) -> Dict[str, Any]:
@@ -802,13 +1060,14 @@ class WhatsAppAPIClient:
         Returns:
             List of request logs
         """
-        with self._log_lock:
-            return self.request_logs[-limit:] if self.request_logs else []
+        return self.request_logs.recent(limit)
     
     def reset_health_metrics(self):
         """Reset health metrics (useful for testing or periodic resets)."""
         with self._health_lock:
             self.health_metrics = APIHealthMetrics()
+        self.retry_scheduler.reset_metrics()
+        self.latency_histogram.reset()
         logger.info("Health metrics reset")
     
     def update_rate_limits(
@@ -936,6 +1195,10 @@ class WhatsAppAPIClient:
         """
         Queue a message request to be sent when quota allows.
         
+        The dispatcher thread only makes the first attempt; retries are parked
+        in the retry scheduler and the callback runs once the message is sent
+        or will not be retried.
+        
         Args:
             to: Recipient phone number
             message: Message text
@@ -945,19 +1208,32 @@ class WhatsAppAPIClient:
         Returns:
             Request ID for tracking
         """
-        def send_message_callback():
+        def on_done(future):
             try:
-                result = self.send_text_message(to, message)
+                result = future.result()
+            except Exception as e:
                 if callback:
-                    callback(True, result)
-                return result
+                    callback(False, str(e))
+                return
+            
+            if callback:
+                callback(True, result)
+        
+        def send_message_callback():
+            try:
+                future = self.submit_text_message(to, message)
             except Exception as e:
                 if callback:
                     callback(False, str(e))
                 raise
+            future.add_done_callback(on_done)
         
         return self.rate_limiter.queue_request(
-            quota_type=QuotaType.MESSAGES_PER_MINUTE,
+            quota_type=[
+                QuotaType.MESSAGES_PER_MINUTE,
+                QuotaType.MESSAGES_PER_HOUR,
+                QuotaType.MESSAGES_PER_DAY
+            ],
             callback=send_message_callback,
             priority=priority
         )
@@ -1093,11 +1369,18 @@ class WhatsAppAPIClient:
                 "rate_limited_requests": health_metrics.rate_limited_requests,
                 "average_response_time": health_metrics.average_response_time,
                 "consecutive_failures": health_metrics.consecutive_failures,
-                "last_error": health_metrics.last_error
+                "last_error": health_metrics.last_error,
+                "total_retries": health_metrics.total_retries,
+                "retries_by_reason": health_metrics.retries_by_reason,
+                "retry_delay_histogram": health_metrics.retry_delay_histogram
             },
             "rate_limits": rate_limit_status,
             "performance": {
                 "average_response_time": health_metrics.average_response_time,
+                "p50_response_time": health_metrics.p50_response_time,
+                "p95_response_time": health_metrics.p95_response_time,
+                "p99_response_time": health_metrics.p99_response_time,
+                "max_response_time": health_metrics.max_response_time,
                 "last_request_time": health_metrics.last_request_time.isoformat() if health_metrics.last_request_time else None
             }
         }
@@ -1110,6 +1393,14 @@ class WhatsAppAPIClient:
         if hasattr(self, 'rate_limiter'):
             self.rate_limiter.shutdown()
         
+        # Cancel parked retries
+        if hasattr(self, 'retry_scheduler'):
+            self.retry_scheduler.shutdown()
+        
+        # Close the request log spill file
+        if hasattr(self, 'request_logs'):
+            self.request_logs.close()
+        
         # Shutdown delivery system
         if hasattr(self, 'delivery_system') and self.delivery_system:
             # Clean up old records before shutdown
@@ -66,36 +66,16 @@ class WhatsAppService:
             True if successful, False otherwise
         """
         try:
-            # Validate customer phone number
-            if not customer.phone or not self.api_client.validate_phone_number(customer.phone):
-                logger.warning(f"Invalid phone number for customer {customer.name}: {customer.phone}")
-                return False
-            
-            # Render template for WhatsApp
-            rendered = template.render(customer)
-            whatsapp_content = rendered.get('whatsapp_content') or rendered.get('content', '')
-            
-            if not whatsapp_content:
-                logger.warning(f"No WhatsApp content available for template {template.name}")
+            formatted_message = self._prepare_message(customer, template)
+            if formatted_message is None:
                 return False
             
-            # Format WhatsApp message
-            formatted_message = self._format_whatsapp_message(whatsapp_content)
-            
             # Send message via API
             response = self.api_client.send_text_message(
                 to=customer.phone,
                 message=formatted_message
             )
-            
-            # Check if message was sent successfully
-            if 'messages' in response and response['messages']:
-                message_id = response['messages'][0].get('id')
-                logger.info(f"WhatsApp message sent to {customer.phone}. Message ID: {message_id}")
-                return True
-            else:
-                logger.warning(f"Unexpected response format when sending to {customer.phone}")
-                return False
+            return self._is_message_sent(customer, response)
                 
         except WhatsAppAPIError as e:
             logger.error(f"WhatsApp API error sending to {customer.phone}: {e}")
@@ -114,6 +94,11 @@ class WhatsAppService:
         """
         Send bulk WhatsApp messages.
         
+        Messages are submitted without waiting for their retries: a message
+        whose first attempt fails is retried by the API client's retry
+        scheduler while the following messages are sent, and the results are
+        collected once every message has been submitted.
+        
         Args:
             customers: List of customers to send messages to
             template: Message template to use
@@ -124,6 +109,7 @@ class WhatsAppService:
             List of message records with sending results
         """
         records = []
+        pending = []
         
         try:
             logger.info(f"Starting bulk WhatsApp send to {len(customers)} recipients")
@@ -135,15 +121,14 @@ class WhatsAppService:
                     record.status = MessageStatus.SENDING
                     record.channel = "whatsapp"
                     
-                    # Send message
-                    success = self.send_message(customer, template)
-                    
-                    if success:
-                        record.mark_as_sent()
-                        logger.debug(f"WhatsApp message {i+1}/{len(customers)} sent successfully to {customer.phone}")
-                    else:
+                    # Submit message; retries complete in the background
+                    formatted_message = self._prepare_message(customer, template)
+                    if formatted_message is None:
                         record.mark_as_failed("Failed to send WhatsApp message")
                         logger.warning(f"WhatsApp message {i+1}/{len(customers)} failed to {customer.phone}")
+                    else:
+                        future = self.api_client.submit_text_message(customer.phone, formatted_message)
+                        pending.append((i, record, future))
                     
                     records.append(record)
                     
@@ -163,11 +148,6 @@ class WhatsAppService:
                     records.append(record)
                     logger.error(f"Failed to process WhatsApp message for {customer.phone}: {e}")
             
-            successful = sum(1 for r in records if r.status == MessageStatus.SENT)
-            failed = sum(1 for r in records if r.status == MessageStatus.FAILED)
-            
-            logger.info(f"Bulk WhatsApp send completed: {successful} successful, {failed} failed")
-            
         except Exception as e:
             logger.error(f"Bulk WhatsApp send failed: {e}")
             # Mark remaining customers as failed
@@ -177,8 +157,65 @@ class WhatsAppService:
                 record.mark_as_failed(f"Bulk send failed: {e}")
                 records.append(record)
         
+        # Collect submitted messages, including those still being retried
+        for i, record, future in pending:
+            try:
+                success = self._is_message_sent(record.customer, future.result())
+            except Exception as e:
+                logger.error(f"WhatsApp API error sending to {record.customer.phone}: {e}")
+                success = False
+            
+            if success:
+                record.mark_as_sent()
+                logger.debug(f"WhatsApp message {i+1}/{len(customers)} sent successfully to {record.customer.phone}")
+            else:
+                record.mark_as_failed("Failed to send WhatsApp message")
+                logger.warning(f"WhatsApp message {i+1}/{len(customers)} failed to {record.customer.phone}")
+        
+        successful = sum(1 for r in records if r.status == MessageStatus.SENT)
+        failed = sum(1 for r in records if r.status == MessageStatus.FAILED)
+        
+        logger.info(f"Bulk WhatsApp send completed: {successful} successful, {failed} failed")
+        
         return records
     
+    def _prepare_message(self, customer: Customer, template: MessageTemplate) -> Optional[str]:
+        """
+        Validate the customer's phone number and render the message for them.
+        
+        Args:
+            customer: Customer to send message to
+            template: Message template to use
+            
+        Returns:
+            Formatted message text, or None if the message can't be sent
+        """
+        # Validate customer phone number
+        if not customer.phone or not self.api_client.validate_phone_number(customer.phone):
+            logger.warning(f"Invalid phone number for customer {customer.name}: {customer.phone}")
+            return None
+        
+        # Render template for WhatsApp
+        rendered = template.render(customer)
+        whatsapp_content = rendered.get('whatsapp_content') or rendered.get('content', '')
+        
+        if not whatsapp_content:
+            logger.warning(f"No WhatsApp content available for template {template.name}")
+            return None
+        
+        # Format WhatsApp message
+        return self._format_whatsapp_message(whatsapp_content)
+    
+    def _is_message_sent(self, customer: Customer, response: Dict) -> bool:
+        """Check that a send response carries a message ID."""
+        if 'messages' in response and response['messages']:
+            message_id = response['messages'][0].get('id')
+            logger.info(f"WhatsApp message sent to {customer.phone}. Message ID: {message_id}")
+            return True
+        
+        logger.warning(f"Unexpected response format when sending to {customer.phone}")
+        return False
+    
     def create_draft_message(self, customer: Customer, template: MessageTemplate) -> bool:
         """
         Create a draft WhatsApp message (for preview/testing purposes).
@@ -73,6 +73,31 @@ def pytest_collection_modifyitems(config, items):
 
 
 # Global fixtures
+@pytest.fixture(autouse=True)
+def in_memory_import_cache(monkeypatch):
+    """Keep the process-wide import cache in memory so tests never write to the user's data directory."""
+    # The package is importable both as multichannel_messaging and src.multichannel_messaging
+    for name, module in list(sys.modules.items()):
+        if name.endswith("multichannel_messaging.core.import_cache"):
+            monkeypatch.setattr(module, "_import_cache", module.ImportCache())
+
+
+@pytest.fixture(autouse=True)
+def in_memory_domain_cache(monkeypatch):
+    """Give each test a fresh, non-persistent domain cache so lookups do not leak between runs."""
+    for name, module in list(sys.modules.items()):
+        if name.endswith("multichannel_messaging.core.data_validator"):
+            monkeypatch.setattr(module, "_domain_cache", module.DomainCache())
+
+
+@pytest.fixture(autouse=True)
+def isolated_quota_storage(monkeypatch, tmp_path):
+    """Keep rate limiter quota snapshots and event logs of each test in its own directory."""
+    for name, module in list(sys.modules.items()):
+        if name.endswith("multichannel_messaging.core.rate_limiter"):
+            monkeypatch.setattr(module, "get_app_data_dir", lambda: tmp_path)
+
+
 @pytest.fixture(scope="session")
 def test_data_dir() -> Path:
     """Get the test data directory."""
@@ -325,6 +350,78 @@ def performance_timer():
     return Timer()
 
 
+# Mock WhatsApp Graph API server
+@pytest.fixture
+def mock_graph_api():
+    """Local HTTP server answering WhatsApp Graph API message requests."""
+    import json
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    class MockGraphAPI:
+        def __init__(self):
+            self.latency = 0.0
+            self.responses = []  # (status, body, headers) returned before the default success
+            self.requests = []
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.lock = threading.Lock()
+        
+        def next_response(self, payload):
+            with self.lock:
+                self.requests.append(payload)
+                if self.responses:
+                    return self.responses.pop(0)
+                return 200, {"messages": [{"id": f"wamid.{len(self.requests)}"}]}, {}
+    
+    api = MockGraphAPI()
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def _respond(self):
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length)) if length else None
+            with api.lock:
+                api.in_flight += 1
+                api.max_in_flight = max(api.max_in_flight, api.in_flight)
+            try:
+                time.sleep(api.latency)
+                status, body, headers = api.next_response(payload)
+            finally:
+                with api.lock:
+                    api.in_flight -= 1
+            
+            content = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(content)
+        
+        do_GET = do_POST = _respond
+        
+        def log_message(self, format, *args):
+            pass
+    
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 128
+    
+    server = Server(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    api.url = f"http://127.0.0.1:{server.server_address[1]}/"
+    
+    yield api
+    
+    server.shutdown()
+    server.server_close()
+
+
 # Test data validation fixtures
 @pytest.fixture
 def validate_test_data():
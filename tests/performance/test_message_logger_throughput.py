@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Performance tests for MessageLogger write throughput.
+"""
+
+import sys
+import time
+import pytest
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from multichannel_messaging.core.message_logger import MessageLogger
+from multichannel_messaging.core.models import Customer, MessageTemplate, MessageRecord, MessageStatus
+
+
+CAMPAIGN_SIZE = 100_000
+UNBUFFERED_SAMPLE = 2_000
+LARGE_SESSION_SIZE = 50_000
+
+
+def _run_campaign(logger, template, count):
+    """Log and complete `count` messages; return elapsed seconds."""
+    start = time.perf_counter()
+    logger.start_session("email", template)
+
+    for i in range(count):
+        customer = Customer(
+            name=f"Customer {i}",
+            email=f"customer{i}@company{i % 100}.com",
+            company=f"Company {i % 100}",
+            phone=f"+1555{i:07d}"
+        )
+        record = MessageRecord(customer=customer, template=template, channel="email")
+        log_id = logger.log_message(record, "Hello there")
+        logger.update_message_status(log_id, MessageStatus.SENT, f"msg_{i}")
+
+    logger.flush()
+    return time.perf_counter() - start
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestMessageLoggerPerformance:
+    """Performance tests for buffered vs unbuffered message logging."""
+
+    @pytest.fixture
+    def template(self):
+        """Create a template for the campaign."""
+        return MessageTemplate(
+            id="bench", name="Benchmark", subject="Hi", content="Hello {name}", channels=["email"]
+        )
+
+    def test_buffered_campaign_throughput(self, temp_dir, template):
+        """Benchmark a 100k-message campaign against the unbuffered path."""
+        plain = MessageLogger(str(temp_dir / "plain.db"), "bench_user")
+        plain_elapsed = _run_campaign(plain, template, UNBUFFERED_SAMPLE)
+        plain.close()
+        plain_rate = UNBUFFERED_SAMPLE / plain_elapsed
+
+        buffered = MessageLogger(str(temp_dir / "buffered.db"), "bench_user", buffered=True)
+        buffered_elapsed = _run_campaign(buffered, template, CAMPAIGN_SIZE)
+        summary = buffered.end_session()
+        stats = buffered.get_writer_stats()
+        buffered.close()
+        buffered_rate = CAMPAIGN_SIZE / buffered_elapsed
+
+        assert summary.total_messages == CAMPAIGN_SIZE
+        assert summary.successful_messages == CAMPAIGN_SIZE
+        assert stats["failed_rows"] == 0
+        assert buffered_rate > plain_rate * 2, (
+            f"Buffered writer too slow: {buffered_rate:.0f} vs {plain_rate:.0f} messages/sec"
+        )
+
+        print(f"✅ Unbuffered: {UNBUFFERED_SAMPLE} messages in {plain_elapsed:.2f}s ({plain_rate:.0f} messages/sec)")
+        print(f"✅ Buffered: {CAMPAIGN_SIZE} messages in {buffered_elapsed:.2f}s ({buffered_rate:.0f} messages/sec, "
+              f"{stats['batches']} transactions)")
+
+    def test_per_message_cost_independent_of_session_size(self, temp_dir, template):
+        """Logging into a 50k-message session costs the same as into an empty one."""
+        logger = MessageLogger(str(temp_dir / "large.db"), "bench_user")
+
+        empty_elapsed = _run_campaign(logger, template, UNBUFFERED_SAMPLE // 2)
+        logger.end_session()
+
+        session_id = logger.start_session("email", template)
+        with logger._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO message_logs (id, timestamp, user_id, session_id, channel, template_id,
+                    template_name, recipient_email, recipient_name, message_status)
+                VALUES (?, datetime('now'), 'bench_user', ?, 'email', 'bench', 'Benchmark', ?, ?, 'sent')
+            """,
+                [(f"prefill_{i}", session_id, f"p{i}@example.com", f"P {i}") for i in range(LARGE_SESSION_SIZE)],
+            )
+            conn.commit()
+        logger.reconcile_session_stats(session_id)
+
+        start = time.perf_counter()
+        for i in range(UNBUFFERED_SAMPLE // 2):
+            customer = Customer(name=f"Late {i}", email=f"late{i}@example.com", company="Late", phone=f"+1666{i:07d}")
+            record = MessageRecord(customer=customer, template=template, channel="email")
+            log_id = logger.log_message(record, "Hello there")
+            logger.update_message_status(log_id, MessageStatus.SENT)
+        large_elapsed = time.perf_counter() - start
+
+        summary = logger.end_session()
+        logger.close()
+
+        assert summary.total_messages == LARGE_SESSION_SIZE + UNBUFFERED_SAMPLE // 2
+        assert large_elapsed < empty_elapsed * 3, (
+            f"Per-message cost grows with session size: {large_elapsed:.2f}s vs {empty_elapsed:.2f}s"
+        )
+
+        print(f"✅ {UNBUFFERED_SAMPLE // 2} messages: {empty_elapsed:.2f}s in empty session, "
+              f"{large_elapsed:.2f}s in {LARGE_SESSION_SIZE}-message session")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Performance tests for bulk template import and export.
+"""
+
+import sys
+import time
+import pytest
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from multichannel_messaging.core.config_manager import ConfigManager
+from multichannel_messaging.core.models import MessageTemplate
+from multichannel_messaging.core.template_manager import TemplateManager
+
+
+LIBRARY_SIZE = 5_000
+SEQUENTIAL_SIZE = 500
+
+
+def _create_manager(templates_dir):
+    """Create a template manager for a library directory."""
+    config_manager = ConfigManager()
+    config_manager.get_templates_path = lambda: templates_dir
+    return TemplateManager(config_manager)
+
+
+def _templates(count):
+    """Generate templates for a library."""
+    return [
+        MessageTemplate(
+            id=f"template_{i}",
+            name=f"Template {i}",
+            subject=f"Update {i} for {{name}}",
+            content=f"Hello {{name}}, this is message {i} about order {{order}}. " * 10,
+            variables=["name", "order"]
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestTemplateBulkImportPerformance:
+    """Benchmark migrating a library through an export archive."""
+
+    def test_archive_migration(self, temp_dir):
+        """A bulk import commits once instead of rewriting the indexes per template."""
+        source = _create_manager(temp_dir / "source")
+        for template in _templates(LIBRARY_SIZE):
+            source._stage_template(template, tags=["migration"])
+        source._update_category_counts()
+        source._update_templates_index()
+        source._save_search_index()
+
+        start = time.perf_counter()
+        archive_path = source.bulk_export_templates(export_path=temp_dir / "library.zip")
+        export_elapsed = time.perf_counter() - start
+        source.close()
+
+        # Importing one template at a time writes the indexes after each template
+        sequential = _create_manager(temp_dir / "sequential")
+        start = time.perf_counter()
+        for template in _templates(SEQUENTIAL_SIZE):
+            sequential.save_template(template, tags=["migration"])
+        sequential_elapsed = (time.perf_counter() - start) / SEQUENTIAL_SIZE
+        sequential.close()
+
+        target = _create_manager(temp_dir / "target")
+        progress = []
+        start = time.perf_counter()
+        results = target.bulk_import_templates(archive_path, progress_callback=lambda *args: progress.append(args))
+        bulk_elapsed = (time.perf_counter() - start) / LIBRARY_SIZE
+        target.close()
+
+        assert results["successful_imports"] == LIBRARY_SIZE
+        assert progress[-1] == (LIBRARY_SIZE, LIBRARY_SIZE, "Import completed")
+        assert len(_create_manager(temp_dir / "target").get_templates()) == LIBRARY_SIZE
+        assert bulk_elapsed * 5 < sequential_elapsed, (
+            f"Bulk import too slow: {bulk_elapsed * 1e3:.2f}ms vs {sequential_elapsed * 1e3:.2f}ms per template"
+        )
+
+        archive_size = archive_path.stat().st_size
+        print(f"✅ Exported {LIBRARY_SIZE} templates to one archive in {export_elapsed:.2f}s "
+              f"({archive_size / 1024 / 1024:.1f} MB)")
+        print(f"✅ Per template: one at a time {sequential_elapsed * 1e3:.2f}ms (first {SEQUENTIAL_SIZE}), "
+              f"bulk import {bulk_elapsed * 1e3:.2f}ms (total {bulk_elapsed * LIBRARY_SIZE:.2f}s)")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
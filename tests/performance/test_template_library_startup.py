@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Performance tests for template library startup.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from multichannel_messaging.core.config_manager import ConfigManager
+from multichannel_messaging.core.models import MessageTemplate
+from multichannel_messaging.core.template_manager import (
+    TemplateManager, TemplateSearchIndex, TemplateVersion, TemplateVersionManager
+)
+
+
+LIBRARY_SIZE = 2_000
+HISTORY_DEPTH = 20
+
+
+def _write_library(templates_dir):
+    """Write a template library with deep version histories directly to disk."""
+    versions_dir = templates_dir / "versions"
+    versions_dir.mkdir(parents=True)
+    search_index = TemplateSearchIndex()
+    index = {}
+
+    for i in range(LIBRARY_SIZE):
+        template = MessageTemplate(
+            id=f"template_{i}",
+            name=f"Template {i}",
+            subject=f"Subject {i} for {{name}}",
+            content=f"Hello {{name}}, this is revision text for template {i}. " * 20,
+            variables=["name"]
+        )
+        metadata = {"category_id": "general", "tags": [], "usage_count": 0,
+                    "created_at": template.created_at.isoformat(), "updated_at": template.updated_at.isoformat()}
+        index[template.id] = metadata
+        search_index.add_template(template, metadata)
+
+        (templates_dir / f"{template.id}.json").write_text(json.dumps({
+            "id": template.id, "name": template.name, "channels": template.channels,
+            "subject": template.subject, "content": template.content,
+            "whatsapp_content": template.whatsapp_content, "language": template.language,
+            "variables": template.variables, "created_at": template.created_at.isoformat(),
+            "updated_at": template.updated_at.isoformat()
+        }))
+
+        versions = {}
+        for v in range(HISTORY_DEPTH):
+            version = TemplateVersion(f"v{v}", template, message=f"Edit {v}")
+            versions[version.version_id] = version.to_dict()
+        (versions_dir / f"{template.id}.json").write_text(json.dumps({
+            "template_id": template.id, "versions": versions, "active_version": f"v{HISTORY_DEPTH - 1}"
+        }))
+
+    (templates_dir / "index.json").write_text(json.dumps({"templates": index}))
+    data = search_index.to_dict()
+    data["updated_at"] = datetime.now().isoformat()
+    (templates_dir / "search_index.json").write_text(json.dumps(data))
+
+
+def _measure(func):
+    """Run `func` and return (result, elapsed seconds, peak traced bytes)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestTemplateLibraryStartupPerformance:
+    """Startup cost should not depend on template bodies or history depth."""
+
+    def test_lazy_startup_vs_full_hydration(self, temp_dir):
+        """Opening a library reads the index; bodies and histories load on access."""
+        templates_dir = temp_dir / "templates"
+        _write_library(templates_dir)
+        config_manager = ConfigManager()
+        config_manager.get_templates_path = lambda: templates_dir
+
+        manager, startup_elapsed, startup_peak = _measure(lambda: TemplateManager(config_manager))
+
+        def hydrate():
+            templates = manager.get_templates()
+            for template in templates:
+                manager.get_template_versions(template.id)
+            return templates
+
+        templates, hydrate_elapsed, hydrate_peak = _measure(hydrate)
+        single_start = time.perf_counter()
+        manager.get_template_versions("template_0")
+        single_elapsed = time.perf_counter() - single_start
+        manager.close()
+
+        def load_all_histories():
+            version_manager = TemplateVersionManager(templates_dir, max_resident_histories=None)
+            for template_id in list(version_manager.versions):
+                version_manager.versions[template_id]
+            return version_manager
+
+        _, eager_elapsed, eager_peak = _measure(load_all_histories)
+
+        assert len(templates) == LIBRARY_SIZE
+        assert startup_elapsed * 3 < hydrate_elapsed, (
+            f"Startup too slow: {startup_elapsed:.2f}s vs {hydrate_elapsed:.2f}s to hydrate"
+        )
+        assert hydrate_peak * 2 < eager_peak, (
+            f"Resident histories not bounded: {hydrate_peak} vs {eager_peak} bytes"
+        )
+
+        print(f"✅ Startup with {LIBRARY_SIZE} templates x {HISTORY_DEPTH} versions: "
+              f"{startup_elapsed:.2f}s (peak {startup_peak / 1024 / 1024:.1f} MB)")
+        print(f"✅ Hydrating every template and history: {hydrate_elapsed:.2f}s "
+              f"(peak {hydrate_peak / 1024 / 1024:.1f} MB), one history on demand {single_elapsed * 1e3:.1f}ms")
+        print(f"✅ Keeping all histories resident: {eager_elapsed:.2f}s (peak {eager_peak / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Performance tests for template usage accounting.
+"""
+
+import sys
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from multichannel_messaging.core import template_manager as template_manager_module
+from multichannel_messaging.core.config_manager import ConfigManager
+from multichannel_messaging.core.models import MessageTemplate
+from multichannel_messaging.core.template_manager import TemplateManager
+
+
+CAMPAIGN_SIZE = 10_000
+WRITE_THROUGH_SIZE = 500
+LIBRARY_SIZE = 200
+
+
+def _create_manager(templates_dir, usage_flush_interval):
+    """Create a template manager with a populated library."""
+    config_manager = ConfigManager()
+    config_manager.get_templates_path = lambda: templates_dir
+    manager = TemplateManager(config_manager, usage_flush_interval=usage_flush_interval)
+    for i in range(LIBRARY_SIZE):
+        manager.save_template(MessageTemplate(
+            id=f"template_{i}",
+            name=f"Template {i}",
+            subject=f"Subject {i} for {{name}}",
+            content=f"Hello {{name}}, this is template {i} from {{company}}.",
+            variables=["name", "company"]
+        ), category_id="general")
+    return manager
+
+
+def _time_campaign(manager, recipients):
+    """Record one usage per recipient; return (elapsed seconds, files written)."""
+    real_write = template_manager_module._write_json_atomic
+    with patch.object(template_manager_module, "_write_json_atomic", side_effect=real_write) as write:
+        start = time.perf_counter()
+        for i in range(recipients):
+            manager.increment_template_usage("template_0", context={"recipient": i})
+        manager.flush_usage()
+        elapsed = time.perf_counter() - start
+    return elapsed, write.call_count
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestTemplateUsagePerformance:
+    """Benchmark batched usage persistence against writing on every use."""
+
+    def test_batched_usage_vs_write_through(self, temp_dir):
+        """A campaign's usage is written in a handful of file writes."""
+        write_through = _create_manager(temp_dir / "write_through", usage_flush_interval=0)
+        batched = _create_manager(temp_dir / "batched", usage_flush_interval=60)
+
+        try:
+            write_through_elapsed, write_through_writes = _time_campaign(write_through, WRITE_THROUGH_SIZE)
+            batched_elapsed, batched_writes = _time_campaign(batched, CAMPAIGN_SIZE)
+        finally:
+            write_through.close()
+            batched.close()
+
+        assert batched.get_template_metadata("template_0")["usage_count"] == CAMPAIGN_SIZE
+        assert batched_writes <= 5
+        per_use_write_through = write_through_elapsed / WRITE_THROUGH_SIZE
+        per_use_batched = batched_elapsed / CAMPAIGN_SIZE
+        assert per_use_batched * 20 < per_use_write_through, (
+            f"Batched usage too slow: {per_use_batched * 1e6:.0f}us vs {per_use_write_through * 1e6:.0f}us per use"
+        )
+
+        print(f"✅ Write-through: {WRITE_THROUGH_SIZE} uses, {write_through_writes} file writes, "
+              f"{per_use_write_through * 1e3:.2f}ms per use")
+        print(f"✅ Batched: {CAMPAIGN_SIZE} uses, {batched_writes} file writes, "
+              f"{per_use_batched * 1e6:.0f}us per use")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Performance tests for template version storage.
+"""
+
+import json
+import random
+import sys
+import time
+import pytest
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from multichannel_messaging.core.models import MessageTemplate
+from multichannel_messaging.core.template_manager import TemplateVersionManager
+
+
+HISTORY_DEPTH = 1_000
+CONTENT_LINES = 80
+FULL_REWRITES = 5
+RANDOM_READS = 200
+
+
+def _revisions():
+    """Yield templates for a long history, each revision editing one line."""
+    rng = random.Random(7)
+    lines = [f"Paragraph {i}: dear {{name}}, this line describes offer number {i} in detail.\n"
+             for i in range(CONTENT_LINES)]
+    for revision in range(HISTORY_DEPTH):
+        lines[rng.randrange(CONTENT_LINES)] = f"Revised in {revision}: dear {{name}}, see the new terms.\n"
+        yield MessageTemplate(
+            id="campaign",
+            name=f"Campaign {revision // 100}",
+            subject=f"Offer for {{name}} ({revision // 50})",
+            content="".join(lines),
+            variables=["name"]
+        )
+
+
+def _write_full_copies(version_file, versions):
+    """Rewrite a whole history of full copies, as each save did before delta storage."""
+    data = {
+        "template_id": "campaign",
+        "versions": {version.version_id: version.to_dict() for version in versions},
+        "active_version": versions[-1].version_id
+    }
+    with open(version_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestTemplateVersionStoragePerformance:
+    """Benchmark delta-encoded, append-only histories against full-copy rewrites."""
+
+    def test_storage_and_save_latency(self, temp_dir):
+        """Saving a version appends a delta instead of rewriting every full copy."""
+        templates_dir = temp_dir / "storage" / "templates"
+        templates_dir.mkdir(parents=True)
+        version_manager = TemplateVersionManager(templates_dir)
+
+        save_times = []
+        for template in _revisions():
+            start = time.perf_counter()
+            version_manager.create_version(template, message="Edit")
+            save_times.append(time.perf_counter() - start)
+
+        log_size = (templates_dir / "versions" / "campaign.jsonl").stat().st_size
+        append_latency = sum(save_times[-100:]) / 100
+
+        # One save of the same history under the full-copy format
+        versions = TemplateVersionManager(templates_dir).get_version_history("campaign")[::-1]
+        full_copy_file = temp_dir / "storage" / "full_copy.json"
+        start = time.perf_counter()
+        for _ in range(FULL_REWRITES):
+            _write_full_copies(full_copy_file, versions)
+        rewrite_latency = (time.perf_counter() - start) / FULL_REWRITES
+        full_copy_size = full_copy_file.stat().st_size
+
+        assert log_size * 5 < full_copy_size, (
+            f"Delta storage too large: {log_size} vs {full_copy_size} bytes"
+        )
+        assert append_latency * 10 < rewrite_latency, (
+            f"Append too slow: {append_latency * 1e3:.2f}ms vs {rewrite_latency * 1e3:.2f}ms per save"
+        )
+
+        print(f"✅ {HISTORY_DEPTH} versions: full copies {full_copy_size / 1024:.0f} KB, "
+              f"deltas {log_size / 1024:.0f} KB")
+        print(f"✅ Save at depth {HISTORY_DEPTH}: rewrite {rewrite_latency * 1e3:.1f}ms, "
+              f"append {append_latency * 1e3:.2f}ms")
+
+    def test_reconstruction_latency(self, temp_dir):
+        """Versions are rebuilt from the nearest snapshot and cached once rebuilt."""
+        templates_dir = temp_dir / "reconstruction" / "templates"
+        templates_dir.mkdir(parents=True)
+        version_manager = TemplateVersionManager(templates_dir)
+        expected = {}
+        for template in _revisions():
+            expected[version_manager.create_version(template)] = template.content
+
+        restarted = TemplateVersionManager(templates_dir)
+        start = time.perf_counter()
+        restarted.get_version_history("campaign")
+        load_elapsed = time.perf_counter() - start
+
+        sample = random.Random(11).sample(list(expected), RANDOM_READS)
+        start = time.perf_counter()
+        for version_id in sample:
+            assert restarted.get_version("campaign", version_id).template.content == expected[version_id]
+        cold_latency = (time.perf_counter() - start) / RANDOM_READS
+
+        start = time.perf_counter()
+        for version_id in sample:
+            restarted.get_version("campaign", version_id).template
+        cached_latency = (time.perf_counter() - start) / RANDOM_READS
+
+        start = time.perf_counter()
+        for older, newer in zip(sample, sample[1:]):
+            restarted.get_diff_text("campaign", older, newer)
+        diff_latency = (time.perf_counter() - start) / (RANDOM_READS - 1)
+
+        assert cold_latency < 0.005
+        assert cached_latency * 10 < cold_latency
+
+        print(f"✅ Loaded {HISTORY_DEPTH}-version history in {load_elapsed * 1e3:.1f}ms")
+        print(f"✅ Random version: {cold_latency * 1e3:.2f}ms rebuilt, {cached_latency * 1e6:.1f}us cached, "
+              f"diff {diff_latency * 1e3:.2f}ms")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Performance tests for batched webhook ingestion.
+"""
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from multichannel_messaging.core.webhook_manager import DeliveryTracker, MessageStatus, WebhookManager
+
+
+BURST_MESSAGES = 25_000
+STATUSES = ("sent", "delivered", "read", "read")
+STATUSES_PER_PAYLOAD = 100
+SEQUENTIAL_SAMPLE = 1_000
+
+
+def _seed_tracker(database_path, count):
+    """Create a tracker holding `count` queued messages without going through track_message."""
+    tracker = DeliveryTracker(database_path)
+    now = datetime.now().isoformat()
+    conn = sqlite3.connect(str(database_path))
+    conn.executemany(
+        "INSERT INTO delivery_records (message_id, phone_number, status, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [(f"wamid.{i}", f"+1555{i:07d}", MessageStatus.QUEUED.value, now, now) for i in range(count)]
+    )
+    conn.commit()
+    conn.close()
+    return tracker
+
+
+def _burst_payloads(count):
+    """Build webhook payloads carrying one status per message per entry in STATUSES."""
+    statuses = [
+        {"id": f"wamid.{i}", "status": status, "timestamp": str(1700000000 + step)}
+        for step, status in enumerate(STATUSES)
+        for i in range(count)
+    ]
+    return [
+        json.dumps({
+            "entry": [{
+                "changes": [{
+                    "field": "messages",
+                    "value": {"statuses": statuses[start:start + STATUSES_PER_PAYLOAD]}
+                }]
+            }]
+        })
+        for start in range(0, len(statuses), STATUSES_PER_PAYLOAD)
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestWebhookIngestionPerformance:
+    """Throughput of batched vs per-status delivery receipt processing."""
+
+    def test_batched_burst_throughput(self, temp_dir):
+        """A 100k-event burst applies far faster than one status update at a time."""
+        sequential = _seed_tracker(temp_dir / "sequential.db", SEQUENTIAL_SAMPLE)
+        start = time.perf_counter()
+        for i in range(SEQUENTIAL_SAMPLE):
+            sequential.update_message_status(f"wamid.{i}", MessageStatus.DELIVERED)
+        sequential_rate = SEQUENTIAL_SAMPLE / (time.perf_counter() - start)
+
+        tracker = _seed_tracker(temp_dir / "batched.db", BURST_MESSAGES)
+        manager = WebhookManager(webhook_secret="bench_secret", delivery_tracker=tracker)
+        payloads = _burst_payloads(BURST_MESSAGES)
+        events = BURST_MESSAGES * len(STATUSES)
+
+        start = time.perf_counter()
+        processed = manager.process_webhook_batch((payload, None) for payload in payloads)
+        batched_elapsed = time.perf_counter() - start
+        batched_rate = events / batched_elapsed
+
+        analytics = tracker.get_delivery_analytics(days=1)
+        assert processed == len(payloads)
+        assert analytics.read_messages == BURST_MESSAGES
+        assert batched_rate > sequential_rate * 10, (
+            f"Batched ingestion too slow: {batched_rate:.0f} vs {sequential_rate:.0f} events/sec"
+        )
+
+        print(f"✅ Sequential: {sequential_rate:.0f} status updates/sec")
+        print(f"✅ Batched: {events} events in {batched_elapsed:.2f}s ({batched_rate:.0f} events/sec)")
+
+    def test_senders_not_blocked_during_burst(self, temp_dir):
+        """track_message stays fast while bursts are applied in chunks of payloads."""
+        tracker = _seed_tracker(temp_dir / "concurrent.db", BURST_MESSAGES)
+        manager = WebhookManager(webhook_secret="bench_secret", delivery_tracker=tracker)
+        payloads = _burst_payloads(BURST_MESSAGES)
+
+        worker = threading.Thread(
+            target=lambda: [
+                manager.process_webhook_batch((payload, None) for payload in payloads[start:start + 50])
+                for start in range(0, len(payloads), 50)
+            ]
+        )
+        worker.start()
+
+        latencies = []
+        for i in range(50):
+            start = time.perf_counter()
+            tracker.track_message(f"new_msg_{i}", "+15550000000")
+            latencies.append(time.perf_counter() - start)
+        worker.join()
+
+        latencies.sort()
+        assert latencies[len(latencies) // 2] < 0.5
+        print(f"✅ track_message median latency during burst: {latencies[len(latencies) // 2] * 1000:.1f}ms")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Load tests for the local webhook receiver.
+"""
+
+import hashlib
+import hmac
+import http.client
+import json
+import sqlite3
+import sys
+import threading
+import time
+import pytest
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from multichannel_messaging.core.webhook_manager import DeliveryTracker, MessageStatus, WebhookManager
+from multichannel_messaging.core.webhook_receiver import WebhookReceiver
+
+
+SECRET = "bench_secret"
+MESSAGES = 20_000
+STATUSES = ("sent", "delivered", "read")
+STATUSES_PER_PAYLOAD = 20
+GENERATOR_THREADS = 8
+
+
+def _seed_tracker(database_path, count):
+    """Create a tracker holding `count` queued messages without going through track_message."""
+    tracker = DeliveryTracker(database_path)
+    now = datetime.now().isoformat()
+    conn = sqlite3.connect(str(database_path))
+    conn.executemany(
+        "INSERT INTO delivery_records (message_id, phone_number, status, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [(f"wamid.{i}", f"+1555{i:07d}", MessageStatus.QUEUED.value, now, now) for i in range(count)]
+    )
+    conn.commit()
+    conn.close()
+    return tracker
+
+
+def _signed_payloads(count):
+    """Build signed webhook deliveries covering every status of `count` messages."""
+    statuses = [
+        {"id": f"wamid.{i}", "status": status, "timestamp": str(1700000000 + step)}
+        for step, status in enumerate(STATUSES)
+        for i in range(count)
+    ]
+    payloads = []
+    for start in range(0, len(statuses), STATUSES_PER_PAYLOAD):
+        body = json.dumps({
+            "entry": [{
+                "changes": [{
+                    "field": "messages",
+                    "value": {"statuses": statuses[start:start + STATUSES_PER_PAYLOAD]}
+                }]
+            }]
+        }).encode("utf-8")
+        signature = "sha256=" + hmac.new(SECRET.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        payloads.append((body, signature))
+    return payloads
+
+
+def _generate_load(url, payloads, threads):
+    """POST payloads from several keep-alive connections; return ack latencies and refusals."""
+    target = urlparse(url)
+    latencies = []
+    refused = []
+    lock = threading.Lock()
+
+    def run(chunk):
+        conn = http.client.HTTPConnection(target.hostname, target.port, timeout=30)
+        local_latencies = []
+        local_refused = 0
+        for body, signature in chunk:
+            while True:
+                start = time.perf_counter()
+                conn.request("POST", target.path, body=body, headers={
+                    "Content-Type": "application/json",
+                    "X-Hub-Signature-256": signature
+                })
+                response = conn.getresponse()
+                response.read()
+                local_latencies.append(time.perf_counter() - start)
+                if response.status != 503:
+                    break
+                local_refused += 1
+                time.sleep(0.01)
+        conn.close()
+        with lock:
+            latencies.extend(local_latencies)
+            refused.append(local_refused)
+
+    workers = [
+        threading.Thread(target=run, args=(payloads[i::threads],))
+        for i in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return sorted(latencies), sum(refused)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestWebhookReceiverThroughput:
+    """Throughput and acknowledgement latency of the webhook receiver under load."""
+
+    def test_receiver_load(self, temp_dir):
+        """Concurrent signed deliveries are acknowledged quickly and all applied."""
+        tracker = _seed_tracker(temp_dir / "receiver.db", MESSAGES)
+        manager = WebhookManager(webhook_secret=SECRET, delivery_tracker=tracker)
+        payloads = _signed_payloads(MESSAGES)
+        events = MESSAGES * len(STATUSES)
+
+        with WebhookReceiver(manager, workers=2, max_queue_size=5000) as receiver:
+            start = time.perf_counter()
+            latencies, refused = _generate_load(receiver.url, payloads, GENERATOR_THREADS)
+            assert receiver.flush(timeout=60)
+            elapsed = time.perf_counter() - start
+            metrics = receiver.get_metrics()
+
+        analytics = tracker.get_delivery_analytics(days=1)
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+
+        assert metrics["processed_payloads"] == len(payloads)
+        assert metrics["failed_payloads"] == 0
+        assert analytics.read_messages == MESSAGES
+        assert p99 < 0.5, f"Acknowledgement p99 too slow: {p99 * 1000:.0f}ms"
+
+        print(f"✅ {events} events in {len(payloads)} deliveries applied in {elapsed:.2f}s "
+              f"({events / elapsed:.0f} events/sec, {metrics['batches']} batches)")
+        print(f"✅ Ack latency p50 {latencies[len(latencies) // 2] * 1000:.1f}ms, p99 {p99 * 1000:.1f}ms; "
+              f"peak queue depth {metrics['peak_queue_depth']}, {refused} deliveries refused and retried")
+
+    def test_backpressure_bounds_queue(self, temp_dir):
+        """With a small queue, deliveries are refused and retried instead of buffered."""
+        tracker = _seed_tracker(temp_dir / "backpressure.db", MESSAGES // 4)
+        manager = WebhookManager(webhook_secret=SECRET, delivery_tracker=tracker)
+        payloads = _signed_payloads(MESSAGES // 4)
+
+        with WebhookReceiver(manager, workers=1, max_queue_size=20, batch_size=5) as receiver:
+            _, refused = _generate_load(receiver.url, payloads, GENERATOR_THREADS * 4)
+            assert receiver.flush(timeout=60)
+            metrics = receiver.get_metrics()
+
+        assert metrics["peak_queue_depth"] <= 20
+        assert metrics["processed_payloads"] == len(payloads)
+        assert metrics["rejected_backpressure"] == refused
+        print(f"✅ Peak queue depth {metrics['peak_queue_depth']} of 20; {refused} deliveries refused and retried")
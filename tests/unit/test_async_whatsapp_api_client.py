@@ -0,0 +1,119 @@
+"""
+Unit tests for the asyncio WhatsApp Business API client.
+"""
+
+import asyncio
+
+import pytest
+
+from src.multichannel_messaging.core.rate_limiter import IntelligentRateLimiter, QuotaConfig, QuotaType
+from src.multichannel_messaging.services.api_clients.async_whatsapp_api_client import (
+    AsyncWhatsAppAPIClient, OutgoingMessage
+)
+from src.multichannel_messaging.services.api_clients.whatsapp_api_client import WhatsAppAPIClient
+
+
+def make_limiter(limit):
+    """Create a non-persistent limiter allowing `limit` messages per quota window."""
+    return IntelligentRateLimiter(
+        quota_configs=[
+            QuotaConfig(quota_type=quota_type, limit=limit, window_seconds=60,
+                        warning_threshold=1.0, critical_threshold=1.0)
+            for quota_type in (QuotaType.MESSAGES_PER_MINUTE, QuotaType.MESSAGES_PER_HOUR,
+                               QuotaType.MESSAGES_PER_DAY)
+        ],
+        enable_persistence=False
+    )
+
+
+def collect(async_client, messages):
+    """Run send_many to completion and return its results in completion order."""
+    async def run():
+        return [result async for result in async_client.send_many(messages)]
+    return asyncio.run(run())
+
+
+class TestAsyncWhatsAppAPIClient:
+    """Test cases for AsyncWhatsAppAPIClient against a local mock Graph API."""
+
+    @pytest.fixture
+    def client(self, mock_graph_api):
+        """Create a client sending to the mock Graph API with a generous quota."""
+        client = WhatsAppAPIClient(
+            access_token="test_token",
+            phone_number_id="test_phone_id",
+            base_url=mock_graph_api.url,
+            enable_delivery_tracking=False
+        )
+        client.rate_limiter.shutdown()
+        client.rate_limiter = make_limiter(10000)
+        yield client
+        client.shutdown()
+
+    def test_send_many_keeps_requests_in_flight(self, client, mock_graph_api):
+        """Test that every recipient gets a result and requests overlap."""
+        mock_graph_api.latency = 0.05
+        async_client = AsyncWhatsAppAPIClient(client, max_in_flight=8)
+        messages = [OutgoingMessage(to=f"+1555{i:07d}", message=f"Hello {i}") for i in range(40)]
+
+        try:
+            results = collect(async_client, messages)
+        finally:
+            async_client.shutdown()
+
+        assert sorted(result.index for result in results) == list(range(40))
+        assert all(result.success and result.message_id for result in results)
+        assert 1 < mock_graph_api.max_in_flight <= 8
+        assert client.get_health_metrics().successful_requests == 40
+        assert client.rate_limiter.get_quota_status(QuotaType.MESSAGES_PER_MINUTE)["current_usage"] == 40
+
+    def test_error_taxonomy_matches_sync_client(self, client, mock_graph_api):
+        """Test that retryable errors are retried and other failures are reported per recipient."""
+        mock_graph_api.responses = [
+            (400, {"error": {"code": 133006, "message": "overloaded"}}, {}),
+            (200, {"messages": [{"id": "wamid.retried"}]}, {}),
+            (400, {"error": {"code": 131021, "message": "bad recipient"}}, {}),
+        ]
+        async_client = AsyncWhatsAppAPIClient(client, max_in_flight=1)
+        messages = [
+            OutgoingMessage(to="+15550000001", message="retried"),
+            OutgoingMessage(to="+15550000002", message="rejected"),
+            OutgoingMessage(to="invalid", message="never sent"),
+            OutgoingMessage(to="+15550000003", template_name="welcome", parameters=["Ana"]),
+        ]
+
+        try:
+            results = {result.index: result for result in collect(async_client, messages)}
+        finally:
+            async_client.shutdown()
+
+        assert results[0].success and results[0].message_id == "wamid.retried"
+        assert not results[1].success and "Recipient phone number not valid" in results[1].error
+        assert not results[2].success and "Invalid phone number" in results[2].error
+        assert results[3].success
+
+        # Message 0 is sent twice before message 1; "invalid" never reaches the API
+        assert [request["to"] for request in mock_graph_api.requests] == [
+            "+15550000001", "+15550000001", "+15550000002", "+15550000003"
+        ]
+        assert mock_graph_api.requests[-1]["template"]["name"] == "welcome"
+
+        logs = client.get_request_logs()
+        assert [log["retry_count"] for log in logs] == [0, 1, 0, 0]
+        assert logs[0]["error"]["code"] == 133006
+        assert client.get_health_metrics().total_retries == 1
+
+    def test_quota_budget_enforced(self, client, mock_graph_api):
+        """Test that sends beyond the quota fail instead of exceeding it."""
+        client.rate_limiter.shutdown()
+        client.rate_limiter = make_limiter(3)
+        async_client = AsyncWhatsAppAPIClient(client, max_in_flight=4, max_quota_wait=0)
+        messages = [OutgoingMessage(to=f"+1555{i:07d}", message="Hi") for i in range(6)]
+
+        try:
+            results = collect(async_client, messages)
+        finally:
+            async_client.shutdown()
+
+        assert sum(result.success for result in results) == 3
+        assert len(mock_graph_api.requests) == 3
@@ -0,0 +1,165 @@
+"""
+Unit tests for the intelligent column mapper and its precompiled header matcher.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.multichannel_messaging.core import column_mapper
+from src.multichannel_messaging.core.column_mapper import (
+    ColumnProfiler,
+    HeaderMatcher,
+    IntelligentColumnMapper,
+    MappingConfidence,
+    MappingTemplate,
+)
+
+
+class TestHeaderMatcher:
+    """Test cases for HeaderMatcher."""
+
+    @pytest.fixture
+    def mapper(self, tmp_path):
+        """Create a mapper with an empty template directory."""
+        return IntelligentColumnMapper(templates_dir=tmp_path)
+
+    def test_exact_pattern_and_fuzzy_stages(self, mapper):
+        """Test that each stage maps the expected columns."""
+        headers = ["Customer_Name", " E-Mail ", "Organisation", "telefone", "Notes"]
+
+        exact = mapper._perform_exact_matching(headers)
+        assert {field: m.source_column for field, m in exact.items()} == {
+            "name": "Customer_Name", "email": " E-Mail ", "phone": "telefone"
+        }
+
+        pattern = mapper._perform_pattern_matching(headers)
+        # '.*customer.*' (12 chars) beats '.*name.*'
+        assert pattern["name"].confidence_score == pytest.approx(0.92)
+        assert pattern["phone"].source_column == "telefone"
+        assert "company" not in pattern
+
+        fuzzy = mapper._perform_fuzzy_matching(headers)
+        assert fuzzy["company"].source_column == "Organisation"
+        assert fuzzy["company"].suggestions == ["Similar to: organization"]
+        assert fuzzy["company"].confidence is MappingConfidence.HIGH
+
+    def test_map_columns(self, mapper):
+        """Test a complete mapping of a wide layout."""
+        headers = [f"extra_{i}" for i in range(50)] + ["name", "company", "email_address", "mobile"]
+
+        result = mapper.map_columns(headers)
+
+        assert {field: m.source_column for field, m in result.mappings.items()} == {
+            "name": "name", "company": "company", "email": "email_address", "phone": "mobile"
+        }
+        assert result.missing_required_fields == []
+        assert len(result.unmapped_columns) == 50
+
+    def test_results_memoized_per_header(self, mapper):
+        """Test that re-mapping a layout reuses the fuzzy results."""
+        headers = ["Organisation", "Client Nme", "Telephon"]
+        first = mapper.map_columns(headers)
+
+        with patch.object(column_mapper, "_ratio_above", side_effect=AssertionError("recomputed")):
+            second = mapper.map_columns(headers)
+
+        assert {f: (m.source_column, m.confidence_score) for f, m in first.mappings.items()} == {
+            f: (m.source_column, m.confidence_score) for f, m in second.mappings.items()
+        }
+        # Each call returns its own mappings
+        assert first.mappings["company"] is not second.mappings["company"]
+
+    def test_ratio_bounds_skip_distant_candidates(self):
+        """Test that candidates failing the cheap bounds skip the full ratio."""
+        matcher = HeaderMatcher({
+            "phone": {"exact_matches": ["phone"], "pattern_matches": [], "fuzzy_matches": []}
+        })
+
+        with patch("difflib.SequenceMatcher.ratio", side_effect=AssertionError("full ratio")):
+            assert matcher.fuzzy_match("phone", "a_very_long_unrelated_header") == (0.0, None)
+
+        score, match = matcher.fuzzy_match("phone", "phones")
+        assert match == "phone"
+        assert score == pytest.approx(10 / 11)
+
+    def test_template_matching(self, mapper):
+        """Test that templates map columns by exact, regex and fuzzy matches."""
+        mapper.templates = [MappingTemplate(
+            name="crm",
+            description="CRM export",
+            mappings={"name": "Contact Person", "email": "Mail Addr", "phone": "Cell Phone"},
+            patterns={"email": [r"^mail.*"]},
+            created_at="2024-01-01"
+        )]
+        headers = ["id", "contact person", "Mail (work)", "Cell Phones"]
+
+        mappings = mapper._apply_template_matching(headers, None)
+
+        assert {field: m.source_column for field, m in mappings.items()} == {
+            "name": "contact person", "email": "Mail (work)", "phone": "Cell Phones"
+        }
+        assert mapper._matches_template_pattern("CELL PHONE", "Cell Phone", [])
+        assert not mapper._matches_template_pattern("id", "Cell Phone", [r"^mail.*"])
+
+
+class TestColumnProfiler:
+    """Test cases for ColumnProfiler."""
+
+    def test_profile_values(self):
+        """Test that all patterns are evaluated for each distinct value."""
+        profiler = ColumnProfiler([r".*\b(Inc|LLC)\b.*"])
+        rows = [
+            {"contact": "ann@example.com", "org": "Acme Inc", "id": 7},
+            {"contact": "bob@example.com", "org": "Acme Inc", "id": 0},
+            {"contact": " ", "org": "Globex", "id": "12"},
+            {"contact": "+1 555 123 4567", "org": None},
+        ]
+
+        profiles = profiler.profile_columns(["contact", "org", "id", "missing"], rows)
+
+        assert set(profiles) == {"contact", "org", "id"}
+        contact = profiles["contact"]
+        assert contact.total_values == 3
+        assert contact.patterns["email"] == pytest.approx(2 / 3)
+        assert contact.patterns["phone"] == pytest.approx(1 / 3)
+        org = profiles["org"]
+        assert (org.total_values, org.unique_values) == (3, 2)
+        assert org.pattern_ratios[r".*\b(Inc|LLC)\b.*"] == pytest.approx(2 / 3)
+        assert org.sample_values == ["Acme Inc", "Globex"]
+        # Falsy values such as 0 are skipped
+        assert profiles["id"].patterns["numeric"] == 1.0
+        assert profiles["id"].total_values == 2
+
+    def test_reservoir_sampling(self):
+        """Test that large inputs are profiled from a bounded, repeatable sample."""
+        profiler = ColumnProfiler(sample_size=100)
+        rows = ({"value": "123" if i % 4 else "abc"} for i in range(10_000))
+
+        profile = profiler.profile_columns(["value"], rows)["value"]
+
+        assert (profile.sampled_rows, profile.total_rows, profile.total_values) == (100, 10_000, 100)
+        assert 0.6 < profile.patterns["numeric"] < 0.9
+        again = profiler.profile_columns(["value"], ({"value": "123" if i % 4 else "abc"} for i in range(10_000)))
+        assert again["value"].patterns == profile.patterns
+
+    def test_uncombinable_patterns_matched_separately(self):
+        """Test the fallback for patterns that cannot be combined into one regex."""
+        profiler = ColumnProfiler([r"(?i)^acme"])
+
+        profile = profiler.profile_columns(["org"], [{"org": "ACME Corp"}, {"org": "Globex"}])["org"]
+
+        assert profile.pattern_ratios[r"(?i)^acme"] == 0.5
+        assert profile.patterns["alphanumeric"] == 1.0
+
+    def test_profiles_exposed_on_mapping_result(self, tmp_path):
+        """Test that map_columns maps by data and returns the column profiles."""
+        mapper = IntelligentColumnMapper(templates_dir=tmp_path)
+        rows = [{"col_a": f"user{i}@example.com", "col_b": f"+1 555 000 {i:04d}"} for i in range(20)]
+
+        result = mapper.map_columns(["col_a", "col_b"], sample_data=rows)
+
+        assert result.mappings["email"].source_column == "col_a"
+        assert result.mappings["email"].detection_method == "data_pattern"
+        assert result.mappings["phone"].source_column == "col_b"
+        assert result.column_profiles["col_a"].patterns["email"] == 1.0
+        assert result.column_profiles["col_b"].unique_values == 20
@@ -0,0 +1,109 @@
+"""
+Unit tests for columnar customer normalization and validation.
+"""
+
+import pytest
+import pandas as pd
+
+from src.multichannel_messaging.core.customer_frame import (
+    CUSTOMER_FIELDS,
+    customer_frame_errors,
+    extract_customer_columns,
+    format_phone_numbers,
+    frame_to_customers,
+    normalize_customer_frame,
+    valid_email_mask,
+    valid_phone_mask,
+)
+from src.multichannel_messaging.core.models import Customer
+from src.multichannel_messaging.utils.exceptions import ValidationError
+
+
+class TestCustomerFrame:
+    """Test cases for the columnar customer path."""
+
+    @pytest.fixture
+    def raw_frame(self):
+        """Create a DataFrame with messy customer data."""
+        return pd.DataFrame({
+            "name": ["  John Doe  ", "J", None, "Jane Smith", "Bob Wilson"],
+            "company": ["Example Corp", "", "Acme", None, "Test Co"],
+            "phone": ["(555) 123-4567", "15551234567", "+44 20 7946 0958", "123", None],
+            "email": [" John@Example.COM ", "bad@", "x@y.co", "", "bob@test.com"],
+        })
+
+    def _row_customers(self, df):
+        """Build customers row by row the way the old import path did."""
+        customers = []
+        for _, row in df.iterrows():
+            data = {
+                field: "" if pd.isna(row.get(field)) else str(row.get(field)).strip()
+                for field in CUSTOMER_FIELDS
+            }
+            customers.append(Customer.from_dict(data))
+        return customers
+
+    def test_normalization_matches_customer_model(self, raw_frame):
+        """Test that normalized columns equal Customer.__post_init__ output."""
+        frame = normalize_customer_frame(raw_frame)
+
+        assert frame_to_customers(frame) == self._row_customers(raw_frame)
+
+    def test_format_phone_numbers(self):
+        """Test phone formatting rules."""
+        phones = pd.Series(["(555) 123-4567", "15551234567", "+1 555 123 4567", "12345", "", "abc"])
+
+        assert list(format_phone_numbers(phones)) == [
+            "+15551234567", "+15551234567", "+15551234567", "12345", "", ""
+        ]
+
+    def test_validity_masks(self):
+        """Test email and phone validity masks."""
+        emails = pd.Series(["john@example.com", "bad@", "a.b@c.io", ""])
+        phones = pd.Series(["+15551234567", "123", "+441234567890123", "1234567"])
+
+        assert list(valid_email_mask(emails)) == [True, False, True, False]
+        assert list(valid_phone_mask(phones)) == [True, False, True, False]
+
+    @pytest.mark.parametrize("required_fields", [None, ["name"], ["name", "email"], ["name", "phone"]])
+    def test_errors_match_customer_validate(self, raw_frame, required_fields):
+        """Test that error messages equal those raised by Customer.validate."""
+        errors = customer_frame_errors(normalize_customer_frame(raw_frame), required_fields)
+
+        for customer, error in zip(self._row_customers(raw_frame), errors):
+            try:
+                customer.validate(required_fields)
+                expected = ""
+            except ValidationError as e:
+                expected = str(e)
+            assert error == expected
+
+    def test_column_mapping_and_missing_columns(self):
+        """Test extraction through a column mapping with missing source columns."""
+        df = pd.DataFrame({"Full Name": ["John Doe"], "E-mail": ["JOHN@EXAMPLE.COM"]})
+
+        frame = normalize_customer_frame(df, {"name": "Full Name", "email": "E-mail", "phone": "Mobile"})
+
+        assert frame.iloc[0].to_dict() == {
+            "name": "John Doe", "company": "", "phone": "", "email": "john@example.com"
+        }
+
+    def test_frame_to_customers_with_mask(self, raw_frame):
+        """Test that only masked rows are materialized."""
+        frame = normalize_customer_frame(raw_frame)
+        valid = customer_frame_errors(frame, ["name"]) == ""
+
+        customers = frame_to_customers(frame, valid)
+
+        assert [c.name for c in customers] == ["John Doe", "Bob Wilson"]
+        assert customers[0].whatsapp_opt_in is True
+        assert customers[0].preferred_channel == "both"
+
+    def test_extract_handles_numeric_columns(self):
+        """Test that non-string values are converted like str()."""
+        df = pd.DataFrame({"name": ["John Doe"], "phone": [5551234567]})
+
+        raw = extract_customer_columns(df)
+
+        assert raw.loc[0, "phone"] == "5551234567"
+        assert normalize_customer_frame(df).loc[0, "phone"] == "+15551234567"
@@ -0,0 +1,187 @@
+"""
+Unit tests for the shared email domain resolution cache.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.multichannel_messaging.core.csv_processor import AdvancedTableProcessor
+from src.multichannel_messaging.core.data_validator import (
+    DomainCache,
+    DomainStatus,
+    EmailValidator,
+)
+
+
+class StubResolver:
+    """Local resolver that records lookups."""
+
+    def __init__(self, missing=(), delay=0.0):
+        self.missing = set(missing)
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, domain):
+        with self._lock:
+            self.calls.append(domain)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return DomainStatus.NOT_FOUND if domain in self.missing else DomainStatus.VALID
+
+
+class TestDomainCache:
+    """Test cases for DomainCache."""
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL."""
+        cache = DomainCache(ttl_seconds=60)
+        cache.set("example.com", DomainStatus.VALID)
+
+        assert cache.get("example.com") == DomainStatus.VALID
+        with patch("src.multichannel_messaging.core.data_validator.time.time", return_value=time.time() + 120):
+            assert cache.get("example.com") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used domain is evicted."""
+        cache = DomainCache(max_entries=2)
+        cache.set("a.com", DomainStatus.VALID)
+        cache.set("b.com", DomainStatus.VALID)
+        cache.get("a.com")
+        cache.set("c.com", DomainStatus.NOT_FOUND)
+
+        assert cache.get("b.com") is None
+        assert cache.get("a.com") == DomainStatus.VALID
+        assert cache.get("c.com") == DomainStatus.NOT_FOUND
+
+    def test_persistence_round_trip(self, tmp_path):
+        """Test that saved entries are loaded by a new cache."""
+        cache_file = tmp_path / "domains.json"
+        cache = DomainCache(cache_file)
+        cache.update({"a.com": DomainStatus.VALID, "b.com": DomainStatus.UNRESOLVABLE})
+
+        assert cache.save(force=True) is True
+        assert cache.save(force=True) is False  # Nothing changed
+
+        reloaded = DomainCache(cache_file)
+        assert reloaded.get("a.com") == DomainStatus.VALID
+        assert reloaded.get("b.com") == DomainStatus.UNRESOLVABLE
+
+    def test_concurrent_saves_keep_file_valid(self, tmp_path):
+        """Test that caches saving the same file at once never leave a corrupt or temporary file."""
+        cache_file = tmp_path / "domains.json"
+        caches = [DomainCache(cache_file) for _ in range(8)]
+        for i, cache in enumerate(caches):
+            cache.update({f"domain{i}-{j}.com": DomainStatus.VALID for j in range(200)})
+
+        threads = [threading.Thread(target=cache.save, args=(True,)) for cache in caches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(DomainCache(cache_file)) == 200
+        assert [path.name for path in tmp_path.iterdir()] == ["domains.json"]
+
+    def test_child_process_does_not_save_on_exit(self, tmp_path, monkeypatch):
+        """Test that the shared cache of a child process is not saved by an exit hook."""
+        from src.multichannel_messaging.core import data_validator
+
+        monkeypatch.setattr(data_validator, "_domain_cache", None)
+        monkeypatch.setattr(data_validator, "get_app_data_dir", lambda: tmp_path)
+        with patch.object(data_validator.multiprocessing, "parent_process", return_value=object()), \
+             patch.object(data_validator.atexit, "register") as register:
+            data_validator.get_domain_cache()
+
+        register.assert_not_called()
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path):
+        """Test that an unreadable cache file starts an empty cache."""
+        cache_file = tmp_path / "domains.json"
+        cache_file.write_text("not json")
+
+        assert len(DomainCache(cache_file)) == 0
+
+
+class TestEmailValidatorDomainCache:
+    """Test cases for cached domain validation in EmailValidator."""
+
+    def test_repeated_domain_resolved_once(self):
+        """Test that each domain is looked up only once."""
+        resolver = StubResolver(missing={"nowhere.test"})
+        validator = EmailValidator(domain_cache=DomainCache(), resolver=resolver)
+
+        for i in range(3):
+            assert validator.validate_email(f"user{i}@example.com") == []
+            issues = validator.validate_email(f"user{i}@nowhere.test")
+            assert [issue.rule_name for issue in issues] == ["email_domain_exists"]
+
+        assert sorted(resolver.calls) == ["example.com", "nowhere.test"]
+
+    def test_validators_share_cache(self):
+        """Test that a new validator reuses results from the shared cache."""
+        cache = DomainCache()
+        first = StubResolver()
+        EmailValidator(domain_cache=cache, resolver=first).validate_email("a@example.com")
+
+        second = StubResolver()
+        EmailValidator(domain_cache=cache, resolver=second).validate_email("b@example.com")
+
+        assert first.calls == ["example.com"]
+        assert second.calls == []
+
+    def test_resolve_domains_bounded_parallelism(self):
+        """Test concurrent pre-resolution with a worker limit."""
+        resolver = StubResolver(delay=0.02)
+        cache = DomainCache()
+        cache.set("cached.com", DomainStatus.VALID)
+        validator = EmailValidator(domain_cache=cache, resolver=resolver)
+
+        domains = [f"domain{i}.com" for i in range(20)] + ["cached.com", "domain0.com"]
+        statuses = validator.resolve_domains(domains, max_workers=4)
+
+        assert len(statuses) == 21
+        assert len(resolver.calls) == 20
+        assert 1 < resolver.max_active <= 4
+
+    def test_transient_failures_not_cached(self):
+        """Test that lookups returning None are retried later."""
+        calls = []
+
+        def flaky(domain):
+            calls.append(domain)
+            return None
+
+        validator = EmailValidator(domain_cache=DomainCache(), resolver=flaky)
+        validator.validate_email("a@example.com")
+        validator.validate_email("b@example.com")
+
+        assert calls == ["example.com", "example.com"]
+
+
+class TestTableDomainPreresolution:
+    """Test cases for domain pre-resolution during table validation."""
+
+    def test_distinct_domains_resolved_per_import(self, tmp_path):
+        """Test that a table validation resolves each distinct domain once."""
+        csv_file = tmp_path / "customers.csv"
+        rows = [f"Customer {i},Company,+1555{i:07d},customer{i}@company{i % 5}.com" for i in range(50)]
+        csv_file.write_text("name,company,phone,email\n" + "\n".join(rows) + "\n")
+
+        resolver = StubResolver(missing={"company4.com"})
+        processor = AdvancedTableProcessor(validation_workers=1)
+        processor.data_validator.email_validator = EmailValidator(domain_cache=DomainCache(), resolver=resolver)
+
+        report = processor.validate_table_comprehensive(csv_file)
+
+        assert sorted(resolver.calls) == [f"company{i}.com" for i in range(5)]
+        assert len([issue for issue in report.issues if issue.issue_type == "email_domain_exists"]) == 10
@@ -6,6 +6,8 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 import json
+import threading
+import time
 
 from src.multichannel_messaging.services.api_clients.whatsapp_api_client import (
     WhatsAppAPIClient, APIHealthMetrics, EnhancedHTTPAdapter
@@ -17,7 +19,7 @@ from src.multichannel_messaging.core.whatsapp_template_manager import (
     WhatsAppTemplateManager, WhatsAppTemplate, TemplateCategory, TemplateStatus
 )
 from src.multichannel_messaging.core.webhook_manager import (
-    WhatsAppDeliverySystem, DeliveryTracker, WebhookManager, MessageStatus
+    WhatsAppDeliverySystem, DeliveryTracker, WebhookManager, MessageStatus, StatusUpdate
 )
 from src.multichannel_messaging.utils.exceptions import WhatsAppAPIError, QuotaExceededError
 
@@ -175,6 +177,239 @@ class TestIntelligentRateLimiter:
         # Should allow requests again
         can_proceed, reason, details = self.rate_limiter.can_make_request(QuotaType.MESSAGES_PER_MINUTE)
         assert can_proceed is True
+    
+    def test_sliding_window_expiry(self):
+        """Test that requests leave the window individually."""
+        start = 1_000_000.0
+        with patch('src.multichannel_messaging.core.rate_limiter.time.time') as mock_time:
+            for i in range(7):
+                mock_time.return_value = start + i
+                self.rate_limiter.record_request(QuotaType.MESSAGES_PER_MINUTE, use_burst=i >= 5)
+            
+            mock_time.return_value = start + 10
+            can_proceed, reason, details = self.rate_limiter.can_make_request(QuotaType.MESSAGES_PER_MINUTE)
+            assert can_proceed is False
+            # The oldest request expires one window after it was made
+            assert details["next_available"] == datetime.fromtimestamp(start + 60).isoformat()
+            
+            mock_time.return_value = start + 60
+            can_proceed, reason, details = self.rate_limiter.can_make_request(QuotaType.MESSAGES_PER_MINUTE)
+            assert can_proceed is True
+            assert details["current_usage"] == 4
+            assert details["using_burst"] is False
+            
+            mock_time.return_value = start + 70
+            status = self.rate_limiter.get_quota_status(QuotaType.MESSAGES_PER_MINUTE)
+            assert status["current_usage"] == 0
+            assert status["burst_usage"] == 0
+    
+    def test_next_available_time(self):
+        """Test that the next slot is when the oldest blocking request expires."""
+        start = 1_000_000.0
+        with patch('src.multichannel_messaging.core.rate_limiter.time.time') as mock_time:
+            for i in range(5):
+                mock_time.return_value = start + i
+                self.rate_limiter.record_request(QuotaType.MESSAGES_PER_MINUTE)
+            
+            mock_time.return_value = start + 10
+            next_regular = self.rate_limiter._calculate_next_available_time(
+                QuotaType.MESSAGES_PER_MINUTE, use_burst=False
+            )
+            assert next_regular == datetime.fromtimestamp(start + 60)
+            
+            for i in range(2):
+                self.rate_limiter.record_request(QuotaType.MESSAGES_PER_MINUTE, use_burst=True)
+            next_any = self.rate_limiter._calculate_next_available_time(QuotaType.MESSAGES_PER_MINUTE)
+            assert next_any == datetime.fromtimestamp(start + 60)
+
+
+class TestRateLimiterPersistence:
+    """Test snapshot and event log persistence of quota usage."""
+    
+    def _create_limiter(self, storage_path):
+        return IntelligentRateLimiter(
+            quota_configs=[
+                QuotaConfig(
+                    quota_type=QuotaType.MESSAGES_PER_HOUR,
+                    limit=100,
+                    window_seconds=3600,
+                    burst_capacity=10
+                )
+            ],
+            storage_path=storage_path,
+            flush_interval=60
+        )
+    
+    def test_record_request_does_not_write_snapshot(self, tmp_path):
+        """Test that recording requests leaves the snapshot untouched until a flush."""
+        storage_path = tmp_path / "quota.json"
+        limiter = self._create_limiter(storage_path)
+        snapshot = storage_path.read_text()
+        
+        for _ in range(5):
+            limiter.record_request(QuotaType.MESSAGES_PER_HOUR)
+        
+        assert storage_path.read_text() == snapshot
+        limiter.shutdown()
+    
+    def test_event_log_replayed_after_restart(self, tmp_path):
+        """Test that flushed events are restored on top of the snapshot."""
+        storage_path = tmp_path / "quota.json"
+        limiter = self._create_limiter(storage_path)
+        for i in range(5):
+            limiter.record_request(QuotaType.MESSAGES_PER_HOUR, use_burst=i == 4)
+        limiter._flush_quota_events()
+        
+        # Simulate a crash: no final snapshot, plus a torn last line
+        limiter._persist_stop.set()
+        with open(limiter.event_log_path, 'a') as f:
+            f.write('["messages_per_hour", 12')
+        
+        restored = self._create_limiter(storage_path)
+        status = restored.get_quota_status(QuotaType.MESSAGES_PER_HOUR)
+        assert status["current_usage"] == 4
+        assert status["burst_usage"] == 1
+        restored.shutdown()
+    
+    def test_stale_event_log_ignored(self, tmp_path):
+        """Test that a log from an older snapshot is not replayed twice."""
+        storage_path = tmp_path / "quota.json"
+        limiter = self._create_limiter(storage_path)
+        for _ in range(3):
+            limiter.record_request(QuotaType.MESSAGES_PER_HOUR)
+        limiter._flush_quota_events()
+        stale_log = limiter.event_log_path.read_text()
+        limiter.shutdown()
+        
+        # Snapshot written but the log was not yet replaced
+        limiter.event_log_path.write_text(stale_log)
+        
+        restored = self._create_limiter(storage_path)
+        assert restored.get_quota_status(QuotaType.MESSAGES_PER_HOUR)["current_usage"] == 3
+        restored.shutdown()
+    
+    def test_reset_persisted_on_shutdown(self, tmp_path):
+        """Test that a reset quota stays reset after restart."""
+        storage_path = tmp_path / "quota.json"
+        limiter = self._create_limiter(storage_path)
+        for _ in range(3):
+            limiter.record_request(QuotaType.MESSAGES_PER_HOUR)
+        limiter._flush_quota_events()
+        limiter.reset_quota(QuotaType.MESSAGES_PER_HOUR)
+        limiter.shutdown()
+        
+        restored = self._create_limiter(storage_path)
+        assert restored.get_quota_status(QuotaType.MESSAGES_PER_HOUR)["current_usage"] == 0
+        restored.shutdown()
+
+
+class TestQueuedRequestDispatch:
+    """Test quota-aware dispatch of queued requests."""
+    
+    def _create_limiter(self, limit, window_seconds=60, dispatch_workers=1):
+        return IntelligentRateLimiter(
+            quota_configs=[
+                QuotaConfig(
+                    quota_type=QuotaType.MESSAGES_PER_MINUTE,
+                    limit=limit,
+                    window_seconds=window_seconds
+                ),
+                QuotaConfig(
+                    quota_type=QuotaType.MESSAGES_PER_HOUR,
+                    limit=1000,
+                    window_seconds=3600
+                )
+            ],
+            enable_persistence=False,
+            dispatch_workers=dispatch_workers
+        )
+    
+    def _wait_for(self, condition, timeout=5.0):
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            time.sleep(0.01)
+        return condition()
+    
+    def test_saturation_never_exceeds_window(self):
+        """Test that a saturated queue is dispatched within the sliding window limit."""
+        limiter = self._create_limiter(limit=10, window_seconds=0.5, dispatch_workers=4)
+        sent_at = []
+        lock = threading.Lock()
+        
+        def send():
+            with lock:
+                sent_at.append(time.monotonic())
+        
+        for _ in range(30):
+            limiter.queue_request(QuotaType.MESSAGES_PER_MINUTE, send)
+        
+        assert self._wait_for(lambda: len(sent_at) == 30)
+        limiter.shutdown()
+        
+        sent_at.sort()
+        for i in range(len(sent_at) - 10):
+            # Small allowance for callbacks starting after their slot was reserved
+            assert sent_at[i + 10] - sent_at[i] >= 0.45
+        # Slots were used as soon as they freed rather than on a polling interval
+        assert sent_at[-1] - sent_at[0] < 1.5
+    
+    def test_priority_order_when_quota_frees(self):
+        """Test that higher-priority requests are dispatched first."""
+        limiter = self._create_limiter(limit=1, window_seconds=0.2)
+        order = []
+        
+        limiter.record_request(QuotaType.MESSAGES_PER_MINUTE)
+        for priority in (5, 9, 1, 3):
+            limiter.queue_request(
+                QuotaType.MESSAGES_PER_MINUTE,
+                lambda p=priority: order.append(p),
+                priority=priority
+            )
+        
+        assert self._wait_for(lambda: len(order) == 4)
+        limiter.shutdown()
+        assert order == [1, 3, 5, 9]
+    
+    def test_callback_quota_checks_use_reservation(self):
+        """Test that a dispatched callback doing its own quota accounting is counted once."""
+        limiter = self._create_limiter(limit=3)
+        results = []
+        
+        def send():
+            can_proceed, _, details = limiter.can_make_request(QuotaType.MESSAGES_PER_MINUTE)
+            limiter.record_request(QuotaType.MESSAGES_PER_MINUTE, use_burst=details.get("using_burst", False))
+            limiter.record_request(QuotaType.MESSAGES_PER_HOUR)
+            results.append(can_proceed)
+        
+        for _ in range(3):
+            limiter.queue_request([QuotaType.MESSAGES_PER_MINUTE, QuotaType.MESSAGES_PER_HOUR], send)
+        
+        assert self._wait_for(lambda: len(results) == 3)
+        status = limiter.get_quota_status()
+        metrics = limiter.get_queue_metrics()["messages_per_minute+messages_per_hour"]
+        limiter.shutdown()
+        
+        assert results == [True, True, True]
+        assert status[QuotaType.MESSAGES_PER_MINUTE.value]["current_usage"] == 3
+        assert status[QuotaType.MESSAGES_PER_HOUR.value]["current_usage"] == 3
+        assert metrics["dispatched"] == 3
+        assert metrics["depth"] == 0
+        # Outside a dispatched callback the quota is exhausted
+        assert limiter.can_make_request(QuotaType.MESSAGES_PER_MINUTE)[0] is False
+    
+    def test_failed_callback_counted(self):
+        """Test that callback errors are recorded in the queue metrics."""
+        limiter = self._create_limiter(limit=5)
+        
+        def fail():
+            raise RuntimeError("send failed")
+        
+        limiter.queue_request(QuotaType.MESSAGES_PER_MINUTE, fail)
+        assert self._wait_for(
+            lambda: limiter.get_queue_metrics()["messages_per_minute"]["failed"] == 1
+        )
+        assert limiter.get_statistics()["queue_size"] == 0
+        limiter.shutdown()
 
 
 class TestWhatsAppTemplateManager:
@@ -293,6 +528,65 @@ class TestDeliveryTracker:
         assert analytics.total_messages >= 10
         assert analytics.delivered_messages >= 10
         assert analytics.delivery_rate > 0
+    
+    def test_apply_status_updates_matches_sequential_updates(self, tmp_path):
+        """Test that batched status updates leave the same rows as one update at a time."""
+        batched = DeliveryTracker(tmp_path / "batched.db")
+        sequential = DeliveryTracker(tmp_path / "sequential.db")
+        for tracker in (batched, sequential):
+            for i in range(3):
+                tracker.track_message(f"msg_{i}", f"+123456789{i}")
+        
+        base = datetime(2024, 1, 1, 12, 0, 0)
+        updates = [
+            StatusUpdate("msg_0", MessageStatus.SENT, base),
+            StatusUpdate("msg_1", MessageStatus.SENT, base),
+            StatusUpdate("msg_0", MessageStatus.DELIVERED, base + timedelta(seconds=5)),
+            StatusUpdate("msg_1", MessageStatus.FAILED, base + timedelta(seconds=6),
+                         {"code": "131026", "message": "Message undeliverable"}),
+            StatusUpdate("msg_0", MessageStatus.READ, base + timedelta(seconds=9)),
+            StatusUpdate("unknown_msg", MessageStatus.DELIVERED, base),
+        ]
+        
+        assert batched.apply_status_updates(updates) == 2
+        for update in updates:
+            sequential.update_message_status(update.message_id, update.status, update.timestamp, update.error_info)
+        
+        for message_id in ("msg_0", "msg_1", "msg_2"):
+            cached = batched.get_message_status(message_id).to_dict()
+            stored = batched._load_record(message_id).to_dict()
+            expected = sequential._load_record(message_id).to_dict()
+            assert cached == stored
+            for key in ("status", "sent_at", "delivered_at", "read_at", "failed_at", "error_code", "error_message"):
+                assert stored[key] == expected[key]
+        
+        record = batched.get_message_status("msg_0")
+        assert record.status == MessageStatus.READ
+        assert record.get_delivery_time() == timedelta(seconds=5)
+        assert batched.get_message_status("msg_1").error_code == "131026"
+    
+    def test_stale_status_updates_ignored(self, tmp_path):
+        """Test that late or lower-ranked updates don't move a status backwards on either path."""
+        batched = DeliveryTracker(tmp_path / "batched.db")
+        single = DeliveryTracker(tmp_path / "single.db")
+        base = datetime(2024, 1, 1, 12, 0, 0)
+        for tracker in (batched, single):
+            tracker.track_message("msg_0", "+1234567890")
+        
+        batched.apply_status_updates([StatusUpdate("msg_0", MessageStatus.READ, base + timedelta(seconds=9))])
+        assert batched.apply_status_updates([
+            StatusUpdate("msg_0", MessageStatus.DELIVERED, base + timedelta(seconds=5)),
+            StatusUpdate("msg_0", MessageStatus.READ, base + timedelta(seconds=1))
+        ]) == 0
+        
+        assert single.update_message_status("msg_0", MessageStatus.READ, base + timedelta(seconds=9))
+        assert not single.update_message_status("msg_0", MessageStatus.DELIVERED, base + timedelta(seconds=5))
+        
+        for tracker in (batched, single):
+            for record in (tracker.get_message_status("msg_0"), tracker._load_record("msg_0")):
+                assert record.status == MessageStatus.READ
+                assert record.read_at == base + timedelta(seconds=9)
+                assert record.delivered_at is None
 
 
 class TestWebhookManager:
@@ -355,6 +649,48 @@ class TestWebhookManager:
         # Verify status was updated
         record = self.delivery_tracker.get_message_status("test_msg_123")
         assert record.status == MessageStatus.DELIVERED
+    
+    def test_webhook_batch_processing(self, tmp_path):
+        """Test processing several payloads as one batch."""
+        delivery_tracker = DeliveryTracker(tmp_path / "batch.db")
+        events = []
+        webhook_manager = WebhookManager(
+            webhook_secret="test_secret",
+            delivery_tracker=delivery_tracker,
+            event_callback=events.append
+        )
+        delivery_tracker.track_message("batch_msg_1", "+1234567890")
+        
+        def status_payload(status, timestamp):
+            return json.dumps({
+                "entry": [{
+                    "changes": [{
+                        "field": "messages",
+                        "value": {
+                            "statuses": [{"id": "batch_msg_1", "status": status, "timestamp": str(timestamp)}]
+                        }
+                    }]
+                }]
+            })
+        
+        import hmac
+        import hashlib
+        delivered = status_payload("delivered", 1700000000)
+        signature = hmac.new(b"test_secret", delivered.encode('utf-8'), hashlib.sha256).hexdigest()
+        
+        processed = webhook_manager.process_webhook_batch([
+            (status_payload("sent", 1699999990), None),
+            (delivered, f"sha256={signature}"),
+            (status_payload("read", 1700000100), "invalid_signature"),
+            ("{not json", None),
+        ])
+        
+        assert processed == 2
+        assert len(events) == 2
+        record = delivery_tracker.get_message_status("batch_msg_1")
+        assert record.status == MessageStatus.DELIVERED
+        assert record.sent_at == datetime.fromtimestamp(1699999990)
+        assert record.read_at is None
 
 
 if __name__ == "__main__":
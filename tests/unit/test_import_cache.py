@@ -0,0 +1,113 @@
+"""
+Unit tests for the persistent import file analysis cache.
+"""
+
+import os
+from unittest.mock import patch
+
+from src.multichannel_messaging.core.csv_processor import AdvancedTableProcessor
+from src.multichannel_messaging.core.import_cache import ImportCache
+
+
+def write_contacts(path, count, newline="\n"):
+    """Write a contact export with the given number of rows."""
+    rows = [f"Customer {i},Company {i},+1555{i:07d},customer{i}@example.com" for i in range(count)]
+    path.write_bytes((newline.join(["name,company,phone,email"] + rows) + newline).encode("utf-8"))
+    return path
+
+
+class TestImportCache:
+    """Test cases for ImportCache."""
+
+    def test_fingerprint_changes_with_content(self, tmp_path):
+        """Test that rewriting a file changes its fingerprint."""
+        csv_file = write_contacts(tmp_path / "contacts.csv", 10)
+        fingerprint = ImportCache.fingerprint(csv_file)
+
+        assert ImportCache.fingerprint(csv_file) == fingerprint
+        write_contacts(csv_file, 11)
+        assert ImportCache.fingerprint(csv_file) != fingerprint
+
+    def test_entries_persist_and_are_copied(self, tmp_path):
+        """Test that entries are reloaded from disk and cannot be mutated by callers."""
+        cache = ImportCache(tmp_path / "cache")
+        cache.update("abc", column_mapping={"name": "Name"})
+        cache.get("abc")["column_mapping"]["name"] = "Other"
+
+        assert ImportCache(tmp_path / "cache").get("abc") == {"column_mapping": {"name": "Name"}}
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entry files are removed."""
+        cache = ImportCache(tmp_path / "cache", max_entries=2)
+        cache.update("a", value=1)
+        cache.update("b", value=2)
+        os.utime(tmp_path / "cache" / "a.json", (0, 0))
+        cache.update("c", value=3)
+
+        assert sorted(path.stem for path in (tmp_path / "cache").glob("*.json")) == ["b", "c"]
+
+
+class TestProcessorImportCache:
+    """Test cases for import caching in AdvancedTableProcessor."""
+
+    def test_reopened_file_skips_analysis(self, tmp_path):
+        """Test that analyzing an unchanged file again reuses the cached structure."""
+        csv_file = write_contacts(tmp_path / "contacts.csv", 20)
+        cache = ImportCache(tmp_path / "cache")
+        first = AdvancedTableProcessor(import_cache=cache).analyze_file_structure(csv_file)
+
+        processor = AdvancedTableProcessor(import_cache=ImportCache(tmp_path / "cache"))
+        with patch.object(processor, "detect_encoding") as detect_encoding:
+            structure = processor.analyze_file_structure(csv_file)
+
+        detect_encoding.assert_not_called()
+        assert structure == first
+        assert structure.total_rows == 20
+
+    def test_cached_entries_hold_no_row_contents(self, tmp_path):
+        """Test that sample rows are re-read instead of being written to the cache."""
+        csv_file = write_contacts(tmp_path / "contacts.csv", 20)
+        first = AdvancedTableProcessor(import_cache=ImportCache(tmp_path / "cache")).analyze_file_structure(csv_file)
+
+        entry_files = list((tmp_path / "cache").glob("*.json"))
+        assert len(entry_files) == 1
+        assert "customer0@example.com" not in entry_files[0].read_text(encoding="utf-8")
+
+        processor = AdvancedTableProcessor(import_cache=ImportCache(tmp_path / "cache"))
+        structure = processor.analyze_file_structure(csv_file)
+        assert structure.sample_rows == first.sample_rows
+        assert structure.sample_rows[0]["email"] == "customer0@example.com"
+
+    def test_old_version_entries_removed(self, tmp_path):
+        """Test that entries of an older cache version are ignored and deleted."""
+        (tmp_path / "cache").mkdir()
+        old_entry = tmp_path / "cache" / "abc.json"
+        old_entry.write_text('{"version": 1, "entry": {"structures": {}}}', encoding="utf-8")
+
+        assert ImportCache(tmp_path / "cache").get("abc") is None
+        assert not old_entry.exists()
+
+    def test_column_mapping_remembered(self, tmp_path):
+        """Test that the mapping used to load a file is reused when it is loaded again."""
+        csv_file = write_contacts(tmp_path / "contacts.csv", 5)
+        processor = AdvancedTableProcessor(enable_domain_checking=False, import_cache=ImportCache())
+        mapping = {"name": "company", "company": "name", "phone": "phone", "email": "email"}
+        processor.load_customers_advanced(csv_file, column_mapping=mapping)
+
+        assert processor.get_cached_column_mapping(csv_file) == mapping
+        customers, _ = processor.load_customers_advanced(csv_file)
+        assert customers[0].name == "Company 0"
+
+    def test_stream_seeks_to_row_offsets(self, tmp_path):
+        """Test that streaming from a row uses the recorded offsets and matches a full scan."""
+        csv_file = write_contacts(tmp_path / "contacts.csv", 250, newline="\r\n")
+        processor = AdvancedTableProcessor(import_cache=ImportCache())
+        processor.ROW_OFFSET_INTERVAL = 100
+        structure = processor.analyze_file_structure(csv_file)
+
+        assert [rows for rows, _ in structure.row_offsets] == [100, 200]
+        all_rows = [row for chunk in processor.stream_table_rows(csv_file, structure) for row in chunk]
+        seeked = [row for chunk in processor.stream_table_rows(csv_file, structure, start_row=205) for row in chunk]
+
+        assert seeked == all_rows[205:]
+        assert seeked[0]["_row_number"] == 207
@@ -0,0 +1,90 @@
+"""
+Unit tests for constant-memory request logs and latency percentiles.
+"""
+
+import json
+import random
+
+from src.multichannel_messaging.services.api_clients.request_metrics import LatencyHistogram, RequestLogBuffer
+from src.multichannel_messaging.services.api_clients.whatsapp_api_client import WhatsAppAPIClient
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    def test_percentiles_within_bucket_error(self):
+        """Test that percentiles match exact values to within the bucket resolution."""
+        random.seed(7)
+        latencies = sorted(random.lognormvariate(-2.5, 0.8) for _ in range(20000))
+        histogram = LatencyHistogram()
+        for latency in latencies:
+            histogram.record(latency)
+
+        estimates = histogram.percentiles([50, 95, 99])
+        for percent, estimate in estimates.items():
+            exact = latencies[int(percent / 100 * len(latencies)) - 1]
+            assert abs(estimate - exact) / exact < 0.02
+
+        assert histogram.count == 20000
+        assert histogram.max == latencies[-1]
+
+    def test_memory_is_constant(self):
+        """Test that recording more latencies does not grow the histogram."""
+        histogram = LatencyHistogram()
+        buckets = len(histogram._counts)
+        for i in range(10000):
+            histogram.record(i / 1000)
+
+        assert len(histogram._counts) == buckets
+        assert LatencyHistogram().percentile(99) == 0.0
+
+
+class TestRequestLogBuffer:
+    """Test cases for RequestLogBuffer."""
+
+    def test_keeps_most_recent_entries(self):
+        """Test that the buffer keeps only its capacity of entries."""
+        buffer = RequestLogBuffer(capacity=3)
+        for i in range(10):
+            buffer.append({"i": i})
+
+        assert len(buffer) == 3
+        assert buffer.recent(2) == [{"i": 8}, {"i": 9}]
+        assert buffer.recent(100) == [{"i": 7}, {"i": 8}, {"i": 9}]
+
+    def test_spills_evicted_entries(self, tmp_path):
+        """Test that evicted entries are appended to the spill file in order."""
+        spill_path = tmp_path / "logs" / "requests.jsonl"
+        buffer = RequestLogBuffer(capacity=2, spill_path=spill_path)
+        for i in range(5):
+            buffer.append({"i": i})
+        buffer.close()
+
+        spilled = [json.loads(line) for line in spill_path.read_text().splitlines()]
+        assert spilled == [{"i": 0}, {"i": 1}, {"i": 2}]
+        assert buffer.spilled == 3
+
+
+class TestClientRequestMetrics:
+    """Test cases for request metrics of WhatsAppAPIClient."""
+
+    def test_health_metrics_report_percentiles(self, mock_graph_api):
+        """Test that latency percentiles and bounded logs are exposed by the client."""
+        mock_graph_api.latency = 0.02
+        client = WhatsAppAPIClient(
+            access_token="test_token",
+            phone_number_id="test_phone_id",
+            base_url=mock_graph_api.url,
+            enable_delivery_tracking=False,
+            request_log_capacity=5
+        )
+        try:
+            for i in range(8):
+                client.get_account_info()
+            metrics = client.get_health_metrics()
+        finally:
+            client.shutdown()
+
+        assert len(client.get_request_logs(limit=100)) == 5
+        assert 0.02 <= metrics.p50_response_time <= metrics.p95_response_time <= metrics.p99_response_time
+        assert metrics.p99_response_time <= metrics.max_response_time
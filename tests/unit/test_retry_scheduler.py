@@ -0,0 +1,147 @@
+"""
+Unit tests for the central WhatsApp API retry scheduler.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.multichannel_messaging.core.models import Customer, MessageStatus, MessageTemplate
+from src.multichannel_messaging.core.rate_limiter import IntelligentRateLimiter, QuotaConfig, QuotaType
+from src.multichannel_messaging.services.api_clients.retry_scheduler import RetryScheduler
+from src.multichannel_messaging.services.api_clients.whatsapp_api_client import WhatsAppAPIClient
+from src.multichannel_messaging.services.whatsapp_service import WhatsAppService
+from src.multichannel_messaging.utils.exceptions import WhatsAppAPIError
+
+
+class TestRetryScheduler:
+    """Test cases for RetryScheduler."""
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test that delays stay within half and all of the capped exponential backoff."""
+        scheduler = RetryScheduler(base_delay=1.0, max_delay=8.0)
+        delays = [scheduler.backoff_delay(retry_count) for retry_count in range(6) for _ in range(50)]
+
+        assert all(0.5 <= delay <= 8.0 for delay in delays)
+        assert len(set(delays)) > 1
+        assert scheduler.backoff_delay(0, retry_after=5) >= 5
+
+    def test_callbacks_run_in_due_order(self):
+        """Test that parked callbacks run once due, earliest first, off the scheduling thread."""
+        scheduler = RetryScheduler(max_workers=1)
+        order = []
+        threads = set()
+
+        def record(name):
+            order.append(name)
+            threads.add(threading.get_ident())
+
+        try:
+            late = scheduler.schedule(lambda: record("late"), 0.2)
+            early = scheduler.schedule(lambda: record("early"), 0.05)
+            assert not late.done()
+            early.result(timeout=2)
+            late.result(timeout=2)
+        finally:
+            scheduler.shutdown()
+
+        assert order == ["early", "late"]
+        assert threading.get_ident() not in threads
+
+    def test_shutdown_cancels_parked_callbacks(self):
+        """Test that parked callbacks are cancelled on shutdown."""
+        scheduler = RetryScheduler()
+        future = scheduler.schedule(lambda: None, 60)
+        scheduler.shutdown()
+
+        assert future.cancelled()
+
+
+class TestClientRetries:
+    """Test cases for WhatsAppAPIClient retries against a local mock Graph API."""
+
+    @pytest.fixture
+    def client(self, mock_graph_api):
+        """Create a client with short backoff and a generous quota."""
+        client = WhatsAppAPIClient(
+            access_token="test_token",
+            phone_number_id="test_phone_id",
+            base_url=mock_graph_api.url,
+            enable_delivery_tracking=False,
+            retry_scheduler=RetryScheduler(base_delay=0.01)
+        )
+        client.rate_limiter.shutdown()
+        client.rate_limiter = IntelligentRateLimiter(
+            quota_configs=[
+                QuotaConfig(quota_type=quota_type, limit=1000, window_seconds=60,
+                            warning_threshold=1.0, critical_threshold=1.0)
+                for quota_type in (QuotaType.MESSAGES_PER_MINUTE, QuotaType.MESSAGES_PER_HOUR,
+                                   QuotaType.MESSAGES_PER_DAY)
+            ],
+            enable_persistence=False
+        )
+        yield client
+        client.shutdown()
+
+    def test_single_retry_budget(self, client, mock_graph_api):
+        """Test that server errors are retried only by the scheduler, up to max_retries."""
+        mock_graph_api.responses = [(503, {"error": {"code": 133005, "message": "unavailable"}}, {})] * 10
+
+        with pytest.raises(WhatsAppAPIError):
+            client.send_text_message("+15550000001", "Hello")
+
+        metrics = client.get_health_metrics()
+        assert len(mock_graph_api.requests) == client.max_retries + 1
+        assert metrics.total_retries == client.max_retries
+        assert metrics.retries_by_reason == {"api_error": client.max_retries}
+        assert sum(metrics.retry_delay_histogram.values()) == client.max_retries
+
+    def test_retry_after_pauses_all_senders(self, client, mock_graph_api):
+        """Test that a Retry-After hint delays other requests and frees the submitting thread."""
+        mock_graph_api.responses = [(429, {}, {"Retry-After": "1"})]
+        payload = client._build_text_payload("+15550000001", "first")
+
+        first = client._submit_request("POST", client._messages_endpoint(), payload)
+        assert not first.done()
+
+        start = time.perf_counter()
+        client.send_text_message("+15550000002", "second")
+
+        assert time.perf_counter() - start >= 0.9
+        assert first.result(timeout=5)["messages"]
+        assert client.get_health_metrics().retries_by_reason == {"rate_limited": 1}
+        assert client.get_health_metrics().rate_limited_requests == 1
+
+    def test_submit_text_message_returns_before_retry(self, client, mock_graph_api):
+        """Test that a submitted message returns while its retry is parked."""
+        client.retry_scheduler.base_delay = 0.5
+        mock_graph_api.responses = [(503, {"error": {"code": 133005, "message": "unavailable"}}, {})]
+
+        future = client.submit_text_message("+15550000001", "Hello")
+        assert not future.done()
+        assert future.result(timeout=5)["messages"]
+        assert len(mock_graph_api.requests) == 2
+
+    def test_bulk_send_does_not_wait_for_retries(self, client, mock_graph_api):
+        """Test that the bulk sender keeps sending while an earlier message is retried."""
+        client.retry_scheduler.base_delay = 0.5
+        mock_graph_api.responses = [(503, {"error": {"code": 133005, "message": "unavailable"}}, {})]
+        with patch.object(WhatsAppService, "test_connection", return_value=(True, "ok")):
+            service = WhatsAppService("test_token", "test_phone_id")
+        service.api_client.shutdown()
+        service.api_client = client
+
+        template = MessageTemplate(id="bulk", name="Bulk", channels=["whatsapp"],
+                                   whatsapp_content="Hello {name}")
+        customers = [
+            Customer(name=f"Customer {i}", company="Company", phone=f"+1555000000{i}",
+                     email=f"c{i}@example.com")
+            for i in range(1, 4)
+        ]
+        records = service.send_bulk_messages(customers, template, delay_between_messages=0)
+
+        recipients = [request["to"] for request in mock_graph_api.requests]
+        assert recipients == ["+15550000001", "+15550000002", "+15550000003", "+15550000001"]
+        assert [record.status for record in records] == [MessageStatus.SENT] * 3
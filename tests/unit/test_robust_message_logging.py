@@ -299,6 +299,85 @@ class TestRobustMessageLogging:
         assert summary.failed_messages == 2
         assert summary.success_rate == 60.0
     
+    def test_incremental_session_counters(self):
+        """Test session counters follow status transitions without recounting."""
+        session_id = self.logger.start_session("email", self.template)
+        
+        log_ids = []
+        for i in range(4):
+            customer = Customer(
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                company="Test Corp",
+                phone=f"+12345678{i:02d}"
+            )
+            record = MessageRecord(customer=customer, template=self.template, channel="email")
+            log_ids.append(self.logger.log_message(record))
+        
+        self.logger.update_message_status(log_ids[0], MessageStatus.SENT)
+        self.logger.update_message_status(log_ids[1], MessageStatus.SENT)
+        self.logger.update_message_status(log_ids[1], MessageStatus.FAILED, error_message="bounced")
+        self.logger.update_message_status(log_ids[2], MessageStatus.CANCELLED)
+        
+        with sqlite3.connect(str(self.db_path)) as conn:
+            row = conn.execute(
+                """SELECT total_messages, successful_messages, failed_messages,
+                          pending_messages, cancelled_messages, success_rate
+                   FROM session_summaries WHERE session_id = ?""",
+                (session_id,)
+            ).fetchone()
+        
+        assert tuple(row) == (4, 1, 1, 1, 1, 25.0)
+    
+    def test_status_update_from_previous_logger(self):
+        """Test counters stay correct for messages logged by another instance."""
+        session_id = self.logger.start_session("email", self.template)
+        record = MessageRecord(customer=self.customer, template=self.template, channel="email")
+        log_id = self.logger.log_message(record)
+        
+        other = MessageLogger(str(self.db_path), "test_user")
+        other.update_message_status(log_id, MessageStatus.SENT)
+        other.close()
+        
+        with sqlite3.connect(str(self.db_path)) as conn:
+            row = conn.execute(
+                "SELECT successful_messages, pending_messages FROM session_summaries WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+        
+        assert tuple(row) == (1, 0)
+    
+    def test_reconcile_session_stats(self):
+        """Test counters are rebuilt from message logs after a crash."""
+        session_id = self.logger.start_session("email", self.template)
+        for status in (MessageStatus.SENT, MessageStatus.SENT, MessageStatus.FAILED):
+            record = MessageRecord(
+                customer=self.customer, template=self.template, channel="email", status=status
+            )
+            self.logger.log_message(record)
+        
+        # Simulate counters lost in a crash
+        with sqlite3.connect(str(self.db_path)) as conn:
+            conn.execute(
+                "UPDATE session_summaries SET total_messages = 0, successful_messages = 0, "
+                "failed_messages = 0, success_rate = 0 WHERE session_id = ?",
+                (session_id,)
+            )
+            conn.commit()
+        
+        # Open sessions are reconciled when a new logger starts
+        recovered = MessageLogger(str(self.db_path), "test_user")
+        recovered.close()
+        
+        with sqlite3.connect(str(self.db_path)) as conn:
+            row = conn.execute(
+                "SELECT total_messages, successful_messages, failed_messages FROM session_summaries WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+        assert tuple(row) == (3, 2, 1)
+        
+        assert self.logger.reconcile_session_stats(session_id) == 1
+    
     def test_data_export(self):
         """Test data export functionality."""
         # Create test data
@@ -357,6 +436,54 @@ class TestRobustMessageLogging:
             count = cursor.fetchone()[0]
             assert count == 0
     
+    def test_connection_pool_reuse(self):
+        """Test writes share one connection and reads reuse a per-thread read-only one."""
+        self.logger.start_session("email", self.template)
+        
+        with self.logger._get_connection() as first:
+            pass
+        with self.logger._get_connection() as second:
+            pass
+        assert first is second
+        
+        self.logger.get_quick_stats()
+        with self.logger._read_connection() as reader:
+            assert reader is not first
+            with pytest.raises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM message_logs")
+        
+        readers = []
+        def read_in_thread():
+            with self.logger._read_connection() as conn:
+                readers.append(conn)
+        thread = threading.Thread(target=read_in_thread)
+        thread.start()
+        thread.join()
+        assert readers[0] is not reader
+        
+        self.logger.close()
+        assert self.logger._writer_conn is None
+        assert self.logger._reader_conns == {}
+    
+    def test_reader_connections_of_exited_threads_closed(self):
+        """Test read-only connections of finished threads are closed rather than kept."""
+        readers = []
+        def read_in_thread():
+            with self.logger._read_connection() as conn:
+                readers.append(conn)
+        for _ in range(5):
+            thread = threading.Thread(target=read_in_thread)
+            thread.start()
+            thread.join()
+        
+        with self.logger._read_connection():
+            pass
+        
+        assert list(self.logger._reader_conns) == [threading.current_thread()]
+        for conn in readers:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+    
     def test_context_manager(self):
         """Test context manager functionality."""
         with MessageLogger(str(self.temp_dir / "context_test.db"), "context_user") as logger:
@@ -369,6 +496,168 @@ class TestRobustMessageLogging:
         # This is mainly to ensure no exceptions are raised
 
 
+class TestBufferedMessageLogging:
+    """Test suite for the buffered (group-commit) write pipeline."""
+    
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.db_path = self.temp_dir / "buffered_logs.db"
+        self.logger = MessageLogger(
+            str(self.db_path), "test_user", buffered=True, batch_size=50, flush_interval_ms=50
+        )
+        
+        self.template = MessageTemplate(
+            id="test_template",
+            name="Test Template",
+            subject="Test Subject",
+            content="Hello {name}",
+            channels=["email"]
+        )
+    
+    def teardown_method(self):
+        """Clean up test environment."""
+        try:
+            self.logger.close()
+        except:
+            pass
+        
+        import shutil
+        try:
+            shutil.rmtree(self.temp_dir)
+        except:
+            pass
+    
+    def _record(self, i, status=MessageStatus.PENDING):
+        customer = Customer(
+            name=f"User {i}",
+            email=f"user{i}@example.com",
+            company="Test Corp",
+            phone=f"+1234567{i:04d}"
+        )
+        return MessageRecord(customer=customer, template=self.template, channel="email", status=status)
+    
+    def _stored_row(self, log_id):
+        with sqlite3.connect(str(self.db_path)) as conn:
+            return tuple(conn.execute(
+                """
+                SELECT id, timestamp, user_id, session_id, channel, template_id, template_name,
+                       recipient_email, recipient_name, recipient_phone, recipient_company,
+                       message_status, message_id, delivery_status, error_message,
+                       sent_at, delivered_at, read_at, response_received, content_preview, metadata
+                FROM message_logs WHERE id = ?
+                """,
+                (log_id,)
+            ).fetchone())
+    
+    def test_writer_started(self):
+        """Test the background writer runs in buffered mode only."""
+        assert self.logger.get_writer_stats()["writer_running"] is True
+        
+        unbuffered = MessageLogger(str(self.temp_dir / "plain.db"), "test_user")
+        assert unbuffered.get_writer_stats()["writer_running"] is False
+        assert unbuffered.flush() is True
+        unbuffered.close()
+    
+    def test_flush_commits_messages_and_status_updates(self):
+        """Test flush makes queued inserts and status updates durable in order."""
+        session_id = self.logger.start_session("email", self.template)
+        log_ids = [self.logger.log_message(self._record(i)) for i in range(120)]
+        for log_id in log_ids[:100]:
+            self.logger.update_message_status(log_id, MessageStatus.SENT, "msg_ok")
+        for log_id in log_ids[100:]:
+            self.logger.update_message_status(log_id, MessageStatus.FAILED, error_message="boom")
+        
+        assert self.logger.flush(timeout=10) is True
+        
+        with sqlite3.connect(str(self.db_path)) as conn:
+            counts = dict(conn.execute(
+                "SELECT message_status, COUNT(*) FROM message_logs GROUP BY message_status"
+            ).fetchall())
+            assert counts == {"sent": 100, "failed": 20}
+            
+            row = conn.execute(
+                "SELECT message_id, sent_at FROM message_logs WHERE id = ?", (log_ids[0],)
+            ).fetchone()
+            assert row[0] == "msg_ok"
+            assert row[1] is not None
+            
+            session = conn.execute(
+                "SELECT total_messages, successful_messages, failed_messages FROM session_summaries WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+            assert tuple(session) == (120, 100, 20)
+        
+        stats = self.logger.get_writer_stats()
+        assert stats["rows"] > 0
+        assert stats["batches"] < stats["rows"]
+        assert stats["failed_rows"] == 0
+    
+    def test_failed_batch_retries_rows_individually(self):
+        """Test a constraint violation costs only the offending row and fails flush."""
+        session_id = self.logger.start_session("email", self.template)
+        first_id = self.logger.log_message(self._record(0))
+        assert self.logger.flush(timeout=10) is True
+        
+        log_ids = [self.logger.log_message(self._record(i)) for i in range(1, 11)]
+        # Same primary key as an existing row, queued in the middle of the batch
+        self.logger._enqueue_write("message", self._stored_row(first_id))
+        log_ids += [self.logger.log_message(self._record(i)) for i in range(11, 21)]
+        
+        assert self.logger.flush(timeout=10) is False
+        assert self.logger.flush(timeout=10) is True
+        
+        with sqlite3.connect(str(self.db_path)) as conn:
+            stored = {row[0] for row in conn.execute("SELECT id FROM message_logs")}
+            total = conn.execute(
+                "SELECT total_messages FROM session_summaries WHERE session_id = ?", (session_id,)
+            ).fetchone()[0]
+        
+        assert stored == {first_id, *log_ids}
+        assert total == 21
+        assert self.logger.get_writer_stats()["failed_rows"] == 1
+    
+    def test_reads_leave_write_failures_for_flush(self):
+        """Test a read that waits for the writer does not swallow failures flush reports."""
+        self.logger.start_session("email", self.template)
+        first_id = self.logger.log_message(self._record(0))
+        assert self.logger.flush(timeout=10) is True
+        
+        self.logger._enqueue_write("message", self._stored_row(first_id))
+        self.logger.log_message(self._record(1))
+        
+        assert self.logger.get_quick_stats()["messages_last_30_days"] == 2
+        assert self.logger.get_writer_stats()["failed_rows"] == 1
+        assert self.logger.flush(timeout=10) is False
+        assert self.logger.flush(timeout=10) is True
+    
+    def test_reads_see_queued_writes(self):
+        """Test read paths flush pending writes before querying."""
+        self.logger.start_session("email", self.template)
+        for i in range(5):
+            self.logger.log_message(self._record(i, MessageStatus.SENT))
+        
+        stats = self.logger.get_quick_stats()
+        assert stats["messages_last_30_days"] == 5
+        
+        summary = self.logger.end_session()
+        assert summary.total_messages == 5
+        assert summary.successful_messages == 5
+    
+    def test_close_drains_queue(self):
+        """Test close commits all outstanding writes and stops the writer."""
+        self.logger.start_session("email", self.template)
+        for i in range(30):
+            self.logger.log_message(self._record(i))
+        
+        self.logger.close()
+        assert self.logger.get_writer_stats()["writer_running"] is False
+        
+        with sqlite3.connect(str(self.db_path)) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM message_logs").fetchone()[0]
+            assert count == 30
+
+
 def test_logger_with_invalid_database_path():
     """Test logger behavior with invalid database path."""
     # Try to create logger with invalid path
@@ -227,6 +227,71 @@ Carlos Rodriguez,Demo LLC,+1-555-0789,carlos.rodriguez@demo.com"""
         assert customers[0].company == 'Example Corp'
         assert isinstance(report, TableValidationReport)
     
+    def test_load_customers_advanced_single_pass(self, processor, sample_csv_file):
+        """Test that validated loading streams the file once and matches separate validation."""
+        expected_report = processor.validate_table_comprehensive(sample_csv_file)
+        
+        with patch.object(processor, 'stream_table_rows', wraps=processor.stream_table_rows) as stream, \
+             patch.object(processor, '_extract_customer_data', wraps=processor._extract_customer_data) as extract:
+            customers, report = processor.load_customers_advanced(sample_csv_file)
+        
+        assert stream.call_count == 1
+        assert extract.call_count == 3
+        assert len(customers) == 3
+        assert report.total_rows == expected_report.total_rows == 3
+        assert len(report.issues) == len(expected_report.issues)
+        assert processor.last_structure.total_rows == 3
+        assert processor.last_structure.rows_counted is True
+    
+    def test_parallel_validation_matches_serial(self, tmp_path):
+        """Test that pooled validation merges issues in row order like serial validation."""
+        csv_file = tmp_path / "parallel.csv"
+        rows = [
+            f"Customer {i},Company {i},+1555{i:07d},{'invalid' if i % 7 == 0 else f'customer{i}@example.com'}"
+            for i in range(1200)
+        ]
+        csv_file.write_text("name,company,phone,email\n" + "\n".join(rows) + "\n")
+        
+        serial = AdvancedTableProcessor(enable_domain_checking=False, validation_workers=1)
+        parallel = AdvancedTableProcessor(enable_domain_checking=False, validation_workers=2)
+        parallel.PARALLEL_VALIDATION_MIN_ROWS = 100
+        
+        expected = serial.validate_table_comprehensive(csv_file)
+        with patch.object(parallel, '_start_validation_pool', wraps=parallel._start_validation_pool) as start_pool:
+            report = parallel.validate_table_comprehensive(csv_file)
+        
+        assert start_pool.call_count == 1
+        assert report.valid_rows == expected.valid_rows
+        assert report.issues == expected.issues
+        assert [issue.row_number for issue in report.issues] == sorted(issue.row_number for issue in report.issues)
+    
+    def test_validation_worker_keeps_caches_in_memory(self, monkeypatch):
+        """Test that validation worker processes never load or persist the shared caches."""
+        from src.multichannel_messaging.core import csv_processor
+        
+        monkeypatch.setattr(csv_processor, "_worker_processor", None)
+        with patch("src.multichannel_messaging.core.data_validator.get_domain_cache") as shared_domains, \
+             patch.object(csv_processor, "get_import_cache") as shared_imports:
+            csv_processor._init_validation_worker(True)
+        
+        worker = csv_processor._worker_processor
+        assert worker.data_validator.email_validator.domain_cache.cache_file is None
+        assert worker.import_cache.cache_dir is None
+        shared_domains.assert_not_called()
+        shared_imports.assert_not_called()
+    
+    def test_analyze_csv_structure_without_row_count(self, processor, tmp_path):
+        """Test that sample-only analysis stops after the sample rows."""
+        csv_file = tmp_path / "large.csv"
+        rows = [f"Customer {i},Company {i},+1555{i:07d},customer{i}@example.com" for i in range(50)]
+        csv_file.write_text("name,company,phone,email\n" + "\n".join(rows) + "\n")
+        
+        structure = processor.analyze_file_structure(csv_file, count_rows=False)
+        
+        assert structure.rows_counted is False
+        assert structure.total_rows == len(structure.sample_rows) == 5
+        assert processor.analyze_file_structure(csv_file).total_rows == 50
+    
     def test_validate_table_format_csv(self, processor, sample_csv_file):
         """Test table format validation for CSV."""
         result = processor.validate_table_format(sample_csv_file)
@@ -6,8 +6,11 @@ Tests the core functionality of the template management system
 including CRUD operations, categories, and data validation.
 """
 
+import json
 import sys
 import tempfile
+import threading
+import time
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -16,7 +19,10 @@ from unittest.mock import Mock, patch
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from multichannel_messaging.core.config_manager import ConfigManager
-from multichannel_messaging.core.template_manager import TemplateManager, TemplateCategory
+from multichannel_messaging.core.template_manager import (
+    LazyStore, TemplateManager, TemplateCategory, TemplateRecommendationEngine, TemplateSearchIndex,
+    TemplateVersion, TemplateVersionHistory, TemplateVersionManager
+)
 from multichannel_messaging.core.models import MessageTemplate, Customer
 from multichannel_messaging.utils.exceptions import ValidationError
 
@@ -205,6 +211,85 @@ class TestTemplateManager:
         metadata = template_manager.get_template_metadata("test_email")
         assert metadata["usage_count"] == 1
     
+    def test_template_usage_batched_until_flush(self, temp_config, sample_template):
+        """Test that usage updates are written once per dirty file on flush."""
+        manager = TemplateManager(temp_config, usage_flush_interval=60)
+        manager.save_template(sample_template, category_id="general")
+        
+        with patch("multichannel_messaging.core.template_manager._write_json_atomic") as write:
+            for _ in range(100):
+                manager.increment_template_usage("test_email")
+            assert write.call_count == 0
+            
+            manager.flush_usage()
+            written = sorted(call.args[0].name for call in write.call_args_list)
+        
+        assert written == [
+            "categories.json", "index.json", "recommendations.json",
+            "search_index.json", "usage_stats.json"
+        ]
+        
+        manager.increment_template_usage("test_email")
+        manager.close()
+        
+        reloaded = TemplateManager(temp_config)
+        assert reloaded.get_template_metadata("test_email")["usage_count"] == 101
+        assert reloaded.analytics.usage_stats["test_email"]["total_uses"] == 101
+        reloaded.close()
+    
+    def test_template_usage_flushed_on_timer(self, temp_config, sample_template):
+        """Test that pending usage is written after the flush interval."""
+        manager = TemplateManager(temp_config, usage_flush_interval=0.05)
+        manager.save_template(sample_template, category_id="general")
+        
+        manager.increment_template_usage("test_email")
+        usage_file = manager.analytics.analytics_dir / "usage_stats.json"
+        
+        deadline = time.time() + 5
+        while usage_file.exists() is False and time.time() < deadline:
+            time.sleep(0.01)
+        
+        assert usage_file.exists()
+        assert manager._dirty_files == set()
+        manager.close()
+    
+    def test_timer_flush_concurrent_with_saves(self, temp_config, sample_template, caplog):
+        """Test that timer flushes don't race template saves and deletes."""
+        manager = TemplateManager(temp_config, usage_flush_interval=0.001)
+        manager.save_template(sample_template, category_id="general")
+        errors = []
+        
+        def record_usage():
+            try:
+                for _ in range(200):
+                    manager.increment_template_usage("test_email")
+                    time.sleep(0.0005)
+            except Exception as e:
+                errors.append(e)
+        
+        thread = threading.Thread(target=record_usage)
+        thread.start()
+        for i in range(30):
+            template = MessageTemplate(
+                id=f"concurrent_{i}",
+                name=f"Concurrent {i}",
+                channels=["email"],
+                subject="Subject",
+                content="Content"
+            )
+            manager.save_template(template, category_id="general")
+            if i % 3 == 0:
+                manager.delete_template(template.id)
+        thread.join()
+        manager.flush_usage()
+        
+        assert errors == []
+        assert not [r for r in caplog.records if r.levelname == "ERROR"]
+        assert manager._dirty_files == set()
+        index = json.loads(manager.templates_index_file.read_text())
+        assert len(index["templates"]) == 21
+        manager.close()
+    
     def test_template_validation(self, template_manager):
         """Test template validation."""
         # Test invalid template (no name) - should raise ValidationError during creation
@@ -241,6 +326,81 @@ class TestTemplateManager:
         assert success is True
 
 
+class TestBulkImportExport:
+    """Test cases for bulk template import and export."""
+    
+    def _manager(self, templates_dir):
+        config_manager = ConfigManager()
+        config_manager.get_templates_path = lambda: templates_dir
+        return TemplateManager(config_manager)
+    
+    @pytest.fixture
+    def source_manager(self, tmp_path):
+        """Create a manager with a small library."""
+        manager = self._manager(tmp_path / "source")
+        manager.create_category("promotions", "Promotions")
+        for i in range(6):
+            manager.save_template(MessageTemplate(
+                id=f"t{i}", name=f"Template {i}", subject="Hi {name}", content=f"Offer {i} for {{name}}"
+            ), category_id="promotions" if i % 2 else "general", tags=[f"tag{i}"])
+        yield manager
+        manager.close()
+    
+    def test_archive_round_trip(self, source_manager, tmp_path):
+        """Test that an exported archive imports with metadata and categories in one commit."""
+        export_path = source_manager.bulk_export_templates(include_versions=True)
+        assert export_path.suffix == ".zip"
+        assert source_manager.validate_import_file(export_path)["template_count"] == 6
+        
+        target = self._manager(tmp_path / "target")
+        progress = []
+        with patch.object(TemplateManager, "_update_templates_index", autospec=True,
+                          side_effect=TemplateManager._update_templates_index) as update_index:
+            results = target.bulk_import_templates(
+                export_path, progress_callback=lambda *args: progress.append(args)
+            )
+        
+        assert results["successful_imports"] == 6
+        assert results["errors"] == []
+        assert update_index.call_count == 1
+        assert progress[-1] == (6, 6, "Import completed")
+        assert target.get_template("t3").content == "Offer 3 for {name}"
+        assert target.get_template_metadata("t3")["category_id"] == "promotions"
+        assert target.get_template_metadata("t3")["tags"] == ["tag3"]
+        assert target.get_category("promotions").template_count == 3
+        target.close()
+        
+        restarted = self._manager(tmp_path / "target")
+        assert len(restarted.get_templates()) == 6
+        assert restarted.search_index.search("offer")
+        restarted.close()
+    
+    def test_conflicts_and_invalid_files(self, source_manager, tmp_path):
+        """Test ID conflicts within an import and files that fail to parse."""
+        import_dir = tmp_path / "import"
+        import_dir.mkdir()
+        source_manager.bulk_export_templates(["t0", "t1"], export_path=import_dir / "bulk.json")
+        source_manager.export_template("t1", import_dir / "single.json")
+        (import_dir / "broken.json").write_text("{not json")
+        (import_dir / "invalid.json").write_text(json.dumps({"id": "bad", "name": "No subject"}))
+        
+        strict = source_manager.bulk_import_templates(import_dir)
+        assert strict["successful_imports"] == 0
+        assert strict["failed_imports"] == 5
+        
+        target = self._manager(tmp_path / "target")
+        strict = target.bulk_import_templates(import_dir)
+        assert sorted(strict["imported_templates"]) == ["t0", "t1"]
+        assert any("already exists" in error for error in strict["errors"])
+        assert any("broken.json" in error for error in strict["errors"])
+        
+        lenient = target.bulk_import_templates(import_dir, validation_mode="lenient")
+        assert lenient["successful_imports"] == 3
+        assert len(set(lenient["imported_templates"])) == 3
+        assert len(target.get_templates()) == 5
+        target.close()
+
+
 class TestTemplateCategory:
     """Test cases for TemplateCategory class."""
     
@@ -277,5 +437,418 @@ class TestTemplateCategory:
         assert restored.color == category.color
 
 
+class TestTemplateSearchIndex:
+    """Test cases for the inverted template search index."""
+    
+    def _template(self, template_id, name, content, subject="Subject"):
+        return MessageTemplate(id=template_id, name=name, subject=subject, content=content)
+    
+    @pytest.fixture
+    def search_index(self):
+        """Create an index with a few templates."""
+        index = TemplateSearchIndex()
+        index.add_template(
+            self._template("welcome", "Welcome Email", "Welcome aboard, we are glad you joined."),
+            {"category_id": "onboarding", "tags": ["Welcome", "greeting"]}
+        )
+        index.add_template(
+            self._template("invoice", "Invoice Reminder", "Your invoice is due. Please pay the invoice soon."),
+            {"category_id": "billing", "tags": ["billing"]}
+        )
+        index.add_template(
+            self._template("renewal", "Renewal Notice", "Your plan renews next month, welcome to another year."),
+            {"category_id": "billing", "tags": ["billing", "reminder"]}
+        )
+        return index
+    
+    def test_bm25_ranking_and_name_bonus(self, search_index):
+        """Test that more relevant templates rank first."""
+        results = search_index.search("welcome")
+        
+        assert [template_id for template_id, _ in results] == ["welcome", "renewal"]
+        assert results[0][1] > results[1][1] + TemplateSearchIndex.NAME_MATCH_BONUS
+    
+    def test_prefix_and_filters(self, search_index):
+        """Test that partial words match and filters restrict candidates."""
+        assert {tid for tid, _ in search_index.search("invo")} == {"invoice"}
+        assert [tid for tid, _ in search_index.search("welc", category_id="billing")] == ["renewal"]
+        assert [tid for tid, _ in search_index.search("your", tags=["REMINDER"])] == ["renewal"]
+        assert sorted(search_index.search("", category_id="billing")) == [("invoice", 1.0), ("renewal", 1.0)]
+        assert search_index.search("missing") == []
+    
+    def test_usage_boost(self, search_index):
+        """Test that usage raises the score of matching templates only."""
+        before = dict(search_index.search("your"))
+        search_index.usage_index["invoice"] = 50
+        search_index.usage_index["welcome"] = 50
+        after = dict(search_index.search("your"))
+        
+        assert after["invoice"] == pytest.approx(before["invoice"] + 2.0)
+        assert "welcome" not in after
+    
+    def test_update_and_remove(self, search_index):
+        """Test that updating or removing a template leaves no stale entries."""
+        search_index.add_template(
+            self._template("invoice", "Payment Due", "Payment is due."),
+            {"category_id": "finance", "tags": ["urgent"]}
+        )
+        
+        assert search_index.search("invoice") == []
+        assert [tid for tid, _ in search_index.search("payment", category_id="finance")] == ["invoice"]
+        assert "invoice" not in search_index.category_index["billing"]
+        
+        search_index.remove_template("invoice")
+        
+        assert "invoice" not in search_index
+        assert "payment" not in search_index.postings
+        assert "urgent" not in search_index.tag_index
+        assert search_index.suggest_template_ids("pay") == set()
+    
+    def test_suggestions(self, search_index):
+        """Test name suggestions for partially typed queries."""
+        assert search_index.suggest_template_ids("re") == {"invoice", "renewal"}
+        assert search_index.suggest_template_ids("invoice rem") == {"invoice"}
+        assert search_index.suggest_template_ids("") == {"welcome", "invoice", "renewal"}
+    
+    def test_persistence_round_trip(self, search_index):
+        """Test that a restored index gives identical results."""
+        search_index.usage_index["renewal"] = 3
+        restored = TemplateSearchIndex.from_dict(search_index.to_dict())
+        
+        for query in ("welcome", "your invoice", "re"):
+            assert restored.search(query) == search_index.search(query)
+        assert restored.tag_index == search_index.tag_index
+        assert restored.category_index == search_index.category_index
+        assert len(TemplateSearchIndex.from_dict({"index": {"welcome": "welcome"}})) == 0
+    
+    def test_manager_restores_index_without_rebuild(self, tmp_path):
+        """Test that a saved index is loaded at startup and kept current on update."""
+        config_manager = ConfigManager()
+        config_manager.get_templates_path = lambda: tmp_path / "templates"
+        manager = TemplateManager(config_manager)
+        manager.save_template(self._template("promo", "Spring Promo", "Spring sale starts today"))
+        manager.update_template("promo", content="Summer sale starts today")
+        manager.close()
+        
+        with patch.object(TemplateManager, "_save_search_index") as save_search_index:
+            reloaded = TemplateManager(config_manager)
+        
+        save_search_index.assert_not_called()
+        assert [t.id for t, _ in reloaded.search_templates("summ")] == ["promo"]
+        assert reloaded.search_templates("spring sale")[0][0].id == "promo"
+        assert reloaded.search_templates("winter") == []
+        assert reloaded.get_template_suggestions("spr") == ["Spring Promo"]
+        reloaded.close()
+
+
+class TestLazyLoading:
+    """Test cases for on-demand template and version loading."""
+    
+    def test_lazy_store(self):
+        """Test loading on first access, failed loads and LRU release."""
+        loads = []
+        
+        def loader(key):
+            loads.append(key)
+            return None if key == "broken" else key.upper()
+        
+        store = LazyStore(loader, ["a", "b", "c", "broken"], max_resident=2)
+        assert len(store) == 4 and "a" in store and loads == []
+        
+        assert store["a"] == "A" and store["a"] == "A"
+        assert store["b"] == "B"
+        assert store["c"] == "C"
+        assert not store.is_loaded("a") and store.is_loaded("c")
+        assert store["a"] == "A"
+        assert loads == ["a", "b", "c", "a"]
+        
+        assert store.get("broken") is None
+        assert "broken" not in store
+        assert store.values() == ["A", "B", "C"]
+    
+    def test_templates_loaded_on_access(self, tmp_path):
+        """Test that startup reads the index but not the template files."""
+        config_manager = ConfigManager()
+        config_manager.get_templates_path = lambda: tmp_path / "templates"
+        manager = TemplateManager(config_manager)
+        for i in range(5):
+            manager.save_template(MessageTemplate(
+                id=f"t{i}", name=f"Template {i}", subject="Hi {name}", content="Hello {name}"
+            ))
+        manager.close()
+        
+        with patch.object(TemplateManager, "_load_template_file",
+                          autospec=True, side_effect=TemplateManager._load_template_file) as load_file:
+            reloaded = TemplateManager(config_manager)
+            assert load_file.call_count == 0
+            assert reloaded.get_template_usage_stats()["total_templates"] == 5
+            
+            assert reloaded.get_template("t3").name == "Template 3"
+            assert load_file.call_count == 1
+            assert len(reloaded.get_templates()) == 5
+            assert load_file.call_count == 5
+        reloaded.close()
+    
+    def test_missing_template_file_pruned_from_index(self, tmp_path):
+        """Test that an indexed template whose file was deleted is forgotten on access."""
+        config_manager = ConfigManager()
+        config_manager.get_templates_path = lambda: tmp_path / "templates"
+        manager = TemplateManager(config_manager)
+        for template_id in ("kept", "gone"):
+            manager.save_template(MessageTemplate(
+                id=template_id, name=template_id.title(), subject="Hi", content="Hello {name}"
+            ), tags=["promo"])
+        manager.close()
+        (tmp_path / "templates" / "gone.json").unlink()
+    
+        reloaded = TemplateManager(config_manager)
+        assert [t.id for t in reloaded.get_templates_by_tags(["promo"])] == ["kept"]
+        assert "gone" not in reloaded._template_metadata
+        assert "gone" not in reloaded.search_index
+        reloaded.close()
+    
+        index = json.loads((tmp_path / "templates" / "index.json").read_text(encoding="utf-8"))
+        assert list(index["templates"]) == ["kept"]
+    
+        # With the index pruned, startup no longer loads every template
+        restarted = TemplateManager(config_manager)
+        assert not restarted._templates.is_loaded("kept")
+        restarted.close()
+    
+    def test_version_histories_loaded_on_access(self, tmp_path):
+        """Test that version histories are read on demand and bounded in memory."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        version_manager = TemplateVersionManager(templates_dir)
+        version_ids = {}
+        for i in range(3):
+            version_ids[f"t{i}"] = version_manager.create_version(MessageTemplate(
+                id=f"t{i}", name=f"Template {i}", subject="Subject", content=f"Content {i}"
+            ))
+        
+        restarted = TemplateVersionManager(templates_dir, max_resident_histories=2)
+        assert restarted.active_versions == {}
+        assert not any(restarted.versions.is_loaded(f"t{i}") for i in range(3))
+        
+        # Loading a history restores its active version
+        assert restarted.get_active_version("t0").version_id == version_ids["t0"]
+        branch_id = restarted.branch_template("t1", "experiment")
+        assert restarted.get_version("t1", branch_id).parent_version == version_ids["t1"]
+        restarted.get_version_history("t2")
+        
+        assert not restarted.versions.is_loaded("t0")
+        assert restarted.get_version("t0", version_ids["t0"]).template.content == "Content 0"
+        assert len(restarted.get_version_history("t1")) == 2
+
+
+class TestVersionStorage:
+    """Test cases for delta-encoded version histories."""
+    
+    def _template(self, revision, lines=40):
+        content = "".join(f"Line {i} for {{name}}, revision {revision if i == revision % lines else 0}\n"
+                          for i in range(lines))
+        return MessageTemplate(id="t", name=f"Template {revision // 10}", subject="Subject",
+                               content=content, variables=["name"])
+    
+    def test_versions_appended_as_deltas(self, tmp_path):
+        """Test that versions are appended as snapshots and deltas and reconstruct exactly."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        version_manager = TemplateVersionManager(templates_dir)
+        version_ids = [version_manager.create_version(self._template(r), message=f"Edit {r}")
+                       for r in range(60)]
+        
+        # Versions created within the same second still get distinct IDs
+        assert len(set(version_ids)) == 60
+        
+        lines = (templates_dir / "versions" / "t.jsonl").read_text().splitlines()
+        assert len(lines) == 60
+        records = [json.loads(line) for line in lines]
+        snapshots = [i for i, record in enumerate(records) if "template" in record]
+        assert snapshots == list(range(0, 60, TemplateVersionHistory.SNAPSHOT_INTERVAL))
+        assert set(records[1]["delta"]) == {"content", "updated_at", "created_at"}
+        assert "patch" in records[1]["delta"]["content"]
+        
+        restarted = TemplateVersionManager(templates_dir)
+        assert restarted.get_active_version("t").version_id == version_ids[-1]
+        for revision in (0, 1, 24, 25, 49, 59):
+            version = restarted.get_version("t", version_ids[revision])
+            assert version.template.content == self._template(revision).content
+            assert version.message == f"Edit {revision}"
+            # Reconstructed templates are cached on the version
+            assert version.template is version.template
+        
+        comparison = restarted.compare_versions("t", version_ids[9], version_ids[10])
+        assert comparison["changed_fields"] == ["name", "content"]
+        assert "+ Template 1" in restarted.get_diff_text("t", version_ids[9], version_ids[10])
+    
+    def test_delete_rollback_and_cleanup(self, tmp_path):
+        """Test that deleted versions stay usable as delta bases until compaction."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        version_manager = TemplateVersionManager(templates_dir)
+        version_ids = [version_manager.create_version(self._template(r)) for r in range(30)]
+        
+        assert version_manager.delete_version("t", version_ids[3])
+        rolled_back = version_manager.rollback_to_version("t", version_ids[4])
+        assert rolled_back.content == self._template(4).content
+        
+        restarted = TemplateVersionManager(templates_dir)
+        assert restarted.get_version("t", version_ids[3]) is None
+        assert restarted.get_version("t", version_ids[5]).template.content == self._template(5).content
+        assert restarted.get_active_version("t").template.content == self._template(4).content
+        
+        restarted.cleanup_old_versions("t", keep_count=5)
+        log_file = templates_dir / "versions" / "t.jsonl"
+        assert len(log_file.read_text().splitlines()) == len(restarted.get_version_history("t"))
+        assert "template" in json.loads(log_file.read_text().splitlines()[0])
+        
+        compacted = TemplateVersionManager(templates_dir)
+        assert compacted.get_active_version("t").template.content == self._template(4).content
+    
+    def test_legacy_history_converted_on_write(self, tmp_path):
+        """Test that full-copy version files load and are rewritten as a log."""
+        templates_dir = tmp_path / "templates"
+        versions_dir = templates_dir / "versions"
+        versions_dir.mkdir(parents=True)
+        versions = {}
+        for revision in range(3):
+            version = TemplateVersion(f"v{revision}", self._template(revision), message=f"Edit {revision}")
+            versions[version.version_id] = version.to_dict()
+        (versions_dir / "t.json").write_text(json.dumps(
+            {"template_id": "t", "versions": versions, "active_version": "v1"}
+        ))
+        
+        version_manager = TemplateVersionManager(templates_dir)
+        assert version_manager.get_active_version("t").version_id == "v1"
+        assert version_manager.get_version("t", "v2").template.content == self._template(2).content
+        
+        new_id = version_manager.create_version(self._template(3))
+        assert not (versions_dir / "t.json").exists()
+        assert len((versions_dir / "t.jsonl").read_text().splitlines()) == 4
+        
+        restarted = TemplateVersionManager(templates_dir)
+        assert restarted.get_active_version("t").version_id == new_id
+        assert restarted.get_version("t", "v0").template.content == self._template(0).content
+    
+    def test_incomplete_last_record_ignored(self, tmp_path):
+        """Test that a record cut short by an interrupted write is skipped."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        version_manager = TemplateVersionManager(templates_dir)
+        first_id = version_manager.create_version(self._template(0))
+        log_file = templates_dir / "versions" / "t.jsonl"
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write('{"version_id": "v9", "delta": {"con')
+        
+        restarted = TemplateVersionManager(templates_dir)
+        assert [v.version_id for v in restarted.get_version_history("t")] == [first_id]
+        
+        # The next write rewrites the log without the incomplete record
+        second_id = restarted.create_version(self._template(1))
+        assert [v.version_id for v in TemplateVersionManager(templates_dir).get_version_history("t")] == [
+            second_id, first_id
+        ]
+
+
+class TestTemplateRecommendationEngine:
+    """Test cases for the vectorized recommendation engine."""
+    
+    TERMS = {
+        "welcome": {"welcome": 1, "aboard": 1},
+        "greeting": {"welcome": 1, "friend": 1},
+        "invoice": {"invoice": 3, "due": 1},
+    }
+    
+    @pytest.fixture
+    def engine(self):
+        """Create an engine with usage recorded on different channels."""
+        engine = TemplateRecommendationEngine(content_terms=self.TERMS.get)
+        for template_id, channel, uses in (("welcome", "email", 4), ("greeting", "email", 4),
+                                           ("invoice", "whatsapp", 4), ("unused", None, 0)):
+            if uses:
+                for _ in range(uses):
+                    engine.record_usage(template_id, channel=channel)
+            else:
+                engine.set_usage_pattern(template_id, {"usage_count": 0, "last_used": None, "contexts": []})
+        return engine
+    
+    def _fresh_similarities(self, engine, template_id):
+        """Similarities computed from scratch by a new engine."""
+        fresh = TemplateRecommendationEngine(content_terms=self.TERMS.get)
+        for other_id, pattern in engine.usage_patterns.items():
+            fresh.set_usage_pattern(other_id, pattern)
+        return dict(fresh._find_similar_templates(template_id))
+    
+    def test_similarity_uses_usage_channel_and_content(self, engine):
+        """Test that templates sharing channels and terms rank first."""
+        similar = engine._find_similar_templates("welcome")
+        scores = dict(similar)
+        
+        assert [template_id for template_id, _ in similar] == ["greeting", "invoice", "unused"]
+        # Same usage, recency and channel mix; one of two terms shared
+        assert scores["greeting"] == pytest.approx(0.5 + 0.2 + 0.15 + 0.15 * 0.5, abs=1e-5)
+        # Disjoint channels and terms
+        assert scores["invoice"] == pytest.approx(0.5 + 0.2, abs=1e-5)
+        # Never used and no content: usage 0, everything else neutral
+        assert scores["unused"] == pytest.approx((0.2 + 0.15 + 0.15) * 0.5, abs=1e-5)
+    
+    def test_cached_rows_follow_updates(self, engine):
+        """Test that cached similarity rows are updated as usage changes."""
+        engine._find_similar_templates("welcome")
+        engine._find_similar_templates("invoice")
+        assert set(engine.similarity_cache) == {"welcome", "invoice"}
+        
+        for _ in range(6):
+            engine.record_usage("unused", channel="whatsapp")
+        self.TERMS["unused"] = {"invoice": 1}
+        try:
+            engine.update_content("unused")
+            for template_id in ("welcome", "invoice"):
+                assert dict(engine._find_similar_templates(template_id)) == pytest.approx(
+                    self._fresh_similarities(engine, template_id), abs=1e-5
+                )
+        finally:
+            del self.TERMS["unused"]
+        
+        assert engine._find_similar_templates("invoice")[0][0] == "unused"
+    
+    def test_capacity_growth_after_query(self):
+        """Test that feature arrays can grow past 64 rows while similarity rows are cached."""
+        engine = TemplateRecommendationEngine()
+        for i in range(64):
+            engine.record_usage(f"t{i}", channel="email")
+        engine.get_recommendations("t0")
+        
+        engine.record_usage("t64", channel="email")
+        
+        assert "t64" in dict(engine._find_similar_templates("t0"))
+        assert dict(engine._find_similar_templates("t0")) == pytest.approx(
+            self._fresh_similarities(engine, "t0"), abs=1e-5
+        )
+    
+    def test_remove_template(self, engine):
+        """Test that removed templates are no longer recommended."""
+        engine._find_similar_templates("welcome")
+        engine.remove_template("greeting")
+        
+        assert "greeting" not in engine.usage_patterns
+        assert [template_id for template_id, _ in engine._find_similar_templates("welcome")] == [
+            "invoice", "unused"
+        ]
+        assert all(template_id != "greeting" for template_id, _, _ in engine.get_recommendations("welcome"))
+    
+    def test_recommendations_combine_sources(self, engine):
+        """Test that recommendations are unique and best first."""
+        recommendations = engine.get_recommendations("welcome", category_id="general", limit=3)
+        
+        template_ids = [template_id for template_id, _, _ in recommendations]
+        assert len(template_ids) == len(set(template_ids)) == 3
+        assert (recommendations[0][0], recommendations[0][2]) == ("greeting", "Similar usage pattern")
+        assert [score for _, score, _ in recommendations] == sorted(
+            (score for _, score, _ in recommendations), reverse=True
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
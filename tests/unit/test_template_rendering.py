@@ -0,0 +1,124 @@
+"""
+Unit tests for compiled template rendering.
+"""
+
+import pytest
+
+from src.multichannel_messaging.core.email_composer import EmailComposer
+from src.multichannel_messaging.core.models import Customer, MessageTemplate
+from src.multichannel_messaging.core.template_renderer import compile_text
+
+
+def _replace_render(template, customer):
+    """Reference rendering with one str.replace pass per variable."""
+    customer_data = customer.to_dict()
+    result = {}
+    fields = []
+    if "email" in template.channels:
+        fields += [("subject", template.subject), ("content", template.content)]
+    if "whatsapp" in template.channels:
+        fields.append(("whatsapp_content", template.whatsapp_content))
+    for name, text in fields:
+        for var in template.variables:
+            placeholder = f"{{{var}}}"
+            text = text.replace(placeholder, str(customer_data.get(var, placeholder)))
+        result[name] = text
+    return result
+
+
+class TestCompileText:
+    """Test cases for compile_text."""
+
+    def test_slots_and_literal_braces(self):
+        """Test that placeholders become slots and other braces stay literal."""
+        compiled = compile_text("Hi {name}, {name}! Use {{code}} or {} at {company}.")
+
+        assert compiled.slots == ("name", "code", "company")
+        assert compiled.render({"name": "Ann", "company": "Acme"}) == (
+            "Hi Ann, Ann! Use {{code}} or {} at Acme."
+        )
+
+    def test_declared_variables_with_special_characters(self):
+        """Test that declared variable names need not be word characters."""
+        compiled = compile_text("Dear {first name} ({first})", ["first name", "first"])
+
+        assert compiled.render({"first name": "Ann Lee", "first": "Ann"}) == "Dear Ann Lee (Ann)"
+
+    def test_text_without_placeholders(self):
+        """Test that plain text is returned unchanged."""
+        compiled = compile_text("No variables here")
+
+        assert compiled.slots == ()
+        assert compiled.render({"name": "Ann"}) == "No variables here"
+
+
+class TestMessageTemplateRendering:
+    """Test cases for MessageTemplate.render and render_many."""
+
+    @pytest.fixture
+    def template(self):
+        """Create a multi-channel template."""
+        return MessageTemplate(
+            id="welcome",
+            name="Welcome",
+            channels=["email", "whatsapp"],
+            subject="Welcome {name} from {company}",
+            content="Hello {name},\n\nWe will call {phone} or write to {email}. {unknown} {missing}",
+            whatsapp_content="Hi {name} 👋 {{literal}}",
+            variables=["name", "company", "phone", "email", "missing"]
+        )
+
+    @pytest.fixture
+    def customers(self):
+        """Create sample customers."""
+        return [
+            Customer(name="John Doe", company="Example Corp", phone="+15551234567", email="john@example.com"),
+            Customer(name="Jane {company}", company="Acme", phone="", email="jane@acme.com"),
+        ]
+
+    def test_render_matches_replace_rendering(self, template, customers):
+        """Test that compiled rendering matches per-variable replacement."""
+        assert template.render(customers[0]) == _replace_render(template, customers[0])
+
+    def test_render_many(self, template, customers):
+        """Test that batch rendering matches rendering each customer."""
+        rendered = template.render_many(customers)
+
+        assert rendered == [template.render(customer) for customer in customers]
+        # Substituted values are not rendered again
+        assert rendered[1]["subject"] == "Welcome Jane {company} from Acme"
+
+    def test_compiled_form_cached_and_invalidated(self, template, customers):
+        """Test that the compiled form is reused until content changes."""
+        compiled = template.compile()
+        assert template.compile() is compiled
+
+        template.subject = "Hello {name}"
+        assert template.compile() is not compiled
+        assert template.render(customers[0])["subject"] == "Hello John Doe"
+
+        template.variables.remove("name")
+        assert template.render(customers[0])["subject"] == "Hello {name}"
+
+    def test_extra_variables(self, template, customers):
+        """Test that extra variables fill placeholders customer data does not."""
+        rendered = template.render(customers[0], {"unknown": "X", "missing": "Y", "name": "ignored"})
+
+        assert rendered["content"].endswith("X Y")
+        assert rendered["subject"] == "Welcome John Doe from Example Corp"
+
+    def test_email_composer_variables(self, customers):
+        """Test custom and system variables in composed emails."""
+        template = MessageTemplate(
+            id="promo",
+            name="Promo",
+            subject="{name}: offer for {current_year}",
+            content="Use code {code} before {current_date}.",
+            variables=["name"]
+        )
+
+        composition = EmailComposer().compose_email(customers[0], template, custom_variables={"code": "SAVE10"})
+
+        assert composition.subject.startswith("John Doe: offer for 20")
+        assert composition.content.startswith("Use code SAVE10 before ")
+        assert "{" not in composition.content
@@ -0,0 +1,163 @@
+"""
+Unit tests for the local WhatsApp webhook receiver.
+"""
+
+import hashlib
+import hmac
+import http.client
+import json
+import threading
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import pytest
+
+from src.multichannel_messaging.core.webhook_manager import DeliveryTracker, MessageStatus, WebhookManager
+from src.multichannel_messaging.core.webhook_receiver import WebhookReceiver
+
+
+SECRET = "test_secret"
+
+
+def status_payload(message_id, status, timestamp=1700000000):
+    """Build a webhook payload with one status update."""
+    return json.dumps({
+        "entry": [{
+            "changes": [{
+                "field": "messages",
+                "value": {"statuses": [{"id": message_id, "status": status, "timestamp": str(timestamp)}]}
+            }]
+        }]
+    })
+
+
+def post(receiver, payload, signature=None, sign=True):
+    """POST a payload to the receiver; return status code and headers."""
+    body = payload.encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    if sign:
+        signature = signature or "sha256=" + hmac.new(SECRET.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    if signature:
+        headers["X-Hub-Signature-256"] = signature
+
+    url = urlparse(receiver.url)
+    conn = http.client.HTTPConnection(url.hostname, url.port, timeout=5)
+    try:
+        conn.request("POST", url.path, body=body, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        return response.status, dict(response.getheaders())
+    finally:
+        conn.close()
+
+
+class TestWebhookReceiver:
+    """Test cases for WebhookReceiver."""
+    
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        """Create a delivery tracker with one tracked message."""
+        tracker = DeliveryTracker(tmp_path / "receiver.db")
+        tracker.track_message("wamid.1", "+1234567890")
+        return tracker
+    
+    @pytest.fixture
+    def manager(self, tracker):
+        """Create a webhook manager for the tracker."""
+        return WebhookManager(webhook_secret=SECRET, delivery_tracker=tracker)
+    
+    def test_signed_delivery_updates_tracker(self, tracker, manager):
+        """Test that a signed delivery is acknowledged and applied by the workers."""
+        with WebhookReceiver(manager) as receiver:
+            status, _ = post(receiver, status_payload("wamid.1", "delivered"))
+            assert status == 200
+            assert receiver.flush(timeout=5)
+            metrics = receiver.get_metrics()
+        
+        assert tracker.get_message_status("wamid.1").status == MessageStatus.DELIVERED
+        assert metrics["accepted"] == 1
+        assert metrics["processed_payloads"] == 1
+        assert metrics["queue_depth"] == 0
+    
+    def test_rejects_bad_and_missing_signatures(self, tracker, manager):
+        """Test that unsigned or wrongly signed deliveries are refused."""
+        with WebhookReceiver(manager) as receiver:
+            assert post(receiver, status_payload("wamid.1", "read"), signature="sha256=bad")[0] == 403
+            assert post(receiver, status_payload("wamid.1", "read"), sign=False)[0] == 401
+            assert receiver.flush(timeout=5)
+            metrics = receiver.get_metrics()
+        
+        assert metrics["rejected_signature"] == 2
+        assert metrics["accepted"] == 0
+        assert tracker.get_message_status("wamid.1").status == MessageStatus.QUEUED
+    
+    def test_backpressure_when_queue_full(self, manager):
+        """Test that deliveries get 503 with Retry-After while the queue is full."""
+        release = threading.Event()
+        started = threading.Event()
+        
+        def slow_batch(payloads):
+            payloads = list(payloads)
+            started.set()
+            release.wait(5)
+            return len(payloads), []
+        
+        with patch.object(manager, "parse_webhook_batch", side_effect=slow_batch):
+            with WebhookReceiver(manager, workers=1, max_queue_size=2, retry_after=3) as receiver:
+                assert post(receiver, status_payload("wamid.1", "sent"))[0] == 200
+                assert started.wait(5)
+                
+                statuses = [post(receiver, status_payload("wamid.1", "sent"))[0] for _ in range(2)]
+                status, headers = post(receiver, status_payload("wamid.1", "sent"))
+                metrics = receiver.get_metrics()
+                
+                release.set()
+                assert receiver.flush(timeout=5)
+        
+        assert statuses == [200, 200]
+        assert status == 503
+        assert headers["Retry-After"] == "3"
+        assert metrics["rejected_backpressure"] == 1
+        assert metrics["queue_depth"] == 2
+        assert metrics["peak_queue_depth"] == 2
+    
+    def test_concurrent_receipts_never_move_status_backwards(self, tracker, manager):
+        """Test that delivered and read sent concurrently for a message always end as read."""
+        message_ids = [f"wamid.concurrent.{i}" for i in range(40)]
+        for message_id in message_ids:
+            tracker.track_message(message_id, "+1234567890")
+        
+        with WebhookReceiver(manager, workers=4, batch_size=4) as receiver:
+            threads = [
+                threading.Thread(target=post, args=(receiver, status_payload(message_id, status, timestamp)))
+                for message_id in message_ids
+                for status, timestamp in (("read", 1700000010), ("delivered", 1700000005))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert receiver.flush(timeout=10)
+            metrics = receiver.get_metrics()
+        
+        assert metrics["processed_payloads"] == 2 * len(message_ids)
+        for message_id in message_ids:
+            stored = tracker._load_record(message_id)
+            assert stored.status == MessageStatus.READ
+            assert tracker.get_message_status(message_id).status == MessageStatus.READ
+    
+    def test_subscription_verification(self, manager):
+        """Test the GET verification handshake."""
+        with WebhookReceiver(manager, verify_token="token123") as receiver:
+            url = urlparse(receiver.url)
+            conn = http.client.HTTPConnection(url.hostname, url.port, timeout=5)
+            conn.request("GET", f"{url.path}?hub.mode=subscribe&hub.verify_token=token123&hub.challenge=42")
+            response = conn.getresponse()
+            assert response.status == 200
+            assert response.read() == b"42"
+            
+            conn.request("GET", f"{url.path}?hub.mode=subscribe&hub.verify_token=wrong&hub.challenge=42")
+            response = conn.getresponse()
+            response.read()
+            assert response.status == 403
+            conn.close()